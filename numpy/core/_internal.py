@@ -312,6 +312,48 @@ class _ctypes(object):
     _as_parameter_ = property(get_as_parameter, None, doc="_as parameter_")
 
 
+def _check_kth(a, kth, axis):
+    from multiarray import array
+    n = a.shape[axis]
+    for k in array(kth, dtype='intp', ndmin=1).ravel():
+        if not -n <= k < n:
+            raise ValueError("kth(=%d) out of bounds (%d)" % (k, n))
+
+# Partition an array in place along axis around the kth elements,
+#  falling back to a full sort for types without a select function
+def _partition(a, kth, axis=-1, kind='introselect', order=None):
+    from _sort import partition
+    if kind != 'introselect':
+        raise ValueError("unknown partition kind: %s" % (kind,))
+    if axis is None:
+        # a flattened copy can not be partitioned in place
+        raise ValueError("axis=None is not supported by ndarray.partition, "
+                         "use numpy.partition instead")
+    if order is None and partition(a, kth, axis) is not NotImplemented:
+        return
+    if a.ndim == 0:
+        raise ValueError("partition requires an array of at least "
+                         "one dimension")
+    _check_kth(a, kth, axis)
+    a.sort(axis=axis, order=order)
+
+def _argpartition(a, kth, axis=-1, kind='introselect', order=None):
+    from _sort import argpartition
+    if kind != 'introselect':
+        raise ValueError("unknown partition kind: %s" % (kind,))
+    if axis is None:
+        a = a.ravel()
+        axis = -1
+    if order is None:
+        res = argpartition(a, kth, axis)
+        if res is not NotImplemented:
+            return res
+    if a.ndim == 0:
+        raise ValueError("partition requires an array of at least "
+                         "one dimension")
+    _check_kth(a, kth, axis)
+    return a.argsort(axis=axis, order=order)
+
 # Given a datatype and an order object
 #  return a new names tuple
 #  with the order indicated
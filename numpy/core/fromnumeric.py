@@ -3,7 +3,8 @@ __docformat__ = "restructuredtext en"
 
 # functions that are now methods
 __all__ = ['take', 'reshape', 'choose', 'repeat', 'put',
-           'swapaxes', 'transpose', 'sort', 'argsort', 'argmax', 'argmin',
+           'swapaxes', 'transpose', 'sort', 'argsort', 'partition',
+           'argpartition', 'argmax', 'argmin',
            'searchsorted', 'alen',
            'resize', 'diagonal', 'trace', 'ravel', 'nonzero', 'shape',
            'compress', 'clip', 'sum', 'product', 'prod', 'sometrue', 'alltrue',
@@ -679,6 +680,131 @@ def argsort(a, axis=-1, kind='quicksort', order=None):
     return argsort(axis, kind, order)
 
 
+def partition(a, kth, axis=-1, kind='introselect', order=None):
+    """
+    Return a partitioned copy of an array.
+
+    Creates a copy of the array with its elements rearranged in such a way
+    that the value of the element in the kth position is in the position it
+    would be in a sorted array. All elements smaller than the kth element
+    are moved before this element and all equal or greater are moved behind
+    it. The ordering of the elements in the two partitions is undefined.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to be partitioned.
+    kth : int or sequence of ints
+        Element index to partition by. The kth value of the element will be
+        in its final sorted position and all smaller elements will be moved
+        before it and all equal or greater elements behind it. If provided
+        with a sequence of kth it will partition all elements indexed by kth
+        of them into their sorted position at once, using a single pass of
+        selections that each work on the part left over by the previous one.
+    axis : int or None, optional
+        Axis along which to partition. If None, the array is flattened
+        before partitioning. The default is -1, which partitions along the
+        last axis.
+    kind : {'introselect'}, optional
+        Selection algorithm. Default is 'introselect'.
+    order : list, optional
+        When `a` is a structured array, this argument specifies which fields
+        to compare first, second, and so on.  Structured arrays are fully
+        sorted.
+
+    Returns
+    -------
+    partitioned_array : ndarray
+        Array of the same type and shape as `a`.
+
+    See Also
+    --------
+    ndarray.partition : Method to partition an array in-place.
+    argpartition : Indirect partition.
+    sort : Full sorting.
+
+    Notes
+    -----
+    'introselect' is a quickselect with a median of three pivot that
+    switches to a median of medians pivot when it makes too little
+    progress, so it runs in linear time in the worst case and does not
+    need any work space. The order of the elements, including nan values,
+    is the one used by `sort`. Types without a selection function, such as
+    strings and objects, are sorted instead.
+
+    Examples
+    --------
+    >>> a = np.array([3, 4, 2, 1])
+    >>> np.partition(a, 3)
+    array([2, 1, 3, 4])
+
+    >>> np.partition(a, (1, 3))
+    array([1, 2, 3, 4])
+
+    """
+    if axis is None:
+        a = asanyarray(a).flatten()
+        axis = 0
+    else:
+        a = asanyarray(a).copy()
+    a.partition(kth, axis=axis, kind=kind, order=order)
+    return a
+
+
+def argpartition(a, kth, axis=-1, kind='introselect', order=None):
+    """
+    Perform an indirect partition along the given axis using the algorithm
+    specified by the `kind` keyword. It returns an array of indices of the
+    same shape as `a` that index data along the given axis in partitioned
+    order.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to partition.
+    kth : int or sequence of ints
+        Element index to partition by. The kth element will be in its final
+        sorted position and all smaller elements will be moved before it and
+        all larger elements behind it. If provided with a sequence of kth it
+        will partition all of them into their sorted position at once.
+    axis : int or None, optional
+        Axis along which to partition. The default is -1 (the last axis). If
+        None, the flattened array is used.
+    kind : {'introselect'}, optional
+        Selection algorithm. Default is 'introselect'.
+    order : list, optional
+        When `a` is an array with fields defined, this argument specifies
+        which fields to compare first, second, etc.  Not all fields need be
+        specified.
+
+    Returns
+    -------
+    index_array : ndarray, int
+        Array of indices that partition `a` along the specified axis.
+        In other words, ``a[index_array]`` yields a partitioned `a`.
+
+    See Also
+    --------
+    partition : Describes partition algorithms used.
+    ndarray.partition : Inplace partition.
+    argsort : Full indirect sort.
+
+    Examples
+    --------
+    >>> x = np.array([3, 4, 2, 1])
+    >>> x[np.argpartition(x, 3)]
+    array([2, 1, 3, 4])
+    >>> x[np.argpartition(x, (1, 3))]
+    array([1, 2, 3, 4])
+
+    """
+    try:
+        argpartition = a.argpartition
+    except AttributeError:
+        return _wrapit(a, 'argpartition', kth, axis, kind, order)
+    return argpartition(kth, axis, kind, order)
+
+
 def argmax(a, axis=None):
     """
     Indices of the maximum values along an axis.
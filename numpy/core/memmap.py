@@ -2,6 +2,7 @@ __all__ = ['memmap']
 
 import warnings
 from numeric import uint8, ndarray, dtype
+from multiarray import _madvise
 import sys
 
 from numpy.compat import asbytes
@@ -79,6 +80,11 @@ class memmap(ndarray):
         Flush any changes in memory to file on disk.
         When you delete a memmap object, flush is called first to write
         changes to disk before removing the object.
+    advise
+        Tell the operating system how the memory of the array will be
+        accessed.
+    windows
+        Iterate over a file too large to be mapped at once.
 
     Notes
     -----
@@ -91,6 +97,11 @@ class memmap(ndarray):
     certain size depending on the platform. This size is always < 2GB
     even on 64-bit systems.
 
+    The whole region of the file holding the array is mapped at once, which
+    needs as much address space; in a 32-bit process, or to limit the memory
+    that the pages of the map can take, `memmap.windows` maps a large file
+    one part at a time instead.
+
     Examples
     --------
     >>> data = np.arange(12, dtype='float32')
@@ -241,6 +252,8 @@ class memmap(ndarray):
         self = ndarray.__new__(subtype, shape, dtype=descr, buffer=mm,
             offset=offset, order=order)
         self._mmap = mm
+        # Address of the start of the map, to locate the data of views
+        self._mmap_start = self.__array_interface__['data'][0] - offset
         self.offset = offset
         self.mode = mode
 
@@ -254,13 +267,36 @@ class memmap(ndarray):
     def __array_finalize__(self, obj):
         if hasattr(obj, '_mmap'):
             self._mmap = obj._mmap
+            self._mmap_start = getattr(obj, '_mmap_start', None)
             self.filename = obj.filename
             self.offset = obj.offset
             self.mode = obj.mode
         else:
             self._mmap = None
+            self._mmap_start = None
+
+    def _mmap_range(self):
+        """
+        Return the offset in the map of the first byte of the data of the
+        array, and the number of bytes from there to its last byte.
+
+        """
+        if self._mmap is None or self._mmap_start is None:
+            raise ValueError("the array is not memory-mapped")
+        if self.size == 0:
+            return (0, 0)
+        start = stop = self.__array_interface__['data'][0] - self._mmap_start
+        for (n, stride) in zip(self.shape, self.strides):
+            if stride < 0:
+                start += (n - 1) * stride
+            else:
+                stop += (n - 1) * stride
+        stop += self.itemsize
+        if start < 0 or stop > len(self._mmap):
+            raise ValueError("the data of the array is not in its map")
+        return (start, stop - start)
 
-    def flush(self):
+    def flush(self, offset=None, size=None):
         """
         Write any changes in the array to the file on disk.
 
@@ -268,15 +304,188 @@ class memmap(ndarray):
 
         Parameters
         ----------
-        None
+        offset : int, optional
+            Offset in bytes, from the start of the data of the array, of the
+            first byte to write. If neither `offset` nor `size` is given,
+            the whole map is written.
+        size : int, optional
+            Number of bytes to write. Default is to write all the bytes of
+            the array from `offset`.
 
         See Also
         --------
         memmap
 
+        Notes
+        -----
+        Only the pages of the map holding the requested bytes are written,
+        which is much faster than writing the whole map when a few rows of
+        a large array have changed.
+
+        Examples
+        --------
+        >>> from tempfile import mkdtemp
+        >>> import os.path as path
+        >>> filename = path.join(mkdtemp(), 'newfile.dat')
+        >>> fp = np.memmap(filename, dtype='float64', mode='w+',
+        ...                shape=(1000, 100))
+        >>> fp[10] = 1
+        >>> fp[10].flush()
+        >>> fp.flush(10 * 800, 800)
+
         """
-        if self._mmap is not None:
+        if self._mmap is None:
+            return
+        if offset is None and size is None:
             self._mmap.flush()
+            return
+        start, length = self._mmap_range()
+        if offset is None:
+            offset = 0
+        if size is None:
+            size = length - offset
+        if offset < 0 or size < 0 or offset + size > length:
+            raise ValueError("byte range is not within the array")
+        if size == 0:
+            return
+        import mmap
+        start += offset
+        # The start of the range must be aligned on a page
+        shift = start % mmap.PAGESIZE
+        self._mmap.flush(start - shift, size + shift)
+
+    def advise(self, advice):
+        """
+        Tell the operating system how the memory of the array will be used.
+
+        The hint applies to the pages holding the data of the array, so that
+        it can be given for a part of a map by calling it on a slice.  It
+        does nothing on platforms without ``madvise``, e.g. on Windows.
+
+        Parameters
+        ----------
+        advice : {'normal', 'sequential', 'random', 'willneed', 'dontneed'}
+            'sequential' : the pages will be read in order, so they can be
+            read ahead aggressively and freed soon after being read.
+            'random' : the pages will be read in random order, so reading
+            ahead would be wasted.
+            'willneed' : the pages will be needed soon; start reading them
+            in the background.
+            'dontneed' : the pages will not be needed soon; free them. Their
+            data is read again from the file when they are used, so this
+            is not allowed with the copy-on-write mode 'c', whose changes
+            would be lost.
+            'normal' : undo the previous hints.
+
+        See Also
+        --------
+        memmap
+
+        Examples
+        --------
+        >>> from tempfile import mkdtemp
+        >>> import os.path as path
+        >>> filename = path.join(mkdtemp(), 'newfile.dat')
+        >>> fp = np.memmap(filename, dtype='float64', mode='w+',
+        ...                shape=(1000, 100))
+        >>> fp.advise('sequential')
+        >>> fp[500:].advise('willneed')
+
+        """
+        if advice == 'dontneed' and self.mode == 'c':
+            raise ValueError("'dontneed' would discard the changes of a "
+                             "copy-on-write map")
+        start, length = self._mmap_range()
+        _madvise(self._mmap, start, length, advice)
+
+    def windows(cls, filename, dtype=uint8, mode='r', offset=0, shape=None,
+                nbytes=2**26):
+        """
+        memmap.windows(filename, dtype=uint8, mode='r', offset=0,
+                       shape=None, nbytes=2**26)
+
+        Iterate over an array stored in a file, mapping only a window of
+        the file at a time.
+
+        The array is split along its first axis into memmaps of at most
+        `nbytes` bytes, but for at least one row each.  Each window is
+        mapped when it is reached, and unmapped once it is no longer
+        referenced, so that a file larger than the address space of the
+        process, or than the memory it may use, can be processed.
+
+        Parameters
+        ----------
+        filename, dtype, offset
+            See `memmap`.
+        mode : {'r', 'r+', 'c'}, optional
+            See `memmap`. The file must exist. Default is 'r'.
+        shape : tuple, optional
+            The shape of the whole array. By default, it is 1-D with the
+            number of elements determined by the file size and data-type.
+        nbytes : int, optional
+            Maximum size of a window in bytes. Default is 64 MB.
+
+        Returns
+        -------
+        windows : generator
+            Generator of C-ordered memmaps covering consecutive rows of the
+            array.
+
+        Notes
+        -----
+        Needs Python 2.6 or later.  The generator does not keep any window
+        referenced, so at most two windows are mapped at a time when each
+        window is dropped by the caller as the next one is requested.
+
+        Examples
+        --------
+        >>> from tempfile import mkdtemp
+        >>> import os.path as path
+        >>> filename = path.join(mkdtemp(), 'newfile.dat')
+        >>> np.arange(1000, dtype='int32').tofile(filename)
+        >>> total = 0
+        >>> for window in np.memmap.windows(filename, 'int32', nbytes=1024):
+        ...     total += window.sum()
+        >>> total
+        499500
+
+        """
+        import mmap
+        if sys.version_info[:2] < (2, 6):
+            raise NotImplementedError("mapping a window of a file needs "
+                                      "Python 2.6 or later")
+        mode = mode_equivalents.get(mode, mode)
+        if mode not in ('r', 'r+', 'c'):
+            raise ValueError("mode must be one of %s" % ['r', 'r+', 'c'])
+        if hasattr(filename, 'read'):
+            fid = filename
+        else:
+            fid = open(filename, (mode == 'c' and 'r' or mode) + 'b')
+        descr = dtypedescr(dtype)
+        fid.seek(0, 2)
+        flen = fid.tell()
+        if shape is None:
+            if (flen - offset) % descr.itemsize:
+                raise ValueError("Size of available data is not a "
+                                 "multiple of data-type size.")
+            shape = ((flen - offset) // descr.itemsize,)
+        elif not isinstance(shape, tuple):
+            shape = (shape,)
+        rowbytes = descr.itemsize
+        for k in shape[1:]:
+            rowbytes *= k
+        if offset + shape[0] * rowbytes > flen:
+            raise ValueError("the file is too small for the shape")
+        rows = max(nbytes // max(rowbytes, 1), 1)
+        for start in xrange(0, shape[0], rows):
+            n = min(rows, shape[0] - start)
+            yield cls(fid, dtype=descr, mode=mode,
+                      offset=offset + start * rowbytes,
+                      shape=(n,) + shape[1:])
+        if fid is not filename:
+            fid.close()
+
+    windows = classmethod(windows)
 
     def sync(self):
         """This method is deprecated, use `flush`."""
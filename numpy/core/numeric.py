@@ -8,6 +8,7 @@ __all__ = ['newaxis', 'ndarray', 'flatiter', 'ufunc',
            'isfortran', 'empty_like', 'zeros_like',
            'correlate', 'convolve', 'inner', 'dot', 'outer', 'vdot',
            'alterdot', 'restoredot', 'roll', 'rollaxis', 'cross', 'tensordot',
+           'einsum',
            'array2string', 'get_printoptions', 'set_printoptions',
            'array_repr', 'array_str', 'set_string_function',
            'little_endian', 'require',
@@ -1057,6 +1058,334 @@ def tensordot(a, b, axes=2):
     res = dot(at, bt)
     return res.reshape(olda + oldb)
 
+def _einsum_parse(subscripts, operands):
+    """
+    Turn the subscripts of einsum into integer labels.
+
+    Returns one list of labels per operand, the number of output labels,
+    which are numbered first, and the size of every label.  The axes
+    covered by an ellipsis get labels of their own, aligned to the right.
+
+    """
+    subscripts = subscripts.replace(' ', '')
+    if '->' in subscripts:
+        inputs, output = subscripts.split('->', 1)
+        if '-' in output or '>' in output:
+            raise ValueError("subscripts may contain only one '->'")
+    else:
+        inputs, output = subscripts, None
+    terms = inputs.split(',')
+    if len(terms) != len(operands):
+        raise ValueError("%d operands given for %d subscript terms"
+                         % (len(operands), len(terms)))
+
+    def check(term):
+        if term.count('...') > 1 or '.' in term.replace('...', '', 1):
+            raise ValueError("invalid ellipsis in subscripts %r" % term)
+        for c in term.replace('...', ''):
+            if not c.isalpha():
+                raise ValueError("invalid subscript %r in %r" % (c, term))
+
+    nells = []
+    for term, op in zip(terms, operands):
+        check(term)
+        nell = op.ndim - len(term.replace('...', ''))
+        if nell < 0 or (nell > 0 and '...' not in term):
+            raise ValueError("subscripts %r do not match an operand with "
+                             "%d dimensions" % (term, op.ndim))
+        nells.append(nell)
+    nell = max(nells)
+
+    keys = []
+    for term, n in zip(terms, nells):
+        if '...' in term:
+            before, after = term.split('...')
+            keys.append(list(before) + range(nell - n, nell) + list(after))
+        else:
+            keys.append(list(term))
+    if output is None:
+        counts = {}
+        for key in keys:
+            for k in key:
+                counts[k] = counts.get(k, 0) + 1
+        letters = [k for k in counts if counts[k] == 1 and isinstance(k, str)]
+        letters.sort()
+        outkeys = range(nell) + letters
+    else:
+        check(output)
+        if '...' in output:
+            before, after = output.split('...')
+            outkeys = list(before) + range(nell) + list(after)
+        else:
+            outkeys = list(output)
+        for k in outkeys:
+            if outkeys.count(k) > 1:
+                raise ValueError("output subscript %r is repeated" % k)
+            if isinstance(k, str) and not [key for key in keys if k in key]:
+                raise ValueError("output subscript %r does not appear in "
+                                 "the inputs" % k)
+
+    ids = {}
+    for k in outkeys:
+        ids[k] = len(ids)
+    for key in keys:
+        for k in key:
+            if k not in ids:
+                ids[k] = len(ids)
+    labels = [[ids[k] for k in key] for key in keys]
+    sizes = [1] * len(ids)
+    for lab, op in zip(labels, operands):
+        for l, n in zip(lab, op.shape):
+            if sizes[l] == 1:
+                sizes[l] = n
+            elif n != 1 and n != sizes[l]:
+                raise ValueError("operands could not be broadcast together "
+                                 "for subscripts %r" % subscripts)
+    return labels, len(outkeys), sizes
+
+def _einsum_path(labels, nout, sizes, optimize=True):
+    """
+    Plan the order in which einsum contracts its operands pairwise.
+
+    Returns a list of pairs ``(i, j)``, ``i < j``, of positions in the
+    list of operands: each pair is removed from the list and the result of
+    contracting it is appended at the end.  Returns None when a single
+    pass over all the operands costs no more than the pairwise path.  The
+    cost of a step is the size of the union of the labels of the pair.
+    The search is exhaustive for up to five operands and greedy beyond,
+    or as selected by `optimize`, 'optimal' or 'greedy'.
+
+    """
+    if optimize not in (True, 'optimal', 'greedy'):
+        raise ValueError("optimize must be a boolean, 'optimal' or 'greedy'")
+    output = set(range(nout))
+
+    def size(labels):
+        n = 1
+        for l in labels:
+            n *= sizes[l]
+        return n
+
+    def contract(ops, i, j):
+        needed = set(output)
+        for k in range(len(ops)):
+            if k != i and k != j:
+                needed |= ops[k]
+        union = ops[i] | ops[j]
+        rest = [ops[k] for k in range(len(ops)) if k != i and k != j]
+        return rest + [union & needed], 2*size(union)
+
+    ops = [frozenset(l) for l in labels]
+    if optimize == 'greedy' or (optimize is True and len(ops) > 5):
+        path, cost = [], 0
+        while len(ops) > 1:
+            best = None
+            for i in range(len(ops)):
+                for j in range(i + 1, len(ops)):
+                    new, c = contract(ops, i, j)
+                    key = (c, size(new[-1]))
+                    if best is None or key < best[0]:
+                        best = (key, (i, j), new)
+            path.append(best[1])
+            cost += best[0][0]
+            ops = best[2]
+    else:
+        best = [None, None]
+        def search(ops, path, cost):
+            if best[1] is not None and cost >= best[1]:
+                return
+            if len(ops) == 1:
+                best[0], best[1] = path, cost
+                return
+            for i in range(len(ops)):
+                for j in range(i + 1, len(ops)):
+                    new, c = contract(ops, i, j)
+                    search(new, path + [(i, j)], cost + c)
+        search(ops, [], 0)
+        path, cost = best
+
+    total = set()
+    for l in labels:
+        total |= set(l)
+    if len(labels) > 2 and len(labels)*size(total) <= cost:
+        return None
+    return path
+
+def _sum_of_products(operands, labels, out):
+    """
+    Sum of products of the operands over the labels not in `out`, with the
+    axes of the result in the order of `out`.
+
+    """
+    ids = {}
+    for l in out:
+        ids[l] = len(ids)
+    for lab in labels:
+        for l in lab:
+            if l not in ids:
+                ids[l] = len(ids)
+    labels = [[ids[l] for l in lab] for lab in labels]
+    res = multiarray._sum_of_products(operands, labels, len(out))
+    if res is NotImplemented:
+        # no kernel for this type, broadcast the operands against each
+        # other with an axis per label and multiply out
+        nlabels = len(ids)
+        prod = None
+        for op, lab in zip(operands, labels):
+            op, lab = asarray(op), list(lab)
+            for l in range(nlabels):
+                while lab.count(l) > 1:
+                    i = lab.index(l)
+                    j = lab.index(l, i + 1)
+                    op = op.diagonal(0, i, j)
+                    del lab[j], lab[i]
+                    lab.append(l)
+            shape = [1] * nlabels
+            for l, n in zip(lab, op.shape):
+                shape[l] = n
+            order = range(len(lab))
+            order.sort(key=lab.__getitem__)
+            op = op.transpose(order).reshape(shape)
+            if prod is None:
+                prod = op
+            else:
+                prod = prod * op
+        for axis in range(nlabels - 1, len(out) - 1, -1):
+            prod = umath.add.reduce(prod, axis=axis, dtype=prod.dtype)
+        res = array(prod)
+    return asarray(res)
+
+def _einsum_pair(a, la, b, lb, out, sizes):
+    """
+    Contract the operands a and b, labelled la and lb, into the labels
+    `out`.  Pure contractions go through tensordot, and so through BLAS
+    where dot does, everything else through the sum of products kernel.
+
+    """
+    needed = set(out) | set(lb)
+    if len(set(la)) < len(la) or set(la) - needed:
+        keep = [l for i, l in enumerate(la) if l in needed and l not in la[:i]]
+        a, la = _sum_of_products([a], [la], keep), keep
+    needed = set(out) | set(la)
+    if len(set(lb)) < len(lb) or set(lb) - needed:
+        keep = [l for i, l in enumerate(lb) if l in needed and l not in lb[:i]]
+        b, lb = _sum_of_products([b], [lb], keep), keep
+
+    shared = [l for l in la if l in lb]
+    plain = list(a.shape) + list(b.shape) == [sizes[l] for l in la + lb]
+    if plain and 0 not in a.shape + b.shape and not set(shared) & set(out):
+        res = tensordot(a, b, ([la.index(l) for l in shared],
+                               [lb.index(l) for l in shared]))
+        lres = [l for l in la + lb if l not in shared]
+        return asarray(res).transpose([lres.index(l) for l in out])
+    return _sum_of_products([a, b], [la, lb], out)
+
+def einsum(subscripts, *operands, **kwargs):
+    """
+    einsum(subscripts, *operands, optimize=True)
+
+    Evaluate the Einstein summation convention on the operands.
+
+    The subscripts label the axes of every operand with a letter; the
+    result is the sum, over all the labels that do not appear in the
+    output, of the product of the operands.  Many linear algebra
+    operations can be written this way: ``einsum('ij,jk', a, b)`` is a
+    matrix product, ``einsum('ii', a)`` the trace and ``einsum('ij->ji',
+    a)`` the transpose.
+
+    Parameters
+    ----------
+    subscripts : str
+        The subscripts of the operands, separated by commas.  Repeating a
+        letter within an operand takes its diagonal.  An explicit output
+        can follow ``->``; without it, the output has the letters that
+        appear only once, in alphabetical order.  An ellipsis, ``...``,
+        stands for the axes not labelled otherwise, which broadcast
+        against each other and, without an explicit output, come first in
+        the result.
+    operands : array_like
+        The arrays to operate on.
+    optimize : {True, False, 'optimal', 'greedy'}, optional
+        With two or more operands, contract them pairwise, through
+        `tensordot` where possible, in the order of least cost.  The
+        order is searched exhaustively for up to five operands and
+        greedily beyond, unless 'optimal' or 'greedy' is given.  With
+        False, or when it is no more expensive, all the operands are
+        evaluated in a single pass without intermediate arrays.
+
+    Returns
+    -------
+    output : ndarray
+        The result, a scalar when it has no axes.
+
+    See Also
+    --------
+    dot, inner, outer, tensordot, trace
+
+    Notes
+    -----
+    The single pass loops over every combination of the labels, so its
+    cost is the product of the sizes of all of them; a pairwise path only
+    ever loops over the labels of one pair.  For instance ``einsum('ij,jk,
+    kl', a, b, c)`` with square matrices of size n is O(n**4) in a single
+    pass but O(n**3) as two matrix products.
+
+    Examples
+    --------
+    >>> a = np.arange(25).reshape(5,5)
+    >>> b = np.arange(5)
+    >>> np.einsum('ii', a)
+    60
+    >>> np.einsum('ii->i', a)
+    array([ 0,  6, 12, 18, 24])
+    >>> np.einsum('ij,j', a, b)
+    array([ 30,  80, 130, 180, 230])
+    >>> np.einsum('i,i', b, b)
+    30
+    >>> np.einsum('i,j', np.arange(2)+1, b)
+    array([[ 0,  1,  2,  3,  4],
+           [ 0,  2,  4,  6,  8]])
+    >>> np.einsum('...j,j', a, b)
+    array([ 30,  80, 130, 180, 230])
+    >>> np.einsum('ij,jk,kl->il', a, a, a).shape
+    (5, 5)
+
+    """
+    optimize = kwargs.pop('optimize', True)
+    if kwargs:
+        raise TypeError("einsum() got an unexpected keyword argument %r"
+                        % kwargs.keys()[0])
+    if not operands:
+        raise ValueError("einsum needs at least one operand")
+    operands = [asarray(op) for op in operands]
+    labels, nout, sizes = _einsum_parse(subscripts, operands)
+
+    path = None
+    if optimize and len(operands) > 1:
+        path = _einsum_path(labels, nout, sizes, optimize)
+    if path is None:
+        res = _sum_of_products(operands, labels, range(nout))
+    else:
+        ops = zip(operands, labels)
+        for i, j in path:
+            b, lb = ops.pop(j)
+            a, la = ops.pop(i)
+            if ops:
+                needed = set(range(nout))
+                for op, lab in ops:
+                    needed |= set(lab)
+                out = []
+                for l in la + lb:
+                    if l in needed and l not in out:
+                        out.append(l)
+            else:
+                out = range(nout)
+            ops.append((_einsum_pair(a, la, b, lb, out, sizes), out))
+        res = ops[0][0]
+    if res.ndim == 0:
+        return res[()]
+    return res
+
 def roll(a, shift, axis=None):
     """
     Roll array elements along a given axis.
@@ -95,6 +95,10 @@ OPTIONAL_STDFUNCS = ["expm1", "log1p", "acosh", "asinh", "atanh",
         "rint", "trunc", "exp2", "log2", "hypot", "atan2", "pow",
         "copysign", "nextafter"]
 
+# Headers which may not be available, HAVE_<HEADER>_H is defined for the ones
+# which are
+OPTIONAL_HEADERS = ["sys/mman.h"]
+
 # Subset of OPTIONAL_STDFUNCS which may alreay have HAVE_* defined by Python.h
 OPTIONAL_STDFUNCS_MAYBE = ["expm1", "log1p", "acosh", "atanh", "asinh", "hypot",
         "copysign"]
@@ -117,6 +121,9 @@ C99_COMPLEX_FUNCS = ['creal', 'cimag', 'cabs', 'carg', 'cexp', 'csqrt', 'clog',
 def fname2def(name):
     return "HAVE_%s" % name.upper()
 
+def header2def(name):
+    return "HAVE_%s" % name.replace('/', '_').replace('.', '_').upper()
+
 def sym2def(symbol):
     define = symbol.replace(' ', '')
     return define.upper()
@@ -0,0 +1,7 @@
+#ifndef _NPY_EINSUM_H_
+#define _NPY_EINSUM_H_
+
+NPY_NO_EXPORT PyObject *
+PyArray_SumOfProducts(PyObject *ops, PyObject *labels, int nout);
+
+#endif
@@ -1113,6 +1113,53 @@ array_argsort(PyArrayObject *self, PyObject *args, PyObject *kwds)
     return _ARET(res);
 }
 
+/*
+ * Calls numpy.core._internal.<name>(self, *args, **kwds)
+ */
+static PyObject *
+forward_to_internal(const char *name, PyArrayObject *self, PyObject *args,
+                    PyObject *kwds)
+{
+    PyObject *_numpy_internal, *func, *first, *newargs, *ret;
+
+    _numpy_internal = PyImport_ImportModule("numpy.core._internal");
+    if (_numpy_internal == NULL) {
+        return NULL;
+    }
+    func = PyObject_GetAttrString(_numpy_internal, name);
+    Py_DECREF(_numpy_internal);
+    if (func == NULL) {
+        return NULL;
+    }
+    first = PyTuple_Pack(1, (PyObject *)self);
+    if (first == NULL) {
+        Py_DECREF(func);
+        return NULL;
+    }
+    newargs = PySequence_Concat(first, args);
+    Py_DECREF(first);
+    if (newargs == NULL) {
+        Py_DECREF(func);
+        return NULL;
+    }
+    ret = PyObject_Call(func, newargs, kwds);
+    Py_DECREF(newargs);
+    Py_DECREF(func);
+    return ret;
+}
+
+static PyObject *
+array_partition(PyArrayObject *self, PyObject *args, PyObject *kwds)
+{
+    return forward_to_internal("_partition", self, args, kwds);
+}
+
+static PyObject *
+array_argpartition(PyArrayObject *self, PyObject *args, PyObject *kwds)
+{
+    return forward_to_internal("_argpartition", self, args, kwds);
+}
+
 static PyObject *
 array_searchsorted(PyArrayObject *self, PyObject *args, PyObject *kwds)
 {
@@ -2172,6 +2219,9 @@ NPY_NO_EXPORT PyMethodDef array_methods[] = {
     {"argmin",
         (PyCFunction)array_argmin,
         METH_VARARGS | METH_KEYWORDS, NULL},
+    {"argpartition",
+        (PyCFunction)array_argpartition,
+        METH_VARARGS | METH_KEYWORDS, NULL},
     {"argsort",
         (PyCFunction)array_argsort,
         METH_VARARGS | METH_KEYWORDS, NULL},
@@ -2241,6 +2291,9 @@ NPY_NO_EXPORT PyMethodDef array_methods[] = {
     {"nonzero",
         (PyCFunction)array_nonzero,
         METH_VARARGS, NULL},
+    {"partition",
+        (PyCFunction)array_partition,
+        METH_VARARGS | METH_KEYWORDS, NULL},
     {"prod",
         (PyCFunction)array_prod,
         METH_VARARGS | METH_KEYWORDS, NULL},
@@ -42,6 +42,7 @@ NPY_NO_EXPORT int NPY_NUMUSERTYPES = 0;
 #include "number.h"
 #include "scalartypes.h"
 #include "numpymemoryview.h"
+#include "einsum.h"
 
 /*NUMPY_API
  * Get Priority from object
@@ -1833,6 +1834,23 @@ array_fastCopyAndTranspose(PyObject *NPY_UNUSED(dummy), PyObject *args)
     return _ARET(PyArray_CopyAndTranspose(a0));
 }
 
+/*
+ * _sum_of_products(operands, labels, nout): the kernel of einsum, see
+ * PyArray_SumOfProducts.
+ */
+static PyObject *
+array__sum_of_products(PyObject *NPY_UNUSED(dummy), PyObject *args)
+{
+    PyObject *ops, *labels;
+    int nout;
+
+    if (!PyArg_ParseTuple(args, "OOi:_sum_of_products",
+                          &ops, &labels, &nout)) {
+        return NULL;
+    }
+    return PyArray_SumOfProducts(ops, labels, nout);
+}
+
 static PyObject *
 array_correlate(PyObject *NPY_UNUSED(dummy), PyObject *args, PyObject *kwds)
 {
@@ -2671,6 +2689,73 @@ test_interrupt(PyObject *NPY_UNUSED(self), PyObject *args)
     return PyInt_FromLong(a);
 }
 
+#ifdef HAVE_SYS_MMAN_H
+#include <sys/mman.h>
+#include <unistd.h>
+#endif
+
+/*
+ * Give the kernel a hint on how the pages of a memory map will be used:
+ * _madvise(buffer, offset, length, advice), where the range is in bytes
+ * within the buffer of a mmap object.  This does nothing on platforms
+ * without madvise, as the hints do not change the data.
+ */
+static PyObject *
+array__madvise(PyObject *NPY_UNUSED(dummy), PyObject *args)
+{
+    PyObject *obj;
+    Py_ssize_t offset, length, size;
+    const void *buffer;
+    char *advice;
+    static const char *names[] = {"normal", "sequential", "random",
+                                  "willneed", "dontneed"};
+#if defined(HAVE_SYS_MMAN_H) && defined(MADV_NORMAL)
+    static const int flags[] = {MADV_NORMAL, MADV_SEQUENTIAL, MADV_RANDOM,
+                                MADV_WILLNEED, MADV_DONTNEED};
+    char *start;
+    npy_uintp shift;
+    int ret;
+    NPY_BEGIN_THREADS_DEF;
+#endif
+    int i;
+
+    if (!PyArg_ParseTuple(args, "Onns:_madvise",
+                          &obj, &offset, &length, &advice)) {
+        return NULL;
+    }
+    for (i = 0; i < 5; i++) {
+        if (strcmp(advice, names[i]) == 0) {
+            break;
+        }
+    }
+    if (i == 5) {
+        PyErr_Format(PyExc_ValueError, "unknown advice '%s'", advice);
+        return NULL;
+    }
+    if (PyObject_AsReadBuffer(obj, &buffer, &size) < 0) {
+        return NULL;
+    }
+    if (offset < 0 || length < 0 || offset > size - length) {
+        PyErr_SetString(PyExc_ValueError, "range is not within the buffer");
+        return NULL;
+    }
+#if defined(HAVE_SYS_MMAN_H) && defined(MADV_NORMAL)
+    if (length > 0) {
+        /* madvise needs a page-aligned start */
+        start = (char *)buffer + offset;
+        shift = ((npy_uintp)start) % sysconf(_SC_PAGESIZE);
+        NPY_BEGIN_THREADS;
+        ret = madvise(start - shift, length + shift, flags[i]);
+        NPY_END_THREADS;
+        if (ret != 0) {
+            return PyErr_SetFromErrno(PyExc_OSError);
+        }
+    }
+#endif
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static struct PyMethodDef array_module_methods[] = {
     {"_get_ndarray_c_version",
         (PyCFunction)array__get_ndarray_c_version,
@@ -2732,6 +2817,9 @@ static struct PyMethodDef array_module_methods[] = {
     {"_fastCopyAndTranspose",
         (PyCFunction)array_fastCopyAndTranspose,
         METH_VARARGS, NULL},
+    {"_sum_of_products",
+        (PyCFunction)array__sum_of_products,
+        METH_VARARGS, NULL},
     {"correlate",
         (PyCFunction)array_correlate,
         METH_VARARGS | METH_KEYWORDS, NULL},
@@ -2770,6 +2858,9 @@ static struct PyMethodDef array_module_methods[] = {
     {"test_interrupt",
         (PyCFunction)test_interrupt,
         METH_VARARGS, NULL},
+    {"_madvise",
+        (PyCFunction)array__madvise,
+        METH_VARARGS, NULL},
     {NULL, NULL, 0, NULL}                /* sentinel */
 };
 
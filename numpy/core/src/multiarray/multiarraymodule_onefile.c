@@ -30,6 +30,7 @@
 #include "shape.c"
 #include "item_selection.c"
 #include "calculation.c"
+#include "einsum.c"
 #include "usertypes.c"
 #include "refcount.c"
 #include "conversion_utils.c"
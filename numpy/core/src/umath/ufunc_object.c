@@ -2037,10 +2037,12 @@ PyUFunc_GenericFunction(PyUFuncObject *self, PyObject *args, PyObject *kwds,
         ufuncloop_dealloc(loop);
         return -2;
     }
-    if (self->core_enabled && loop->meth != SIGNATURE_NOBUFFER_UFUNCLOOP) {
+    if (self->core_enabled && loop->meth != SIGNATURE_NOBUFFER_UFUNCLOOP
+            && loop->meth != NO_UFUNCLOOP) {
         PyErr_SetString(PyExc_RuntimeError,
                         "illegal loop method for ufunc with signature");
-        goto fail;
+        ufuncloop_dealloc(loop);
+        return -1;
     }
 
     NPY_LOOP_BEGIN_THREADS;
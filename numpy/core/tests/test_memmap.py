@@ -1,8 +1,10 @@
 from tempfile import NamedTemporaryFile, mktemp
 import os
+import sys
 import warnings
 
 from numpy import memmap
+from numpy.core.multiarray import _madvise
 from numpy import arange, allclose
 from numpy.testing import *
 
@@ -74,6 +76,74 @@ class TestMemmap(TestCase):
         fp.sync()
         warnings.simplefilter('default', DeprecationWarning)
 
+    def test_flush_range(self):
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='w+',
+                    shape=self.shape)
+        fp[:] = self.data[:]
+        fp.flush(4, 8)
+        fp[1:2].flush()
+        fp[2, ::-2].flush(0)
+        self.assertRaises(ValueError, fp[1].flush, 0, fp[1].nbytes + 1)
+        self.assertRaises(ValueError, fp[1].flush, -1)
+        self.assertRaises(ValueError, (fp + 1).flush, 0)
+        fp2 = memmap(self.tmpfp, dtype=self.dtype, mode='r',
+                     shape=self.shape)
+        assert_array_equal(fp2, self.data)
+
+    def test_advise(self):
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='w+',
+                    shape=self.shape)
+        fp[:] = self.data[:]
+        for advice in ['sequential', 'random', 'willneed', 'normal']:
+            fp.advise(advice)
+            fp[1:, ::-1].advise(advice)
+        fp[:0].advise('random')
+        fp.flush()
+        fp.advise('dontneed')
+        assert_array_equal(fp, self.data)
+        self.assertRaises(ValueError, fp.advise, 'never')
+        fpc = memmap(self.tmpfp, dtype=self.dtype, mode='c',
+                     shape=self.shape)
+        self.assertRaises(ValueError, fpc.advise, 'dontneed')
+
+    @dec.skipif(not sys.platform.startswith('linux'),
+                "only Linux discards private pages on 'dontneed'")
+    def test_advise_dontneed_copy(self):
+        # 'dontneed' on a copy-on-write map throws away the changes, which
+        # only happens if madvise is really called
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='w+',
+                    shape=self.shape)
+        fp[:] = self.data[:]
+        fp.flush()
+        fpc = memmap(self.tmpfp, dtype=self.dtype, mode='c',
+                     shape=self.shape)
+        fpc[:] = 0
+        _madvise(fpc._mmap, 0, len(fpc._mmap), 'dontneed')
+        assert_array_equal(fpc, self.data)
+        self.assertRaises(ValueError, _madvise, fpc._mmap, 0,
+                          len(fpc._mmap) + 1, 'normal')
+
+    def test_windows(self):
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='w+',
+                    shape=self.shape)
+        fp[:] = self.data[:]
+        fp.flush()
+        windows = [w.copy() for w in memmap.windows(self.tmpfp.name,
+                                                    self.dtype, offset=12,
+                                                    shape=(2, 4), nbytes=20)]
+        assert_equal([w.shape for w in windows], [(1, 4), (1, 4)])
+        assert_array_equal(windows[1], [self.data.flat[7:11]])
+        windows = list(memmap.windows(self.tmpfp, self.dtype, mode='r+',
+                                      nbytes=4 * 5))
+        assert_equal([len(w) for w in windows], [5, 5, 2])
+        windows[2][:] = 0
+        windows[2].flush()
+        assert_array_equal(memmap(self.tmpfp, dtype=self.dtype,
+                                  mode='r')[-2:], 0)
+        self.assertRaises(ValueError, list,
+                          memmap.windows(self.tmpfp, self.dtype,
+                                         shape=(4, 4)))
+
     def test_del(self):
         # Make sure a view does not delete the underlying mmap
         fp_base = memmap(self.tmpfp, dtype=self.dtype, mode='w+',
@@ -527,6 +527,61 @@ class TestMethods(TestCase):
         b = a.searchsorted(a, side='r')
         assert_equal(b, np.arange(1,10), msg)
 
+    def test_partition(self):
+        # check all kth positions of random data for the numeric types,
+        # including nans, byteswapped and non-contiguous data.
+        np.random.seed(1)
+        for t in np.typecodes['AllInteger'] + np.typecodes['AllFloat'] + '?':
+            for n in [1, 2, 3, 7, 30, 101]:
+                a = (np.random.rand(n)*10).astype(t)
+                if t in np.typecodes['AllFloat']:
+                    a[::5] = np.nan
+                s = np.sort(a)
+                for k in range(n):
+                    msg = "partition of %s, n=%d, k=%d" % (t, n, k)
+                    b = np.partition(a, k)
+                    assert_equal(b[k], s[k], msg)
+                    assert_equal(np.sort(b[:k]), s[:k], msg)
+                    assert_equal(a[np.argpartition(a, k)][k], s[k], msg)
+        a = np.arange(1000, 0, -1).astype('>f8')[::2]
+        b = a.copy()
+        b.partition([10, -1, 100])
+        assert_equal(b[[10, 100, -1]], [22, 202, 1000])
+        assert_((b[:10] < 22).all() and (b[11:100] < 202).all())
+        assert_equal(a[a.argpartition((10, 100))][[10, 100]], [22, 202])
+
+    def test_partition_axis(self):
+        a = np.random.rand(4, 5, 6)
+        for axis in [0, 1, 2, -1]:
+            s = np.sort(a, axis=axis)
+            b = np.partition(a, [1, 3], axis=axis)
+            assert_equal(b.take([1, 3], axis), s.take([1, 3], axis))
+            i = np.argpartition(a, 2, axis=axis)
+            assert_equal(np.sort(i, axis=axis), np.sort(a, axis=axis).argsort(axis))
+        assert_equal(np.partition(a, 0, axis=None)[0], a.min())
+        assert_equal(a.flat[np.argpartition(a, -1, axis=None)[-1]], a.max())
+
+    def test_partition_fallback(self):
+        # types without a select function are sorted
+        a = np.array(['c', 'a', 'b'])
+        assert_equal(np.partition(a, 1), ['a', 'b', 'c'])
+        assert_equal(np.argpartition(np.array([3, 1, 2], object), 0),
+                     [1, 2, 0])
+        r = np.array([(1, 0), (0, 1)], dtype=[('x', int), ('y', int)])
+        assert_equal(np.partition(r, 0, order='y'), r)
+
+    def test_partition_errors(self):
+        a = np.arange(5)
+        assert_raises(ValueError, np.partition, a, 5)
+        assert_raises(ValueError, np.partition, a, -6)
+        assert_raises(ValueError, np.argpartition, a, [1, 5])
+        assert_raises(ValueError, np.partition, np.array(['a']), 1)
+        assert_raises(ValueError, np.partition, a, 1, kind='quicksort')
+        assert_raises(ValueError, np.partition, a, 1, axis=1)
+        assert_raises(ValueError, a.copy().partition, 1, axis=None)
+        a.flags.writeable = False
+        assert_raises(RuntimeError, a.partition, 1)
+
     def test_flatten(self):
         x0 = np.array([[1,2,3],[4,5,6]], np.int32)
         x1 = np.array([[[1,2],[3,4]],[[5,6],[7,8]]], np.int32)
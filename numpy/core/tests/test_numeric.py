@@ -134,6 +134,122 @@ class TestDot(TestCase):
         assert_equal(zeros[1].array, zeros_test[1].array)
 
 
+class TestEinsum(TestCase):
+    def test_basic(self):
+        a = np.arange(12.).reshape(3, 4)
+        b = np.arange(20.).reshape(4, 5)
+        v = np.arange(4.)
+        for opt in [True, False]:
+            assert_equal(np.einsum('ij,jk', a, b, optimize=opt), dot(a, b))
+            assert_equal(np.einsum('ij,jk->ki', a, b, optimize=opt),
+                         dot(a, b).T)
+            assert_equal(np.einsum('ij,j', a, v, optimize=opt), dot(a, v))
+            assert_equal(np.einsum('i,j', v, v, optimize=opt),
+                         np.outer(v, v))
+            assert_equal(np.einsum('ij,ij->i', a, a, optimize=opt),
+                         (a*a).sum(1))
+        assert_equal(np.einsum('i,i', v, v), 14)
+        assert_equal(np.einsum('ij->ji', a), a.T)
+        assert_equal(np.einsum('ji', a), a.T)
+        assert_equal(np.einsum('ij->', a), a.sum())
+        assert_equal(np.einsum('ij', a), a)
+        sq = np.arange(16).reshape(4, 4)
+        assert_equal(np.einsum('ii', sq), np.trace(sq))
+        assert_equal(np.einsum('ii->i', sq), np.diag(sq))
+        x = np.arange(27).reshape(3, 3, 3)
+        assert_equal(np.einsum('iii', x), 0 + 13 + 26)
+        assert_equal(np.einsum('iij->j', x), x[0, 0] + x[1, 1] + x[2, 2])
+
+    def test_types(self):
+        a = np.arange(6).reshape(2, 3)
+        for t in [np.int8, np.uint16, np.int32, np.int64, np.float32,
+                  np.longdouble, np.complex64, np.clongdouble, object]:
+            r = np.einsum('ij,kj->ik', a.astype(t), a.astype(t))
+            assert_equal(r.dtype, np.dtype(t))
+            assert_equal(r, dot(a, a.T))
+        c = np.array([1+2j, 3-1j])
+        assert_almost_equal(np.einsum('i,i', c, c), (c*c).sum())
+        assert_almost_equal(np.einsum('i,i,i', c, c, c), (c*c*c).sum())
+        assert_equal(np.einsum('i,i', [1, 2], [1.5, 2]).dtype, np.float64)
+        t, f = np.array([True, False]), np.array([False, False])
+        assert_equal(np.einsum('i,i', t, t), True)
+        assert_equal(np.einsum('i,i', t, f), False)
+        s = np.arange(10.)[::-2].astype('>f8')
+        assert_equal(np.einsum('i,i', s, s), dot(s, s))
+        assert_equal(np.einsum('i,j->ij', s, np.arange(4)),
+                     np.outer(s, range(4)))
+
+    def test_ellipsis(self):
+        a = np.arange(24.).reshape(2, 3, 4)
+        b = np.arange(4.)
+        assert_equal(np.einsum('...i,i', a, b), dot(a, b))
+        assert_equal(np.einsum('...i,i->...', a, b), dot(a, b))
+        assert_equal(np.einsum('i...->...', a), a.sum(0))
+        assert_equal(np.einsum('...', a), a)
+        assert_equal(np.einsum('...ij,...jk', a, a.swapaxes(1, 2)),
+                     [dot(x, x.T) for x in a])
+        # ellipsis axes broadcast, and are summed without one in the output
+        c = np.arange(3.).reshape(3, 1)
+        assert_equal(np.einsum('...,...', c, b), c*b)
+        assert_equal(np.einsum('...i,i->i', a, b), a.sum(0).sum(0)*b)
+        assert_equal(np.einsum('i,i', np.ones(1), b), b.sum())
+
+    def test_empty(self):
+        a = np.zeros((0, 3))
+        assert_equal(np.einsum('ij,jk', a, np.ones((3, 2))), np.zeros((0, 2)))
+        assert_equal(np.einsum('ij,ik', a, a), np.zeros((3, 3)))
+        assert_equal(np.einsum('ij,ik,kl', a, a, np.ones((3, 2))),
+                     np.zeros((3, 2)))
+
+    def test_path(self):
+        from numpy.core.numeric import _einsum_parse, _einsum_path
+        ops = [np.ones((10, 20)), np.ones((20, 30)), np.ones((30, 5)),
+               np.ones(5)]
+        labels, nout, sizes = _einsum_parse('ij,jk,kl,l->i', ops)
+        assert_equal(labels, [[0, 1], [1, 2], [2, 3], [3]])
+        assert_equal((nout, sizes), (1, [10, 20, 30, 5]))
+        # the vector is folded in from the right
+        for opt in [True, 'optimal', 'greedy']:
+            assert_equal(_einsum_path(labels, nout, sizes, opt),
+                         [(2, 3), (1, 2), (0, 1)])
+        # a single pass is cheaper for elementwise products
+        ops = [np.ones(10)] * 3
+        labels, nout, sizes = _einsum_parse('i,i,i', ops)
+        assert_equal(_einsum_path(labels, nout, sizes), None)
+        assert_raises(ValueError, _einsum_path, labels, nout, sizes, 'all')
+
+    def test_optimize(self):
+        np.random.seed(3)
+        a, b, c = rand(4, 5), rand(5, 6), rand(6, 3)
+        d, e = rand(3, 4), rand(4)
+        for subs, ops in [('ij,jk,kl->il', (a, b, c)),
+                          ('ij,jk,kl,li->', (a, b, c, d)),
+                          ('ij,jk,kl,lm,m->i', (a, b, c, d, e)),
+                          ('ij,jk,kl,lm,mn,n', (a, b, c, d, a, rand(5))),
+                          ('ij,jk,kl,li->ij', (a, b, c, d)),
+                          ('i,ij,ij->j', (e, a, a)),
+                          ('ij,jk,k->jk', (a, b, rand(6)))]:
+            r = np.einsum(subs, *ops, **dict(optimize=False))
+            for opt in [True, 'optimal', 'greedy']:
+                assert_almost_equal(
+                    np.einsum(subs, *ops, **dict(optimize=opt)), r)
+
+    def test_errors(self):
+        a = np.ones((2, 3))
+        assert_raises(ValueError, np.einsum, 'ij')
+        assert_raises(ValueError, np.einsum, 'ij,jk', a)
+        assert_raises(ValueError, np.einsum, 'i', a)
+        assert_raises(ValueError, np.einsum, 'ijk', a)
+        assert_raises(ValueError, np.einsum, 'ij,ij', a, a.T)
+        assert_raises(ValueError, np.einsum, 'ii', a)
+        assert_raises(ValueError, np.einsum, 'i1', a)
+        assert_raises(ValueError, np.einsum, 'i..j', a)
+        assert_raises(ValueError, np.einsum, 'ij->k', a)
+        assert_raises(ValueError, np.einsum, 'ij->ii', a)
+        assert_raises(ValueError, np.einsum, 'ij->i->j', a)
+        assert_raises(TypeError, np.einsum, 'ij', a, order='C')
+
+
 class TestResize(TestCase):
     def test_copies(self):
         A = array([[1,2],[3,4]])
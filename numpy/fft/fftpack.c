@@ -1224,6 +1224,22 @@ void cfftb(int n, Treal c[], Treal wsave[])
   } /* cfftb */
 
 
+/* cfftf and cfftb with the scratch space (2*n values) passed separately,
+   so that wsave is only read and can be shared between threads. */
+void cfftf_scratch(int n, Treal c[], Treal ch[], const Treal wsave[])
+  {
+    if (n == 1) return;
+    cfftf1(n, c, ch, wsave+2*n, (const int*)(wsave+4*n), -1);
+  } /* cfftf_scratch */
+
+
+void cfftb_scratch(int n, Treal c[], Treal ch[], const Treal wsave[])
+  {
+    if (n == 1) return;
+    cfftf1(n, c, ch, wsave+2*n, (const int*)(wsave+4*n), +1);
+  } /* cfftb_scratch */
+
+
 static void factorize(int n, int ifac[MAXFAC+2], const int ntryh[NSPECIAL])
   /* Factorize n in factors in ntryh and rest. On exit,
 ifac[0] contains n and ifac[1] contains number of factors,
@@ -1448,6 +1464,21 @@ void rfftb(int n, Treal r[], Treal wsave[])
   } /* rfftb */
 
 
+/* rfftf and rfftb with the scratch space (n values) passed separately. */
+void rfftf_scratch(int n, Treal r[], Treal ch[], const Treal wsave[])
+  {
+    if (n == 1) return;
+    rfftf1(n, r, ch, wsave+n, (const int*)(wsave+2*n));
+  } /* rfftf_scratch */
+
+
+void rfftb_scratch(int n, Treal r[], Treal ch[], const Treal wsave[])
+  {
+    if (n == 1) return;
+    rfftb1(n, r, ch, wsave+n, (const int*)(wsave+2*n));
+  } /* rfftb_scratch */
+
+
 static void rffti1(int n, Treal wa[], int ifac[MAXFAC+2])
   {
     static const Treal twopi = 6.28318530717959;
@@ -23,6 +23,13 @@ extern void rfftf(int N, Treal data[], const Treal wrk[]);
 extern void rfftb(int N, Treal data[], const Treal wrk[]);
 extern void rffti(int N, Treal wrk[]);
 
+/* As above, with the scratch space (2*N values for the complex and N for
+   the real transforms) in scr, leaving wrk untouched. */
+extern void cfftf_scratch(int N, Treal data[], Treal scr[], const Treal wrk[]);
+extern void cfftb_scratch(int N, Treal data[], Treal scr[], const Treal wrk[]);
+extern void rfftf_scratch(int N, Treal data[], Treal scr[], const Treal wrk[]);
+extern void rfftb_scratch(int N, Treal data[], Treal scr[], const Treal wrk[]);
+
 #ifdef __cplusplus
 }
 #endif
@@ -35,14 +35,166 @@ __all__ = ['fft','ifft', 'rfft', 'irfft', 'hfft', 'ihfft', 'rfftn',
            'refft', 'irefft','refftn','irefftn', 'refft2', 'irefft2']
 
 from numpy.core import asarray, zeros, swapaxes, shape, conjugate, \
-     take
+     take, arange, exp, pi, concatenate, empty
 import fftpack_lite as fftpack
+from helper import _FFTCache, next_fast_len
+import sys
+try:
+    import threading
+    _have_threads = True
+except ImportError:
+    _have_threads = False
+import Queue
+
+_fft_cache = _FFTCache(max_size_in_mb=100, max_item_count=32)
+_real_fft_cache = _FFTCache(max_size_in_mb=100, max_item_count=32)
+_bluestein_cache = _FFTCache(max_size_in_mb=100, max_item_count=32)
+
+# FFTPACK handles a prime factor p of the length in O(p) operations per
+# point, lengths with a prime factor above this go through _bluestein.
+_BLUESTEIN_MIN_PRIME = 100
+
+def _largest_prime_factor(n):
+    for p in (2, 3, 5):
+        while n % p == 0 and n > p:
+            n //= p
+    p = 7
+    while p*p <= n:
+        while n % p == 0 and n > p:
+            n //= p
+        p += 2
+    return n
+
+def _raw_bluestein(a, n, backward=False, threads=1):
+    """
+    Unnormalized complex transform of length `n` along the last axis of
+    `a` with Bluestein's algorithm.
+
+    The transform is written as a convolution with the chirp
+    ``exp(1j*pi*k**2/n)``, which is done with FFTs of a fast length
+    ``m >= 2*n - 1``.  The chirp and the transform of the convolution
+    kernel only depend on `n` and are cached.
 
-_fft_cache = {}
-_real_fft_cache = {}
+    """
+    m = next_fast_len(2*n - 1)
+    plan = _bluestein_cache.pop_twiddle_factors(n)
+    if plan is None:
+        k = arange(n, dtype=float)
+        # k**2 mod 2n keeps the phase argument small and exact
+        w = exp(-1j * pi * ((k*k) % (2*n)) / n)
+        b = zeros(m, complex)
+        b[:n] = w.conj()
+        b[m-n+1:] = w[:0:-1].conj()
+        b = _raw_fft(b, m, -1, fftpack.cffti, fftpack.cfftf, _fft_cache)
+        plan = concatenate((w, b))
+    try:
+        w = plan[:n]
+        if backward:
+            x = conjugate(a) * w
+        else:
+            x = a * w
+        x = _raw_fft(x, m, -1, fftpack.cffti, fftpack.cfftf, _fft_cache,
+                     threads)
+        x *= plan[n:]
+        x = _raw_fft(x, m, -1, fftpack.cffti, fftpack.cfftb, _fft_cache,
+                     threads)
+        r = x[..., :n] * (w / m)
+    finally:
+        _bluestein_cache.put_twiddle_factors(n, plan)
+    if backward:
+        r = conjugate(r)
+    return r
+
+def _bluestein(a, work_function, threads=1):
+    # a does the same as work_function(a, wsave) would
+    n = a.shape[-1]
+    if work_function is fftpack.cfftf:
+        return _raw_bluestein(a, n, False, threads)
+    elif work_function is fftpack.cfftb:
+        return _raw_bluestein(a, n, True, threads)
+    elif work_function is fftpack.rfftf:
+        return _raw_bluestein(asarray(a, float), n, False,
+                              threads)[..., :n//2 + 1]
+    else:
+        # complete the hermitian spectrum rfftb reads its input as
+        a = asarray(a, complex)
+        full = zeros(a.shape, complex)
+        full[..., :n//2 + 1] = a[..., :n//2 + 1]
+        full[..., n//2 + 1:] = conjugate(a[..., (n-1)//2:0:-1])
+        return _raw_bluestein(full, n, True, threads).real
+
+class _WorkerPool(object):
+    """
+    Threads kept alive between the calls of the threaded transforms.
+
+    `map` runs function(*args) for each item of a list of arguments, the
+    first one on the calling thread and the others on the pool, which
+    grows as needed.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tasks = Queue.Queue()
+        self._size = 0
+
+    def _work(self):
+        while True:
+            function, args, done = self._tasks.get()
+            try:
+                function(*args)
+                done.put(None)
+            except:
+                done.put(sys.exc_info()[1])
+
+    def map(self, function, args_list):
+        self._lock.acquire()
+        try:
+            while self._size < len(args_list) - 1:
+                t = threading.Thread(target=self._work)
+                t.setDaemon(True)
+                t.start()
+                self._size += 1
+        finally:
+            self._lock.release()
+        done = Queue.Queue()
+        for args in args_list[1:]:
+            self._tasks.put((function, args, done))
+        errors = []
+        try:
+            function(*args_list[0])
+        except:
+            errors.append(sys.exc_info()[1])
+        for args in args_list[1:]:
+            e = done.get()
+            if e is not None:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+if _have_threads:
+    _workers = _WorkerPool()
+
+def _threaded(work_function, a, wsave, threads):
+    # work_function(a, wsave) with the rows of a split over threads, which
+    # write their part of the result into a single output array; the work
+    # functions release the GIL and only read wsave
+    shape = a.shape
+    a = a.reshape(-1, shape[-1])
+    rows = a.shape[0]
+    # the first row gives the type and length of the result
+    first = work_function(a[:1], wsave)
+    r = empty((rows, first.shape[-1]), first.dtype)
+    r[:1] = first
+    if threads > rows - 1:
+        threads = rows - 1
+    bounds = [1 + (rows - 1)*i // threads for i in range(threads + 1)]
+    args = [(a[bounds[i]:bounds[i+1]], wsave, r[bounds[i]:bounds[i+1]])
+            for i in range(threads)]
+    _workers.map(work_function, args)
+    return r.reshape(shape[:-1] + r.shape[-1:])
 
 def _raw_fft(a, n=None, axis=-1, init_function=fftpack.cffti,
-             work_function=fftpack.cfftf, fft_cache = _fft_cache ):
+             work_function=fftpack.cfftf, fft_cache = _fft_cache,
+             threads=1):
     a = asarray(a)
 
     if n is None:
@@ -51,11 +203,8 @@ def _raw_fft(a, n=None, axis=-1, init_function=fftpack.cffti,
     if n < 1:
         raise ValueError("Invalid number of FFT data points (%d) specified." % n)
 
-    try:
-        wsave = fft_cache[n]
-    except(KeyError):
-        wsave = init_function(n)
-        fft_cache[n] = wsave
+    if threads < 1:
+        raise ValueError("threads must be at least 1, got %d" % threads)
 
     if a.shape[axis] != n:
         s = list(a.shape)
@@ -73,13 +222,33 @@ def _raw_fft(a, n=None, axis=-1, init_function=fftpack.cffti,
 
     if axis != -1:
         a = swapaxes(a, axis, -1)
-    r = work_function(a, wsave)
+
+    if n > _BLUESTEIN_MIN_PRIME and \
+           _largest_prime_factor(n) > _BLUESTEIN_MIN_PRIME:
+        r = _bluestein(a, work_function, threads)
+        if axis != -1:
+            r = swapaxes(r, axis, -1)
+        return r
+
+    # The plan is taken out of the cache while in use and put back
+    # afterwards; all threads of this call share it.
+    wsave = fft_cache.pop_twiddle_factors(n)
+    if wsave is None:
+        wsave = init_function(n)
+    try:
+        if threads > 1 and a.size > n and _have_threads:
+            r = _threaded(work_function, a, wsave, threads)
+        else:
+            r = work_function(a, wsave)
+    finally:
+        fft_cache.put_twiddle_factors(n, wsave)
+
     if axis != -1:
         r = swapaxes(r, axis, -1)
     return r
 
 
-def fft(a, n=None, axis=-1):
+def fft(a, n=None, axis=-1, threads=1):
     """
     Compute the one-dimensional discrete Fourier Transform.
 
@@ -99,6 +268,9 @@ def fft(a, n=None, axis=-1):
     axis : int, optional
         Axis over which to compute the FFT.  If not given, the last axis is
         used.
+    threads : int, optional
+        Number of threads the transforms of the individual 1-d slices
+        along `axis` are split over.  Default is 1.
 
     Returns
     -------
@@ -125,7 +297,10 @@ def fft(a, n=None, axis=-1):
     FFT (Fast Fourier Transform) refers to a way the discrete Fourier
     Transform (DFT) can be calculated efficiently, by using symmetries in the
     calculated terms.  The symmetry is highest when `n` is a power of 2, and
-    the transform is therefore most efficient for these sizes.
+    the transform is therefore most efficient for these sizes.  Lengths
+    with a large prime factor are computed with Bluestein's algorithm
+    [BS]_, which is O(n log n) as well but several times slower than a
+    transform of length `next_fast_len(n)`.
 
     The DFT is defined, with the conventions used in this implementation, in
     the documentation for the `numpy.fft` module.
@@ -135,6 +310,9 @@ def fft(a, n=None, axis=-1):
     .. [CT] Cooley, James W., and John W. Tukey, 1965, "An algorithm for the
             machine calculation of complex Fourier series," *Math. Comput.*
             19: 297-301.
+    .. [BS] Bluestein, L., 1970, "A linear filtering approach to the
+            computation of discrete Fourier transform," *IEEE Transactions
+            on Audio and Electroacoustics* 18: 451-455.
 
     Examples
     --------
@@ -162,10 +340,11 @@ def fft(a, n=None, axis=-1):
 
     """
 
-    return _raw_fft(a, n, axis, fftpack.cffti, fftpack.cfftf, _fft_cache)
+    return _raw_fft(a, n, axis, fftpack.cffti, fftpack.cfftf, _fft_cache,
+                    threads)
 
 
-def ifft(a, n=None, axis=-1):
+def ifft(a, n=None, axis=-1, threads=1):
     """
     Compute the one-dimensional inverse discrete Fourier Transform.
 
@@ -194,6 +373,9 @@ def ifft(a, n=None, axis=-1):
     axis : int, optional
         Axis over which to compute the inverse DFT.  If not given, the last
         axis is used.
+    threads : int, optional
+        Number of threads the transforms of the individual 1-d slices
+        along `axis` are split over.  Default is 1.
 
     Returns
     -------
@@ -243,10 +425,11 @@ def ifft(a, n=None, axis=-1):
     a = asarray(a).astype(complex)
     if n is None:
         n = shape(a)[axis]
-    return _raw_fft(a, n, axis, fftpack.cffti, fftpack.cfftb, _fft_cache) / n
+    return _raw_fft(a, n, axis, fftpack.cffti, fftpack.cfftb, _fft_cache,
+                    threads) / n
 
 
-def rfft(a, n=None, axis=-1):
+def rfft(a, n=None, axis=-1, threads=1):
     """
     Compute the one-dimensional discrete Fourier Transform for real input.
 
@@ -266,6 +449,9 @@ def rfft(a, n=None, axis=-1):
     axis : int, optional
         Axis over which to compute the FFT. If not given, the last axis is
         used.
+    threads : int, optional
+        Number of threads the transforms of the individual 1-d slices
+        along `axis` are split over.  Default is 1.
 
     Returns
     -------
@@ -320,10 +506,11 @@ def rfft(a, n=None, axis=-1):
     """
 
     a = asarray(a).astype(float)
-    return _raw_fft(a, n, axis, fftpack.rffti, fftpack.rfftf, _real_fft_cache)
+    return _raw_fft(a, n, axis, fftpack.rffti, fftpack.rfftf, _real_fft_cache,
+                    threads)
 
 
-def irfft(a, n=None, axis=-1):
+def irfft(a, n=None, axis=-1, threads=1):
     """
     Compute the inverse of the n-point DFT for real input.
 
@@ -350,6 +537,9 @@ def irfft(a, n=None, axis=-1):
         the length of the input (along the axis specified by `axis`).
     axis : int, optional
         Axis over which to compute the inverse FFT.
+    threads : int, optional
+        Number of threads the transforms of the individual 1-d slices
+        along `axis` are split over.  Default is 1.
 
     Returns
     -------
@@ -404,10 +594,10 @@ def irfft(a, n=None, axis=-1):
     if n is None:
         n = (shape(a)[axis] - 1) * 2
     return _raw_fft(a, n, axis, fftpack.rffti, fftpack.rfftb,
-                    _real_fft_cache) / n
+                    _real_fft_cache, threads) / n
 
 
-def hfft(a, n=None, axis=-1):
+def hfft(a, n=None, axis=-1, threads=1):
     """
     Compute the FFT of a signal whose spectrum has Hermitian symmetry.
 
@@ -420,6 +610,9 @@ def hfft(a, n=None, axis=-1):
     axis : int, optional
         The axis over which to compute the FFT, assuming Hermitian symmetry
         of the spectrum. Default is the last axis.
+    threads : int, optional
+        Number of threads the transforms of the individual 1-d slices
+        along `axis` are split over.  Default is 1.
 
     Returns
     -------
@@ -455,10 +648,10 @@ def hfft(a, n=None, axis=-1):
     a = asarray(a).astype(complex)
     if n is None:
         n = (shape(a)[axis] - 1) * 2
-    return irfft(conjugate(a), n, axis) * n
+    return irfft(conjugate(a), n, axis, threads) * n
 
 
-def ihfft(a, n=None, axis=-1):
+def ihfft(a, n=None, axis=-1, threads=1):
     """
     Compute the inverse FFT of a signal whose spectrum has Hermitian symmetry.
 
@@ -471,6 +664,9 @@ def ihfft(a, n=None, axis=-1):
     axis : int, optional
         Axis over which to compute the inverse FFT, assuming Hermitian
         symmetry of the spectrum. Default is the last axis.
+    threads : int, optional
+        Number of threads the transforms of the individual 1-d slices
+        along `axis` are split over.  Default is 1.
 
     Returns
     -------
@@ -494,7 +690,7 @@ def ihfft(a, n=None, axis=-1):
     a = asarray(a).astype(float)
     if n is None:
         n = shape(a)[axis]
-    return conjugate(rfft(a, n, axis))/n
+    return conjugate(rfft(a, n, axis, threads))/n
 
 
 def _cook_nd_args(a, s=None, axes=None, invreal=0):
@@ -516,14 +712,59 @@ def _cook_nd_args(a, s=None, axes=None, invreal=0):
     return s, axes
 
 
-def _raw_fftnd(a, s=None, axes=None, function=fft):
+def _raw_fftnd(a, s=None, axes=None, backward=False):
     a = asarray(a)
     s, axes = _cook_nd_args(a, s, axes)
-    itl = range(len(axes))
-    itl.reverse()
-    for ii in itl:
-        a = function(a, n=s[ii], axis=axes[ii])
-    return a
+    if len(axes) == 0:
+        return a
+    if len(set([range(len(a.shape))[ax] for ax in axes])) != len(axes) or \
+           [n for n in s if n > _BLUESTEIN_MIN_PRIME and
+            _largest_prime_factor(n) > _BLUESTEIN_MIN_PRIME]:
+        # repeated axes are transformed repeatedly, and lengths with large
+        # prime factors need _bluestein, so go one axis at a time
+        function = fft
+        if backward:
+            function = ifft
+        for ii in reversed(range(len(axes))):
+            a = function(a, n=s[ii], axis=axes[ii])
+        return a
+
+    # Crop and zero pad all axes at once, then transform every axis in a
+    # single call working on the strided data, last axis first.
+    newshape = list(a.shape)
+    for ax, n in zip(axes, s):
+        if n < 1:
+            raise ValueError("Invalid number of FFT data points (%d) "
+                             "specified." % n)
+        newshape[ax] = n
+    if newshape != list(a.shape):
+        index = [slice(0, min(m, n)) for m, n in zip(a.shape, newshape)]
+        z = zeros(newshape, complex)
+        z[index] = a[index]
+        a = z
+
+    axes = list(axes)
+    axes.reverse()
+    lengths = [newshape[ax] for ax in axes]
+    wsaves = {}
+    try:
+        for n in lengths:
+            if n not in wsaves:
+                wsave = _fft_cache.pop_twiddle_factors(n)
+                if wsave is None:
+                    wsave = fftpack.cffti(n)
+                wsaves[n] = wsave
+        r = fftpack.cfftn(a, axes, [wsaves[n] for n in lengths],
+                          int(backward))
+    finally:
+        for n, wsave in wsaves.items():
+            _fft_cache.put_twiddle_factors(n, wsave)
+    if backward:
+        size = 1
+        for n in lengths:
+            size *= n
+        r /= size
+    return r
 
 
 def fftn(a, s=None, axes=None):
@@ -616,7 +857,7 @@ def fftn(a, s=None, axes=None):
 
     """
 
-    return _raw_fftnd(a,s,axes,fft)
+    return _raw_fftnd(a, s, axes)
 
 def ifftn(a, s=None, axes=None):
     """
@@ -708,7 +949,7 @@ def ifftn(a, s=None, axes=None):
 
     """
 
-    return _raw_fftnd(a, s, axes, ifft)
+    return _raw_fftnd(a, s, axes, backward=True)
 
 
 def fft2(a, s=None, axes=(-2,-1)):
@@ -789,7 +1030,7 @@ def fft2(a, s=None, axes=(-2,-1)):
 
     """
 
-    return _raw_fftnd(a,s,axes,fft)
+    return _raw_fftnd(a, s, axes)
 
 
 def ifft2(a, s=None, axes=(-2,-1)):
@@ -872,7 +1113,7 @@ def ifft2(a, s=None, axes=(-2,-1)):
 
     """
 
-    return _raw_fftnd(a, s, axes, ifft)
+    return _raw_fftnd(a, s, axes, backward=True)
 
 
 def rfftn(a, s=None, axes=None):
@@ -958,8 +1199,7 @@ def rfftn(a, s=None, axes=None):
     a = asarray(a).astype(float)
     s, axes = _cook_nd_args(a, s, axes)
     a = rfft(a, s[-1], axes[-1])
-    for ii in range(len(axes)-1):
-        a = fft(a, s[ii], axes[ii])
+    a = _raw_fftnd(a, s[:-1], axes[:-1])
     return a
 
 def rfft2(a, s=None, axes=(-2,-1)):
@@ -1078,8 +1318,7 @@ def irfftn(a, s=None, axes=None):
 
     a = asarray(a).astype(complex)
     s, axes = _cook_nd_args(a, s, axes, invreal=1)
-    for ii in range(len(axes)-1):
-        a = ifft(a, s[ii], axes[ii])
+    a = _raw_fftnd(a, s[:-1], axes[:-1], backward=True)
     a = irfft(a, s[-1], axes[-1])
     return a
 
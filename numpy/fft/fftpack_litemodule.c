@@ -6,23 +6,74 @@ static PyObject *ErrorObject;
 
 /* ----------------------------------------------------- */
 
+/*
+ * The array the transforms are written to: `out` if it is given, which
+ * must then be a C-contiguous, writeable array of the given type and
+ * shape, else a new array of zeros.  Returns a new reference.
+ */
+static PyArrayObject *
+get_output(PyObject *out, int nd, npy_intp *dims, int type)
+{
+    if (out == NULL || out == Py_None) {
+        return (PyArrayObject *)PyArray_Zeros(nd, dims,
+                PyArray_DescrFromType(type), 0);
+    }
+    if (!PyArray_Check(out) || PyArray_TYPE(out) != type ||
+            !PyArray_ISCARRAY(out) || PyArray_NDIM(out) != nd ||
+            !PyArray_CompareLists(PyArray_DIMS(out), dims, nd)) {
+        PyErr_SetString(PyExc_ValueError,
+                "out must be a C-contiguous array of the type and shape "
+                "of the result");
+        return NULL;
+    }
+    Py_INCREF(out);
+    return (PyArrayObject *)out;
+}
+
+/*
+ * The complex data transformed in place by cfftf and cfftb: a copy of op,
+ * either new or in `out`.  Returns a new reference.
+ */
+static PyArrayObject *
+get_complex_data(PyObject *op, PyObject *out)
+{
+    PyArrayObject *src, *data;
+
+    if (out == NULL || out == Py_None) {
+        return (PyArrayObject *)PyArray_CopyFromObject(op,
+                PyArray_CDOUBLE, 1, 0);
+    }
+    src = (PyArrayObject *)PyArray_ContiguousFromObject(op,
+            PyArray_CDOUBLE, 1, 0);
+    if (src == NULL) {
+        return NULL;
+    }
+    data = get_output(out, src->nd, src->dimensions, PyArray_CDOUBLE);
+    if (data != NULL && data->data != src->data &&
+            PyArray_CopyInto(data, src) < 0) {
+        Py_DECREF(data);
+        data = NULL;
+    }
+    Py_DECREF(src);
+    return data;
+}
+
 static char fftpack_cfftf__doc__[] = "";
 
 PyObject *
 fftpack_cfftf(PyObject *NPY_UNUSED(self), PyObject *args)
 {
-    PyObject *op1, *op2;
+    PyObject *op1, *op2, *out = NULL;
     PyArrayObject *data;
     PyArray_Descr *descr;
-    double *wsave, *dptr;
+    double *wsave, *dptr, *scratch;
     npy_intp nsave;
     int npts, nrepeats, i;
 
-    if(!PyArg_ParseTuple(args, "OO", &op1, &op2)) {
+    if(!PyArg_ParseTuple(args, "OO|O", &op1, &op2, &out)) {
         return NULL;
     }
-    data = (PyArrayObject *)PyArray_CopyFromObject(op1,
-            PyArray_CDOUBLE, 1, 0);
+    data = get_complex_data(op1, out);
     if (data == NULL) {
         return NULL;
     }
@@ -42,12 +93,18 @@ fftpack_cfftf(PyObject *NPY_UNUSED(self), PyObject *args)
 
     nrepeats = PyArray_SIZE(data)/npts;
     dptr = (double *)data->data;
-    NPY_SIGINT_ON;
+    scratch = malloc(npts*2*sizeof(double));
+    if (scratch == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
     for (i = 0; i < nrepeats; i++) {
-        cfftf(npts, dptr, wsave);
+        cfftf_scratch(npts, dptr, scratch, wsave);
         dptr += npts*2;
     }
-    NPY_SIGINT_OFF;
+    NPY_END_ALLOW_THREADS;
+    free(scratch);
     PyArray_Free(op2, (char *)wsave);
     return (PyObject *)data;
 
@@ -62,18 +119,17 @@ static char fftpack_cfftb__doc__[] = "";
 PyObject *
 fftpack_cfftb(PyObject *NPY_UNUSED(self), PyObject *args)
 {
-    PyObject *op1, *op2;
+    PyObject *op1, *op2, *out = NULL;
     PyArrayObject *data;
     PyArray_Descr *descr;
-    double *wsave, *dptr;
+    double *wsave, *dptr, *scratch;
     npy_intp nsave;
     int npts, nrepeats, i;
 
-    if(!PyArg_ParseTuple(args, "OO", &op1, &op2)) {
+    if(!PyArg_ParseTuple(args, "OO|O", &op1, &op2, &out)) {
         return NULL;
     }
-    data = (PyArrayObject *)PyArray_CopyFromObject(op1,
-            PyArray_CDOUBLE, 1, 0);
+    data = get_complex_data(op1, out);
     if (data == NULL) {
         return NULL;
     }
@@ -93,12 +149,18 @@ fftpack_cfftb(PyObject *NPY_UNUSED(self), PyObject *args)
 
     nrepeats = PyArray_SIZE(data)/npts;
     dptr = (double *)data->data;
-    NPY_SIGINT_ON;
+    scratch = malloc(npts*2*sizeof(double));
+    if (scratch == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
     for (i = 0; i < nrepeats; i++) {
-        cfftb(npts, dptr, wsave);
+        cfftb_scratch(npts, dptr, scratch, wsave);
         dptr += npts*2;
     }
-    NPY_SIGINT_OFF;
+    NPY_END_ALLOW_THREADS;
+    free(scratch);
     PyArray_Free(op2, (char *)wsave);
     return (PyObject *)data;
 
@@ -140,14 +202,14 @@ static char fftpack_rfftf__doc__[] ="";
 PyObject *
 fftpack_rfftf(PyObject *NPY_UNUSED(self), PyObject *args)
 {
-    PyObject *op1, *op2;
+    PyObject *op1, *op2, *out = NULL;
     PyArrayObject *data, *ret;
     PyArray_Descr *descr;
-    double *wsave, *dptr, *rptr;
+    double *wsave, *dptr, *rptr, *scratch;
     npy_intp nsave;
     int npts, nrepeats, i, rstep;
 
-    if(!PyArg_ParseTuple(args, "OO", &op1, &op2)) {
+    if(!PyArg_ParseTuple(args, "OO|O", &op1, &op2, &out)) {
         return NULL;
     }
     data = (PyArrayObject *)PyArray_ContiguousFromObject(op1,
@@ -157,9 +219,12 @@ fftpack_rfftf(PyObject *NPY_UNUSED(self), PyObject *args)
     }
     npts = data->dimensions[data->nd-1];
     data->dimensions[data->nd - 1] = npts/2 + 1;
-    ret = (PyArrayObject *)PyArray_Zeros(data->nd, data->dimensions,
-            PyArray_DescrFromType(PyArray_CDOUBLE), 0);
+    ret = get_output(out, data->nd, data->dimensions, PyArray_CDOUBLE);
     data->dimensions[data->nd - 1] = npts;
+    if (ret == NULL) {
+        Py_DECREF(data);
+        return NULL;
+    }
     rstep = (ret->dimensions[ret->nd - 1])*2;
 
     descr = PyArray_DescrFromType(PyArray_DOUBLE);
@@ -179,16 +244,24 @@ fftpack_rfftf(PyObject *NPY_UNUSED(self), PyObject *args)
     dptr = (double *)data->data;
 
 
-    NPY_SIGINT_ON;
+    scratch = malloc(npts*sizeof(double));
+    if (scratch == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
     for (i = 0; i < nrepeats; i++) {
+        /* the imaginary part of the last term, zero for even npts */
+        rptr[rstep - 1] = 0.0;
         memcpy((char *)(rptr+1), dptr, npts*sizeof(double));
-        rfftf(npts, rptr+1, wsave);
+        rfftf_scratch(npts, rptr+1, scratch, wsave);
         rptr[0] = rptr[1];
         rptr[1] = 0.0;
         rptr += rstep;
         dptr += npts;
     }
-    NPY_SIGINT_OFF;
+    NPY_END_ALLOW_THREADS;
+    free(scratch);
     PyArray_Free(op2, (char *)wsave);
     Py_DECREF(data);
     return (PyObject *)ret;
@@ -206,14 +279,14 @@ static char fftpack_rfftb__doc__[] ="";
 PyObject *
 fftpack_rfftb(PyObject *NPY_UNUSED(self), PyObject *args)
 {
-    PyObject *op1, *op2;
+    PyObject *op1, *op2, *out = NULL;
     PyArrayObject *data, *ret;
     PyArray_Descr *descr;
-    double *wsave, *dptr, *rptr;
+    double *wsave, *dptr, *rptr, *scratch;
     npy_intp nsave;
     int npts, nrepeats, i;
 
-    if(!PyArg_ParseTuple(args, "OO", &op1, &op2)) {
+    if(!PyArg_ParseTuple(args, "OO|O", &op1, &op2, &out)) {
         return NULL;
     }
     data = (PyArrayObject *)PyArray_ContiguousFromObject(op1,
@@ -222,8 +295,11 @@ fftpack_rfftb(PyObject *NPY_UNUSED(self), PyObject *args)
         return NULL;
     }
     npts = data->dimensions[data->nd - 1];
-    ret = (PyArrayObject *)PyArray_Zeros(data->nd, data->dimensions,
-            PyArray_DescrFromType(PyArray_DOUBLE), 0);
+    ret = get_output(out, data->nd, data->dimensions, PyArray_DOUBLE);
+    if (ret == NULL) {
+        Py_DECREF(data);
+        return NULL;
+    }
 
     descr = PyArray_DescrFromType(PyArray_DOUBLE);
     if (PyArray_AsCArray(&op2, (void *)&wsave, &nsave, 1, descr) == -1) {
@@ -241,15 +317,21 @@ fftpack_rfftb(PyObject *NPY_UNUSED(self), PyObject *args)
     rptr = (double *)ret->data;
     dptr = (double *)data->data;
 
-    NPY_SIGINT_ON;
+    scratch = malloc(npts*sizeof(double));
+    if (scratch == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
     for (i = 0; i < nrepeats; i++) {
         memcpy((char *)(rptr + 1), (dptr + 2), (npts - 1)*sizeof(double));
         rptr[0] = dptr[0];
-        rfftb(npts, rptr, wsave);
+        rfftb_scratch(npts, rptr, scratch, wsave);
         rptr += npts;
         dptr += npts*2;
     }
-    NPY_SIGINT_OFF;
+    NPY_END_ALLOW_THREADS;
+    free(scratch);
     PyArray_Free(op2, (char *)wsave);
     Py_DECREF(data);
     return (PyObject *)ret;
@@ -289,6 +371,165 @@ fftpack_rffti(PyObject *NPY_UNUSED(self), PyObject *args)
 }
 
 
+static char fftpack_cfftn__doc__[] =
+"cfftn(a, axes, wsaves, backward)\n\n"
+"Complex transform of `a` along each of `axes` in turn, wsaves[i] being\n"
+"the cffti work array for the length of axes[i].  The input is copied\n"
+"once and all axes are transformed in place on the strided copy.";
+
+/*
+ * Number of lines along a strided axis that are gathered into the work
+ * buffer together; consecutive lines are adjacent in memory, so copying
+ * them row by row touches contiguous blocks.
+ */
+#define FFTN_BLOCK 16
+
+static PyObject *
+fftpack_cfftn(PyObject *NPY_UNUSED(self), PyObject *args)
+{
+    PyObject *op1, *axes, *wsaves, *w = NULL;
+    PyArrayObject *data, *wsave = NULL;
+    double *buf = NULL, *scratch = NULL, *wptr, *line, *bptr;
+    npy_intp outer, inner, o, i, j, k, nblock;
+    int backward, naxes, iax, axis, npts, nd;
+
+    if (!PyArg_ParseTuple(args, "OOOi", &op1, &axes, &wsaves, &backward)) {
+        return NULL;
+    }
+    data = (PyArrayObject *)PyArray_CopyFromObject(op1,
+            PyArray_CDOUBLE, 0, 0);
+    if (data == NULL) {
+        return NULL;
+    }
+    nd = data->nd;
+    naxes = PySequence_Size(axes);
+    if (naxes < 0 || PySequence_Size(wsaves) != naxes) {
+        PyErr_SetString(PyExc_ValueError,
+                        "axes and wsaves must be sequences of equal length");
+        goto fail;
+    }
+    if (PyArray_SIZE(data) == 0) {
+        return (PyObject *)data;
+    }
+
+    for (iax = 0; iax < naxes; iax++) {
+        w = PySequence_GetItem(axes, iax);
+        if (w == NULL) {
+            goto fail;
+        }
+        axis = PyInt_AsLong(w);
+        Py_DECREF(w);
+        if (axis == -1 && PyErr_Occurred()) {
+            goto fail;
+        }
+        if (axis < 0) {
+            axis += nd;
+        }
+        if (axis < 0 || axis >= nd) {
+            PyErr_SetString(PyExc_ValueError, "invalid axis for cfftn");
+            goto fail;
+        }
+        w = PySequence_GetItem(wsaves, iax);
+        if (w == NULL) {
+            goto fail;
+        }
+        wsave = (PyArrayObject *)PyArray_ContiguousFromObject(w,
+                PyArray_DOUBLE, 1, 1);
+        Py_DECREF(w);
+        if (wsave == NULL) {
+            goto fail;
+        }
+        npts = data->dimensions[axis];
+        if (PyArray_SIZE(wsave) != npts*4 + 15) {
+            PyErr_SetString(ErrorObject, "invalid work array for fft size");
+            goto fail;
+        }
+        wptr = (double *)wsave->data;
+
+        outer = 1;
+        for (k = 0; k < axis; k++) {
+            outer *= data->dimensions[k];
+        }
+        inner = PyArray_SIZE(data) / (outer*npts);
+
+        scratch = malloc(npts*2*sizeof(double));
+        if (scratch == NULL) {
+            PyErr_NoMemory();
+            goto fail;
+        }
+        if (inner == 1) {
+            /* contiguous lines, transform in place */
+            line = (double *)data->data;
+            NPY_BEGIN_ALLOW_THREADS;
+            for (o = 0; o < outer; o++) {
+                if (backward) {
+                    cfftb_scratch(npts, line, scratch, wptr);
+                }
+                else {
+                    cfftf_scratch(npts, line, scratch, wptr);
+                }
+                line += 2*npts;
+            }
+            NPY_END_ALLOW_THREADS;
+        }
+        else {
+            buf = malloc(FFTN_BLOCK*npts*2*sizeof(double));
+            if (buf == NULL) {
+                PyErr_NoMemory();
+                goto fail;
+            }
+            NPY_BEGIN_ALLOW_THREADS;
+            for (o = 0; o < outer; o++) {
+                for (i = 0; i < inner; i += nblock) {
+                    line = (double *)data->data + 2*(o*npts*inner + i);
+                    nblock = inner - i;
+                    if (nblock > FFTN_BLOCK) {
+                        nblock = FFTN_BLOCK;
+                    }
+                    /* gather nblock lines, buf holds them one after another */
+                    for (j = 0; j < npts; j++) {
+                        double *src = line + 2*j*inner;
+                        for (k = 0; k < nblock; k++) {
+                            buf[2*(k*npts + j)] = src[2*k];
+                            buf[2*(k*npts + j) + 1] = src[2*k + 1];
+                        }
+                    }
+                    for (k = 0, bptr = buf; k < nblock; k++, bptr += 2*npts) {
+                        if (backward) {
+                            cfftb_scratch(npts, bptr, scratch, wptr);
+                        }
+                        else {
+                            cfftf_scratch(npts, bptr, scratch, wptr);
+                        }
+                    }
+                    for (j = 0; j < npts; j++) {
+                        double *dst = line + 2*j*inner;
+                        for (k = 0; k < nblock; k++) {
+                            dst[2*k] = buf[2*(k*npts + j)];
+                            dst[2*k + 1] = buf[2*(k*npts + j) + 1];
+                        }
+                    }
+                }
+            }
+            NPY_END_ALLOW_THREADS;
+            free(buf);
+            buf = NULL;
+        }
+        free(scratch);
+        scratch = NULL;
+        Py_DECREF(wsave);
+        wsave = NULL;
+    }
+    return (PyObject *)data;
+
+fail:
+    free(buf);
+    free(scratch);
+    Py_XDECREF(wsave);
+    Py_DECREF(data);
+    return NULL;
+}
+
 /* List of methods defined in the module */
 
 static struct PyMethodDef fftpack_methods[] = {
@@ -298,6 +539,7 @@ static struct PyMethodDef fftpack_methods[] = {
     {"rfftf",   fftpack_rfftf,  1,      fftpack_rfftf__doc__},
     {"rfftb",   fftpack_rfftb,  1,      fftpack_rfftb__doc__},
     {"rffti",   fftpack_rffti,  1,      fftpack_rffti__doc__},
+    {"cfftn",   fftpack_cfftn,  1,      fftpack_cfftn__doc__},
     {NULL, NULL, 0, NULL}          /* sentinel */
 };
 
@@ -3,12 +3,16 @@ Discrete Fourier Transforms - helper.py
 """
 # Created by Pearu Peterson, September 2002
 
-__all__ = ['fftshift','ifftshift','fftfreq']
+__all__ = ['fftshift','ifftshift','fftfreq','next_fast_len']
 
 from numpy.core import asarray, concatenate, arange, take, \
     integer, empty
 import numpy.core.numerictypes as nt
 import types
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
 
 def fftshift(x,axes=None):
     """
@@ -160,3 +164,152 @@ def fftfreq(n,d=1.0):
     results[N:] = p2
     return results * val
     #return hstack((arange(0,(n-1)/2 + 1), arange(-(n/2),0))) / (n*d)
+
+
+def next_fast_len(n):
+    """
+    Return the smallest length not less than `n` that is fast to transform.
+
+    FFTPACK has specialized kernels for the factors 2, 3, 4 and 5, so
+    lengths of the form ``2**a * 3**b * 5**c`` transform fastest.  Zero
+    padding the input of `fft` up to such a length trades a slightly
+    different frequency grid for speed.
+
+    Parameters
+    ----------
+    n : int
+        Minimum length, must be positive.
+
+    Returns
+    -------
+    out : int
+        The smallest integer ``>= n`` with no prime factor larger than 5.
+
+    See Also
+    --------
+    fft : The transform that benefits from the padding.
+
+    Examples
+    --------
+    >>> np.fft.next_fast_len(97)
+    100
+    >>> np.fft.next_fast_len(100003)
+    101250
+
+    """
+    if not isinstance(n, (int, long, integer)) or n < 1:
+        raise ValueError("n must be a positive integer")
+    n = int(n)
+    best = None
+    p5 = 1
+    while True:
+        p35 = p5
+        while True:
+            p235 = p35
+            while p235 < n:
+                p235 *= 2
+            if best is None or p235 < best:
+                best = p235
+            if p35 >= n:
+                break
+            p35 *= 3
+        if p5 >= n:
+            break
+        p5 *= 5
+    return best
+
+
+class _FFTCache(object):
+    """
+    Cache for the FFTPACK work arrays (twiddle factors), keyed by length.
+
+    The cache is bounded: once it holds more than `max_item_count` plans
+    or more than `max_size_in_mb` megabytes, the least recently used
+    plans are dropped.  The most recently used plan is always kept, so a
+    single huge transform still benefits from the cache.
+
+    Callers take a plan out with `pop_twiddle_factors` and give it back
+    with `put_twiddle_factors` when done, so plans in use are never
+    evicted or counted twice; a concurrent caller asking for the same
+    length meanwhile simply gets a fresh plan.  All access to the cache is
+    serialized by a lock.
+
+    Parameters
+    ----------
+    max_size_in_mb : float
+        Soft limit on the memory used by the cached plans.
+    max_item_count : int
+        Limit on the number of cached plans.
+
+    """
+    def __init__(self, max_size_in_mb, max_item_count):
+        self._max_size_in_bytes = max_size_in_mb * 1024 ** 2
+        self._max_item_count = max_item_count
+        # length -> list of plans, and the lengths from least to most
+        # recently used
+        self._dict = {}
+        self._order = []
+        self._size_in_bytes = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def put_twiddle_factors(self, n, factors):
+        """Store (or give back) the work array `factors` for length `n`."""
+        self._lock.acquire()
+        try:
+            if n in self._dict:
+                self._dict[n].append(factors)
+                self._order.remove(n)
+            else:
+                self._dict[n] = [factors]
+            self._order.append(n)
+            self._size_in_bytes += factors.nbytes
+            self._count += 1
+            self._prune()
+        finally:
+            self._lock.release()
+
+    def pop_twiddle_factors(self, n):
+        """
+        Remove and return a work array for length `n`, or None if there
+        is none.
+
+        """
+        self._lock.acquire()
+        try:
+            plans = self._dict.get(n)
+            if not plans:
+                return None
+            factors = plans.pop()
+            if not plans:
+                del self._dict[n]
+                self._order.remove(n)
+            self._size_in_bytes -= factors.nbytes
+            self._count -= 1
+            return factors
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        """Drop all cached plans."""
+        self._lock.acquire()
+        try:
+            self._dict.clear()
+            del self._order[:]
+            self._size_in_bytes = 0
+            self._count = 0
+        finally:
+            self._lock.release()
+
+    def __len__(self):
+        return self._count
+
+    def _prune(self):
+        # called with the lock held
+        while len(self._order) > 1 and (
+                self._count > self._max_item_count or
+                self._size_in_bytes > self._max_size_in_bytes):
+            n = self._order.pop(0)
+            for factors in self._dict.pop(n):
+                self._size_in_bytes -= factors.nbytes
+                self._count -= 1
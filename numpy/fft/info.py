@@ -51,6 +51,7 @@ Helper routines
    fftfreq   Discrete Fourier Transform sample frequencies.
    fftshift  Shift zero-frequency component to center of spectrum.
    ifftshift Inverse of fftshift.
+   next_fast_len Smallest length >= n that FFTPACK transforms quickly.
 
 Background information
 ----------------------
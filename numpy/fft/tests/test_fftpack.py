@@ -19,5 +19,123 @@ class TestFFT1D(TestCase):
         assert_array_almost_equal(fft1(x), np.fft.fft(x))
 
 
+class TestFFTPrimeLength(TestCase):
+    # lengths with a large prime factor are done with Bluestein's algorithm
+    def setUp(self):
+        np.random.seed(1234)
+
+    def test_complex(self):
+        for n in [101, 211, 2*211, 3*5*101]:
+            x = np.random.rand(n) + 1j*np.random.rand(n)
+            assert_array_almost_equal(np.fft.fft(x), fft1(x), decimal=10)
+            assert_array_almost_equal(np.fft.ifft(np.fft.fft(x)), x)
+        x = np.random.rand(3, 211, 4) + 1j
+        assert_array_almost_equal(np.fft.fft(x, axis=1),
+                                  np.fft.fft(x.swapaxes(1, 2)).swapaxes(1, 2))
+        assert_array_almost_equal(np.fft.ifftn(np.fft.fftn(x)), x)
+        x = np.random.rand(150) + 0j
+        assert_array_almost_equal(np.fft.fft(x, 211), fft1(np.r_[x, [0]*61]),
+                                  decimal=10)
+
+    def test_real(self):
+        for n in [211, 212*2 - 1, 2*211]:
+            x = np.random.rand(n)
+            assert_array_almost_equal(np.fft.rfft(x), fft1(x)[:n//2 + 1],
+                                      decimal=10)
+            assert_array_almost_equal(np.fft.irfft(np.fft.rfft(x), n), x)
+        y = np.fft.rfft(np.random.rand(2*211))
+        assert_array_almost_equal(np.fft.irfft(y, 211),
+                                  np.fft.ifft(np.r_[y[:106],
+                                                    y[105:0:-1].conj()]).real)
+
+
+class TestFFTND(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        self.x = np.random.rand(4, 5, 6) + 1j*np.random.rand(4, 5, 6)
+
+    def loop(self, function, a, s, axes):
+        # reference: one axis at a time
+        s, axes = np.fft.fftpack._cook_nd_args(a, s, axes)
+        for ii in reversed(range(len(axes))):
+            a = function(a, n=s[ii], axis=axes[ii])
+        return a
+
+    def test_fftn(self):
+        x = self.x
+        for s, axes in [(None, None), (None, (0, 2)), ((3, 8), (2, 0)),
+                        ((2, 9), (-1, 1)), (None, (1, 1)), ((4, 4, 4), None)]:
+            assert_array_almost_equal(np.fft.fftn(x, s, axes),
+                                      self.loop(np.fft.fft, x, s, axes))
+            assert_array_almost_equal(np.fft.ifftn(x, s, axes),
+                                      self.loop(np.fft.ifft, x, s, axes))
+        assert_array_almost_equal(np.fft.fft2(x[::2, :, ::-3]),
+                                  self.loop(np.fft.fft, x[::2, :, ::-3],
+                                            None, (-2, -1)))
+        assert_array_almost_equal(np.fft.ifftn(np.fft.fftn(x)), x)
+
+    def test_rfftn(self):
+        x = self.x.real
+        assert_array_almost_equal(np.fft.rfftn(x),
+                                  np.fft.fftn(x)[..., :4])
+        assert_array_almost_equal(np.fft.irfftn(np.fft.rfftn(x), x.shape), x)
+        assert_array_almost_equal(np.fft.irfft2(np.fft.rfft2(x)), x)
+
+
+class TestFFTThreads(TestCase):
+    def test_threads_argument(self):
+        np.random.seed(1234)
+        x = np.random.rand(7, 16, 5) + 1j*np.random.rand(7, 16, 5)
+        for f in [np.fft.fft, np.fft.ifft, np.fft.rfft, np.fft.irfft,
+                  np.fft.hfft, np.fft.ihfft]:
+            a = x
+            if f in (np.fft.rfft, np.fft.ihfft):
+                a = x.real
+            for axis in [0, 1, -1]:
+                for threads in [2, 3, 100]:
+                    assert_array_equal(f(a, axis=axis, threads=threads),
+                                       f(a, axis=axis))
+        assert_array_almost_equal(np.fft.fft(x[:, :2, :2], 211, 1, threads=2),
+                                  np.fft.fft(x[:, :2, :2], 211, 1))
+        assert_equal(np.fft.fft(np.zeros((0, 4)), threads=2).shape, (0, 4))
+        assert_raises(ValueError, np.fft.fft, x, threads=0)
+
+    def test_output_argument(self):
+        from numpy.fft import fftpack_lite
+        x = np.random.rand(4, 8) + 1j*np.random.rand(4, 8)
+        wsave = fftpack_lite.cffti(8)
+        out = np.empty((4, 8), complex)
+        r = fftpack_lite.cfftf(x, wsave, out)
+        assert_(r is out)
+        assert_array_almost_equal(out, np.fft.fft(x))
+        out = np.empty((4, 5), complex)
+        r = fftpack_lite.rfftf(x.real, fftpack_lite.rffti(8), out)
+        assert_(r is out)
+        assert_array_almost_equal(out, np.fft.rfft(x.real))
+        for bad in [np.empty((4, 8)), np.empty((4, 7), complex),
+                    np.empty((8, 8), complex)[::2]]:
+            assert_raises(ValueError, fftpack_lite.cfftf, x, wsave, bad)
+
+
+class TestFFTThreadSafety(TestCase):
+    def test_threads(self):
+        import threading
+        np.random.seed(1234)
+        data = [np.random.rand(n) + 1j for n in [30, 31, 30, 64, 31, 30]]
+        expected = [fft1(x) for x in data]
+        errors = []
+        def worker(i):
+            for k in range(20):
+                if not np.allclose(np.fft.fft(data[i]), expected[i]):
+                    errors.append(i)
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(len(data))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert_equal(errors, [])
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -4,7 +4,9 @@
 """
 
 from numpy.testing import *
-from numpy.fft import fftshift,ifftshift,fftfreq
+from numpy.fft import fftshift,ifftshift,fftfreq,next_fast_len
+from numpy.fft.helper import _FFTCache
+import numpy as np
 
 from numpy import pi
 
@@ -46,5 +48,56 @@ class TestFFTFreq(TestCase):
         assert_array_almost_equal(10*pi*fftfreq(10,pi),x)
 
 
+class TestNextFastLen(TestCase):
+    def test_definition(self):
+        def smooth(n):
+            for p in [2, 3, 5]:
+                while n % p == 0:
+                    n //= p
+            return n == 1
+        for n in range(1, 1000):
+            m = next_fast_len(n)
+            assert_(m >= n and smooth(m))
+            assert_(not [k for k in range(n, m) if smooth(k)])
+        assert_equal(next_fast_len(100003), 101250)
+        assert_equal(next_fast_len(np.int32(97)), 100)
+
+    def test_invalid(self):
+        assert_raises(ValueError, next_fast_len, 0)
+        assert_raises(ValueError, next_fast_len, 2.5)
+
+
+class TestFFTCache(TestCase):
+    def test_pop_put(self):
+        c = _FFTCache(max_size_in_mb=1, max_item_count=4)
+        assert_(c.pop_twiddle_factors(8) is None)
+        w = np.ones(47)
+        c.put_twiddle_factors(8, w)
+        assert_(c.pop_twiddle_factors(8) is w)
+        assert_(c.pop_twiddle_factors(8) is None)
+        assert_equal(len(c), 0)
+
+    def test_item_count(self):
+        c = _FFTCache(max_size_in_mb=1, max_item_count=4)
+        for n in range(1, 7):
+            c.put_twiddle_factors(n, np.ones(n))
+        assert_equal(len(c), 4)
+        # the least recently used lengths went first
+        assert_(c.pop_twiddle_factors(2) is None)
+        assert_(c.pop_twiddle_factors(3) is not None)
+        c.clear()
+        assert_equal(len(c), 0)
+
+    def test_size(self):
+        c = _FFTCache(max_size_in_mb=1, max_item_count=100)
+        c.put_twiddle_factors(1, np.ones(2**17))
+        c.put_twiddle_factors(2, np.ones(2**17))
+        assert_equal(len(c), 1)
+        # the last plan is kept even if it alone is over the limit
+        c.put_twiddle_factors(3, np.ones(2**18))
+        assert_equal(len(c), 1)
+        assert_(c.pop_twiddle_factors(3) is not None)
+
+
 if __name__ == "__main__":
     run_module_suite()
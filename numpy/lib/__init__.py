@@ -18,6 +18,7 @@ from npyio import *
 from financial import *
 import math
 from arrayterator import *
+from chunked import *
 
 __all__ = ['emath','math']
 __all__ += type_check.__all__
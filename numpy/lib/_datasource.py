@@ -35,6 +35,7 @@ Example::
 __docformat__ = "restructuredtext en"
 
 import os
+import threading
 from shutil import rmtree, copyfile, copyfileobj
 
 _open = open
@@ -109,7 +110,29 @@ class _FileOpeners(object):
 
 _file_openers = _FileOpeners()
 
-def open(path, mode='r', destpath=os.curdir):
+# Name of the index of the downloaded files in the DataSource directories,
+# and the lock serializing its updates within this process.
+_INDEX_NAME = '.datasource-index'
+_index_lock = threading.Lock()
+
+def _now():
+    import time
+    return time.time()
+
+def _same_remote(entry, etag, modified, length):
+    """
+    Test whether the remote file described by the response headers `etag`,
+    `modified` and `length` is the one recorded in the index `entry`.
+
+    """
+    size, atime, cached_etag, cached_modified = entry
+    if etag or cached_etag:
+        return etag == cached_etag
+    if not modified or modified != cached_modified:
+        return False
+    return length is not None and int(length) == size
+
+def open(path, mode='r', destpath=os.curdir, cache_size=None, validate=False):
     """
     Open `path` with `mode` and return the file object.
 
@@ -128,6 +151,12 @@ def open(path, mode='r', destpath=os.curdir):
         Path to the directory where the source file gets downloaded to for use.
         If `destpath` is None, a temporary directory will be created. The
         default path is the current directory.
+    cache_size : int, optional
+        Maximum number of bytes of downloaded files kept in `destpath`.
+        See `DataSource`.
+    validate : bool, optional
+        Whether to check that a downloaded file is still up to date before
+        opening it. See `DataSource`.
 
     Returns
     -------
@@ -141,13 +170,13 @@ def open(path, mode='r', destpath=os.curdir):
 
     """
 
-    ds = DataSource(destpath)
+    ds = DataSource(destpath, cache_size=cache_size, validate=validate)
     return ds.open(path, mode)
 
 
 class DataSource (object):
     """
-    DataSource(destpath='.')
+    DataSource(destpath='.', cache_size=None, validate=False)
 
     A generic data source file (file, http, ftp, ...).
 
@@ -162,6 +191,17 @@ class DataSource (object):
         Path to the directory where the source file gets downloaded to for use.
         If `destpath` is None, a temporary directory will be created.
         The default path is the current directory.
+    cache_size : int, optional
+        Maximum number of bytes of downloaded files to keep in `destpath`.
+        When a download brings the total over this size, the least recently
+        used downloaded files are deleted. Default is None, which keeps
+        every file.
+    validate : bool, optional
+        If True, a downloaded file is checked against the remote file each
+        time it is opened, and downloaded again if the remote file changed.
+        The check compares the ETag, or the size and modification time, the
+        server reported when the file was downloaded. Default is False,
+        which always uses the downloaded file.
 
     Notes
     -----
@@ -176,6 +216,13 @@ class DataSource (object):
 
     Temporary directories are deleted when the DataSource is deleted.
 
+    If `cache_size` is given or `validate` is True, the downloaded files
+    are recorded, with their size, last access time and remote validators,
+    in an index file named ``.datasource-index`` in `destpath`. Only the
+    files recorded in the index are ever deleted. DataSource instances
+    sharing a `destpath` share its index, so the function `open` can be used
+    with a bounded cache.
+
     Examples
     --------
     ::
@@ -194,7 +241,7 @@ class DataSource (object):
 
     """
 
-    def __init__(self, destpath=os.curdir):
+    def __init__(self, destpath=os.curdir, cache_size=None, validate=False):
         """Create a DataSource with a local path at destpath."""
         if destpath:
             self._destpath = os.path.abspath(destpath)
@@ -203,6 +250,10 @@ class DataSource (object):
             import tempfile # deferring import to improve startup time
             self._destpath = tempfile.mkdtemp()
             self._istmpdest = True
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self._cache_size = cache_size
+        self._validate = validate
 
     def __del__(self):
         # Remove temp directories
@@ -262,6 +313,10 @@ class DataSource (object):
         scheme, netloc, upath, uparams, uquery, ufrag = urlparse(path)
         return bool(scheme and netloc)
 
+    def _ismanaged(self):
+        """Test if downloaded files are recorded in the cache index."""
+        return self._cache_size is not None or self._validate
+
     def _cache(self, path):
         """Cache the file specified by path.
 
@@ -277,10 +332,17 @@ class DataSource (object):
 
         # ensure directory exists
         if not os.path.exists(os.path.dirname(upath)):
-            os.makedirs(os.path.dirname(upath))
+            try:
+                os.makedirs(os.path.dirname(upath))
+            except OSError:
+                # Another thread may have created it meanwhile
+                if not os.path.isdir(os.path.dirname(upath)):
+                    raise
 
         # TODO: Doesn't handle compressed files!
         if self._isurl(path):
+            if self._ismanaged():
+                return self._cache_managed(path, upath)
             try:
                 openedurl = urlopen(path)
                 f = _open(upath, 'wb')
@@ -291,9 +353,215 @@ class DataSource (object):
             except URLError:
                 raise URLError("URL not found: %s" % path)
         else:
-            shutil.copyfile(path, upath)
+            copyfile(path, upath)
+        return upath
+
+    def _cache_managed(self, path, upath):
+        """Download the URL `path` to `upath` and record it in the index.
+
+        If `upath` already holds the remote file, as told by the validators
+        stored in the index, it is not downloaded again.
+
+        """
+        from urllib2 import urlopen, Request
+        from urllib2 import URLError, HTTPError
+        import tempfile
+
+        key = self._index_key(upath)
+        entry = self._update_index(lambda index: index.get(key))
+        if not os.path.exists(upath):
+            entry = None
+        request = Request(path)
+        if entry is not None:
+            etag, modified = entry[2], entry[3]
+            if etag:
+                request.add_header('If-None-Match', etag)
+            if modified:
+                request.add_header('If-Modified-Since', modified)
+        try:
+            openedurl = urlopen(request)
+        except HTTPError, e:
+            if e.code == 304 and entry is not None:
+                self._touch(key)
+                return upath
+            raise URLError("URL not found: %s" % path)
+        except URLError:
+            raise URLError("URL not found: %s" % path)
+
+        try:
+            info = openedurl.info()
+            etag = info.get('ETag')
+            modified = info.get('Last-Modified')
+            length = info.get('Content-Length')
+            if entry is not None and _same_remote(entry, etag, modified,
+                                                  length):
+                self._touch(key)
+                return upath
+            # Download to a temporary file which then replaces the cached
+            # one, so that concurrent readers never see a partial file.
+            fd, tmppath = tempfile.mkstemp(dir=os.path.dirname(upath),
+                                           prefix='.download-')
+            try:
+                f = os.fdopen(fd, 'wb')
+                try:
+                    copyfileobj(openedurl, f)
+                finally:
+                    f.close()
+                if os.name == 'nt' and os.path.exists(upath):
+                    os.remove(upath)
+                os.rename(tmppath, upath)
+            except:
+                if os.path.exists(tmppath):
+                    os.remove(tmppath)
+                raise
+        finally:
+            openedurl.close()
+
+        size = os.path.getsize(upath)
+        def add(index):
+            index[key] = [size, _now(), etag, modified]
+            self._evict(index, key)
+        self._update_index(add)
         return upath
 
+    def _index_key(self, upath):
+        """Return the key of the cached file `upath` in the index."""
+        return upath[len(self._destpath):].lstrip(os.sep)
+
+    def _update_index(self, func):
+        """Call `func` with the cache index and save the index afterwards.
+
+        The index is a dictionary that maps the paths of the downloaded
+        files, relative to the DataSource directory, to lists
+        ``[size, last access time, ETag, Last-Modified]``. It is read from
+        disk on every call, so that all the DataSource instances using the
+        same directory share it. Returns what `func` returns.
+
+        """
+        import cPickle
+        import tempfile
+        indexpath = os.path.join(self._destpath, _INDEX_NAME)
+        _index_lock.acquire()
+        try:
+            try:
+                f = _open(indexpath, 'rb')
+                try:
+                    index = cPickle.load(f)
+                finally:
+                    f.close()
+            except (IOError, EOFError, cPickle.UnpicklingError):
+                index = {}
+            original = dict(index)
+            result = func(index)
+            if index != original:
+                if not os.path.isdir(self._destpath):
+                    os.makedirs(self._destpath)
+                fd, tmppath = tempfile.mkstemp(dir=self._destpath,
+                                               prefix=_INDEX_NAME)
+                f = os.fdopen(fd, 'wb')
+                try:
+                    cPickle.dump(index, f, 2)
+                finally:
+                    f.close()
+                if os.name == 'nt' and os.path.exists(indexpath):
+                    os.remove(indexpath)
+                os.rename(tmppath, indexpath)
+            return result
+        finally:
+            _index_lock.release()
+
+    def _touch(self, key):
+        """Record an access to the cached file `key` in the index."""
+        def touch(index):
+            if key in index:
+                index[key] = [index[key][0], _now()] + index[key][2:]
+        self._update_index(touch)
+
+    def _evict(self, index, keep):
+        """Remove the least recently used files until the cache fits.
+
+        The file `keep`, which was just downloaded, is never removed.
+
+        """
+        if self._cache_size is None:
+            return
+        # Forget the files that were deleted behind our back.
+        for key in index.keys():
+            if not os.path.exists(os.path.join(self._destpath, key)):
+                del index[key]
+        total = sum([entry[0] for entry in index.values()])
+        lru = [(entry[1], key) for key, entry in index.items()]
+        lru.sort()
+        for atime, key in lru:
+            if total <= self._cache_size:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(os.path.join(self._destpath, key))
+            except OSError:
+                continue
+            total -= index.pop(key)[0]
+
+    def prefetch(self, paths, threads=4):
+        """
+        Download several files concurrently.
+
+        The URLs among `paths` that are not already in the DataSource
+        directory (or are stale, if `validate` is True) are downloaded on a
+        pool of threads.
+
+        Parameters
+        ----------
+        paths : sequence of str
+            Local file paths or URLs.
+        threads : int, optional
+            Maximum number of concurrent downloads. Default is 4.
+
+        Returns
+        -------
+        out : list of str
+            The local paths of the files, in the order of `paths`.
+
+        Raises
+        ------
+        IOError
+            If one of the files is not found.
+
+        """
+        import Queue
+        import sys
+
+        paths = list(paths)
+        todo = Queue.Queue()
+        for i, path in enumerate(paths):
+            todo.put((i, path))
+        found = [None] * len(paths)
+        errors = []
+
+        def worker():
+            while 1:
+                try:
+                    i, path = todo.get_nowait()
+                except Queue.Empty:
+                    return
+                try:
+                    found[i] = self._findfile(path)
+                    if found[i] is None:
+                        raise IOError("%s not found." % path)
+                except:
+                    errors.append(sys.exc_info())
+
+        pool = [threading.Thread(target=worker)
+                for i in range(max(min(threads, len(paths)), 1))]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        if errors:
+            raise errors[0][0], errors[0][1], errors[0][2]
+        return found
+
     def _findfile(self, path):
         """Searches for ``path`` and returns full path if found.
 
@@ -314,6 +582,8 @@ class DataSource (object):
             # Paths in self._destpath
             filelist += self._possible_names(self.abspath(path))
         else:
+            if self._ismanaged():
+                return self._findurl(path)
             # Cached URLs in self._destpath
             filelist = self._possible_names(self.abspath(path))
             # Remote URLs
@@ -326,6 +596,30 @@ class DataSource (object):
                 return name
         return None
 
+    def _findurl(self, path):
+        """_findfile for URLs when downloaded files are managed."""
+        from urllib2 import URLError
+
+        # Cached URLs in self._destpath
+        for url in self._possible_names(path):
+            upath = self.abspath(url)
+            if os.path.exists(upath):
+                if self._validate:
+                    try:
+                        return self._cache(url)
+                    except URLError:
+                        # The server is unreachable, use the cached copy
+                        pass
+                self._touch(self._index_key(upath))
+                return upath
+        # Remote URLs
+        for url in self._possible_names(path):
+            try:
+                return self._cache(url)
+            except URLError:
+                pass
+        return None
+
     def abspath(self, path):
         """
         Return absolute path of file in the DataSource directory.
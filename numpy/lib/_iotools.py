@@ -384,6 +384,11 @@ class NameValidator:
 
 
 
+def _int_from_float(value):
+    """Convert a string to an integer, going through a float first."""
+    return int(float(value))
+
+
 def str2bool(value):
     """
     Tries to transform a string supposed to represent a boolean to a boolean.
@@ -602,7 +607,7 @@ class StringConverter:
                 self.func = func
             # If the status is 1 (int), change the function to smthg more robust
             if self.func == self._mapper[1][1]:
-                self.func = lambda x : int(float(x))
+                self.func = _int_from_float
         # Store the list of strings corresponding to missing values.
         if missing_values is None:
             self.missing_values = set([asbytes('')])
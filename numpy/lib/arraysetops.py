@@ -1,5 +1,5 @@
 """
-Set operations for 1D numeric arrays based on sorting.
+Set operations for 1D numeric arrays based on sorting or hashing.
 
 :Contains:
   ediff1d,
@@ -24,6 +24,11 @@ Speed could be gained in some operations by an implementation of
 sort(), that can provide directly the permutation vectors, avoiding
 thus calls to argsort().
 
+The functions take a `method` argument choosing between sorting and the
+hash tables of `_compiled_base`, which find equal elements in linear
+time.  Hashing is used by default for large boolean, integer, floating
+point (except long double), complex and fixed-width string arrays.
+
 To do: Optionally return indices analogously to unique for all functions.
 
 :Author: Robert Cimrman
@@ -33,6 +38,73 @@ __all__ = ['ediff1d', 'unique1d', 'intersect1d', 'intersect1d_nu', 'setxor1d',
 
 import numpy as np
 from numpy.lib.utils import deprecate
+from numpy.lib._compiled_base import _unique_hash, _in1d_hash
+
+# Total number of elements from which the hash tables are used by default
+_HASH_MIN_SIZE = 2**10
+# Hash tables only pay off for finding unique values if these repeat: they
+# are used by default if at most this fraction of a sample of the elements,
+# one in _HASH_SAMPLE_STEP, is distinct
+_HASH_MAX_DISTINCT = 0.9
+_HASH_SAMPLE_STEP = 16
+
+def _use_hash(arrays, method, repeats=False):
+    """
+    Whether a set operation on `arrays` should use hash tables, given the
+    `method` argument.  With method None this depends on the dtype and on
+    the size of the arrays and, if `repeats` is True, on whether a sample
+    of their elements holds enough repeated values.
+    """
+    if method == 'sort':
+        return False
+    if method is not None and method != 'hash':
+        raise ValueError("method must be None, 'sort' or 'hash'")
+    arrays = [np.asarray(a) for a in arrays]
+    dt = np.concatenate([a.ravel()[:0] for a in arrays]).dtype
+    # The padding bytes of long doubles are undefined, so equal values
+    # may differ in the bytes the hash tables compare
+    if dt.kind not in 'biufcSU' or dt.char in 'gG' or dt.itemsize == 0:
+        if method == 'hash':
+            raise TypeError("method 'hash' does not support arrays of "
+                            "dtype %s" % dt)
+        return False
+    if method is None:
+        if np.sum([a.size for a in arrays]) < _HASH_MIN_SIZE:
+            return False
+        if repeats:
+            return _distinct_fraction(arrays) <= _HASH_MAX_DISTINCT
+    return True
+
+def _distinct_fraction(arrays):
+    """
+    Estimate the fraction of distinct values among the elements of `arrays`
+    from a strided sample of them.  With few distinct values this is well
+    below one, with all of them distinct it is one.
+    """
+    step = _HASH_SAMPLE_STEP
+    sample = np.concatenate([a.flat[::step] for a in arrays])
+    sample.sort()
+    return (1 + np.sum(sample[1:] != sample[:-1])) / float(sample.size)
+
+def _hash_keys(arrays):
+    """
+    Flatten `arrays` to contiguous arrays of a common, native dtype whose
+    elements are equal exactly when their bytes are, as needed by the
+    hash tables.  Returns None for floating point arrays holding nans,
+    which never compare equal and are left to the sort based code.
+    """
+    arrays = [np.asarray(a).ravel() for a in arrays]
+    dt = np.concatenate([a[:0] for a in arrays]).dtype.newbyteorder('=')
+    keys = []
+    for a in arrays:
+        a = np.ascontiguousarray(a, dtype=dt)
+        if dt.kind in 'fc':
+            if np.isnan(a).any():
+                return None
+            # -0.0 == 0.0 but the bytes differ
+            a = a + dt.type(0)
+        keys.append(a)
+    return keys
 
 def ediff1d(ary, to_end=None, to_begin=None):
     """
@@ -92,7 +164,7 @@ def ediff1d(ary, to_end=None, to_begin=None):
 
     return ed
 
-def unique(ar, return_index=False, return_inverse=False):
+def unique(ar, return_index=False, return_inverse=False, method=None):
     """
     Find the unique elements of an array.
 
@@ -111,6 +183,15 @@ def unique(ar, return_index=False, return_inverse=False):
     return_inverse : bool, optional
         If True, also return the indices of the unique array that can be used
         to reconstruct `ar`.
+    method : {None, 'sort', 'hash'}, optional
+        How equal elements are found.  'sort' sorts all the elements, 'hash'
+        puts them in a hash table, which takes linear time, and only sorts
+        the unique values.  'hash' supports boolean, integer, floating
+        point and complex arrays, except long double ones, and fixed-width
+        string arrays; floating point arrays holding nans are sorted.  The default, None, uses 'hash' for large
+        arrays of those types if `return_inverse` is True, or if a sample
+        of the elements shows that many of them are repeated.  Otherwise
+        sorting is faster.
 
     Returns
     -------
@@ -178,6 +259,11 @@ def unique(ar, return_index=False, return_inverse=False):
         else:
             return ar
 
+    if _use_hash([ar], method, repeats=not return_inverse):
+        keys = _hash_keys([ar])
+        if keys is not None:
+            return _unique_hashed(ar, keys[0], return_index, return_inverse)
+
     if return_inverse or return_index:
         perm = ar.argsort()
         aux = ar[perm]
@@ -197,8 +283,27 @@ def unique(ar, return_index=False, return_inverse=False):
         flag = np.concatenate(([True], ar[1:] != ar[:-1]))
         return ar[flag]
 
+def _unique_hashed(ar, key, return_index, return_inverse):
+    first, inverse = _unique_hash(key)
+    # only the unique values need sorting
+    if not return_index and not return_inverse:
+        ret = ar[first]
+        ret.sort()
+        return ret
+    order = ar[first].argsort()
+    ret = (ar[first[order]],)
+    if return_index:
+        ret += (first[order],)
+    if return_inverse:
+        rank = np.empty(len(order), np.intp)
+        rank[order] = np.arange(len(order))
+        ret += (rank[inverse],)
+    if len(ret) == 1:
+        return ret[0]
+    return ret
+
 
-def intersect1d(ar1, ar2, assume_unique=False):
+def intersect1d(ar1, ar2, assume_unique=False, method=None):
     """
     Find the intersection of two arrays.
 
@@ -211,6 +316,8 @@ def intersect1d(ar1, ar2, assume_unique=False):
     assume_unique : bool
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    method : {None, 'sort', 'hash'}, optional
+        How equal elements are found, see `unique`.
 
     Returns
     -------
@@ -228,6 +335,14 @@ def intersect1d(ar1, ar2, assume_unique=False):
     array([1, 3])
 
     """
+    if _use_hash([ar1, ar2], method, repeats=True):
+        if not assume_unique:
+            ar1 = unique(ar1, method=method)
+        aux = np.asarray(ar1).ravel()
+        aux = aux[in1d(aux, ar2, method=method)]
+        if assume_unique:
+            aux.sort()
+        return aux
     if not assume_unique:
         # Might be faster than unique( intersect1d( ar1, ar2 ) )?
         ar1 = unique(ar1)
@@ -236,7 +351,7 @@ def intersect1d(ar1, ar2, assume_unique=False):
     aux.sort()
     return aux[aux[1:] == aux[:-1]]
 
-def setxor1d(ar1, ar2, assume_unique=False):
+def setxor1d(ar1, ar2, assume_unique=False, method=None):
     """
     Find the set exclusive-or of two arrays.
 
@@ -250,6 +365,8 @@ def setxor1d(ar1, ar2, assume_unique=False):
     assume_unique : bool
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    method : {None, 'sort', 'hash'}, optional
+        How equal elements are found, see `unique`.
 
     Returns
     -------
@@ -265,6 +382,17 @@ def setxor1d(ar1, ar2, assume_unique=False):
     array([1, 4, 5, 7])
 
     """
+    if _use_hash([ar1, ar2], method, repeats=True):
+        if not assume_unique:
+            ar1 = unique(ar1, method=method)
+            ar2 = unique(ar2, method=method)
+        ar1 = np.asarray(ar1).ravel()
+        ar2 = np.asarray(ar2).ravel()
+        aux = np.concatenate((ar1[~in1d(ar1, ar2, method=method)],
+                              ar2[~in1d(ar2, ar1, method=method)]))
+        aux.sort()
+        return aux
+
     if not assume_unique:
         ar1 = unique(ar1)
         ar2 = unique(ar2)
@@ -280,7 +408,7 @@ def setxor1d(ar1, ar2, assume_unique=False):
     flag2 = flag[1:] == flag[:-1]
     return aux[flag2]
 
-def in1d(ar1, ar2, assume_unique=False):
+def in1d(ar1, ar2, assume_unique=False, method=None):
     """
     Test whether each element of a 1D array is also present in a second array.
 
@@ -296,6 +424,12 @@ def in1d(ar1, ar2, assume_unique=False):
     assume_unique : bool, optional
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    method : {None, 'sort', 'hash'}, optional
+        How equal elements are found.  'sort' sorts both arrays together,
+        'hash' puts `ar2` in a hash table and looks up the elements of
+        `ar1`, which takes linear time.  See `unique` for the supported
+        types; the default, None, uses 'hash' for large arrays of those
+        types.
 
     Returns
     -------
@@ -326,6 +460,11 @@ def in1d(ar1, ar2, assume_unique=False):
     array([0, 2, 0])
 
     """
+    if _use_hash([ar1, ar2], method):
+        keys = _hash_keys([ar1, ar2])
+        if keys is not None:
+            return _in1d_hash(keys[0], keys[1])
+
     if not assume_unique:
         ar1, rev_idx = np.unique(ar1, return_inverse=True)
         ar2 = np.unique(ar2)
@@ -345,7 +484,7 @@ def in1d(ar1, ar2, assume_unique=False):
     else:
         return flag[indx][rev_idx]
 
-def union1d(ar1, ar2):
+def union1d(ar1, ar2, method=None):
     """
     Find the union of two arrays.
 
@@ -356,6 +495,8 @@ def union1d(ar1, ar2):
     ----------
     ar1, ar2 : array_like
         Input arrays. They are flattened if they are not already 1D.
+    method : {None, 'sort', 'hash'}, optional
+        How equal elements are found, see `unique`.
 
     Returns
     -------
@@ -373,9 +514,9 @@ def union1d(ar1, ar2):
     array([-2, -1,  0,  1,  2])
 
     """
-    return unique( np.concatenate( (ar1, ar2) ) )
+    return unique( np.concatenate( (ar1, ar2) ), method=method )
 
-def setdiff1d(ar1, ar2, assume_unique=False):
+def setdiff1d(ar1, ar2, assume_unique=False, method=None):
     """
     Find the set difference of two arrays.
 
@@ -390,6 +531,8 @@ def setdiff1d(ar1, ar2, assume_unique=False):
     assume_unique : bool
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    method : {None, 'sort', 'hash'}, optional
+        How equal elements are found, see `unique`.
 
     Returns
     -------
@@ -410,9 +553,10 @@ def setdiff1d(ar1, ar2, assume_unique=False):
 
     """
     if not assume_unique:
-        ar1 = unique(ar1)
-        ar2 = unique(ar2)
-    aux = in1d(ar1, ar2, assume_unique=True)
+        ar1 = unique(ar1, method=method)
+        if not _use_hash([ar1, ar2], method):
+            ar2 = unique(ar2)
+    aux = in1d(ar1, ar2, assume_unique=True, method=method)
     if aux.size == 0:
         return aux
     else:
@@ -15,8 +15,12 @@ from operator import mul
 __all__ = ['Arrayterator']
 
 import sys
+import threading
 if sys.version_info[0] >= 3:
     from functools import reduce
+    import queue as Queue
+else:
+    import Queue
 
 class Arrayterator(object):
     """
@@ -40,6 +44,10 @@ class Arrayterator(object):
         data that will be read into memory is `buf_size` elements.
         Default is None, which will read as many element as possible
         into memory.
+    prefetch : int, optional
+        Number of blocks to read ahead in a background thread while the
+        current one is being processed. Default is 0, which reads each
+        block when it is requested.
 
     Attributes
     ----------
@@ -68,6 +76,13 @@ class Arrayterator(object):
     returned the process continues from the next dimension, until all
     elements have been read.
 
+    With `prefetch`, the blocks are copied into ``prefetch + 2`` buffers
+    that are reused in turn, so that reading from e.g. a `memmap` or a
+    NetCDF variable overlaps with the processing of the previous blocks.
+    A block is then only valid until the next one is requested: copy it
+    to keep it longer. An exception raised while reading a block is
+    raised again when that block is requested.
+
     Examples
     --------
     >>> import numpy as np
@@ -88,9 +103,12 @@ class Arrayterator(object):
 
     """
 
-    def __init__(self, var, buf_size=None):
+    def __init__(self, var, buf_size=None, prefetch=0):
         self.var = var
         self.buf_size = buf_size
+        self.prefetch = int(prefetch)
+        if self.prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer")
 
         self.start = [0 for dim in var.shape]
         self.stop = [dim for dim in var.shape]
@@ -121,7 +139,7 @@ class Arrayterator(object):
             index += (slice(None),) * (dims-len(index))
 
         # Return a new arrayterator object.
-        out = self.__class__(self.var, self.buf_size)
+        out = self.__class__(self.var, self.buf_size, self.prefetch)
         for i, (start, stop, step, slice_) in enumerate(
                 zip(self.start, self.stop, self.step, index)):
             out.start[i] = start + (slice_.start or 0)
@@ -151,6 +169,17 @@ class Arrayterator(object):
                 zip(self.start, self.stop, self.step))
 
     def __iter__(self):
+        if self.prefetch:
+            return _Prefetcher(self.var, self._slices(),
+                               self.buf_size or reduce(mul, self.shape),
+                               self.prefetch)
+        return (self.var[slice_] for slice_ in self._slices())
+
+    def _slices(self):
+        """
+        Generate the index of each block.
+
+        """
         # Skip arrays with degenerate dimensions
         if [dim for dim in self.shape if dim <= 0]: raise StopIteration
 
@@ -181,8 +210,7 @@ class Arrayterator(object):
                 count = count//self.shape[i]
 
             # yield a block
-            slice_ = tuple(slice(*t) for t in zip(start, stop, step))
-            yield self.var[slice_]
+            yield tuple(slice(*t) for t in zip(start, stop, step))
 
             # Update start position, taking care of overflow to
             # other dimensions
@@ -193,3 +221,84 @@ class Arrayterator(object):
                     start[i-1] += self.step[i-1]
             if start[0] >= self.stop[0]:
                 raise StopIteration
+
+
+def _read_blocks(var, slices, size, free, full, stopped):
+    """
+    Read the blocks of `var` into the buffers of the `free` queue, and put
+    them in the `full` queue, until `stopped` is set.
+
+    """
+    import numpy as np
+    try:
+        for slice_ in slices:
+            buf = free.get()
+            if stopped.isSet():
+                return
+            data = np.asarray(var[slice_])
+            if buf is None or buf.dtype != data.dtype:
+                buf = np.empty(size, data.dtype)
+            block = buf[:data.size].reshape(data.shape)
+            block[...] = data
+            full.put((buf, block, None))
+        full.put((None, None, None))
+    except:
+        full.put((None, None, sys.exc_info()))
+
+
+class _Prefetcher(object):
+    """
+    Iterator over the blocks of an `Arrayterator`, read by a background
+    thread into a fixed set of buffers.
+
+    """
+
+    def __init__(self, var, slices, size, prefetch):
+        self._free = Queue.Queue()
+        self._full = Queue.Queue()
+        self._stopped = threading.Event()
+        # The buffers are allocated by the thread, once it knows the dtype:
+        # one is held by the caller, one is being read into, and the others
+        # hold the blocks read ahead
+        for i in range(prefetch + 2):
+            self._free.put(None)
+        self._current = None
+        self._done = False
+        # The thread must not hold a reference to the iterator itself, so
+        # that dropping the iterator stops it
+        thread = threading.Thread(target=_read_blocks,
+                                  args=(var, slices, size, self._free,
+                                        self._full, self._stopped))
+        thread.setDaemon(True)
+        thread.start()
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self._done:
+            raise StopIteration
+        buf, block, exc_info = self._full.get()
+        # The previous block is not used anymore
+        if self._current is not None:
+            self._free.put(self._current)
+        self._current = buf
+        if buf is None:
+            self._done = True
+            if exc_info is not None:
+                raise exc_info[0], exc_info[1], exc_info[2]
+            raise StopIteration
+        return block
+
+    def close(self):
+        """
+        Stop reading blocks ahead.
+
+        """
+        if not self._done:
+            self._done = True
+            self._stopped.set()
+            self._free.put(None)
+
+    def __del__(self):
+        self.close()
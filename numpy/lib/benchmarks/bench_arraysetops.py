@@ -61,5 +61,60 @@ def bench_unique1d( plot_results = False ):
         plotMe( 2, pylab.plot, nItems, dt1s, dt2s )
         pylab.show()
 
+def bench_methods( plot_results = False ):
+    """Compare the 'sort' and 'hash' methods of the set operations with
+    the default choice between them, for few and for mostly distinct
+    values."""
+    exponents = np.linspace( 2, 7, 11 )
+    cases = [('unique', lambda a, b, m: unique( a, method = m )),
+             ('unique/inverse',
+              lambda a, b, m: unique( a, return_inverse = True, method = m )),
+             ('in1d', lambda a, b, m: in1d( a, b, method = m )),
+             ('intersect1d', lambda a, b, m: intersect1d( a, b, method = m )),
+             ('setdiff1d', lambda a, b, m: setdiff1d( a, b, method = m ))]
+    dtypes = [np.int64, np.float64, 'S8']
+    # values drawn from nItem / 10 and from 100 * nItem possible ones
+    spreads = [('few', 0.1), ('distinct', 100)]
+    times = {}
+    nItems = []
+    for ii in exponents:
+
+        nItem = int( 10 ** ii )
+        nItems.append( nItem )
+        print 'using %d items:' % nItem
+        for dtype in dtypes:
+            for spread, factor in spreads:
+                a = np.fix( nItem * factor * np.random.random( nItem ) )
+                a = a.astype( dtype )
+                b = np.fix( nItem * factor * np.random.random( nItem / 10 + 1 ) )
+                b = b.astype( dtype )
+                for name, fun in cases:
+                    dts = []
+                    for method in ['sort', 'hash', None]:
+                        tt = time.clock()
+                        fun( a, b, method )
+                        dts.append( time.clock() - tt )
+                    key = (name, np.dtype( dtype ).str, spread)
+                    times.setdefault( key, [] ).append( dts )
+                    print '  %-15s %-4s %-8s sort: %.2e hash: %.2e ' \
+                          'default: %.2e' % (name, np.dtype( dtype ).str[1:],
+                                             spread, dts[0], dts[1], dts[2])
+
+    if plot_results:
+        import pylab
+
+        for fig, key in enumerate( sorted( times.keys() ) ):
+            dts = np.array( times[key] )
+            pylab.figure( fig + 1 )
+            pylab.loglog( nItems, dts[:,0], 'g-o', linewidth = 2, markersize = 8 )
+            pylab.loglog( nItems, dts[:,1], 'b-x', linewidth = 2, markersize = 8 )
+            pylab.loglog( nItems, dts[:,2], 'r--', linewidth = 2 )
+            pylab.legend( ('sort', 'hash', 'default') )
+            pylab.title( '%s %s %s' % key )
+            pylab.xlabel( 'nItem' )
+            pylab.ylabel( 'time [s]' )
+        pylab.show()
+
 if __name__ == '__main__':
     bench_unique1d( plot_results = True )
+    bench_methods( plot_results = True )
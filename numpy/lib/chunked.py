@@ -0,0 +1,431 @@
+"""
+Compressed arrays on disk, stored in chunks with random access.
+
+This module provides a file format between ``.npy`` files, which are not
+compressed, and ``.npz`` files, whose members must be decompressed as a
+whole. The array is split into chunks of a fixed shape, which are
+compressed independently with zlib or bz2. A `ChunkedArray` reads only
+the chunks that a slice touches, so it can be iterated over with an
+`Arrayterator` without reading the whole array into memory.
+
+File layout
+-----------
+The file starts with the 6-byte magic string ``\\x93NUMPYZ`` followed by
+the major and minor version numbers of the format, currently 1.0. Then
+comes a header laid out as in version 2.0 of the ``.npy`` format: a
+4-byte little-endian length and the representation of a dictionary,
+padded to a multiple of 16 bytes. Its keys are:
+
+"descr" : dtype.descr
+  The dtype of the array, as in the ``.npy`` format.
+
+"shape" : tuple of int
+  The shape of the array.
+
+"chunks" : tuple of int
+  The shape of the chunks. Chunks at the end of an axis may be smaller.
+
+"compression" : {'zlib', 'bz2', None}
+  How each chunk is compressed.
+
+The header is followed by the chunk index: ``nchunks + 1`` little-endian
+8-byte offsets from the magic string, chunk ``i`` being stored
+between offsets ``i`` and ``i + 1``. The chunks are numbered in C order of
+their position in the array, and the data of each chunk is stored in C
+order.
+
+"""
+
+from operator import mul
+
+import sys
+import threading
+
+import numpy
+import format
+from numpy.compat import asbytes
+
+__all__ = ['ChunkedArray', 'save_chunked', 'open_chunked']
+
+if sys.version_info[0] >= 3:
+    from functools import reduce
+
+MAGIC = asbytes('\x93NUMPYZ')
+VERSION = (1, 0)
+CHUNK_SIZE = 2**20  # approximate size of the default chunks, in bytes
+_COMPRESSIONS = (None, 'zlib', 'bz2')
+
+def _default_chunks(shape, itemsize):
+    """
+    Return a chunk shape of about `CHUNK_SIZE` bytes, made of whole rows
+    along the last axes.
+    """
+    count = max(CHUNK_SIZE // max(itemsize, 1), 1)
+    chunks = []
+    for dim in shape[::-1]:
+        chunks.insert(0, max(min(dim, count), 1))
+        count = max(count // max(dim, 1), 1)
+    return tuple(chunks)
+
+def _grid(shape, chunks):
+    """Return the number of chunks along each axis."""
+    return tuple([-(-dim // c) for (dim, c) in zip(shape, chunks)])
+
+def _as_slice(indices):
+    """Return the slice selecting the arithmetic progression `indices`."""
+    start = indices[0]
+    if len(indices) > 1:
+        step = indices[1] - start
+    else:
+        step = 1
+    stop = indices[-1] + step
+    if stop < 0:
+        stop = None
+    return slice(start, stop, step)
+
+def _codec(compression, compresslevel=None):
+    """Return the compression and decompression functions to use."""
+    if compression not in _COMPRESSIONS:
+        raise ValueError("compression must be one of %r, not %r"
+                         % (_COMPRESSIONS, compression))
+    if compression is None:
+        identity = lambda data: data
+        return identity, identity
+    if compression == 'zlib':
+        import zlib
+        if compresslevel is None:
+            compresslevel = 6
+        if compresslevel not in range(10):
+            raise ValueError("compresslevel must be an integer between "
+                             "0 and 9")
+        return (lambda data: zlib.compress(data, compresslevel),
+                zlib.decompress)
+    else:
+        import bz2
+        if compresslevel is None:
+            compresslevel = 9
+        if compresslevel not in range(1, 10):
+            raise ValueError("compresslevel must be an integer between "
+                             "1 and 9")
+        return (lambda data: bz2.compress(data, compresslevel),
+                bz2.decompress)
+
+def save_chunked(file, arr, chunks=None, compression='zlib',
+                 compresslevel=None):
+    """
+    Save an array to a file in chunks, each compressed independently.
+
+    Parameters
+    ----------
+    file : str or file
+        File name, or open file object positioned where the array is to be
+        written. A file object must support `seek` and `tell`.
+    arr : array_like
+        Array to save. Its chunks are read one at a time, so that it can be
+        e.g. a `memmap` larger than the available memory.
+    chunks : tuple of ints, optional
+        Shape of the chunks, with one positive integer per dimension of
+        `arr`. By default, chunks of about 1 MB made of whole rows along
+        the last axes are used.
+    compression : {'zlib', 'bz2', None}, optional
+        How the chunks are compressed. Default is 'zlib'.
+    compresslevel : int, optional
+        Compression level, from 0 (zlib) or 1 (bz2) to 9. The default is 6
+        with zlib and 9 with bz2.
+
+    See Also
+    --------
+    open_chunked, ChunkedArray
+
+    Notes
+    -----
+    The smaller the chunks, the less data has to be decompressed to read
+    a small slice of the array, but the worse the compression ratio.
+
+    Examples
+    --------
+    >>> from tempfile import TemporaryFile
+    >>> outfile = TemporaryFile()
+    >>> x = np.arange(100000).reshape(1000, 100)
+    >>> np.lib.save_chunked(outfile, x, chunks=(100, 100))
+    >>> outfile.seek(0)
+    >>> y = np.lib.open_chunked(outfile)
+    >>> y[550:552, :3]
+    array([[55000, 55001, 55002],
+           [55100, 55101, 55102]])
+
+    """
+    if not hasattr(arr, 'shape'):
+        arr = numpy.asanyarray(arr)
+    if arr.dtype.hasobject:
+        raise ValueError("object arrays cannot be saved in chunks")
+    compress = _codec(compression, compresslevel)[0]
+    shape = tuple(arr.shape)
+    if chunks is None:
+        chunks = _default_chunks(shape, arr.dtype.itemsize)
+    else:
+        chunks = tuple([int(c) for c in chunks])
+        if len(chunks) != len(shape) or [c for c in chunks if c < 1]:
+            raise ValueError("chunks must be %i positive integers, not %r"
+                             % (len(shape), chunks))
+    d = {'descr': format.dtype_to_descr(arr.dtype),
+         'shape': shape,
+         'chunks': chunks,
+         'compression': compression}
+
+    if isinstance(file, basestring):
+        fp = open(file, 'wb')
+        own_fid = True
+    else:
+        fp = file
+        own_fid = False
+    try:
+        base = fp.tell()
+        fp.write(MAGIC + asbytes(chr(VERSION[0]) + chr(VERSION[1])))
+        fp.write(format._header_bytes(d, (2, 0), format.ARRAY_ALIGN))
+        grid = _grid(shape, chunks)
+        index = numpy.zeros(reduce(mul, grid, 1) + 1, '<u8')
+        index_pos = fp.tell()
+        fp.write(index.tostring())
+        index[0] = fp.tell() - base
+        for (i, pos) in enumerate(numpy.ndindex(*grid)):
+            block = arr[tuple([slice(p * c, (p + 1) * c)
+                               for (p, c) in zip(pos, chunks)])]
+            data = compress(numpy.ascontiguousarray(block).tostring())
+            fp.write(data)
+            index[i + 1] = index[i] + len(data)
+        # Now that the sizes of the chunks are known, fill in the index
+        fp.seek(index_pos)
+        fp.write(index.tostring())
+        fp.seek(base + int(index[-1]))
+    finally:
+        if own_fid:
+            fp.close()
+
+def open_chunked(file):
+    """
+    Open an array saved by `save_chunked`, without reading its data.
+
+    Parameters
+    ----------
+    file : str or file
+        File name, or open file object positioned at the start of the
+        array.
+
+    Returns
+    -------
+    arr : ChunkedArray
+        Object whose slices are read from the file on demand.
+
+    See Also
+    --------
+    save_chunked, ChunkedArray
+
+    """
+    return ChunkedArray(file)
+
+class ChunkedArray(object):
+    """
+    ChunkedArray(file)
+
+    Read-only array stored in compressed chunks by `save_chunked`.
+
+    Indexing with integers, slices and ``...`` returns an ndarray, for
+    which only the chunks holding the selected elements are read and
+    decompressed. The last chunk read is kept in memory, so that reading
+    neighbouring slices of it does not decompress it again.
+
+    Parameters
+    ----------
+    file : str or file
+        File name, or open file object positioned at the start of the
+        array. The file must support `seek`.
+
+    Attributes
+    ----------
+    shape : tuple of ints
+        Shape of the array.
+    dtype : dtype
+        Data type of the array.
+    chunks : tuple of ints
+        Shape of the chunks.
+    compression : {'zlib', 'bz2', None}
+        Compression of the chunks.
+
+    See Also
+    --------
+    save_chunked
+    Arrayterator : Iterate over a `ChunkedArray` in blocks.
+
+    Examples
+    --------
+    >>> from tempfile import TemporaryFile
+    >>> outfile = TemporaryFile()
+    >>> np.lib.save_chunked(outfile, np.arange(24).reshape(4, 6), (2, 3))
+    >>> outfile.seek(0)
+    >>> a = np.lib.ChunkedArray(outfile)
+    >>> a.shape, a.chunks
+    ((4, 6), (2, 3))
+    >>> a[1, ::2]
+    array([ 6,  8, 10])
+    >>> for block in np.lib.Arrayterator(a, 12):
+    ...     print block.sum()
+    66
+    210
+
+    """
+
+    def __init__(self, file):
+        if isinstance(file, basestring):
+            self.fid = open(file, 'rb')
+            self._own_fid = True
+        else:
+            self.fid = file
+            self._own_fid = False
+        try:
+            self._base = self.fid.tell()
+            magic_str = self.fid.read(len(MAGIC) + 2)
+            if magic_str[:-2] != MAGIC:
+                msg = "the magic string is not correct; expected %r, got %r"
+                raise ValueError(msg % (MAGIC, magic_str[:-2]))
+            version = tuple(map(ord, magic_str[-2:]))
+            if version != VERSION:
+                msg = "only support version %r of chunked arrays, not %r"
+                raise ValueError(msg % (VERSION, version))
+            d = format._read_header_dict(self.fid, (2, 0))
+            keys = d.keys()
+            keys.sort()
+            if keys != ['chunks', 'compression', 'descr', 'shape']:
+                msg = "Header does not contain the correct keys: %r"
+                raise ValueError(msg % (keys,))
+            self.dtype = numpy.dtype(d['descr'])
+            self.shape = d['shape']
+            self.chunks = d['chunks']
+            self.compression = d['compression']
+            self._decompress = _codec(self.compression)[1]
+            self._grid = _grid(self.shape, self.chunks)
+            size = 8 * (reduce(mul, self._grid, 1) + 1)
+            index = self.fid.read(size)
+            if len(index) != size:
+                raise ValueError("EOF at %s before reading the chunk index"
+                                 % self.fid.tell())
+            self._index = numpy.fromstring(index, '<u8').astype(numpy.int64)
+        except:
+            self.close()
+            raise
+        self._lock = threading.Lock()
+        self._cached = (None, None)
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """
+        Close the file, if it was opened by the `ChunkedArray`.
+
+        """
+        if getattr(self, '_own_fid', False) and self.fid is not None:
+            self.fid.close()
+        self.fid = None
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return reduce(mul, self.shape, 1)
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self):
+        return "ChunkedArray(shape=%r, dtype=%s, chunks=%r)" % \
+               (self.shape, self.dtype, self.chunks)
+
+    def __array__(self, dtype=None):
+        # self[...] is a scalar for a 0-d array
+        out = numpy.asarray(self[...])
+        if dtype is not None:
+            out = out.astype(dtype)
+        return out
+
+    def _read_chunk(self, pos):
+        """Return the chunk at position `pos` in the grid of chunks."""
+        self._lock.acquire()
+        try:
+            if self._cached[0] == pos:
+                return self._cached[1]
+            i = 0
+            for (p, n) in zip(pos, self._grid):
+                i = i * n + p
+            start, stop = self._index[i:i + 2]
+            self.fid.seek(self._base + start)
+            data = self.fid.read(stop - start)
+            if len(data) != stop - start:
+                raise ValueError("EOF at %s before reading chunk %r"
+                                 % (self.fid.tell(), pos))
+            shape = [min(c, dim - p * c)
+                     for (p, c, dim) in zip(pos, self.chunks, self.shape)]
+            chunk = numpy.fromstring(self._decompress(data), self.dtype)
+            chunk = chunk.reshape(shape)
+            self._cached = (pos, chunk)
+            return chunk
+        finally:
+            self._lock.release()
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            index = (index,)
+        # Expand the ellipsis and complete the index with full slices
+        fixed = []
+        expanded = False
+        for item in index:
+            if item is Ellipsis and not expanded:
+                fixed.extend([slice(None)] * (self.ndim - len(index) + 1))
+                expanded = True
+            elif item is Ellipsis:
+                fixed.append(slice(None))
+            else:
+                fixed.append(item)
+        if len(fixed) > self.ndim:
+            raise IndexError("too many indices")
+        fixed.extend([slice(None)] * (self.ndim - len(fixed)))
+
+        # The indices selected along each axis
+        selections = []
+        shape = []
+        for (item, dim) in zip(fixed, self.shape):
+            if isinstance(item, slice):
+                selection = numpy.arange(*item.indices(dim))
+                shape.append(len(selection))
+            elif isinstance(item, (int, long, numpy.integer)):
+                if item < 0:
+                    item += dim
+                if not 0 <= item < dim:
+                    raise IndexError("index out of bounds")
+                selection = numpy.array([item])
+            else:
+                raise IndexError("only integers, slices and ellipsis are "
+                                 "valid indices")
+            selections.append(selection)
+
+        out = numpy.empty([len(s) for s in selections], self.dtype)
+        if out.size:
+            # Copy the selected part of each chunk touched
+            touched = [numpy.unique(s // c)
+                       for (s, c) in zip(selections, self.chunks)]
+            for pos in numpy.ndindex(*[len(t) for t in touched]):
+                pos = tuple([int(t[p]) for (t, p) in zip(touched, pos)])
+                src = []
+                dst = []
+                for (s, c, p) in zip(selections, self.chunks, pos):
+                    where = numpy.nonzero(s // c == p)[0]
+                    dst.append(slice(where[0], where[-1] + 1))
+                    src.append(_as_slice(s[where] - p * c))
+                out[tuple(dst)] = self._read_chunk(pos)[tuple(src)]
+        if not shape:
+            return out[()]
+        return out.reshape(shape)
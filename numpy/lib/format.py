@@ -80,7 +80,8 @@ Version numbering
 
 The version numbering of these formats is independent of NumPy version
 numbering. If the format is upgraded, the code in `numpy.io` will still
-be able to read and write Version 1.0 files.
+be able to read and write Version 1.0 files.  Format version 2.0 was
+introduced in NumPy 2.0.
 
 Format Version 1.0
 ------------------
@@ -128,6 +129,25 @@ Consumers can figure out the number of bytes by multiplying the number
 of elements given by the shape (noting that ``shape=()`` means there is
 1 element) by ``dtype.itemsize``.
 
+Format Version 2.0
+------------------
+
+The version 1.0 format only allows the array header to have a total size of
+65535 bytes.  This can be exceeded by structured arrays with a large number
+of columns.  The version 2.0 format extends the header size to 4 GiB.
+
+The next 4 bytes after the version number form a little-endian unsigned
+int: the length of the header data HEADER_LEN. The header is padded so that
+``magic string + 6 + HEADER_LEN`` is evenly divisible by 16.
+
+In both versions the padding may be larger, so that the array data starts
+at a multiple of a bigger power of two, e.g. 64 bytes or the page size.
+Readers do not need to know the alignment that was used.
+
+`write_array` and `open_memmap` write a version 1.0 file if the header
+fits in it, and a version 2.0 file otherwise. Note that NumPy releases
+older than 2.0 cannot read version 2.0 files.
+
 Notes
 -----
 The ``.npy`` format, including reasons for creating it and a comparison of
@@ -140,10 +160,14 @@ import cPickle
 import numpy
 import sys
 from numpy.lib.utils import safe_eval
+from numpy.lib.arrayterator import Arrayterator
 from numpy.compat import asbytes, isfileobj
 
 MAGIC_PREFIX = asbytes('\x93NUMPY')
 MAGIC_LEN = len(MAGIC_PREFIX) + 2
+ARRAY_ALIGN = 16  # default alignment of the array data in the file
+BUFFER_SIZE = 2**18  # size of the chunks used to read non-file objects
+_HEADER_LEN_FORMATS = {(1, 0): '<H', (2, 0): '<I'}
 
 def magic(major, minor):
     """ Return the magic string for the given file format version.
@@ -255,17 +279,25 @@ def header_data_from_array_1_0(array):
     d['descr'] = dtype_to_descr(array.dtype)
     return d
 
-def write_array_header_1_0(fp, d):
-    """ Write the header for an array using the 1.0 format.
+def _check_version(version):
+    if version not in _HEADER_LEN_FORMATS:
+        msg = "we only support format version (1,0) and (2,0), not %s"
+        raise ValueError(msg % (version,))
+
+def _header_bytes(d, version, align, size=None):
+    """
+    Return the header-length field and the padded header for the
+    dictionary `d`, or raise ValueError if it does not fit in `version`.
+
+    If `size` is given, the header is padded so that the result is exactly
+    `size` bytes long instead of being aligned on `align` bytes.
 
-    Parameters
-    ----------
-    fp : filelike object
-    d : dict
-        This has the appropriate entries for writing its string representation
-        to the header of the file.
     """
     import struct
+    _check_version(version)
+    if align <= 0 or align % 16:
+        raise ValueError("align must be a positive multiple of 16, not %r"
+                         % (align,))
     header = ["{"]
     for key, value in sorted(d.items()):
         # Need to use repr here, since we eval these when reading
@@ -273,17 +305,75 @@ def write_array_header_1_0(fp, d):
     header.append("}")
     header = "".join(header)
     # Pad the header with spaces and a final newline such that the magic
-    # string, the header-length short and the header are aligned on a 16-byte
-    # boundary.  Hopefully, some system, possibly memory-mapping, can take
-    # advantage of our premature optimization.
-    current_header_len = MAGIC_LEN + 2 + len(header) + 1  # 1 for the newline
-    topad = 16 - (current_header_len % 16)
+    # string, the header-length field and the header end on an `align`-byte
+    # boundary, which is where the array data starts.
+    fmt = _HEADER_LEN_FORMATS[version]
+    if size is None:
+        current_header_len = (MAGIC_LEN + struct.calcsize(fmt) + len(header)
+                              + 1)  # 1 for the newline
+        topad = align - (current_header_len % align)
+    else:
+        topad = size - struct.calcsize(fmt) - len(header) - 1
+        if topad < 0:
+            raise ValueError("header does not fit inside %s bytes" % size)
     header = asbytes(header + ' '*topad + '\n')
-    if len(header) >= (256*256):
-        raise ValueError("header does not fit inside %s bytes" % (256*256))
-    header_len_str = struct.pack('<H', len(header))
-    fp.write(header_len_str)
+    max_len = 256**struct.calcsize(fmt)
+    if len(header) >= max_len:
+        raise ValueError("header does not fit inside %s bytes" % max_len)
+    return struct.pack(fmt, len(header)) + header
+
+def write_array_header_1_0(fp, d, align=ARRAY_ALIGN):
+    """ Write the header for an array using the 1.0 format.
+
+    Parameters
+    ----------
+    fp : filelike object
+    d : dict
+        This has the appropriate entries for writing its string representation
+        to the header of the file.
+    align : int, optional
+        The array data following the header will start at a multiple of
+        `align` bytes from the start of the file. Must be a multiple of 16.
+    """
+    fp.write(_header_bytes(d, (1, 0), align))
+
+def write_array_header_2_0(fp, d, align=ARRAY_ALIGN):
+    """ Write the header for an array using the 2.0 format.
+
+    The 2.0 format allows storing very large structured arrays.
+
+    Parameters
+    ----------
+    fp : filelike object
+    d : dict
+        This has the appropriate entries for writing its string representation
+        to the header of the file.
+    align : int, optional
+        The array data following the header will start at a multiple of
+        `align` bytes from the start of the file. Must be a multiple of 16.
+    """
+    fp.write(_header_bytes(d, (2, 0), align))
+
+def _write_array_header(fp, d, version=None, align=ARRAY_ALIGN):
+    """
+    Write the magic string and the header of the array described by `d`.
+
+    If `version` is None, the 1.0 format is used if the header fits in it
+    and the 2.0 format otherwise.  Returns the version used.
+
+    """
+    if version is None:
+        try:
+            header = _header_bytes(d, (1, 0), align)
+            version = (1, 0)
+        except ValueError:
+            header = _header_bytes(d, (2, 0), align)
+            version = (2, 0)
+    else:
+        header = _header_bytes(d, version, align)
+    fp.write(magic(*version))
     fp.write(header)
+    return version
 
 def read_array_header_1_0(fp):
     """
@@ -314,32 +404,44 @@ def read_array_header_1_0(fp):
         If the data is invalid.
 
     """
-    # Read an unsigned, little-endian short int which has the length of the
-    # header.
-    import struct
-    hlength_str = fp.read(2)
-    if len(hlength_str) != 2:
-        msg = "EOF at %s before reading array header length"
-        raise ValueError(msg % fp.tell())
-    header_length = struct.unpack('<H', hlength_str)[0]
-    header = fp.read(header_length)
-    if len(header) != header_length:
-        raise ValueError("EOF at %s before reading array header" % fp.tell())
+    return _read_array_header(fp, version=(1, 0))
 
-    # The header is a pretty-printed string representation of a literal Python
-    # dictionary with trailing newlines padded to a 16-byte boundary. The keys
-    # are strings.
-    #   "shape" : tuple of int
-    #   "fortran_order" : bool
-    #   "descr" : dtype.descr
-    try:
-        d = safe_eval(header)
-    except SyntaxError, e:
-        msg = "Cannot parse header: %r\nException: %r"
-        raise ValueError(msg % (header, e))
-    if not isinstance(d, dict):
-        msg = "Header is not a dictionary: %r"
-        raise ValueError(msg % d)
+def read_array_header_2_0(fp):
+    """
+    Read an array header from a filelike object using the 2.0 file format
+    version.
+
+    This will leave the file object located just after the header.
+
+    Parameters
+    ----------
+    fp : filelike object
+        A file object or something with a `.read()` method like a file.
+
+    Returns
+    -------
+    shape : tuple of int
+        The shape of the array.
+    fortran_order : bool
+        The array data will be written out directly if it is either C-contiguous
+        or Fortran-contiguous. Otherwise, it will be made contiguous before
+        writing it out.
+    dtype : dtype
+        The dtype of the file's data.
+
+    Raises
+    ------
+    ValueError :
+        If the data is invalid.
+
+    """
+    return _read_array_header(fp, version=(2, 0))
+
+def _read_array_header(fp, version):
+    """
+    see read_array_header_1_0
+    """
+    d = _read_header_dict(fp, version)
     keys = d.keys()
     keys.sort()
     if keys != ['descr', 'fortran_order', 'shape']:
@@ -362,13 +464,63 @@ def read_array_header_1_0(fp):
 
     return d['shape'], d['fortran_order'], dtype
 
-def write_array(fp, array, version=(1,0)):
+def _read_header_dict(fp, version):
+    """
+    Read the header-length field and the header of the given format
+    `version`, and return the dictionary of the header.
+    """
+    # Read an unsigned, little-endian short int (version 1.0) or int
+    # (version 2.0) which has the length of the header.
+    import struct
+    if version not in _HEADER_LEN_FORMATS:
+        msg = "only support version (1,0) and (2,0) of file format, not %r"
+        raise ValueError(msg % (version,))
+    fmt = _HEADER_LEN_FORMATS[version]
+    hlength_size = struct.calcsize(fmt)
+    hlength_str = fp.read(hlength_size)
+    if len(hlength_str) != hlength_size:
+        msg = "EOF at %s before reading array header length"
+        raise ValueError(msg % fp.tell())
+    header_length = struct.unpack(fmt, hlength_str)[0]
+    header = fp.read(header_length)
+    if len(header) != header_length:
+        raise ValueError("EOF at %s before reading array header" % fp.tell())
+
+    # The header is a pretty-printed string representation of a literal Python
+    # dictionary with trailing newlines padded to a 16-byte boundary. The keys
+    # are strings.
+    #   "shape" : tuple of int
+    #   "fortran_order" : bool
+    #   "descr" : dtype.descr
+    try:
+        d = safe_eval(header)
+    except SyntaxError, e:
+        msg = "Cannot parse header: %r\nException: %r"
+        raise ValueError(msg % (header, e))
+    if not isinstance(d, dict):
+        msg = "Header is not a dictionary: %r"
+        raise ValueError(msg % d)
+    return d
+
+def _write_chunks(fp, array):
+    """
+    Write the data of `array` in C order to the filelike object `fp`, in
+    blocks of at most `BUFFER_SIZE` bytes.
+
+    """
+    if array.ndim == 0 or array.itemsize == 0:
+        fp.write(array.tostring('C'))
+        return
+    buf_size = max(BUFFER_SIZE // array.itemsize, 1)
+    for chunk in Arrayterator(array, buf_size):
+        fp.write(chunk.tostring('C'))
+
+def write_array(fp, array, version=None, align=ARRAY_ALIGN):
     """
     Write an array to an NPY file, including a header.
 
-    If the array is neither C-contiguous or Fortran-contiguous AND if the
-    filelike object is not a real file object, then this function will have
-    to copy data in memory.
+    If the filelike object is not a real file object, the data is copied
+    to it in blocks of at most `BUFFER_SIZE` bytes.
 
     Parameters
     ----------
@@ -377,8 +529,13 @@ def write_array(fp, array, version=(1,0)):
         method.
     array : numpy.ndarray
         The array to write to disk.
-    version : (int, int), optional
-        The version number of the format.
+    version : (int, int) or None, optional
+        The version number of the format. None means using the oldest
+        supported version that is able to store the data.  Default: None
+    align : int, optional
+        The array data will start at a multiple of `align` bytes from the
+        start of the file, e.g. 64 for SIMD loads or ``mmap.PAGESIZE`` for
+        page-aligned memory maps. Must be a multiple of 16.  Default: 16
 
     Raises
     ------
@@ -390,11 +547,7 @@ def write_array(fp, array, version=(1,0)):
         are not picklable.
 
     """
-    if version != (1, 0):
-        msg = "we only support format version (1,0), not %s"
-        raise ValueError(msg % (version,))
-    fp.write(magic(*version))
-    write_array_header_1_0(fp, header_data_from_array_1_0(array))
+    _write_array_header(fp, header_data_from_array_1_0(array), version, align)
     if array.dtype.hasobject:
         # We contain Python objects so we cannot write out the data directly.
         # Instead, we will pickle it out with version 2 of the pickle protocol.
@@ -403,14 +556,38 @@ def write_array(fp, array, version=(1,0)):
         if isfileobj(fp):
             array.T.tofile(fp)
         else:
-            fp.write(array.T.tostring('C'))
+            _write_chunks(fp, array.T)
     else:
         if isfileobj(fp):
             array.tofile(fp)
         else:
-            # XXX: We could probably chunk this using something like
-            # arrayterator.
-            fp.write(array.tostring('C'))
+            _write_chunks(fp, array)
+
+def _read_into(fp, buf):
+    """
+    Fill the uint8 array `buf` from the filelike object `fp`, reading at
+    most `BUFFER_SIZE` bytes at a time.
+
+    The data is read straight into `buf` if `fp` has a `readinto` method.
+
+    """
+    size = len(buf)
+    pos = 0
+    readinto = getattr(fp, 'readinto', None)
+    while pos < size:
+        n = min(size - pos, BUFFER_SIZE)
+        if readinto is not None:
+            nread = readinto(buf[pos:pos + n])
+        else:
+            data = fp.read(n)
+            nread = len(data)
+            if nread:
+                buf[pos:pos + nread] = numpy.frombuffer(data,
+                                                        dtype=numpy.uint8)
+        if not nread:
+            msg = "EOF: reading array data, expected %d bytes got %d"
+            raise ValueError(msg % (size, pos))
+        pos += nread
 
 def read_array(fp):
     """
@@ -419,8 +596,9 @@ def read_array(fp):
     Parameters
     ----------
     fp : filelike object
-        If this is not a real file object, then this may take extra memory and
-        time.
+        If this is not a real file object, the data is read in blocks of at
+        most `BUFFER_SIZE` bytes, directly into the array if `fp` has a
+        `readinto` method.
 
     Returns
     -------
@@ -434,10 +612,7 @@ def read_array(fp):
 
     """
     version = read_magic(fp)
-    if version != (1, 0):
-        msg = "only support version (1,0) of file format, not %r"
-        raise ValueError(msg % (version,))
-    shape, fortran_order, dtype = read_array_header_1_0(fp)
+    shape, fortran_order, dtype = _read_array_header(fp, version)
     if len(shape) == 0:
         count = 1
     else:
@@ -452,11 +627,11 @@ def read_array(fp):
             # We can use the fast fromfile() function.
             array = numpy.fromfile(fp, dtype=dtype, count=count)
         else:
-            # This is not a real file. We have to read it the memory-intensive
-            # way.
-            # XXX: we can probably chunk this to avoid the memory hit.
-            data = fp.read(int(count * dtype.itemsize))
-            array = numpy.fromstring(data, dtype=dtype, count=count)
+            # This is not a real file. Read it in chunks straight into the
+            # array buffer, so that at most one chunk is held twice.
+            array = numpy.empty(count, dtype=dtype)
+            if dtype.itemsize > 0:
+                _read_into(fp, array.view(numpy.uint8))
 
         if fortran_order:
             array.shape = shape[::-1]
@@ -468,7 +643,7 @@ def read_array(fp):
 
 
 def open_memmap(filename, mode='r+', dtype=None, shape=None,
-                fortran_order=False, version=(1,0)):
+                fortran_order=False, version=None, align=ARRAY_ALIGN):
     """
     Open a .npy file as a memory-mapped array.
 
@@ -491,9 +666,14 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
     fortran_order : bool, optional
         Whether the array should be Fortran-contiguous (True) or
         C-contiguous (False) if we are creating a new file in "write" mode.
-    version : tuple of int (major, minor)
+    version : tuple of int (major, minor) or None
         If the mode is a "write" mode, then this is the version of the file
-        format used to create the file.
+        format used to create the file.  None means use the oldest
+        supported version that is able to store the data.  Default: None
+    align : int, optional
+        If the mode is a "write" mode, the array data will start at a
+        multiple of `align` bytes from the start of the file. Must be a
+        multiple of 16.  Default: 16
 
     Returns
     -------
@@ -519,9 +699,8 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
     if 'w' in mode:
         # We are creating the file, not reading it.
         # Check if we ought to create the file.
-        if version != (1, 0):
-            msg = "only support version (1,0) of file format, not %r"
-            raise ValueError(msg % (version,))
+        if version is not None:
+            _check_version(version)
         # Ensure that the given dtype is an authentic dtype object rather than
         # just something that can be interpreted as a dtype object.
         dtype = numpy.dtype(dtype)
@@ -536,8 +715,7 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
         # If we got here, then it should be safe to create the file.
         fp = open(filename, mode+'b')
         try:
-            fp.write(magic(*version))
-            write_array_header_1_0(fp, d)
+            _write_array_header(fp, d, version, align)
             offset = fp.tell()
         finally:
             fp.close()
@@ -546,10 +724,7 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
         fp = open(filename, 'rb')
         try:
             version = read_magic(fp)
-            if version != (1, 0):
-                msg = "only support version (1,0) of file format, not %r"
-                raise ValueError(msg % (version,))
-            shape, fortran_order, dtype = read_array_header_1_0(fp)
+            shape, fortran_order, dtype = _read_array_header(fp, version)
             if dtype.hasobject:
                 msg = "Array can't be memory-mapped: Python objects in dtype."
                 raise ValueError(msg)
@@ -571,3 +746,259 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
         mode=mode, offset=offset)
 
     return marray
+
+
+# Largest number of rows the header of an appendable file has room for.
+_MAX_ROWS = 2**63 - 1
+
+def _reserved_header_size(d, version, align):
+    """
+    Return the version and the size of a header for `d` that leaves room
+    for the first dimension to grow up to `_MAX_ROWS`.
+
+    """
+    d = dict(d)
+    d['shape'] = (_MAX_ROWS,) + tuple(d['shape'][1:])
+    if version is None:
+        try:
+            return (1, 0), len(_header_bytes(d, (1, 0), align))
+        except ValueError:
+            version = (2, 0)
+    return version, len(_header_bytes(d, version, align))
+
+class ArrayAppender(object):
+    """
+    Append rows to a C-ordered ``.npy`` file.
+
+    Instances are created by `open_appendable`. The header of the file is
+    only updated by `flush` and `close`, so readers always see the rows
+    appended up to the last flush.
+
+    Attributes
+    ----------
+    filename : str
+        The name of the file.
+    dtype : dtype
+        The data type of the array.
+    shape : tuple of int
+        The shape of the array, including the rows appended since the last
+        flush.
+
+    """
+    def __init__(self, filename, fp, d, version, header_size):
+        self.filename = filename
+        self.dtype = numpy.dtype(d['descr'])
+        self.shape = tuple(d['shape'])
+        self._fp = fp
+        self._version = version
+        self._header_size = header_size
+        self._flushed_rows = self.shape[0]
+
+    def append(self, rows):
+        """
+        Append one row or a sequence of rows to the array.
+
+        Parameters
+        ----------
+        rows : array_like
+            Either a single row, with the shape of the rows of the array, or
+            an array of rows, whose first axis runs over the rows.
+
+        """
+        rows = numpy.asarray(rows, dtype=self.dtype)
+        row_shape = self.shape[1:]
+        if rows.shape == row_shape:
+            rows = rows.reshape((1,) + row_shape)
+        elif rows.shape[1:] != row_shape:
+            msg = "rows of shape %r cannot be appended to an array of shape %r"
+            raise ValueError(msg % (rows.shape, self.shape))
+        if self._fp is None:
+            raise ValueError("I/O operation on closed file")
+        self._fp.seek(0, 2)
+        numpy.ascontiguousarray(rows).tofile(self._fp)
+        self.shape = (self.shape[0] + len(rows),) + row_shape
+
+    def flush(self):
+        """
+        Write the appended rows to disk and record them in the header.
+
+        """
+        if self._fp is None or self.shape[0] == self._flushed_rows:
+            return
+        # The data must be on disk before the header announces it.
+        self._fp.flush()
+        d = {'descr': dtype_to_descr(self.dtype), 'fortran_order': False,
+             'shape': self.shape}
+        self._fp.seek(MAGIC_LEN)
+        self._fp.write(_header_bytes(d, self._version, ARRAY_ALIGN,
+                                     self._header_size))
+        self._fp.flush()
+        self._flushed_rows = self.shape[0]
+
+    def close(self):
+        """
+        Flush the array and close the file.
+
+        """
+        if self._fp is not None:
+            try:
+                self.flush()
+            finally:
+                self._fp.close()
+                self._fp = None
+
+def _move_data(fp, start, end, new_start):
+    """
+    Move the bytes between `start` and `end` of `fp` to `new_start`, which
+    must not be less than `start`.
+
+    """
+    pos = end
+    while pos > start:
+        n = min(BUFFER_SIZE, pos - start)
+        pos -= n
+        fp.seek(pos)
+        data = fp.read(n)
+        fp.seek(pos + new_start - start)
+        fp.write(data)
+
+def open_appendable(filename, dtype=None, row_shape=None, version=None,
+                    align=ARRAY_ALIGN):
+    """
+    Open a .npy file to append rows to its first axis.
+
+    If the file does not exist, it is created with an empty first axis.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file on disk. This may not be a file-like object.
+    dtype : dtype, optional
+        The data type of the array. Required to create a new file; for an
+        existing file it must match the data type stored in the file.
+    row_shape : tuple of int, optional
+        The shape of each row, i.e. of the array without its first axis.
+        For an existing file it must match the shape stored in the file.
+        Default is ``()`` for a new file.
+    version : tuple of int (major, minor) or None
+        The version of the file format used to create the file.  None means
+        use the oldest supported version that is able to store the data.
+    align : int, optional
+        The array data of a new file will start at a multiple of `align`
+        bytes from the start of the file. Must be a multiple of 16.
+
+    Returns
+    -------
+    appender : ArrayAppender
+        The object to append the rows with. Its `flush` method updates the
+        shape recorded in the header of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not C-ordered, if its dtype holds Python objects or
+        if the given dtype or row shape do not match those of the file.
+    IOError
+        If the file cannot be opened correctly.
+
+    See Also
+    --------
+    open_memmap
+
+    Notes
+    -----
+    The header of the file is padded so that the shape can grow in place.
+    An existing file written without that padding has its data moved once,
+    when opened. Rows found after the last flushed one are discarded.
+
+    The file can be read at any time, e.g. with
+    ``np.load(filename, mmap_mode='r')``, and holds the rows appended up to
+    the last flush.
+
+    Examples
+    --------
+    >>> import tempfile, os
+    >>> fname = os.path.join(tempfile.mkdtemp(), 'log.npy')
+    >>> log = np.lib.format.open_appendable(fname, float, row_shape=(3,))
+    >>> log.append([1., 2., 3.])
+    >>> log.append(np.zeros((2, 3)))
+    >>> log.close()
+    >>> np.load(fname)
+    array([[ 1.,  2.,  3.],
+           [ 0.,  0.,  0.],
+           [ 0.,  0.,  0.]])
+
+    """
+    if not isinstance(filename, basestring):
+        raise ValueError("Filename must be a string.")
+    if dtype is not None:
+        dtype = numpy.dtype(dtype)
+    if row_shape is not None:
+        row_shape = tuple(row_shape)
+
+    import os
+    if not os.path.exists(filename):
+        if dtype is None:
+            raise ValueError("dtype must be given to create %r" % filename)
+        if dtype.hasobject:
+            msg = "Array can't be appended to: Python objects in dtype."
+            raise ValueError(msg)
+        if row_shape is None:
+            row_shape = ()
+        d = {'descr': dtype_to_descr(dtype), 'fortran_order': False,
+             'shape': (0,) + row_shape}
+        version, size = _reserved_header_size(d, version, align)
+        fp = open(filename, 'w+b')
+        try:
+            fp.write(magic(*version))
+            fp.write(_header_bytes(d, version, align, size))
+            fp.flush()
+        except:
+            fp.close()
+            raise
+        return ArrayAppender(filename, fp, d, version, size)
+
+    fp = open(filename, 'r+b')
+    try:
+        file_version = read_magic(fp)
+        shape, fortran_order, file_dtype = _read_array_header(fp, file_version)
+        offset = fp.tell()
+        if len(shape) == 0 or (fortran_order and len(shape) > 1):
+            raise ValueError("can only append to C-ordered arrays of at "
+                             "least one dimension")
+        if file_dtype.hasobject:
+            msg = "Array can't be appended to: Python objects in dtype."
+            raise ValueError(msg)
+        if dtype is not None and dtype != file_dtype:
+            msg = "dtype %r does not match the dtype %r of the file"
+            raise ValueError(msg % (dtype, file_dtype))
+        if row_shape is not None and row_shape != tuple(shape[1:]):
+            msg = "row shape %r does not match the shape %r of the file"
+            raise ValueError(msg % (row_shape, shape))
+        d = {'descr': dtype_to_descr(file_dtype), 'fortran_order': False,
+             'shape': shape}
+        # Keep the version of the file, unless its header must grow past
+        # what that version allows.
+        if version is None:
+            try:
+                version, size = _reserved_header_size(d, file_version, align)
+            except ValueError:
+                version, size = _reserved_header_size(d, None, align)
+        else:
+            version, size = _reserved_header_size(d, version, align)
+        nbytes = file_dtype.itemsize
+        for n in shape:
+            nbytes *= n
+        if version != file_version or offset < MAGIC_LEN + size:
+            _move_data(fp, offset, offset + nbytes, MAGIC_LEN + size)
+            fp.seek(0)
+            fp.write(magic(*version))
+            fp.write(_header_bytes(d, version, align, size))
+        else:
+            size = offset - MAGIC_LEN
+        fp.truncate(MAGIC_LEN + size + nbytes)
+        fp.flush()
+    except:
+        fp.close()
+        raise
+    return ArrayAppender(filename, fp, d, version, size)
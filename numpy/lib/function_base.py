@@ -2,8 +2,10 @@ __docformat__ = "restructuredtext en"
 __all__ = ['select', 'piecewise', 'trim_zeros', 'copy', 'iterable',
         'percentile', 'diff', 'gradient', 'angle', 'unwrap', 'sort_complex',
         'disp', 'extract', 'place', 'nansum', 'nanmax', 'nanargmax',
-        'nanargmin', 'nanmin', 'vectorize', 'asarray_chkfinite', 'average',
-        'histogram', 'histogramdd', 'bincount', 'digitize', 'cov', 'corrcoef',
+        'nanargmin', 'nanmin', 'nanmean', 'nanvar', 'nanstd', 'vectorize',
+        'asarray_chkfinite', 'average',
+        'histogram', 'histogramdd', 'Histogram', 'bincount', 'digitize',
+        'cov', 'corrcoef',
         'msort', 'median', 'sinc', 'hamming', 'hanning', 'bartlett',
         'blackman', 'kaiser', 'trapz', 'i0', 'add_newdoc', 'add_docstring',
         'meshgrid', 'delete', 'insert', 'append', 'interp']
@@ -19,12 +21,14 @@ from numpy.core.numeric import ScalarType, dot, where, newaxis, intp, \
         integer, isscalar
 from numpy.core.umath import pi, multiply, add, arctan2,  \
         frompyfunc, isnan, cos, less_equal, sqrt, sin, mod, exp, log10
-from numpy.core.fromnumeric import ravel, nonzero, choose, sort, mean
+from numpy.core.fromnumeric import ravel, nonzero, choose, sort, mean, \
+        partition
 from numpy.core.numerictypes import typecodes, number
 from numpy.core import atleast_1d, atleast_2d
 from numpy.lib.twodim_base import diag
 from _compiled_base import _insert, add_docstring
 from _compiled_base import digitize, bincount, interp as compiled_interp
+from _compiled_base import _nanreduce
 from arraysetops import setdiff1d
 from utils import deprecate
 import numpy as np
@@ -119,6 +123,24 @@ def histogram(a, bins=10, range=None, normed=False, weights=None):
         weights = weights.ravel()
     a =  a.ravel()
 
+    uniform = not iterable(bins)
+    if uniform and range is None:
+        range = (a.min(), a.max())
+    bins = _histogram_edges(bins, range)
+    n = _histogram_counts(a, weights, bins, uniform)
+
+    if normed:
+        db = array(np.diff(bins), float)
+        return n/(n*db).sum(), bins
+    else:
+        return n, bins
+
+
+def _histogram_edges(bins, range):
+    """
+    Return the bin edges for the `bins` and `range` arguments of `histogram`.
+
+    """
     if (range is not None):
         mn, mx = range
         if (mn > mx):
@@ -126,8 +148,6 @@ def histogram(a, bins=10, range=None, normed=False, weights=None):
                 'max must be larger than min in range parameter.')
 
     if not iterable(bins):
-        if range is None:
-            range = (a.min(), a.max())
         mn, mx = [mi+0.0 for mi in range]
         if mn == mx:
             mn -= 0.5
@@ -138,15 +158,77 @@ def histogram(a, bins=10, range=None, normed=False, weights=None):
         if (np.diff(bins) < 0).any():
             raise AttributeError(
                     'bins must increase monotonically.')
+    return bins
+
+
+def _uniform_bins(a, bins):
+    """
+    Whether the values of `a` can be put in the equal-width `bins`, made by
+    `_histogram_edges` from a number of bins, by `_uniform_index`.
+
+    """
+    return a.dtype.kind in 'biuf' and bins.dtype.kind == 'f' and \
+           len(bins) > 1 and np.isfinite(bins[[0, -1]]).all() and \
+           bins[0] < bins[-1]
+
+
+def _uniform_index(a, bins):
+    """
+    Return the indices of the bins of the values of `a` that lie within
+    the equal-width `bins`, and the mask of those values.
 
+    The index of a value is computed from its distance to the first edge,
+    in constant time, instead of by a search in the edges.  It is then
+    corrected where rounding put the value on the wrong side of an edge,
+    so that all values fall in the same bins as with `searchsorted`: in
+    ``[bins[i], bins[i+1])``, or in the last bin if equal to the last edge.
+
+    """
+    nbins = len(bins) - 1
+    mn, mx = bins[0], bins[-1]
+    keep = (a >= mn) & (a <= mx)
+    if not keep.all():
+        a = a[keep]
+    index = ((a - mn) * (nbins / (mx - mn))).astype(intp)
+    index[index >= nbins] = nbins - 1
+    index[index < 0] = 0
+    index[a < bins[index]] -= 1
+    index[(a >= bins[index + 1]) & (index != nbins - 1)] += 1
+    return index, keep
+
+
+def _histogram_counts(a, weights, bins, uniform=False):
+    """
+    Return the number of values of the flat array `a`, or the sum of their
+    `weights`, in each bin of the edges `bins`, which are of equal widths
+    if `uniform` is True.
+
+    """
     # Histogram is an integer or a float array depending on the weights.
     if weights is None:
         ntype = int
     else:
         ntype = weights.dtype
-    n = np.zeros(bins.shape, ntype)
 
     block = 65536
+    if uniform and _uniform_bins(a, bins) and \
+       (weights is None or weights.dtype.kind in 'iuf'):
+        # Equal-width bins: find the bin of each value directly, and count
+        # the values of each bin, or sum their weights
+        nbins = len(bins) - 1
+        n = np.zeros(nbins, ntype)
+        for i in arange(0, len(a), block):
+            index, keep = _uniform_index(a[i:i+block], bins)
+            if len(index) == 0:
+                continue
+            if weights is None:
+                counts = bincount(index)
+            else:
+                counts = bincount(index, weights[i:i+block][keep])
+            n[:len(counts)] += counts
+        return n
+
+    n = np.zeros(bins.shape, ntype)
     if weights is None:
         for i in arange(0, len(a), block):
             sa = sort(a[i:i+block])
@@ -165,13 +247,125 @@ def histogram(a, bins=10, range=None, normed=False, weights=None):
                 sa.searchsorted(bins[-1], 'right')]
             n += cw[bin_index]
 
-    n = np.diff(n)
+    return np.diff(n)
 
-    if normed:
-        db = array(np.diff(bins), float)
-        return n/(n*db).sum(), bins
-    else:
-        return n, bins
+
+class Histogram(object):
+    """
+    Histogram(bins=10, range=None)
+
+    Accumulate the histogram of data given in several parts.
+
+    The bin edges are fixed when the histogram is created, so that the data
+    can be added by parts, e.g. while reading it in chunks, without ever
+    holding all of it. Histograms with the same edges, computed e.g. in
+    several processes, can be merged.
+
+    Parameters
+    ----------
+    bins : int or sequence of scalars, optional
+        If `bins` is an int, it defines the number of equal-width bins in
+        the given `range` (10, by default). If `bins` is a sequence, it
+        defines the bin edges, including the rightmost edge, as with
+        `histogram`.
+    range : (float, float), optional
+        The lower and upper range of the bins. It is required when `bins`
+        is an int, as the data is not known in advance. Values outside the
+        range are ignored.
+
+    Attributes
+    ----------
+    hist : ndarray
+        The values of the histogram so far: the number of values in each
+        bin, or the sum of their weights if weights were given.
+    bin_edges : ndarray of float
+        The bin edges ``(len(hist) + 1)``.
+
+    See Also
+    --------
+    histogram
+
+    Notes
+    -----
+    The bins are half-open as with `histogram`, and the results are the
+    same as the `histogram` of all the data that was added.
+
+    Examples
+    --------
+    >>> h = np.Histogram(4, range=(0, 4))
+    >>> h.update([0, 1, 1, 3.5])
+    >>> h.update([2, 4, 5])
+    >>> h.hist
+    array([1, 2, 1, 2])
+    >>> other = np.Histogram(4, range=(0, 4))
+    >>> other.update([1.5], weights=[0.5])
+    >>> h.merge(other)
+    >>> h.hist
+    array([ 1. ,  2.5,  1. ,  2. ])
+    >>> h.density()
+    array([ 0.15384615,  0.38461538,  0.15384615,  0.30769231])
+
+    """
+
+    def __init__(self, bins=10, range=None):
+        if not iterable(bins) and range is None:
+            raise ValueError("range is needed when bins is a number of bins")
+        self.bin_edges = _histogram_edges(bins, range)
+        self.hist = zeros(len(self.bin_edges) - 1, int)
+        self._uniform = not iterable(bins)
+
+    def update(self, a, weights=None):
+        """
+        Add values to the histogram.
+
+        Parameters
+        ----------
+        a : array_like
+            Values to add. They are flattened.
+        weights : array_like, optional
+            Weights of the values, of the same shape as `a`. Each value then
+            contributes its weight to the histogram instead of 1.
+
+        """
+        a = asarray(a)
+        if weights is not None:
+            weights = asarray(weights)
+            if np.any(weights.shape != a.shape):
+                raise ValueError(
+                        'weights should have the same shape as a.')
+            weights = weights.ravel()
+        self.hist = self.hist + _histogram_counts(a.ravel(), weights,
+                                                  self.bin_edges,
+                                                  self._uniform)
+
+    def merge(self, other):
+        """
+        Add the values of another histogram with the same bin edges.
+
+        Parameters
+        ----------
+        other : Histogram
+            Histogram to add.
+
+        """
+        if self.bin_edges.shape != other.bin_edges.shape or \
+           (self.bin_edges != other.bin_edges).any():
+            raise ValueError("histograms with different bin edges cannot "
+                             "be merged")
+        self.hist = self.hist + other.hist
+
+    def density(self):
+        """
+        Return the probability density function of the values added so far.
+
+        Returns
+        -------
+        density : ndarray
+            The histogram normalized as with ``histogram(..., normed=True)``.
+
+        """
+        db = array(np.diff(self.bin_edges), float)
+        return self.hist/(self.hist*db).sum()
 
 
 def histogramdd(sample, bins=10, range=None, normed=False, weights=None):
@@ -280,14 +474,26 @@ def histogramdd(sample, bins=10, range=None, normed=False, weights=None):
 
     # Compute the bin number each sample falls into.
     Ncount = {}
+    uniform = D*[False]
     for i in arange(D):
-        Ncount[i] = digitize(sample[:,i], edges[i])
+        uniform[i] = isscalar(bins[i]) and _uniform_bins(sample[:,i],
+                                                          edges[i])
+        if uniform[i]:
+            # Equal-width bins: compute the bins directly, as histogram
+            # does, putting the outliers in the first and last bins
+            index, keep = _uniform_index(sample[:,i], edges[i])
+            Ncount[i] = where(sample[:,i] < edges[i][0], 0, nbin[i] - 1)
+            Ncount[i][keep] = index + 1
+        else:
+            Ncount[i] = digitize(sample[:,i], edges[i])
 
     # Using digitize, values that fall on an edge are put in the right bin.
     # For the rightmost bin, we want values equal to the right
     # edge to be counted in the last bin, and not as an outlier.
     outliers = zeros(N, int)
     for i in arange(D):
+        if uniform[i]:
+            continue
         # Rounding precision
         decimal = int(-log10(dedges[i].min())) +6
         # Find which points are on the rightmost edge.
@@ -1314,6 +1520,46 @@ def _nanop(op, fill, a, axis=None):
 
     return res
 
+def _nanfloat(a):
+    """
+    Return `a` as an ndarray if the single pass loops of `_nanreduce` can
+    reduce it, that is if it is a non-empty float, double or longdouble
+    array and not a subclass, or None if it has to go through `_nanop`.
+    """
+    if isinstance(a, ndarray) and type(a) is not ndarray:
+        return None
+    y = asarray(a)
+    if y.dtype.char not in 'fdg' or y.size == 0:
+        return None
+    return y
+
+def _nanscalar(res):
+    # Reductions over nans only give the nan object, as in _nanop
+    if np.isscalar(res) and isnan(res):
+        return np.nan
+    return res
+
+def _nanarg(res):
+    if np.isscalar(res):
+        if res < 0:
+            return np.nan
+    elif (res < 0).any():
+        raise ValueError("All-NaN slice encountered")
+    return res
+
+def _nanmasked(op, a, axis, **kwargs):
+    """
+    Reduction `op` of the elements of `a` that are not nans, for the types
+    `_nanreduce` does not handle, through masked arrays.
+    """
+    y = np.ma.array(a, mask=isnan(a))
+    res = getattr(y, op)(axis=axis, **kwargs)
+    if isinstance(a, np.ma.MaskedArray):
+        return res
+    if res is np.ma.masked:
+        return np.nan
+    return np.ma.filled(res, np.nan)
+
 def nansum(a, axis=None):
     """
     Return the sum of array elements over a given axis treating
@@ -1380,7 +1626,10 @@ def nansum(a, axis=None):
     nan
 
     """
-    return _nanop(np.sum, 0, a, axis)
+    y = _nanfloat(a)
+    if y is None:
+        return _nanop(np.sum, 0, a, axis)
+    return _nanscalar(_nanreduce(y, 'sum', axis))
 
 def nanmin(a, axis=None):
     """
@@ -1436,7 +1685,10 @@ def nanmin(a, axis=None):
     -inf
 
     """
-    return _nanop(np.min, np.inf, a, axis)
+    y = _nanfloat(a)
+    if y is None:
+        return _nanop(np.min, np.inf, a, axis)
+    return _nanscalar(_nanreduce(y, 'min', axis))
 
 def nanargmin(a, axis=None):
     """
@@ -1471,7 +1723,10 @@ def nanargmin(a, axis=None):
     array([1, 0])
 
     """
-    return _nanop(np.argmin, np.inf, a, axis)
+    y = _nanfloat(a)
+    if y is None:
+        return _nanop(np.argmin, np.inf, a, axis)
+    return _nanarg(_nanreduce(y, 'argmin', axis))
 
 def nanmax(a, axis=None):
     """
@@ -1529,7 +1784,10 @@ def nanmax(a, axis=None):
     inf
 
     """
-    return _nanop(np.max, -np.inf, a, axis)
+    y = _nanfloat(a)
+    if y is None:
+        return _nanop(np.max, -np.inf, a, axis)
+    return _nanscalar(_nanreduce(y, 'max', axis))
 
 def nanargmax(a, axis=None):
     """
@@ -1564,7 +1822,150 @@ def nanargmax(a, axis=None):
     array([1, 1])
 
     """
-    return _nanop(np.argmax, -np.inf, a, axis)
+    y = _nanfloat(a)
+    if y is None:
+        return _nanop(np.argmax, -np.inf, a, axis)
+    return _nanarg(_nanreduce(y, 'argmax', axis))
+
+def nanmean(a, axis=None):
+    """
+    Compute the arithmetic mean along the specified axis, ignoring NaNs.
+
+    Parameters
+    ----------
+    a : array_like
+        Array containing numbers whose mean is desired. If `a` is not an
+        array, a conversion is attempted.
+    axis : int, optional
+        Axis along which the means are computed. The default is to compute
+        the mean of the flattened array.
+
+    Returns
+    -------
+    m : ndarray
+        A new array holding the result, or a scalar if `axis` is None.
+        NaN is returned where all the elements are NaNs.  Integer input
+        gives float64 results, floating point input keeps its type.
+
+    See Also
+    --------
+    mean : Arithmetic mean taking NaNs into account.
+    nanvar, nanstd, nansum
+
+    Notes
+    -----
+    Floating point arrays are reduced in a single pass over the data,
+    without making a copy of the input or a mask of its NaNs.  Float32
+    sums are accumulated in float64.
+
+    Examples
+    --------
+    >>> a = np.array([[1, np.nan], [3, 4]])
+    >>> np.nanmean(a)
+    2.6666666666666665
+    >>> np.nanmean(a, axis=0)
+    array([ 2.,  4.])
+    >>> np.nanmean(a, axis=1)
+    array([ 1. ,  3.5])
+
+    """
+    y = _nanfloat(a)
+    if y is not None:
+        return _nanscalar(_nanreduce(y, 'mean', axis))
+    y = array(a, subok=True)
+    if np.issubdtype(y.dtype, np.integer):
+        return y.mean(axis)
+    return _nanmasked('mean', y, axis)
+
+def nanvar(a, axis=None, ddof=0):
+    """
+    Compute the variance along the specified axis, ignoring NaNs.
+
+    Parameters
+    ----------
+    a : array_like
+        Array containing numbers whose variance is desired. If `a` is not
+        an array, a conversion is attempted.
+    axis : int, optional
+        Axis along which the variance is computed. The default is to
+        compute the variance of the flattened array.
+    ddof : int, optional
+        "Delta Degrees of Freedom": the divisor used in the calculation is
+        ``N - ddof``, where ``N`` represents the number of non-NaN
+        elements. By default `ddof` is zero.
+
+    Returns
+    -------
+    variance : ndarray
+        A new array holding the result, or a scalar if `axis` is None.
+        NaN is returned where there are no more than `ddof` non-NaN
+        elements.
+
+    See Also
+    --------
+    var : Variance taking NaNs into account.
+    nanmean, nanstd
+
+    Notes
+    -----
+    Floating point arrays are reduced in a single pass over the data with
+    Welford's updating formulas, without making a copy of the input or a
+    mask of its NaNs.
+
+    Examples
+    --------
+    >>> a = np.array([[1, np.nan], [3, 4]])
+    >>> np.nanvar(a, axis=0)
+    array([ 1.,  0.])
+    >>> np.nanvar(a, axis=1)
+    array([ 0.  ,  0.25])
+
+    """
+    y = _nanfloat(a)
+    if y is not None:
+        return _nanscalar(_nanreduce(y, 'var', axis, ddof))
+    y = array(a, subok=True)
+    if np.issubdtype(y.dtype, np.integer):
+        return y.var(axis, ddof=ddof)
+    return _nanmasked('var', y, axis, ddof=ddof)
+
+def nanstd(a, axis=None, ddof=0):
+    """
+    Compute the standard deviation along the specified axis, ignoring NaNs.
+
+    Parameters
+    ----------
+    a : array_like
+        Array containing numbers whose standard deviation is desired. If
+        `a` is not an array, a conversion is attempted.
+    axis : int, optional
+        Axis along which the standard deviation is computed. The default
+        is to compute the standard deviation of the flattened array.
+    ddof : int, optional
+        "Delta Degrees of Freedom": the divisor used in the calculation is
+        ``N - ddof``, where ``N`` represents the number of non-NaN
+        elements. By default `ddof` is zero.
+
+    Returns
+    -------
+    standard_deviation : ndarray
+        A new array holding the result, or a scalar if `axis` is None.
+        NaN is returned where there are no more than `ddof` non-NaN
+        elements.
+
+    See Also
+    --------
+    std : Standard deviation taking NaNs into account.
+    nanvar, nanmean
+
+    Examples
+    --------
+    >>> a = np.array([[1, np.nan], [3, 4]])
+    >>> np.nanstd(a, axis=0)
+    array([ 1.,  0.])
+
+    """
+    return _nanscalar(sqrt(nanvar(a, axis, ddof)))
 
 def disp(mesg, device=None, linefeed=True):
     """
@@ -2805,7 +3206,7 @@ def median(a, axis=None, out=None, overwrite_input=False):
        calculations. The input array will be modified by the call to
        median. This will save memory when you do not need to preserve
        the contents of the input array. Treat the input as undefined,
-       but it will probably be fully or partially sorted. Default is
+       but it will probably be partially sorted. Default is
        False. Note that, if `overwrite_input` is True and the input
        is not already an ndarray, an error will be raised.
 
@@ -2859,25 +3260,37 @@ def median(a, axis=None, out=None, overwrite_input=False):
     """
     if overwrite_input:
         if axis is None:
-            sorted = a.ravel()
-            sorted.sort()
+            part = a.ravel()
         else:
-            a.sort(axis=axis)
-            sorted = a
+            part = a
     else:
-        sorted = sort(a, axis=axis)
+        part = np.asanyarray(a)
+        if axis is None:
+            part = part.ravel()
     if axis is None:
         axis = 0
-    indexer = [slice(None)] * sorted.ndim
-    index = int(sorted.shape[axis]/2)
-    if sorted.shape[axis] % 2 == 1:
+    n = part.shape[axis]
+    index = int(n/2)
+    if n == 0:
+        kth = []
+    elif n % 2 == 1:
+        kth = [index]
+    else:
+        kth = [index-1, index]
+    # only the middle elements need to be in their sorted position
+    if overwrite_input:
+        part.partition(kth, axis=axis)
+    else:
+        part = partition(part, kth, axis=axis)
+    indexer = [slice(None)] * part.ndim
+    if n % 2 == 1:
         # index with slice to allow mean (below) to work
         indexer[axis] = slice(index, index+1)
     else:
         indexer[axis] = slice(index-1, index+1)
     # Use mean in odd and even case to coerce data type
     # and check, use out array.
-    return mean(sorted[indexer], axis=axis, out=out)
+    return mean(part[indexer], axis=axis, out=out)
 
 def percentile(a, q, axis=None, out=None, overwrite_input=False):
     """
@@ -2903,7 +3316,7 @@ def percentile(a, q, axis=None, out=None, overwrite_input=False):
        calculations. The input array will be modified by the call to
        median. This will save memory when you do not need to preserve
        the contents of the input array. Treat the input as undefined,
-       but it will probably be fully or partially sorted. Default is
+       but it will probably be partially sorted. Default is
        False. Note that, if `overwrite_input` is True and the input
        is not already an ndarray, an error will be raised.
 
@@ -2958,26 +3371,43 @@ def percentile(a, q, axis=None, out=None, overwrite_input=False):
     """
     a = np.asarray(a)
 
-    if q == 0:
-        return a.min(axis=axis, out=out)
-    elif q == 100:
-        return a.max(axis=axis, out=out)
-        
+    if isscalar(q):
+        if q == 0:
+            return a.min(axis=axis, out=out)
+        elif q == 100:
+            return a.max(axis=axis, out=out)
+
     if overwrite_input:
         if axis is None:
-            sorted = a.ravel()
-            sorted.sort()
+            part = a.ravel()
         else:
-            a.sort(axis=axis)
-            sorted = a
+            part = a
     else:
-        sorted = sort(a, axis=axis)
+        if axis is None:
+            part = a.flatten()
+        else:
+            part = a.copy()
     if axis is None:
         axis = 0
 
-    return _compute_qth_percentile(sorted, q, axis, out)
-
-# handle sequence of q's without calling sort multiple times
+    # put the neighbours of every requested rank in their sorted
+    # position with a single multi-pivot selection
+    Nx = part.shape[axis]
+    kth = []
+    for qi in np.ravel(q):
+        qi = qi / 100.0
+        if (qi < 0) or (qi > 1):
+            raise ValueError, "percentile must be either in the range [0,100]"
+        if Nx:
+            index = qi*(Nx-1)
+            kth.append(int(index))
+            if int(index) != index:
+                kth.append(int(index) + 1)
+    part.partition(kth, axis=axis)
+
+    return _compute_qth_percentile(part, q, axis, out)
+
+# handle sequence of q's without partitioning multiple times
 def _compute_qth_percentile(sorted, q, axis, out):
     if not isscalar(q):
         p = [_compute_qth_percentile(sorted, qi, axis, None)
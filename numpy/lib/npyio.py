@@ -1,5 +1,6 @@
-__all__ = ['savetxt', 'loadtxt', 'genfromtxt', 'ndfromtxt', 'mafromtxt',
-        'recfromtxt', 'recfromcsv', 'load', 'loads', 'save', 'savez',
+__all__ = ['savetxt', 'loadtxt', 'iterloadtxt', 'genfromtxt',
+        'itergenfromtxt', 'ndfromtxt', 'mafromtxt', 'recfromtxt',
+        'recfromcsv', 'load', 'loads', 'save', 'savez', 'savez_compressed',
         'packbits', 'unpackbits', 'fromregex', 'DataSource']
 
 import numpy as np
@@ -8,19 +9,21 @@ import sys
 import os
 import sys
 import itertools
+import threading
 import warnings
 from operator import itemgetter
 
 from cPickle import load as _cload, loads
 from _datasource import DataSource
-from _compiled_base import packbits, unpackbits
+from _compiled_base import packbits, unpackbits, _loadtxt, _convert_strings, \
+     _format_rows
 
 from _iotools import LineSplitter, NameValidator, StringConverter, \
                      ConverterError, ConverterLockError, ConversionWarning, \
                      _is_string_like, has_nested_fields, flatten_dtype, \
-                     easy_dtype, _bytes_to_name
+                     easy_dtype, _bytes_to_name, _int_from_float
 
-from numpy.compat import asbytes, asstr, asbytes_nested, bytes
+from numpy.compat import asbytes, asstr, asbytes_nested, bytes, isfileobj
 
 if sys.version_info[0] >= 3:
     from io import BytesIO
@@ -110,6 +113,33 @@ class BagObj(object):
 
 
 
+class _PrefixedFile(object):
+    """
+    Read-only file object giving `prefix` followed by the rest of `fp`.
+
+    Only `read` sees the prefix, all other attributes are those of `fp`;
+    `format.read_array` reads the whole magic string with `read` before
+    it uses anything else.
+
+    """
+    def __init__(self, prefix, fp):
+        self.prefix = prefix
+        self.fp = fp
+
+    def read(self, size=-1):
+        prefix = self.prefix
+        if size < 0:
+            self.prefix = asbytes('')
+            return prefix + self.fp.read()
+        self.prefix = prefix[size:]
+        if len(prefix) >= size:
+            return prefix[:size]
+        return prefix + self.fp.read(size - len(prefix))
+
+    def __getattr__(self, name):
+        return getattr(self.fp, name)
+
+
 class NpzFile(object):
     """
     NpzFile(fid)
@@ -142,6 +172,10 @@ class NpzFile(object):
     fid : file or str
         The zipped archive to open. This is either a file-like object
         or a string containing the path to the archive.
+    mmap_mode : {None, 'r', 'c'}, optional
+        If not None, the arrays stored uncompressed in an archive on disk
+        are memory-mapped with the given mode (see `numpy.memmap`) instead
+        of being read into memory.  Compressed members are always read.
 
     Examples
     --------
@@ -163,7 +197,7 @@ class NpzFile(object):
     array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
 
     """
-    def __init__(self, fid):
+    def __init__(self, fid, mmap_mode=None):
         # Import is postponed to here since zipfile depends on gzip, an optional
         # component of the so-called standard library.
         import zipfile
@@ -177,16 +211,10 @@ class NpzFile(object):
                 self.files.append(x)
         self.zip = _zip
         self.f = BagObj(self)
+        self.fid = fid
+        self.mmap_mode = mmap_mode
 
     def __getitem__(self, key):
-        # FIXME: This seems like it will copy strings around
-        #   more than is strictly necessary.  The zipfile
-        #   will read the string and then
-        #   the format.read_array will copy the string
-        #   to another place in memory.
-        #   It would be better if the zipfile could read
-        #   (or at least uncompress) the data
-        #   directly into the array memory.
         member = 0
         if key in self._files:
             member = 1
@@ -194,15 +222,79 @@ class NpzFile(object):
             member = 1
             key += '.npy'
         if member:
-            bytes = self.zip.read(key)
-            if bytes.startswith(format.MAGIC_PREFIX):
-                value = BytesIO(bytes)
-                return format.read_array(value)
-            else:
-                return bytes
+            if self.mmap_mode in ('r', 'c', 'readonly', 'copyonwrite'):
+                array = self._memmap_member(key)
+                if array is not None:
+                    return array
+            if not hasattr(self.zip, 'open'):
+                # Python < 2.6 can only read whole members.
+                bytes = self.zip.read(key)
+                if bytes.startswith(format.MAGIC_PREFIX):
+                    value = BytesIO(bytes)
+                    return format.read_array(value)
+                else:
+                    return bytes
+            # Stream the member so that the array data is inflated directly
+            # into the array buffer instead of through intermediate strings.
+            fp = self.zip.open(key)
+            try:
+                prefix = fp.read(len(format.MAGIC_PREFIX))
+                if prefix == format.MAGIC_PREFIX:
+                    array = format.read_array(_PrefixedFile(prefix, fp))
+                    # Reading up to the end makes zipfile check the CRC.
+                    fp.read()
+                    return array
+                else:
+                    return prefix + fp.read()
+            finally:
+                fp.close()
         else:
             raise KeyError, "%s is not a file in the archive" % key
 
+    def _memmap_member(self, key):
+        """
+        Memory-map an uncompressed ``.npy`` member of the archive.
+
+        Returns None if the member cannot be mapped, i.e. if it is
+        compressed or encrypted, if it does not hold a ``.npy`` file or holds
+        Python objects, or if the archive is not a file on disk.
+
+        """
+        import zipfile
+        import struct
+        info = self.zip.getinfo(key)
+        if (info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1
+            or not isfileobj(self.fid)):
+            return None
+        # The data starts after the local file header, whose name and extra
+        # fields may differ in length from those of the central directory.
+        self.fid.seek(info.header_offset)
+        header = self.fid.read(30)
+        if len(header) != 30 or header[:4] != asbytes('PK\x03\x04'):
+            return None
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        start = info.header_offset + 30 + name_len + extra_len
+        self.fid.seek(start)
+        if self.fid.read(len(format.MAGIC_PREFIX)) != format.MAGIC_PREFIX:
+            return None
+        self.fid.seek(start)
+        version = format.read_magic(self.fid)
+        shape, fortran_order, dtype = format._read_array_header(self.fid,
+                                                                version)
+        if dtype.hasobject or dtype.itemsize == 0:
+            return None
+        count = 1
+        for n in shape:
+            count *= n
+        offset = self.fid.tell()
+        if count == 0 or offset + count * dtype.itemsize > start + info.file_size:
+            return None
+        if fortran_order:
+            order = 'F'
+        else:
+            order = 'C'
+        return np.memmap(self.fid, dtype=dtype, shape=shape, order=order,
+                         mode=self.mmap_mode, offset=offset)
 
     def __iter__(self):
         return iter(self.files)
@@ -242,8 +334,10 @@ def load(file, mmap_mode=None):
         If the filename extension is ``.gz``, the file is first decompressed.
     mmap_mode: {None, 'r+', 'r', 'w+', 'c'}, optional
         If not None, then memory-map the file, using the given mode
-        (see `numpy.memmap`).  The mode has no effect for pickled or
-        zipped files.
+        (see `numpy.memmap`).  The mode has no effect for pickled files.
+        For ``.npz`` files, the read-only modes 'r' and 'c' memory-map
+        the arrays that are stored uncompressed in the archive; other
+        modes have no effect.
         A memory-mapped array is stored on disk, and not directly loaded
         into memory.  However, it can be accessed and sliced like any
         ndarray.  Memory mapping is especially useful for accessing
@@ -306,7 +400,7 @@ def load(file, mmap_mode=None):
     magic = fid.read(N)
     fid.seek(-N, 1) # back-up
     if magic.startswith(_ZIP_PREFIX):  # zip-file (assume .npz)
-        return NpzFile(fid)
+        return NpzFile(fid, mmap_mode=mmap_mode)
     elif magic == format.MAGIC_PREFIX: # .npy file
         if mmap_mode:
             return format.open_memmap(file, mode=mmap_mode)
@@ -397,6 +491,7 @@ def savez(file, *args, **kwds):
     --------
     save : Save a single array to a binary file in NumPy format.
     savetxt : Save an array to a file as plain text.
+    savez_compressed : Save several arrays into a compressed ``.npz`` archive.
 
     Notes
     -----
@@ -439,6 +534,67 @@ def savez(file, *args, **kwds):
 
     """
 
+    _savez(file, args, kwds, False)
+
+def savez_compressed(file, *args, **kwds):
+    """
+    Save several arrays into a single file in compressed ``.npz`` format.
+
+    If arguments are passed in with no keywords, the corresponding variable
+    names, in the .npz file, are 'arr_0', 'arr_1', etc. If keyword arguments
+    are given, the corresponding variable names, in the ``.npz`` file will
+    match the keyword names.
+
+    Parameters
+    ----------
+    file : str or file
+        Either the file name (string) or an open file (file-like object)
+        where the data will be saved. If file is a string, the ``.npz``
+        extension will be appended to the file name if it is not already there.
+    \\*args : Arguments, optional
+        Arrays to save to the file. The arrays will be saved with names
+        "arr_0", "arr_1", and so on.
+    \\*\\*kwds : Keyword arguments, optional
+        Arrays to save to the file. Arrays will be saved in the file with the
+        keyword names. The keyword ``compresslevel`` is reserved: it sets
+        the zlib compression level, an integer from 0 (no compression) to 9
+        (slowest, best compression). The default is 6.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    savez : Save several arrays into an uncompressed ``.npz`` archive.
+    load : Load the files created by savez_compressed.
+
+    Notes
+    -----
+    The arrays are compressed concurrently, one per thread, with up to as
+    many threads as there are processors. Each array is compressed in
+    blocks into a temporary file as it is written, so no copy of its full
+    data is made in memory.
+
+    Examples
+    --------
+    >>> from tempfile import TemporaryFile
+    >>> outfile = TemporaryFile()
+    >>> x = np.arange(10)
+    >>> y = np.zeros(1000)
+    >>> np.savez_compressed(outfile, x=x, y=y, compresslevel=9)
+    >>> outfile.seek(0)
+    >>> npzfile = np.load(outfile)
+    >>> npzfile['x']
+    array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+    """
+    compresslevel = kwds.pop('compresslevel', 6)
+    if compresslevel not in range(10):
+        raise ValueError("compresslevel must be an integer between 0 and 9")
+    _savez(file, args, kwds, True, compresslevel)
+
+def _savez(file, args, kwds, compress, compresslevel=6):
     # Import is postponed to here since zipfile depends on gzip, an optional
     # component of the so-called standard library.
     import zipfile
@@ -456,6 +612,16 @@ def savez(file, *args, **kwds):
             raise ValueError, "Cannot use un-named variables and keyword %s" % key
         namedict[key] = val
 
+    if compress:
+        zip = zipfile.ZipFile(file, mode="w",
+                              compression=zipfile.ZIP_DEFLATED,
+                              allowZip64=True)
+        try:
+            _write_deflated_members(zip, namedict, compresslevel)
+        finally:
+            zip.close()
+        return
+
     zip = zipfile.ZipFile(file, mode="w")
 
     # Stage arrays in a temporary file on disk, before writing to zip.
@@ -478,6 +644,131 @@ def savez(file, *args, **kwds):
 
     zip.close()
 
+
+class _DeflatedMember(object):
+    """
+    Writable file-like object deflating its input into a temporary file.
+
+    The temporary file holds a raw deflate stream that can be copied as is
+    into a zip archive, once `close` has been called.
+
+    """
+    def __init__(self, compresslevel):
+        import tempfile
+        import zlib
+        self._zlib = zlib
+        self._compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                            -zlib.MAX_WBITS)
+        self.fid = tempfile.TemporaryFile()
+        self.CRC = 0
+        self.file_size = 0
+        self.compress_size = 0
+
+    def _write_compressed(self, data):
+        self.fid.write(data)
+        self.compress_size += len(data)
+
+    def write(self, data):
+        # The compression releases the GIL, the CRC (in Python 2) does not.
+        self.CRC = self._zlib.crc32(data, self.CRC)
+        self.file_size += len(data)
+        self._write_compressed(self._compressor.compress(data))
+
+    def close(self):
+        self._write_compressed(self._compressor.flush())
+        self.CRC &= 0xffffffff
+        self.fid.seek(0)
+
+
+def _cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+def _write_deflated_members(zip, namedict, compresslevel):
+    """
+    Write the arrays of `namedict` as deflated ``.npy`` members of `zip`.
+
+    The arrays are compressed by a pool of threads into temporary files,
+    which the calling thread copies into the archive as they are finished.
+
+    """
+    import threading
+    import zipfile
+    import time
+    import Queue
+
+    todo = Queue.Queue()
+    done = Queue.Queue()
+    for item in namedict.iteritems():
+        todo.put(item)
+    nthreads = min(_cpu_count(), len(namedict))
+
+    def worker():
+        while 1:
+            try:
+                key, val = todo.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                member = _DeflatedMember(compresslevel)
+                format.write_array(member, np.asanyarray(val))
+                member.close()
+                done.put((key, member, None))
+            except:
+                done.put((key, None, sys.exc_info()))
+
+    threads = [threading.Thread(target=worker) for i in range(nthreads)]
+    for t in threads:
+        t.setDaemon(True)
+        t.start()
+    error = None
+    try:
+        for i in range(len(namedict)):
+            key, member, exc_info = done.get()
+            if exc_info is not None:
+                if error is None:
+                    error = exc_info
+                continue
+            try:
+                if error is not None:
+                    continue
+                zinfo = zipfile.ZipInfo(key + '.npy',
+                                        time.localtime(time.time())[:6])
+                zinfo.external_attr = 0600 << 16
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.file_size = member.file_size
+                zinfo.compress_size = member.compress_size
+                zinfo.CRC = member.CRC
+                zinfo.header_offset = zip.fp.tell()
+                # The sizes are known in advance, so the local header can be
+                # written directly, without a trailing data descriptor; it
+                # has the ZIP64 extra field if the sizes need it.
+                zip.fp.write(zinfo.FileHeader())
+                while 1:
+                    data = member.fid.read(format.BUFFER_SIZE)
+                    if not data:
+                        break
+                    zip.fp.write(data)
+                zip.filelist.append(zinfo)
+                zip.NameToInfo[zinfo.filename] = zinfo
+            finally:
+                member.fid.close()
+    except:
+        # Let the workers drain the queue without doing any work.
+        while 1:
+            try:
+                todo.get_nowait()
+            except Queue.Empty:
+                break
+        raise
+    for t in threads:
+        t.join()
+    if error is not None:
+        raise error[0], error[1], error[2]
+
 # Adapted from matplotlib
 
 def _getconv(dtype):
@@ -496,9 +787,163 @@ def _getconv(dtype):
         return str
 
 
+def _loadtxt_native(dtype, dtype_types):
+    """
+    Whether `loadtxt` can parse `dtype` with the compiled parser.
+
+    Only booleans, integers, floats and byte strings in native byte order
+    are supported, either as a plain data-type or as the fields of a
+    structured one.
+
+    """
+    if len(dtype_types) == 1 and \
+       (dtype.names is not None or dtype.subdtype is not None):
+        return False
+    for dt in dtype_types:
+        if dt.kind not in 'biufS' or not dt.isnative:
+            return False
+        if dt.kind == 'S' and dt.itemsize == 0:
+            return False
+    return True
+
+
+# Bounds on the size of the byte ranges parsed by each worker process
+_PARSE_RANGE_MIN = 2**20
+_PARSE_RANGE_MAX = 2**26
+
+# The job of the worker processes, inherited when they are forked
+_parse_job = None
+_parse_lock = threading.Lock()
+
+def _check_workers(workers):
+    if workers is not None:
+        workers = int(workers)
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+    return workers
+
+def _universal_newlines(data):
+    """Translate the line endings of `data` as a file opened with 'U'."""
+    return data.replace(asbytes('\r\n'), asbytes('\n')).replace(
+        asbytes('\r'), asbytes('\n'))
+
+def _parse_range(bounds):
+    """Parse a byte range of the file of `_parse_job`, in a worker."""
+    (fname, header, nheader, parse) = _parse_job
+    try:
+        fh = open(fname, 'rb')
+        try:
+            fh.seek(bounds[0])
+            data = fh.read(bounds[1] - bounds[0])
+        finally:
+            fh.close()
+        # Drop the rows of the header, which the caller already has
+        return parse(BytesIO(header + _universal_newlines(data)))[nheader:]
+    except Exception:
+        # The caller parses the file again serially, to report the error
+        return None
+
+def _parallel_parse(fname, workers, parse, comments, skip):
+    """
+    Parse the text file `fname` in byte ranges, with `workers` processes.
+
+    `parse` takes a file-like object and returns the array of all its rows,
+    with the options of the caller, including skipping its first `skip`
+    lines.  The file is first parsed in the calling process up to its first
+    row, which ends the header of the file.  This header is prepended to every range
+    before it is parsed, so that the ranges find exactly the same number
+    of columns, names and data-type as the serial parser, and its rows are
+    dropped again from the result.
+
+    Returns None when the file cannot be split, or when any range fails or
+    does not match the others: the caller then parses the file serially,
+    which reports errors and warnings exactly as usual.
+
+    """
+    if not (_is_string_like(fname) and os.path.isfile(fname)) or \
+       fname.endswith('.gz') or fname.endswith('.bz2') or \
+       not hasattr(os, 'fork'):
+        return None
+    try:
+        import multiprocessing
+    except ImportError:
+        return None
+
+    # Grow the header line by line, until it holds a row
+    fh = open(fname, 'rb')
+    try:
+        lines = []
+        while True:
+            line = fh.readline()
+            if not line:
+                return None
+            lines.append(_universal_newlines(line))
+            if len(lines) <= skip:
+                continue
+            if comments:
+                line = line.split(comments)[0]
+            if not line.strip():
+                continue
+            header = asbytes('').join(lines)
+            try:
+                first = parse(BytesIO(header))
+            except Exception:
+                return None
+            if len(first):
+                break
+        start = fh.tell()
+
+        # Split the rest of the file at line boundaries
+        fh.seek(0, 2)
+        size = fh.tell()
+        step = min(max((size - start) // (4 * workers), _PARSE_RANGE_MIN),
+                   _PARSE_RANGE_MAX)
+        ranges = []
+        while start < size:
+            end = start + step
+            if end < size:
+                fh.seek(end)
+                fh.readline()
+                end = fh.tell()
+            else:
+                end = size
+            ranges.append((start, end))
+            start = end
+    finally:
+        fh.close()
+    if len(ranges) < 2:
+        return None
+
+    global _parse_job
+    _parse_lock.acquire()
+    try:
+        _parse_job = (fname, header, len(first), parse)
+        try:
+            pool = multiprocessing.Pool(min(workers, len(ranges)))
+        except Exception:
+            # e.g. when called from a daemonic process
+            return None
+    finally:
+        _parse_job = None
+        _parse_lock.release()
+    try:
+        pieces = pool.map(_parse_range, ranges)
+    finally:
+        pool.terminate()
+
+    pieces.insert(0, first)
+    for piece in pieces:
+        if piece is None or piece.dtype != first.dtype or \
+           piece.shape[1:] != first.shape[1:]:
+            return None
+    if isinstance(first, np.ma.MaskedArray):
+        return np.ma.concatenate(pieces)
+    return np.concatenate(pieces)
+
 
 def loadtxt(fname, dtype=float, comments='#', delimiter=None,
-            converters=None, skiprows=0, usecols=None, unpack=False):
+            converters=None, skiprows=0, usecols=None, unpack=False,
+            workers=None):
     """
     Load data from a text file.
 
@@ -533,6 +978,11 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
     unpack : bool, optional
         If True, the returned array is transposed, so that arguments may be
         unpacked using ``x, y, z = loadtxt(...)``. Default is False.
+    workers : int, optional
+        Number of processes parsing the file in parallel. Only used for
+        uncompressed files given by name, on platforms supporting `fork`;
+        otherwise, and by default, the file is parsed by the calling
+        process alone.
 
     Returns
     -------
@@ -542,6 +992,7 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
     See Also
     --------
     load, fromstring, fromregex
+    iterloadtxt : Iterate over the data in chunks of rows.
     genfromtxt : Load data with missing values handled as specified.
     scipy.io.loadmat : reads Matlab(R) data files
 
@@ -551,6 +1002,18 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
     `genfromtxt` function provides more sophisticated handling of, e.g.,
     lines with missing values.
 
+    When no `converters` are given and `dtype` only holds booleans,
+    integers, floats or byte strings, the file is parsed by compiled code
+    directly into the output array.
+
+    With `workers`, the file is split into byte ranges at line boundaries,
+    which are parsed by a pool of processes and concatenated in order.  The
+    result is the same as without `workers`: the number of columns is taken
+    from the first row of the file for every range, and if any range fails
+    to parse, the whole file is parsed again serially so that the error is
+    reported as usual.  The `converters` are then called in the worker
+    processes, and should not depend on any state.
+
     Examples
     --------
     >>> from StringIO import StringIO   # StringIO behaves like a file object
@@ -572,6 +1035,85 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
     >>> y
     array([ 2.,  4.])
 
+    """
+    workers = _check_workers(workers)
+    X = None
+    if workers is not None and workers > 1:
+        def parse(fh):
+            (X,) = _loadtxt_chunks(fh, dtype, comments, delimiter,
+                                   converters, skiprows, usecols, None)
+            return X
+        X = _parallel_parse(fname, workers, parse, asbytes(comments),
+                            skiprows)
+    if X is None:
+        # Without a chunk size, all the rows come back as a single chunk
+        (X,) = _loadtxt_chunks(fname, dtype, comments, delimiter, converters,
+                               skiprows, usecols, None)
+    X = np.squeeze(X)
+    if unpack:
+        return X.T
+    else:
+        return X
+
+
+def iterloadtxt(fname, dtype=float, comments='#', delimiter=None,
+                converters=None, skiprows=0, usecols=None, unpack=False,
+                chunksize=65536):
+    """
+    Iterate over the data of a text file, `chunksize` rows at a time.
+
+    This is the streaming counterpart of `loadtxt`: only one chunk of rows
+    is held in memory at any time, so that files larger than the available
+    memory can be processed.
+
+    Parameters
+    ----------
+    fname, dtype, comments, delimiter, converters, skiprows, usecols
+        See `loadtxt`.
+    unpack : bool, optional
+        If True, each chunk is transposed, as with `loadtxt`.
+    chunksize : int, optional
+        Maximum number of rows per chunk.
+
+    Returns
+    -------
+    chunks : generator
+        Generator of arrays with at most `chunksize` rows each.  Unlike
+        `loadtxt`, the chunks are never squeezed: a plain `dtype` gives 2-D
+        arrays with one column per value, a structured one 1-D arrays.
+
+    See Also
+    --------
+    loadtxt, itergenfromtxt
+
+    Examples
+    --------
+    >>> from StringIO import StringIO
+    >>> c = StringIO("0 1\\n2 3\\n4 5")
+    >>> for chunk in np.iterloadtxt(c, chunksize=2):
+    ...     print chunk.sum(axis=0)
+    [ 2.  4.]
+    [ 4.  5.]
+
+    """
+    chunksize = int(chunksize)
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    chunks = _loadtxt_chunks(fname, dtype, comments, delimiter, converters,
+                             skiprows, usecols, chunksize)
+    if unpack:
+        return (X.T for X in chunks)
+    return chunks
+
+
+def _loadtxt_chunks(fname, dtype, comments, delimiter, converters, skiprows,
+                    usecols, chunksize):
+    """
+    Generator doing the actual work of `loadtxt` and `iterloadtxt`.
+
+    Yields arrays of at most `chunksize` rows, or a single array holding
+    all the rows when `chunksize` is None.
+
     """
     # Type conversions for Py3 convenience
     comments = asbytes(comments)
@@ -598,7 +1140,6 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
         fh = fname
     else:
         raise ValueError('fname must be a string or file handle')
-    X = []
 
     def flatten_dtype(dt):
         """Unpack a structured data-type."""
@@ -623,6 +1164,26 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
         else:
             return []
 
+    def pack_rows(X):
+        """Convert a list of rows to an array of the requested dtype."""
+        if len(dtype_types) > 1:
+            # We're dealing with a structured array, with a dtype such as
+            # [('x', int), ('y', [('s', int), ('t', float)])]
+            #
+            # First, create the array using a flattened dtype:
+            # [('x', int), ('s', int), ('t', float)]
+            #
+            # Then, view the array using the specified dtype.
+            try:
+                flat_dtype = np.dtype([('', t) for t in dtype_types])
+                X = np.array(X, dtype=flat_dtype).view(dtype)
+            except TypeError:
+                # In the case we have an object dtype
+                X = np.array(X, dtype=dtype)
+        else:
+            X = np.array(X, dtype)
+        return X
+
     try:
         # Make sure we're dealing with a proper dtype
         dtype = np.dtype(dtype)
@@ -661,43 +1222,53 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
                     continue
             converters[i] = conv
 
-        # Parse each line, including the first
-        for i, line in enumerate(itertools.chain([first_line], fh)):
-            vals = split_line(line)
-            if len(vals) == 0:
-                continue
-
-            if usecols:
-                vals = [vals[i] for i in usecols]
-
-            # Convert each value according to its column and store
-            X.append(tuple([conv(val) for (conv, val) in zip(converters, vals)]))
-    finally:
+        lines = itertools.chain([first_line], fh)
+        # Without user converters, parse straight into the output buffer
+        if not user_converters and _loadtxt_native(dtype, dtype_types) \
+           and comments and delimiter != asbytes(''):
+            if len(dtype_types) > 1:
+                flat_dtype = np.dtype([('', t) for t in dtype_types])
+            else:
+                flat_dtype = dtype
+            while True:
+                X = _loadtxt(lines, flat_dtype, comments, delimiter, usecols,
+                             converters, max_rows=chunksize or -1)
+                if len(X) == 0:
+                    break
+                if len(dtype_types) > 1:
+                    X = X.view(dtype)
+                yield X
+                if chunksize is None or len(X) < chunksize:
+                    break
+        else:
+            while True:
+                X = []
+                # Parse each line, including the first
+                for line in lines:
+                    vals = split_line(line)
+                    if len(vals) == 0:
+                        continue
+
+                    if usecols:
+                        vals = [vals[i] for i in usecols]
+
+                    # Convert each value according to its column and store
+                    X.append(tuple([conv(val)
+                                    for (conv, val) in zip(converters, vals)]))
+                    if len(X) == chunksize:
+                        break
+                if len(X) == 0:
+                    break
+                yield pack_rows(X)
+                if chunksize is None or len(X) < chunksize:
+                    break
+    except:
+        # No yield in a try/finally block before Python 2.5
         if isstring:
             fh.close()
-
-    if len(dtype_types) > 1:
-        # We're dealing with a structured array, with a dtype such as
-        # [('x', int), ('y', [('s', int), ('t', float)])]
-        #
-        # First, create the array using a flattened dtype:
-        # [('x', int), ('s', int), ('t', float)]
-        #
-        # Then, view the array using the specified dtype.
-        try:
-            X = np.array(X, dtype=np.dtype([('', t) for t in dtype_types]))
-            X = X.view(dtype)
-        except TypeError:
-            # In the case we have an object dtype
-            X = np.array(X, dtype=dtype)
-    else:
-        X = np.array(X, dtype)
-
-    X = np.squeeze(X)
-    if unpack:
-        return X.T
-    else:
-        return X
+        raise
+    if isstring:
+        fh.close()
 
 
 def savetxt(fname, X, fmt='%.18e', delimiter=' ', newline='\n'):
@@ -775,6 +1346,11 @@ def savetxt(fname, X, fmt='%.18e', delimiter=' ', newline='\n'):
     This explanation of ``fmt`` is not complete, for an exhaustive
     specification see [1]_.
 
+    Two-dimensional boolean, integer and float arrays whose columns are
+    all formatted with ``%.Ne``, ``%.Nf``, ``%e``, ``%f`` or (for booleans
+    and integers only) ``%d`` and ``%i`` are formatted in compiled code, by
+    blocks of rows. The output is the same as with the other formats.
+
     References
     ----------
     .. [1] `Format Specification Mini-Language
@@ -826,23 +1402,79 @@ def savetxt(fname, X, fmt='%.18e', delimiter=' ', newline='\n'):
 
     # `fmt` can be a string with multiple insertion points or a list of formats.
     # E.g. '%10.5f\t%10d' or ('%10.5f', '$10d')
+    fmts = None
     if type(fmt) in (list, tuple):
         if len(fmt) != ncol:
             raise AttributeError('fmt has wrong shape.  %s' % str(fmt))
-        format = asstr(delimiter).join(map(asstr, fmt))
+        fmts = map(asstr, fmt)
+        format = asstr(delimiter).join(fmts)
     elif type(fmt) is str:
         if fmt.count('%') == 1:
-            fmt = [fmt, ]*ncol
-            format = delimiter.join(fmt)
+            fmts = [fmt, ]*ncol
+            format = delimiter.join(fmts)
         elif fmt.count('%') != ncol:
             raise AttributeError('fmt has wrong number of %% formats.  %s'
                                  % fmt)
         else:
             format = fmt
 
+    # Numeric 2-D arrays with simple formats are formatted in compiled
+    # code, by blocks of rows.
+    if fmts is not None and X.ndim == 2:
+        specs = _savetxt_specs(fmts, X.dtype)
+        if specs is not None:
+            codes, precisions = specs
+            delimiter = asbytes(delimiter)
+            newline = asbytes(newline)
+            blocksize = max(_SAVETXT_BLOCK // max(ncol, 1), 1)
+            for start in xrange(0, len(X), blocksize):
+                fh.write(_format_rows(X[start:start + blocksize], codes,
+                                      precisions, delimiter, newline))
+            return
+
     for row in X:
         fh.write(asbytes(format % tuple(row) + newline))
 
+# Number of values formatted at once by the fast path of savetxt
+_SAVETXT_BLOCK = 2**16
+
+def _savetxt_specs(fmts, dtype):
+    """
+    Return the format codes and precisions `_format_rows` needs to format
+    the columns of an array of `dtype` with the formats `fmts`, or None if
+    they cannot be formatted exactly as the ``%`` operator would.
+
+    Only the ``%.Ne``, ``%.Nf``, ``%e``, ``%f``, ``%d`` and ``%i`` formats
+    of boolean, integer and float data are handled.
+
+    """
+    if dtype.kind not in 'biuf' or dtype.itemsize > 8:
+        return None
+    codes = []
+    precisions = []
+    for fmt in fmts:
+        match = re.match(r'^%(?:\.(\d+))?([efdi])$', fmt)
+        if match is None:
+            return None
+        prec, code = match.groups()
+        if code in 'di':
+            # Floats are truncated by %d, which the compiled code does not
+            # do, and the largest unsigned integers do not fit a long long.
+            if prec is not None or dtype.kind == 'f' or \
+               (dtype.kind == 'u' and dtype.itemsize == 8):
+                return None
+            code = 'd'
+            prec = 0
+        elif prec is None:
+            prec = 6
+        else:
+            prec = int(prec)
+            if prec > 50:
+                return None
+        codes.append(code)
+        precisions.append(prec)
+    return asbytes(''.join(codes)), tuple(precisions)
+
 import re
 def fromregex(file, regexp, dtype):
     """
@@ -927,6 +1559,63 @@ def fromregex(file, regexp, dtype):
 #####--------------------------------------------------------------------------
 
 
+def _convert_column(converter, values, loose=True, upgrade=False):
+    """
+    Convert a list of strings with a `StringConverter`, as a whole.
+
+    The values of integer and float columns are converted by compiled
+    code, and `converter` is only called for the values it rejects, such as
+    missing ones.  If `upgrade` is True, a value `converter` cannot convert
+    upgrades it, and the column is converted again with the new type.
+
+    Returns a 1-D array.
+    """
+    while True:
+        func = converter.func
+        ttype = np.dtype(converter.type)
+        if (func in (float, int, _int_from_float)) and \
+           (ttype.kind in 'iuf') and ttype.isnative:
+            (column, todo) = _convert_strings(values, ttype, func is int)
+        else:
+            (column, todo) = ([None] * len(values), xrange(len(values)))
+        if upgrade or not loose:
+            call = converter._strict_call
+        else:
+            call = converter._loose_call
+        try:
+            for i in todo:
+                column[i] = call(values[i])
+        except ValueError:
+            if not upgrade:
+                raise
+            converter.upgrade(values[i])
+            continue
+        return np.asarray(column)
+
+
+def _array_from_columns(columns, dtype):
+    """
+    Assemble 1-D arrays into one array of `dtype`.
+
+    The result has one field per column if `dtype` is structured, and one
+    column per array otherwise.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.names:
+        output = np.empty(len(columns[0]), dtype=dtype)
+        for (name, column) in zip(dtype.names, columns):
+            output[name] = column
+    else:
+        if dtype.itemsize == 0:
+            # Flexible type: make room for the largest item
+            dtype = np.dtype((dtype.type, max(c.itemsize for c in columns)))
+        output = np.empty((len(columns[0]), len(columns)), dtype=dtype)
+        for (i, column) in enumerate(columns):
+            output[:, i] = column
+    return output
+
+
+
 
 def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
                skiprows=0, skip_header=0, skip_footer=0, converters=None,
@@ -934,7 +1623,8 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
                usecols=None, names=None,
                excludelist=None, deletechars=None, replace_space='_',
                autostrip=False, case_sensitive=True, defaultfmt="f%i",
-               unpack=None, usemask=False, loose=True, invalid_raise=True):
+               unpack=None, usemask=False, loose=True, invalid_raise=True,
+               sample_rows=None, workers=None):
     """
     Load data from a text file, with missing values handled as specified.
 
@@ -1006,6 +1696,16 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
         If True, an exception is raised if an inconsistency is detected in the
         number of columns.
         If False, a warning is emitted and the offending lines are skipped.
+    sample_rows : int, optional
+        If given, the types of the columns are guessed (when `dtype` is None)
+        from the first `sample_rows` rows only, and the values are then
+        converted column by column, mostly by compiled code.  A later value
+        that does not fit the guessed type of its column upgrades it, and
+        the column is converted again.
+    workers : int, optional
+        Number of processes parsing the file in parallel, as with `loadtxt`.
+        The file is parsed by the calling process alone when `dtype` is
+        None or `skip_footer` is set, as both depend on the whole file.
 
     Returns
     -------
@@ -1016,6 +1716,7 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
     See Also
     --------
     numpy.loadtxt : equivalent function when no data is missing.
+    itergenfromtxt : Iterate over the data in chunks of rows.
 
     Notes
     -----
@@ -1068,6 +1769,112 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
     array((1, 1.3, 'abcde'),
           dtype=[('intvar', '<i8'), ('fltvar', '<f8'), ('strvar', '|S5')])
 
+    """
+    workers = _check_workers(workers)
+    output = None
+    # The deprecated options warn, and the footer and the guessed dtypes
+    # depend on the whole file: leave those to the serial parser
+    if workers is not None and workers > 1 and dtype is not None and \
+       not (skiprows or skip_footer or missing):
+        def parse(fh):
+            # The converters of the user get updated with the column indices
+            if isinstance(converters, dict):
+                user_converters = dict(converters)
+            else:
+                user_converters = converters
+            (output,) = _genfromtxt_chunks(fh, dtype, comments, delimiter,
+                                           0, skip_header, 0,
+                                           user_converters, missing,
+                                           missing_values, filling_values,
+                                           usecols, names, excludelist,
+                                           deletechars, replace_space,
+                                           autostrip, case_sensitive,
+                                           defaultfmt, usemask, loose, True,
+                                           sample_rows, None)
+            return output
+        output = _parallel_parse(fname, workers, parse, asbytes(comments),
+                                 skip_header)
+    if output is None:
+        # Without a chunk size, all the rows come back as a single chunk
+        (output,) = _genfromtxt_chunks(fname, dtype, comments, delimiter,
+                                       skiprows, skip_header,
+                                       skip_footer, converters, missing,
+                                       missing_values, filling_values,
+                                       usecols, names, excludelist, deletechars,
+                                       replace_space, autostrip,
+                                       case_sensitive, defaultfmt, usemask,
+                                       loose, invalid_raise, sample_rows,
+                                       None)
+    if unpack:
+        return output.squeeze().T
+    return output.squeeze()
+
+
+def itergenfromtxt(fname, dtype=float, comments='#', delimiter=None,
+                   skiprows=0, skip_header=0, skip_footer=0, converters=None,
+                   missing='', missing_values=None, filling_values=None,
+                   usecols=None, names=None,
+                   excludelist=None, deletechars=None, replace_space='_',
+                   autostrip=False, case_sensitive=True, defaultfmt="f%i",
+                   unpack=None, usemask=False, loose=True, invalid_raise=True,
+                   sample_rows=None, chunksize=65536):
+    """
+    Iterate over the data of a text file, `chunksize` rows at a time.
+
+    This is the streaming counterpart of `genfromtxt`, and accepts the same
+    parameters, plus `chunksize`.  Only one chunk of rows is held in memory
+    at any time, so that files larger than the available memory can be
+    processed.
+
+    Parameters
+    ----------
+    chunksize : int, optional
+        Maximum number of rows per chunk.
+
+    Returns
+    -------
+    chunks : generator
+        Generator of arrays (or masked arrays, if `usemask` is True) with
+        at most `chunksize` rows each.  The chunks are never squeezed.
+
+    See Also
+    --------
+    genfromtxt, iterloadtxt
+
+    Notes
+    -----
+    With ``dtype=None``, the type of each column is guessed from the rows
+    read so far: a later chunk may thus get a more general type than an
+    earlier one, and string columns are sized per chunk.  Give an explicit
+    `dtype` when all the chunks must share the same one.
+
+    """
+    chunksize = int(chunksize)
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    chunks = _genfromtxt_chunks(fname, dtype, comments, delimiter, skiprows,
+                                skip_header, skip_footer, converters, missing,
+                                missing_values, filling_values, usecols, names,
+                                excludelist, deletechars, replace_space,
+                                autostrip, case_sensitive, defaultfmt, usemask,
+                                loose, invalid_raise, sample_rows, chunksize)
+    if unpack:
+        return (output.T for output in chunks)
+    return chunks
+
+
+def _genfromtxt_chunks(fname, dtype, comments, delimiter, skiprows,
+                       skip_header, skip_footer, converters, missing,
+                       missing_values, filling_values, usecols, names,
+                       excludelist, deletechars, replace_space, autostrip,
+                       case_sensitive, defaultfmt, usemask, loose,
+                       invalid_raise, sample_rows, chunksize):
+    """
+    Generator doing the actual work of `genfromtxt` and `itergenfromtxt`.
+
+    Yields arrays of at most `chunksize` rows, or a single array holding
+    all the rows when `chunksize` is None.
+
     """
     # Py3 data conversions to bytes, for convenience
     comments = asbytes(comments)
@@ -1319,202 +2126,262 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
     # Initialize the output lists ...
     # ... rows
     rows = []
-    append_to_rows = rows.append
     # ... masks
     if usemask:
         masks = []
-        append_to_masks = masks.append
-    # ... invalid
-    invalid = []
-    append_to_invalid = invalid.append
-
-    # Parse each line
-    for (i, line) in enumerate(itertools.chain([first_line, ], fhd)):
-        values = split_line(line)
-        nbvalues = len(values)
-        # Skip an empty line
-        if nbvalues == 0:
-            continue
-        # Select only the columns we need
-        if usecols:
-            try:
-                values = [values[_] for _ in usecols]
-            except IndexError:
+    # ... line numbers and row counts, across chunks
+    lines = enumerate(itertools.chain([first_line, ], fhd))
+    nbrows_done = 0
+    while True:
+        append_to_rows = rows.append
+        if usemask:
+            append_to_masks = masks.append
+        # ... invalid
+        invalid = []
+        append_to_invalid = invalid.append
+
+        # Parse each line, keeping `skip_footer` rows in reserve as long as
+        # we don't know whether they are the last ones
+        eof = True
+        for (i, line) in lines:
+            values = split_line(line)
+            nbvalues = len(values)
+            # Skip an empty line
+            if nbvalues == 0:
+                continue
+            # Select only the columns we need
+            if usecols:
+                try:
+                    values = [values[_] for _ in usecols]
+                except IndexError:
+                    append_to_invalid((i, nbvalues))
+                    continue
+            elif nbvalues != nbcols:
                 append_to_invalid((i, nbvalues))
                 continue
-        elif nbvalues != nbcols:
-            append_to_invalid((i, nbvalues))
-            continue
-        # Store the values
-        append_to_rows(tuple(values))
-        if usemask:
-            append_to_masks(tuple([v.strip() in m
-                                   for (v, m) in zip(values, missing_values)]))
-
-    # Strip the last skip_footer data
-    if skip_footer > 0:
-        rows = rows[:-skip_footer]
-        if usemask:
-            masks = masks[:-skip_footer]
-
-    # Upgrade the converters (if needed)
-    if dtype is None:
-        for (i, converter) in enumerate(converters):
-            current_column = map(itemgetter(i), rows)
-            try:
-                converter.iterupgrade(current_column)
-            except ConverterLockError:
-                errmsg = "Converter #%i is locked and cannot be upgraded: " % i
-                current_column = itertools.imap(itemgetter(i), rows)
-                for (j, value) in enumerate(current_column):
-                    try:
-                        converter.upgrade(value)
-                    except (ConverterError, ValueError):
-                        errmsg += "(occurred line #%i for value '%s')"
-                        errmsg %= (j + 1 + skip_header, value)
-                        raise ConverterError(errmsg)
-
-    # Check that we don't have invalid values
-    if len(invalid) > 0:
-        nbrows = len(rows)
-        # Construct the error message
-        template = "    Line #%%i (got %%i columns instead of %i)" % nbcols
-        if skip_footer > 0:
-            nbrows -= skip_footer
-            errmsg = [template % (i + skip_header + 1, nb)
-                      for (i, nb) in invalid if i < nbrows]
+            # Store the values
+            append_to_rows(tuple(values))
+            if usemask:
+                append_to_masks(tuple([v.strip() in m
+                                       for (v, m) in zip(values,
+                                                         missing_values)]))
+            if chunksize and len(rows) == chunksize + skip_footer:
+                eof = False
+                break
+
+        if eof:
+            # Strip the last skip_footer data
+            if skip_footer > 0:
+                rows = rows[:-skip_footer]
+                if usemask:
+                    masks = masks[:-skip_footer]
+            (next_rows, next_masks) = ([], [])
         else:
-            errmsg = [template % (i + skip_header + 1, nb)
-                      for (i, nb) in invalid]
-        if len(errmsg):
-            errmsg.insert(0, "Some errors were detected !")
-            errmsg = "\n".join(errmsg)
-            # Raise an exception ?
-            if invalid_raise:
-                raise ValueError(errmsg)
-            # Issue a warning ?
-            else:
-                warnings.warn(errmsg, ConversionWarning)
-
-    # Convert each value according to the converter:
-    # We want to modify the list in place to avoid creating a new one...
-#    if loose:
-#        conversionfuncs = [conv._loose_call for conv in converters]
-#    else:
-#        conversionfuncs = [conv._strict_call for conv in converters]
-#    for (i, vals) in enumerate(rows):
-#        rows[i] = tuple([convert(val)
-#                         for (convert, val) in zip(conversionfuncs, vals)])
-    if loose:
-        rows = zip(*[map(converter._loose_call, map(itemgetter(i), rows))
-                     for (i, converter) in enumerate(converters)])
-    else:
-        rows = zip(*[map(converter._strict_call, map(itemgetter(i), rows))
-                     for (i, converter) in enumerate(converters)])
-    # Reset the dtype
-    data = rows
-    if dtype is None:
-        # Get the dtypes from the types of the converters
-        column_types = [conv.type for conv in converters]
-        # Find the columns with strings...
-        strcolidx = [i for (i, v) in enumerate(column_types)
-                     if v in (type('S'), np.string_)]
-        # ... and take the largest number of chars.
-        for i in strcolidx:
-            column_types[i] = "|S%i" % max(len(row[i]) for row in data)
-        #
-        if names is None:
-            # If the dtype is uniform, don't define names, else use ''
-            base = set([c.type for c in converters if c._checked])
-            if len(base) == 1:
-                (ddtype, mdtype) = (list(base)[0], np.bool)
+            (rows, next_rows) = (rows[:chunksize], rows[chunksize:])
+            if usemask:
+                (masks, next_masks) = (masks[:chunksize], masks[chunksize:])
+        # Only the first chunk may be empty
+        if nbrows_done and not rows:
+            break
+
+        # Upgrade the converters (if needed), on the sample rows only
+        if sample_rows is None:
+            sample = rows
+        elif nbrows_done:
+            sample = []
+        else:
+            sample = rows[:sample_rows]
+        if dtype is None:
+            for (i, converter) in enumerate(converters):
+                current_column = map(itemgetter(i), sample)
+                try:
+                    converter.iterupgrade(current_column)
+                except ConverterLockError:
+                    errmsg = "Converter #%i is locked and cannot be upgraded: " % i
+                    current_column = itertools.imap(itemgetter(i), sample)
+                    for (j, value) in enumerate(current_column):
+                        try:
+                            converter.upgrade(value)
+                        except (ConverterError, ValueError):
+                            errmsg += "(occurred line #%i for value '%s')"
+                            errmsg %= (j + 1 + skip_header + nbrows_done,
+                                       value)
+                            raise ConverterError(errmsg)
+
+        # Check that we don't have invalid values
+        if len(invalid) > 0:
+            nbrows = nbrows_done + len(rows)
+            # Construct the error message
+            template = "    Line #%%i (got %%i columns instead of %i)" % nbcols
+            if skip_footer > 0 and eof:
+                nbrows -= skip_footer
+                errmsg = [template % (i + skip_header + 1, nb)
+                          for (i, nb) in invalid if i < nbrows]
             else:
-                ddtype = [(defaultfmt % i, dt)
-                          for (i, dt) in enumerate(column_types)]
-                if usemask:
-                    mdtype = [(defaultfmt % i, np.bool)
-                              for (i, dt) in enumerate(column_types)]
+                errmsg = [template % (i + skip_header + 1, nb)
+                          for (i, nb) in invalid]
+            if len(errmsg):
+                errmsg.insert(0, "Some errors were detected !")
+                errmsg = "\n".join(errmsg)
+                # Raise an exception ?
+                if invalid_raise:
+                    raise ValueError(errmsg)
+                # Issue a warning ?
+                else:
+                    warnings.warn(errmsg, ConversionWarning)
+        nbrows_done += len(rows)
+
+        # Convert each value according to the converter:
+        # We want to modify the list in place to avoid creating a new one...
+    #    if loose:
+    #        conversionfuncs = [conv._loose_call for conv in converters]
+    #    else:
+    #        conversionfuncs = [conv._strict_call for conv in converters]
+    #    for (i, vals) in enumerate(rows):
+    #        rows[i] = tuple([convert(val)
+    #                         for (convert, val) in zip(conversionfuncs, vals)])
+        # When sampling, convert whole columns at once instead
+        columnar = (sample_rows is not None) and (len(rows) > 0) and \
+                   ((dtype is None) or
+                    not (user_converters or
+                         'O' in (_.char for _ in dtype_flat)))
+        if columnar:
+            columns = []
+            for (i, converter) in enumerate(converters):
+                current_column = map(itemgetter(i), rows)
+                try:
+                    columns.append(_convert_column(converter, current_column,
+                                                   loose, dtype is None))
+                except ConverterLockError:
+                    errmsg = "Converter #%i is locked and cannot be upgraded" % i
+                    raise ConverterError(errmsg)
+            rows = columns
+        elif loose:
+            rows = zip(*[map(converter._loose_call, map(itemgetter(i), rows))
+                         for (i, converter) in enumerate(converters)])
         else:
-            ddtype = zip(names, column_types)
-            mdtype = zip(names, [np.bool] * len(column_types))
-        output = np.array(data, dtype=ddtype)
-        if usemask:
-            outputmask = np.array(masks, dtype=mdtype)
-    else:
-        # Overwrite the initial dtype names if needed
-        if names and dtype.names:
-            dtype.names = names
-        # Case 1. We have a structured type
-        if len(dtype_flat) > 1:
-            # Nested dtype, eg  [('a', int), ('b', [('b0', int), ('b1', 'f4')])]
-            # First, create the array using a flattened dtype:
-            # [('a', int), ('b1', int), ('b2', float)]
-            # Then, view the array using the specified dtype.
-            if 'O' in (_.char for _ in dtype_flat):
-                if has_nested_fields(dtype):
-                    errmsg = "Nested fields involving objects "\
-                             "are not supported..."
-                    raise NotImplementedError(errmsg)
+            rows = zip(*[map(converter._strict_call, map(itemgetter(i), rows))
+                         for (i, converter) in enumerate(converters)])
+        # Reset the dtype
+        data = rows
+        if dtype is None:
+            # Get the dtypes from the types of the converters
+            column_types = [conv.type for conv in converters]
+            # Find the columns with strings...
+            strcolidx = [i for (i, v) in enumerate(column_types)
+                         if v in (type('S'), np.string_)]
+            # ... and take the largest number of chars.
+            for i in strcolidx:
+                if columnar:
+                    column_types[i] = data[i].dtype
+                else:
+                    column_types[i] = "|S%i" % max(len(row[i]) for row in data)
+            #
+            if names is None:
+                # If the dtype is uniform, don't define names, else use ''
+                base = set([c.type for c in converters if c._checked])
+                if len(base) == 1:
+                    (ddtype, mdtype) = (list(base)[0], np.bool)
                 else:
-                    output = np.array(data, dtype=dtype)
+                    ddtype = [(defaultfmt % i, dt)
+                              for (i, dt) in enumerate(column_types)]
+                    if usemask:
+                        mdtype = [(defaultfmt % i, np.bool)
+                                  for (i, dt) in enumerate(column_types)]
             else:
-                rows = np.array(data, dtype=[('', _) for _ in dtype_flat])
-                output = rows.view(dtype)
-            # Now, process the rowmasks the same way
+                ddtype = zip(names, column_types)
+                mdtype = zip(names, [np.bool] * len(column_types))
+            if columnar:
+                output = _array_from_columns(data, ddtype)
+            else:
+                output = np.array(data, dtype=ddtype)
             if usemask:
-                rowmasks = np.array(masks,
-                                    dtype=np.dtype([('', np.bool)
-                                    for t in dtype_flat]))
-                # Construct the new dtype
-                mdtype = make_mask_descr(dtype)
-                outputmask = rowmasks.view(mdtype)
-        # Case #2. We have a basic dtype
+                outputmask = np.array(masks, dtype=mdtype)
         else:
-            # We used some user-defined converters
-            if user_converters:
-                ishomogeneous = True
-                descr = []
-                for (i, ttype) in enumerate([conv.type for conv in converters]):
-                    # Keep the dtype of the current converter
-                    if i in user_converters:
-                        ishomogeneous &= (ttype == dtype.type)
-                        if ttype == np.string_:
-                            ttype = "|S%i" % max(len(row[i]) for row in data)
-                        descr.append(('', ttype))
-                    else:
-                        descr.append(('', dtype))
-                # So we changed the dtype ?
-                if not ishomogeneous:
-                    # We have more than one field
-                    if len(descr) > 1:
-                        dtype = np.dtype(descr)
-                    # We have only one field: drop the name if not needed.
+            # Overwrite the initial dtype names if needed
+            if names and dtype.names:
+                dtype.names = names
+            # Case 1. We have a structured type
+            if len(dtype_flat) > 1:
+                # Nested dtype, eg  [('a', int), ('b', [('b0', int), ('b1', 'f4')])]
+                # First, create the array using a flattened dtype:
+                # [('a', int), ('b1', int), ('b2', float)]
+                # Then, view the array using the specified dtype.
+                if 'O' in (_.char for _ in dtype_flat):
+                    if has_nested_fields(dtype):
+                        errmsg = "Nested fields involving objects "\
+                                 "are not supported..."
+                        raise NotImplementedError(errmsg)
                     else:
-                        dtype = np.dtype(ttype)
-            #
-            output = np.array(data, dtype)
-            if usemask:
-                if dtype.names:
-                    mdtype = [(_, np.bool) for _ in dtype.names]
+                        output = np.array(data, dtype=dtype)
+                elif columnar:
+                    output = _array_from_columns(data, [('', _)
+                                                        for _ in dtype_flat])
+                    output = output.view(dtype)
                 else:
-                    mdtype = np.bool
-                outputmask = np.array(masks, dtype=mdtype)
-    # Try to take care of the missing data we missed
-    names = output.dtype.names
-    if usemask and names:
-        for (name, conv) in zip(names or (), converters):
-            missing_values = [conv(_) for _ in conv.missing_values
-                              if _ != asbytes('')]
-            for mval in missing_values:
-                outputmask[name] |= (output[name] == mval)
-    # Construct the final array
-    if usemask:
-        output = output.view(MaskedArray)
-        output._mask = outputmask
-    if unpack:
-        return output.squeeze().T
-    return output.squeeze()
+                    rows = np.array(data, dtype=[('', _) for _ in dtype_flat])
+                    output = rows.view(dtype)
+                # Now, process the rowmasks the same way
+                if usemask:
+                    rowmasks = np.array(masks,
+                                        dtype=np.dtype([('', np.bool)
+                                        for t in dtype_flat]))
+                    # Construct the new dtype
+                    mdtype = make_mask_descr(dtype)
+                    outputmask = rowmasks.view(mdtype)
+            # Case #2. We have a basic dtype
+            else:
+                # We used some user-defined converters
+                ddtype = dtype
+                if user_converters:
+                    ishomogeneous = True
+                    descr = []
+                    for (i, ttype) in enumerate([conv.type for conv in converters]):
+                        # Keep the dtype of the current converter
+                        if i in user_converters:
+                            ishomogeneous &= (ttype == dtype.type)
+                            if ttype == np.string_:
+                                ttype = "|S%i" % max(len(row[i]) for row in data)
+                            descr.append(('', ttype))
+                        else:
+                            descr.append(('', dtype))
+                    # So we changed the dtype ?
+                    if not ishomogeneous:
+                        # We have more than one field
+                        if len(descr) > 1:
+                            ddtype = np.dtype(descr)
+                        # We have only one field: drop the name if not needed.
+                        else:
+                            ddtype = np.dtype(ttype)
+                #
+                if columnar:
+                    output = _array_from_columns(data, ddtype)
+                else:
+                    output = np.array(data, ddtype)
+                if usemask:
+                    if output.dtype.names:
+                        mdtype = [(_, np.bool) for _ in output.dtype.names]
+                    else:
+                        mdtype = np.bool
+                    outputmask = np.array(masks, dtype=mdtype)
+        # Try to take care of the missing data we missed
+        if usemask and output.dtype.names:
+            for (name, conv) in zip(output.dtype.names, converters):
+                values = [conv(_) for _ in conv.missing_values
+                          if _ != asbytes('')]
+                for mval in values:
+                    outputmask[name] |= (output[name] == mval)
+        # Construct the final array
+        if usemask:
+            output = output.view(MaskedArray)
+            output._mask = outputmask
+        yield output
 
+        if eof:
+            break
+        rows = next_rows
+        if usemask:
+            masks = next_masks
 
 
 def ndfromtxt(fname, **kwargs):
@@ -1,6 +1,7 @@
 #include "Python.h"
 #include "structmember.h"
 #include "numpy/noprefix.h"
+#include "numpy/npy_math.h"
 #include "npy_config.h"
 
 static intp
@@ -889,6 +890,1387 @@ io_unpack(PyObject *NPY_UNUSED(self), PyObject *args, PyObject *kwds)
     return pack_or_unpack_bits(obj, axis, 1);
 }
 
+/*
+ * LOADTXT
+ *
+ * Compiled parser used by numpy.lib.npyio.loadtxt for the common case of
+ * numeric (or simple structured) data types without user converters.
+ * Lines are pulled from a Python iterator, split in place and every field
+ * is converted straight into a growable buffer that ends up as the data of
+ * the returned array, so that no Python object is created per value.
+ *
+ * A field that the compiled conversion does not accept is handed to the
+ * Python converter of its column, so that malformed input behaves (and
+ * fails) exactly as it does on the pure Python path.
+ */
+
+typedef struct {
+    char kind;              /* 'b', 'i', 'u', 'f' or 'S' */
+    int itemsize;
+    npy_intp offset;        /* offset of the field within a row */
+    int exact;              /* integers only from integer literals, as int() */
+    PyObject *conv;         /* fallback converter (borrowed reference) */
+    PyArrayObject *tmp;     /* 0-d scratch array used by the fallback */
+} _txtcolumn;
+
+#define _TXT_ISSPACE(c) ((c) == ' ' || (c) == '\t' || (c) == '\n' || \
+                         (c) == '\r' || (c) == '\v' || (c) == '\f')
+
+/* Longest token handled without going through the Python converter */
+#define _TXT_NUMBUF 128
+
+/*
+ * Convert a NUL-terminated string to a double, the way float() does.
+ * Returns 0 on success and -1 (without an exception set) on failure.
+ */
+static int
+_txt_str2double(char *str, double *out)
+{
+#if PY_VERSION_HEX >= 0x02070000
+    *out = PyOS_string_to_double(str, NULL, NULL);
+    if (*out == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return -1;
+    }
+    return 0;
+#else
+    char *end;
+
+    *out = PyOS_ascii_strtod(str, &end);
+    if (end == str || *end != '\0') {
+        return -1;
+    }
+    return 0;
+#endif
+}
+
+/*
+ * Store the token [start, end) in the field pointed to by out.
+ * Returns 0 on success and -1 if the compiled conversion cannot handle
+ * the token, in which case the caller falls back to the Python converter.
+ */
+static int
+_txt_convert(_txtcolumn *col, const char *start, const char *end, char *out)
+{
+    char numbuf[_TXT_NUMBUF];
+    double value;
+    npy_intp len;
+
+    if (col->kind == 'S') {
+        len = end - start;
+        if (len > col->itemsize) {
+            len = col->itemsize;
+        }
+        memcpy(out, start, len);
+        memset(out + len, 0, col->itemsize - len);
+        return 0;
+    }
+
+    /* float() and int() ignore surrounding whitespace */
+    while (start < end && _TXT_ISSPACE(*start)) {
+        start++;
+    }
+    while (end > start && _TXT_ISSPACE(end[-1])) {
+        end--;
+    }
+    len = end - start;
+    if (len == 0 || len >= _TXT_NUMBUF) {
+        return -1;
+    }
+
+    if (col->kind == 'b') {
+        /* bool(int(x)): only plain integer literals are accepted */
+        const char *p = start;
+        int nonzero = 0;
+
+        if (*p == '+' || *p == '-') {
+            p++;
+        }
+        if (p == end) {
+            return -1;
+        }
+        for (; p < end; p++) {
+            if (*p < '0' || *p > '9') {
+                return -1;
+            }
+            nonzero |= (*p != '0');
+        }
+        *(npy_bool *)out = (npy_bool)nonzero;
+        return 0;
+    }
+
+    if (col->exact && col->kind != 'f') {
+        /* int(x): digits only, and few enough for a double to be exact */
+        const char *p = start;
+
+        if (*p == '+' || *p == '-') {
+            p++;
+        }
+        if (p == end || end - p > 15) {
+            return -1;
+        }
+        for (; p < end; p++) {
+            if (*p < '0' || *p > '9') {
+                return -1;
+            }
+        }
+    }
+
+    memcpy(numbuf, start, len);
+    numbuf[len] = '\0';
+    if (_txt_str2double(numbuf, &value) < 0) {
+        return -1;
+    }
+
+    if (col->kind == 'f') {
+        if (col->itemsize == sizeof(npy_float)) {
+            *(npy_float *)out = (npy_float)value;
+        }
+        else if (col->itemsize == sizeof(npy_double)) {
+            *(npy_double *)out = value;
+        }
+        else {
+            *(npy_longdouble *)out = (npy_longdouble)value;
+        }
+        return 0;
+    }
+
+    /* int(float(x)): truncate, and let Python handle anything out of range */
+    if (!(value == value)) {
+        return -1;
+    }
+    value = (value < 0) ? ceil(value) : floor(value);
+    if (col->kind == 'i') {
+        double hi = ldexp(1.0, 8*col->itemsize - 1);
+
+        if (value < -hi || value >= hi) {
+            return -1;
+        }
+        switch (col->itemsize) {
+            case 1:
+                *(npy_int8 *)out = (npy_int8)value;
+                break;
+            case 2:
+                *(npy_int16 *)out = (npy_int16)value;
+                break;
+            case 4:
+                *(npy_int32 *)out = (npy_int32)value;
+                break;
+            default:
+                *(npy_int64 *)out = (npy_int64)value;
+                break;
+        }
+    }
+    else {
+        if (value < 0 || value >= ldexp(1.0, 8*col->itemsize)) {
+            return -1;
+        }
+        switch (col->itemsize) {
+            case 1:
+                *(npy_uint8 *)out = (npy_uint8)value;
+                break;
+            case 2:
+                *(npy_uint16 *)out = (npy_uint16)value;
+                break;
+            case 4:
+                *(npy_uint32 *)out = (npy_uint32)value;
+                break;
+            default:
+                *(npy_uint64 *)out = (npy_uint64)value;
+                break;
+        }
+    }
+    return 0;
+}
+
+/*
+ * Convert the token [start, end) with the Python converter of the column
+ * and store the result with the same rules as numpy.array would.
+ */
+static int
+_txt_convert_python(_txtcolumn *col, const char *start, const char *end,
+                    char *out)
+{
+    PyObject *token, *value;
+    int ret;
+
+    token = PyBytes_FromStringAndSize(start, end - start);
+    if (token == NULL) {
+        return -1;
+    }
+    value = PyObject_CallFunctionObjArgs(col->conv, token, NULL);
+    Py_DECREF(token);
+    if (value == NULL) {
+        return -1;
+    }
+    ret = PyArray_SETITEM(col->tmp, PyArray_DATA(col->tmp), value);
+    Py_DECREF(value);
+    if (ret < 0) {
+        return -1;
+    }
+    memcpy(out, PyArray_DATA(col->tmp), col->itemsize);
+    return 0;
+}
+
+/* Return the first occurrence of needle in [start, end), or end */
+static const char *
+_txt_find(const char *start, const char *end, const char *needle,
+          npy_intp nlen)
+{
+    const char *p;
+
+    for (p = start; p + nlen <= end; p++) {
+        if (*p == *needle && memcmp(p, needle, nlen) == 0) {
+            return p;
+        }
+    }
+    return end;
+}
+
+/*
+ * Split a line into tokens stored as (start, end) offset pairs.
+ * Comments are chopped off and the line is stripped before splitting at
+ * `delim`, or at runs of whitespace when `delim` is NULL, mirroring
+ * ``line.split(comments)[0].strip().split(delimiter)``.
+ * Returns the number of tokens, or -1 on memory error.
+ */
+static npy_intp
+_txt_split(const char *line, npy_intp linelen,
+           const char *comments, npy_intp clen,
+           const char *delim, npy_intp dlen,
+           npy_intp **tokens, npy_intp *maxtokens)
+{
+    const char *start = line, *end, *p, *q;
+    npy_intp ntokens = 0;
+
+    end = _txt_find(line, line + linelen, comments, clen);
+    while (start < end && _TXT_ISSPACE(*start)) {
+        start++;
+    }
+    while (end > start && _TXT_ISSPACE(end[-1])) {
+        end--;
+    }
+    if (start == end) {
+        return 0;
+    }
+
+    p = start;
+    while (1) {
+        if (delim == NULL) {
+            for (q = p; q < end && !_TXT_ISSPACE(*q); q++);
+        }
+        else {
+            q = _txt_find(p, end, delim, dlen);
+        }
+        if (ntokens == *maxtokens) {
+            npy_intp *tmp;
+
+            tmp = realloc(*tokens, 4 * (*maxtokens) * sizeof(npy_intp));
+            if (tmp == NULL) {
+                return -1;
+            }
+            *tokens = tmp;
+            *maxtokens *= 2;
+        }
+        (*tokens)[2*ntokens] = p - line;
+        (*tokens)[2*ntokens + 1] = q - line;
+        ntokens++;
+        if (q == end) {
+            break;
+        }
+        if (delim == NULL) {
+            for (p = q; p < end && _TXT_ISSPACE(*p); p++);
+        }
+        else {
+            p = q + dlen;
+        }
+    }
+    return ntokens;
+}
+
+static char arr_loadtxt__doc__[] =
+    "_loadtxt(lines, dtype, comments, delimiter, usecols, converters,\n"
+    "         max_rows=-1)\n\n"
+    "Parse an iterable of text lines into a new array.\n\n"
+    "`dtype` is either a plain data-type, giving a 2-d result with one\n"
+    "column per converter, or a flat structured data-type with one field\n"
+    "per converter, giving a 1-d result.  `converters` are only called for\n"
+    "values the compiled parser cannot convert by itself.  When\n"
+    "`max_rows` is not negative, parsing stops after that many rows and\n"
+    "the remaining lines are left in the iterator.";
+
+static PyObject *
+arr_loadtxt(PyObject *NPY_UNUSED(self), PyObject *args, PyObject *kwds)
+{
+    PyObject *lines, *convobj, *usecols_obj = Py_None;
+    PyObject *converters = NULL, *iter = NULL, *ret = NULL;
+    PyObject *line = NULL, *bline = NULL;
+    PyArray_Descr *descr;
+    char *comments, *delim = NULL;
+    int clen, dlen = 0;
+    Py_ssize_t max_rows = -1;
+    _txtcolumn *cols = NULL;
+    npy_intp *usecols = NULL, *tokens = NULL, maxtokens = 64;
+    npy_intp ncols, i, rowsize, nrows = 0, maxrows;
+    npy_intp dims[2];
+    char *data = NULL;
+    int structured, nd;
+    static char *kwlist[] = {"lines", "dtype", "comments", "delimiter",
+                             "usecols", "converters", "max_rows", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO&s#z#OO|n", kwlist,
+                &lines, PyArray_DescrConverter, &descr,
+                &comments, &clen, &delim, &dlen,
+                &usecols_obj, &convobj, &max_rows)) {
+        return NULL;
+    }
+    if (clen == 0 || (delim != NULL && dlen == 0)) {
+        PyErr_SetString(PyExc_ValueError, "empty separator");
+        goto fail;
+    }
+    converters = PySequence_Fast(convobj, "converters must be a sequence");
+    if (converters == NULL) {
+        goto fail;
+    }
+    ncols = PySequence_Fast_GET_SIZE(converters);
+    structured = PyDataType_HASFIELDS(descr);
+    if (ncols == 0 || (structured &&
+                       PyTuple_GET_SIZE(descr->names) != ncols)) {
+        PyErr_SetString(PyExc_ValueError,
+                "the number of converters does not match the data-type");
+        goto fail;
+    }
+
+    /* Describe where and how each column is stored */
+    cols = calloc(ncols, sizeof(_txtcolumn));
+    if (cols == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    for (i = 0; i < ncols; i++) {
+        PyArray_Descr *fdescr = descr;
+
+        if (structured) {
+            PyObject *tup, *offset, *title;
+
+            tup = PyDict_GetItem(descr->fields,
+                                 PyTuple_GET_ITEM(descr->names, i));
+            if (tup == NULL || !PyArg_ParseTuple(tup, "OO|O",
+                                                 &fdescr, &offset, &title)) {
+                goto fail;
+            }
+            cols[i].offset = PyInt_AsLong(offset);
+        }
+        else {
+            cols[i].offset = i * descr->elsize;
+        }
+        cols[i].kind = fdescr->kind;
+        cols[i].itemsize = fdescr->elsize;
+        cols[i].exact = 0;
+        if (!((fdescr->kind == 'f' &&
+                    (fdescr->elsize == sizeof(npy_float) ||
+                     fdescr->elsize == sizeof(npy_double) ||
+                     fdescr->elsize == sizeof(npy_longdouble))) ||
+              ((fdescr->kind == 'i' || fdescr->kind == 'u') &&
+                    (fdescr->elsize == 1 || fdescr->elsize == 2 ||
+                     fdescr->elsize == 4 || fdescr->elsize == 8)) ||
+              fdescr->kind == 'b' || fdescr->kind == 'S') ||
+                !PyArray_ISNBO(fdescr->byteorder)) {
+            PyErr_SetString(PyExc_TypeError,
+                    "unsupported data-type for the compiled parser");
+            goto fail;
+        }
+        cols[i].conv = PySequence_Fast_GET_ITEM(converters, i);
+        Py_INCREF(fdescr);
+        cols[i].tmp = (PyArrayObject *)PyArray_NewFromDescr(&PyArray_Type,
+                fdescr, 0, NULL, NULL, NULL, 0, NULL);
+        if (cols[i].tmp == NULL) {
+            goto fail;
+        }
+    }
+    rowsize = structured ? descr->elsize : ncols * descr->elsize;
+
+    if (usecols_obj != Py_None) {
+        if (PySequence_Length(usecols_obj) != ncols) {
+            PyErr_SetString(PyExc_ValueError,
+                    "the number of converters does not match usecols");
+            goto fail;
+        }
+        usecols = malloc(ncols * sizeof(npy_intp));
+        if (usecols == NULL) {
+            PyErr_NoMemory();
+            goto fail;
+        }
+        for (i = 0; i < ncols; i++) {
+            PyObject *item = PySequence_GetItem(usecols_obj, i);
+
+            if (item == NULL) {
+                goto fail;
+            }
+            usecols[i] = PyArray_PyIntAsIntp(item);
+            Py_DECREF(item);
+            if (usecols[i] == -1 && PyErr_Occurred()) {
+                goto fail;
+            }
+        }
+    }
+
+    tokens = malloc(2 * maxtokens * sizeof(npy_intp));
+    maxrows = (rowsize < 65536) ? 65536 / rowsize : 1;
+    if (max_rows >= 0 && max_rows < maxrows) {
+        maxrows = max_rows ? max_rows : 1;
+    }
+    data = PyDataMem_NEW(maxrows * rowsize);
+    if (tokens == NULL || data == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+
+    iter = PyObject_GetIter(lines);
+    if (iter == NULL) {
+        goto fail;
+    }
+    while ((max_rows < 0 || nrows < max_rows) &&
+           (line = PyIter_Next(iter)) != NULL) {
+        char *buf, *row;
+        Py_ssize_t buflen;
+        npy_intp ntokens;
+
+        if (PyUnicode_Check(line)) {
+            bline = PyUnicode_AsLatin1String(line);
+            if (bline == NULL) {
+                goto fail;
+            }
+        }
+        else {
+            Py_INCREF(line);
+            bline = line;
+        }
+        if (PyBytes_AsStringAndSize(bline, &buf, &buflen) < 0) {
+            goto fail;
+        }
+        ntokens = _txt_split(buf, buflen, comments, clen, delim, dlen,
+                             &tokens, &maxtokens);
+        if (ntokens < 0) {
+            PyErr_NoMemory();
+            goto fail;
+        }
+        if (ntokens == 0) {
+            Py_CLEAR(bline);
+            Py_CLEAR(line);
+            continue;
+        }
+        if (usecols == NULL && ntokens < ncols) {
+            PyErr_Format(PyExc_ValueError,
+                    "wrong number of columns in row %ld "
+                    "(got %ld instead of %ld)",
+                    (long)(nrows + 1), (long)ntokens, (long)ncols);
+            goto fail;
+        }
+
+        if (nrows == maxrows) {
+            char *tmp;
+
+            maxrows += maxrows/2 + 1;
+            tmp = PyDataMem_RENEW(data, maxrows * rowsize);
+            if (tmp == NULL) {
+                PyErr_NoMemory();
+                goto fail;
+            }
+            data = tmp;
+        }
+        row = data + nrows * rowsize;
+        for (i = 0; i < ncols; i++) {
+            npy_intp k = i;
+            const char *start, *end;
+
+            if (usecols != NULL) {
+                k = usecols[i];
+                if (k < 0) {
+                    k += ntokens;
+                }
+                if (k < 0 || k >= ntokens) {
+                    PyErr_SetString(PyExc_IndexError,
+                                    "list index out of range");
+                    goto fail;
+                }
+            }
+            start = buf + tokens[2*k];
+            end = buf + tokens[2*k + 1];
+            if (_txt_convert(&cols[i], start, end,
+                             row + cols[i].offset) < 0 &&
+                    _txt_convert_python(&cols[i], start, end,
+                                        row + cols[i].offset) < 0) {
+                goto fail;
+            }
+        }
+        nrows++;
+        Py_CLEAR(bline);
+        Py_CLEAR(line);
+    }
+    if (PyErr_Occurred()) {
+        goto fail;
+    }
+
+    /* Hand the buffer, trimmed to size, over to the new array */
+    if (nrows < maxrows) {
+        char *tmp = PyDataMem_RENEW(data, (nrows ? nrows : 1) * rowsize);
+
+        if (tmp != NULL) {
+            data = tmp;
+        }
+    }
+    dims[0] = nrows;
+    dims[1] = ncols;
+    nd = structured ? 1 : 2;
+    Py_INCREF(descr);
+    ret = PyArray_NewFromDescr(&PyArray_Type, descr, nd, dims, NULL,
+                               data, NPY_CARRAY, NULL);
+    if (ret == NULL) {
+        goto fail;
+    }
+    ((PyArrayObject *)ret)->flags |= NPY_OWNDATA;
+    data = NULL;
+
+fail:
+    Py_XDECREF(iter);
+    Py_XDECREF(line);
+    Py_XDECREF(bline);
+    if (cols != NULL) {
+        for (i = 0; i < ncols; i++) {
+            Py_XDECREF(cols[i].tmp);
+        }
+        free(cols);
+    }
+    Py_XDECREF(converters);
+    Py_DECREF(descr);
+    free(usecols);
+    free(tokens);
+    if (data != NULL) {
+        PyDataMem_FREE(data);
+    }
+    return ret;
+}
+
+static char arr_convert_strings__doc__[] =
+    "_convert_strings(values, dtype, exact=False)\n\n"
+    "Convert a sequence of byte strings to a 1-d array of `dtype`, which\n"
+    "must be a plain boolean, integer, float or byte string data-type.\n\n"
+    "Returns a tuple ``(array, rejected)``, where `rejected` lists the\n"
+    "indices of the values the compiled conversion did not accept, and\n"
+    "whose items in `array` are left uninitialized.  Integers are parsed\n"
+    "as ``int(float(x))`` does, or as ``int(x)`` if `exact` is True, and\n"
+    "booleans as ``bool(int(x))``.";
+
+static PyObject *
+arr_convert_strings(PyObject *NPY_UNUSED(self), PyObject *args,
+                    PyObject *kwds)
+{
+    PyObject *values, *seq = NULL, *rejected = NULL, *ret = NULL;
+    PyArrayObject *arr = NULL;
+    PyArray_Descr *descr;
+    _txtcolumn col;
+    npy_intp i, n;
+    int exact = 0;
+    static char *kwlist[] = {"values", "dtype", "exact", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO&|i", kwlist,
+                &values, PyArray_DescrConverter, &descr, &exact)) {
+        return NULL;
+    }
+    if (PyDataType_HASFIELDS(descr) || descr->subarray != NULL ||
+            !PyArray_ISNBO(descr->byteorder) ||
+            !((descr->kind == 'f' &&
+                    (descr->elsize == sizeof(npy_float) ||
+                     descr->elsize == sizeof(npy_double) ||
+                     descr->elsize == sizeof(npy_longdouble))) ||
+              ((descr->kind == 'i' || descr->kind == 'u') &&
+                    (descr->elsize == 1 || descr->elsize == 2 ||
+                     descr->elsize == 4 || descr->elsize == 8)) ||
+              descr->kind == 'b' ||
+              (descr->kind == 'S' && descr->elsize > 0))) {
+        PyErr_SetString(PyExc_TypeError,
+                "unsupported data-type for the compiled conversion");
+        Py_DECREF(descr);
+        return NULL;
+    }
+    col.kind = descr->kind;
+    col.itemsize = descr->elsize;
+    col.offset = 0;
+    col.exact = exact;
+
+    seq = PySequence_Fast(values, "values must be a sequence");
+    if (seq == NULL) {
+        Py_DECREF(descr);
+        return NULL;
+    }
+    n = PySequence_Fast_GET_SIZE(seq);
+    arr = (PyArrayObject *)PyArray_NewFromDescr(&PyArray_Type, descr, 1, &n,
+                                                NULL, NULL, 0, NULL);
+    rejected = PyList_New(0);
+    if (arr == NULL || rejected == NULL) {
+        goto fail;
+    }
+    for (i = 0; i < n; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+        char *buf;
+        Py_ssize_t len;
+
+        if (!PyBytes_Check(item) ||
+                PyBytes_AsStringAndSize(item, &buf, &len) < 0 ||
+                _txt_convert(&col, buf, buf + len,
+                             PyArray_BYTES(arr) + i*col.itemsize) < 0) {
+            PyObject *index = PyInt_FromLong((long)i);
+
+            if (index == NULL || PyList_Append(rejected, index) < 0) {
+                Py_XDECREF(index);
+                goto fail;
+            }
+            Py_DECREF(index);
+        }
+    }
+    ret = Py_BuildValue("(OO)", arr, rejected);
+
+fail:
+    Py_DECREF(seq);
+    Py_XDECREF(arr);
+    Py_XDECREF(rejected);
+    return ret;
+}
+
+#undef _TXT_ISSPACE
+#undef _TXT_NUMBUF
+
+
+/*
+ * Fast path of savetxt: formatting of whole blocks of rows.
+ */
+
+static int
+_fmt_append(char **buf, npy_intp *len, npy_intp *cap, const char *s,
+            npy_intp n)
+{
+    if (*len + n > *cap) {
+        npy_intp newcap = *cap + *cap/2 + n;
+        char *tmp = PyMem_Realloc(*buf, newcap);
+
+        if (tmp == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        *buf = tmp;
+        *cap = newcap;
+    }
+    memcpy(*buf + *len, s, n);
+    *len += n;
+    return 0;
+}
+
+/* Append the text of '%d' % v */
+static int
+_fmt_longlong(char **buf, npy_intp *len, npy_intp *cap, npy_longlong v)
+{
+    char tmp[32];
+    char *p = tmp + sizeof(tmp);
+    npy_ulonglong u = v < 0 ? -(npy_ulonglong)v : (npy_ulonglong)v;
+
+    do {
+        *--p = (char)('0' + u % 10);
+        u /= 10;
+    } while (u != 0);
+    if (v < 0) {
+        *--p = '-';
+    }
+    return _fmt_append(buf, len, cap, p, tmp + sizeof(tmp) - p);
+}
+
+/* Append the text of '%.<prec><code>' % v, the way Python formats it */
+static int
+_fmt_double(char **buf, npy_intp *len, npy_intp *cap, double v, char code,
+            int prec)
+{
+#if PY_VERSION_HEX >= 0x02070000
+    char *s = PyOS_double_to_string(v, code, prec, 0, NULL);
+    int ret;
+
+    if (s == NULL) {
+        return -1;
+    }
+    ret = _fmt_append(buf, len, cap, s, strlen(s));
+    PyMem_Free(s);
+    return ret;
+#else
+    char fmt[16], tmp[128];
+
+    /* Before 2.7, Python switched to %g for large numbers */
+    if (code == 'f' && fabs(v) >= 1e50) {
+        code = 'g';
+    }
+    PyOS_snprintf(fmt, sizeof(fmt), "%%.%d%c", prec, code);
+    PyOS_ascii_formatd(tmp, sizeof(tmp), fmt, v);
+    return _fmt_append(buf, len, cap, tmp, strlen(tmp));
+#endif
+}
+
+static char arr_format_rows__doc__[] =
+    "_format_rows(X, codes, precisions, delimiter, newline)\n\n"
+    "Format the rows of the 2-d array `X` as text, like savetxt does with\n"
+    "``format % tuple(row) + newline`` for each row, and return the\n"
+    "resulting byte string.  `codes` holds a character for each column:\n"
+    "'e' or 'f' for the ``%.Ne`` and ``%.Nf`` formats, with N given by\n"
+    "`precisions`, or 'd' for ``%d``.  The columns are cast to double, or\n"
+    "to long long for 'd', before being formatted.";
+
+static PyObject *
+arr_format_rows(PyObject *NPY_UNUSED(self), PyObject *args)
+{
+    PyObject *X, *precisions, *ret = NULL;
+    PyArrayObject *dbl = NULL, *lng = NULL;
+    const char *codes, *delim, *newline;
+    int ncodes, dlen, nllen, *precs = NULL;
+    int use_dbl = 0, use_lng = 0;
+    npy_intp i, j, nrows, ncols, len = 0, cap = 0;
+    char *buf = NULL;
+
+    if (!PyArg_ParseTuple(args, "Os#Os#s#", &X, &codes, &ncodes, &precisions,
+                &delim, &dlen, &newline, &nllen)) {
+        return NULL;
+    }
+    for (j = 0; j < ncodes; j++) {
+        if (codes[j] == 'd') {
+            use_lng = 1;
+        }
+        else if (codes[j] == 'e' || codes[j] == 'f') {
+            use_dbl = 1;
+        }
+        else {
+            PyErr_SetString(PyExc_ValueError, "invalid format code");
+            return NULL;
+        }
+    }
+    if (use_dbl) {
+        dbl = (PyArrayObject *)PyArray_FromAny(X,
+                PyArray_DescrFromType(NPY_DOUBLE), 2, 2,
+                NPY_CARRAY | NPY_FORCECAST, NULL);
+        if (dbl == NULL) {
+            goto fail;
+        }
+    }
+    if (use_lng) {
+        lng = (PyArrayObject *)PyArray_FromAny(X,
+                PyArray_DescrFromType(NPY_LONGLONG), 2, 2,
+                NPY_CARRAY | NPY_FORCECAST, NULL);
+        if (lng == NULL) {
+            goto fail;
+        }
+    }
+    if (dbl != NULL) {
+        nrows = PyArray_DIM(dbl, 0);
+        ncols = PyArray_DIM(dbl, 1);
+    }
+    else if (lng != NULL) {
+        nrows = PyArray_DIM(lng, 0);
+        ncols = PyArray_DIM(lng, 1);
+    }
+    else {
+        nrows = ncols = 0;
+    }
+    if (ncols != ncodes || PySequence_Size(precisions) != ncodes) {
+        PyErr_SetString(PyExc_ValueError,
+                "one format code and precision are needed per column");
+        goto fail;
+    }
+    precs = PyMem_Malloc((ncodes + 1)*sizeof(int));
+    if (precs == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    for (j = 0; j < ncodes; j++) {
+        PyObject *item = PySequence_GetItem(precisions, j);
+
+        if (item == NULL) {
+            goto fail;
+        }
+        precs[j] = (int)PyInt_AsLong(item);
+        Py_DECREF(item);
+        if (precs[j] == -1 && PyErr_Occurred()) {
+            goto fail;
+        }
+    }
+
+    /* A guess of the size of the output, refined as it grows */
+    cap = nrows*(ncols*(dlen + 25) + nllen) + 1;
+    buf = PyMem_Malloc(cap);
+    if (buf == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    for (i = 0; i < nrows; i++) {
+        for (j = 0; j < ncols; j++) {
+            if (j > 0 && _fmt_append(&buf, &len, &cap, delim, dlen) < 0) {
+                goto fail;
+            }
+            if (codes[j] == 'd') {
+                npy_longlong v =
+                    ((npy_longlong *)PyArray_DATA(lng))[i*ncols + j];
+
+                if (_fmt_longlong(&buf, &len, &cap, v) < 0) {
+                    goto fail;
+                }
+            }
+            else {
+                double v = ((double *)PyArray_DATA(dbl))[i*ncols + j];
+
+                if (_fmt_double(&buf, &len, &cap, v, codes[j], precs[j]) < 0) {
+                    goto fail;
+                }
+            }
+        }
+        if (_fmt_append(&buf, &len, &cap, newline, nllen) < 0) {
+            goto fail;
+        }
+    }
+    ret = PyBytes_FromStringAndSize(buf, len);
+
+fail:
+    Py_XDECREF(dbl);
+    Py_XDECREF(lng);
+    PyMem_Free(precs);
+    PyMem_Free(buf);
+    return ret;
+}
+
+
+/*
+ * Open addressing hash table of element indices used by the hash based
+ * set operations.  The elements are compared as raw bytes, so the caller
+ * has to make sure equal values have equal bytes (same dtype, no -0.0).
+ */
+typedef struct {
+    const char *data;
+    npy_intp itemsize;
+    npy_intp mask;
+    npy_intp *slots;
+} _hashtable;
+
+static NPY_INLINE npy_ulonglong
+_hash_mix(npy_ulonglong h)
+{
+    /* the 64 bit finalizer of MurmurHash3 */
+    h ^= h >> 33;
+    h *= ((npy_ulonglong)0xff51afd7UL << 32) | 0xed558ccdUL;
+    h ^= h >> 33;
+    h *= ((npy_ulonglong)0xc4ceb9feUL << 32) | 0x1a85ec53UL;
+    h ^= h >> 33;
+    return h;
+}
+
+static NPY_INLINE npy_ulonglong
+_hash_bytes(const char *p, npy_intp len)
+{
+    npy_ulonglong h = (npy_ulonglong)len, k;
+
+    while (len >= 8) {
+        memcpy(&k, p, 8);
+        h = _hash_mix(h ^ k);
+        p += 8;
+        len -= 8;
+    }
+    if (len > 0) {
+        k = 0;
+        memcpy(&k, p, len);
+        h = _hash_mix(h ^ k);
+    }
+    return h;
+}
+
+static int
+_ht_init(_hashtable *ht, const char *data, npy_intp itemsize, npy_intp n)
+{
+    npy_intp i, size = 8;
+
+    /* keep the load factor at or below one half */
+    while (size < 2*n) {
+        size <<= 1;
+    }
+    ht->data = data;
+    ht->itemsize = itemsize;
+    ht->mask = size - 1;
+    ht->slots = PyMem_Malloc(size*sizeof(npy_intp));
+    if (ht->slots == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < size; i++) {
+        ht->slots[i] = -1;
+    }
+    return 0;
+}
+
+/* Index of the element equal to `p` in the table, or -1 */
+static NPY_INLINE npy_intp
+_ht_find(_hashtable *ht, const char *p)
+{
+    npy_intp slot = (npy_intp)(_hash_bytes(p, ht->itemsize) & ht->mask);
+    npy_intp j;
+
+    while ((j = ht->slots[slot]) >= 0) {
+        if (memcmp(ht->data + j*ht->itemsize, p, ht->itemsize) == 0) {
+            return j;
+        }
+        slot = (slot + 1) & ht->mask;
+    }
+    return -1;
+}
+
+/*
+ * Adds element `i` of the table data unless an equal one is already
+ * there, and returns the index of the element kept in the table.
+ */
+static NPY_INLINE npy_intp
+_ht_insert(_hashtable *ht, npy_intp i)
+{
+    const char *p = ht->data + i*ht->itemsize;
+    npy_intp slot = (npy_intp)(_hash_bytes(p, ht->itemsize) & ht->mask);
+    npy_intp j;
+
+    while ((j = ht->slots[slot]) >= 0) {
+        if (memcmp(ht->data + j*ht->itemsize, p, ht->itemsize) == 0) {
+            return j;
+        }
+        slot = (slot + 1) & ht->mask;
+    }
+    ht->slots[slot] = i;
+    return i;
+}
+
+static char arr_unique_hash__doc__[] =
+    "_unique_hash(ar) -> (first, inverse)\n\n"
+    "Find the distinct elements of the 1-d array `ar` with a hash table.\n"
+    "`first` holds the index of the first occurrence of each distinct\n"
+    "element, in order of appearance, and `inverse` the position in\n"
+    "`first` of each element of `ar`.  Elements are compared as bytes.";
+
+static PyObject *
+arr_unique_hash(PyObject *NPY_UNUSED(self), PyObject *args)
+{
+    PyObject *obj, *ret = NULL;
+    PyArrayObject *ar = NULL, *first = NULL, *inverse = NULL;
+    _hashtable ht;
+    npy_intp i, j, n, k = 0, *pfirst = NULL, *pinv;
+    NPY_BEGIN_THREADS_DEF;
+
+    ht.slots = NULL;
+    if (!PyArg_ParseTuple(args, "O", &obj)) {
+        return NULL;
+    }
+    ar = (PyArrayObject *)PyArray_FromAny(obj, NULL, 1, 1, NPY_CARRAY, NULL);
+    if (ar == NULL) {
+        return NULL;
+    }
+    n = PyArray_DIM(ar, 0);
+    inverse = (PyArrayObject *)PyArray_SimpleNew(1, &n, PyArray_INTP);
+    if (inverse == NULL) {
+        goto fail;
+    }
+    pfirst = PyMem_Malloc((n + 1)*sizeof(npy_intp));
+    if (pfirst == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    if (_ht_init(&ht, PyArray_DATA(ar), PyArray_ITEMSIZE(ar), n) < 0) {
+        goto fail;
+    }
+    pinv = (npy_intp *)PyArray_DATA(inverse);
+
+    NPY_BEGIN_THREADS;
+    for (i = 0; i < n; i++) {
+        j = _ht_insert(&ht, i);
+        if (j == i) {
+            pfirst[k] = i;
+            pinv[i] = k++;
+        }
+        else {
+            pinv[i] = pinv[j];
+        }
+    }
+    NPY_END_THREADS;
+
+    first = (PyArrayObject *)PyArray_SimpleNew(1, &k, PyArray_INTP);
+    if (first == NULL) {
+        goto fail;
+    }
+    memcpy(PyArray_DATA(first), pfirst, k*sizeof(npy_intp));
+    ret = Py_BuildValue("OO", first, inverse);
+
+fail:
+    PyMem_Free(ht.slots);
+    PyMem_Free(pfirst);
+    Py_XDECREF(first);
+    Py_XDECREF(inverse);
+    Py_DECREF(ar);
+    return ret;
+}
+
+static char arr_in1d_hash__doc__[] =
+    "_in1d_hash(ar1, ar2) -> mask\n\n"
+    "Boolean array telling for each element of the 1-d array `ar1` whether\n"
+    "it is in the 1-d array `ar2`, using a hash table of `ar2`.  Both\n"
+    "arrays must have the same item size; elements are compared as bytes.";
+
+static PyObject *
+arr_in1d_hash(PyObject *NPY_UNUSED(self), PyObject *args)
+{
+    PyObject *obj1, *obj2;
+    PyArrayObject *ar1 = NULL, *ar2 = NULL, *ret = NULL;
+    _hashtable ht;
+    npy_intp i, n1, n2, itemsize;
+    const char *p1;
+    Bool *out;
+    NPY_BEGIN_THREADS_DEF;
+
+    ht.slots = NULL;
+    if (!PyArg_ParseTuple(args, "OO", &obj1, &obj2)) {
+        return NULL;
+    }
+    ar1 = (PyArrayObject *)PyArray_FromAny(obj1, NULL, 1, 1, NPY_CARRAY, NULL);
+    if (ar1 == NULL) {
+        return NULL;
+    }
+    ar2 = (PyArrayObject *)PyArray_FromAny(obj2, NULL, 1, 1, NPY_CARRAY, NULL);
+    if (ar2 == NULL) {
+        goto fail;
+    }
+    itemsize = PyArray_ITEMSIZE(ar1);
+    if (PyArray_ITEMSIZE(ar2) != itemsize) {
+        PyErr_SetString(PyExc_ValueError,
+                "arrays must have the same item size");
+        goto fail;
+    }
+    n1 = PyArray_DIM(ar1, 0);
+    n2 = PyArray_DIM(ar2, 0);
+    ret = (PyArrayObject *)PyArray_SimpleNew(1, &n1, PyArray_BOOL);
+    if (ret == NULL) {
+        goto fail;
+    }
+    if (_ht_init(&ht, PyArray_DATA(ar2), itemsize, n2) < 0) {
+        Py_CLEAR(ret);
+        goto fail;
+    }
+    p1 = PyArray_DATA(ar1);
+    out = (Bool *)PyArray_DATA(ret);
+
+    NPY_BEGIN_THREADS;
+    for (i = 0; i < n2; i++) {
+        _ht_insert(&ht, i);
+    }
+    for (i = 0; i < n1; i++) {
+        out[i] = _ht_find(&ht, p1 + i*itemsize) >= 0;
+    }
+    NPY_END_THREADS;
+
+fail:
+    PyMem_Free(ht.slots);
+    Py_DECREF(ar1);
+    Py_XDECREF(ar2);
+    return (PyObject *)ret;
+}
+
+
+/*
+ * Reductions skipping nans, done in a single pass over the input without
+ * temporaries.  Per output element `acc` holds the running sum, extremum
+ * or mean, `acc2` the sum of squared deviations from the mean (var only)
+ * and `cnt` the number of non-nan elements seen or, for argmin and
+ * argmax, the index of the extremum so far (-1 for none).
+ */
+enum {NAN_SUM, NAN_MIN, NAN_MAX, NAN_ARGMIN, NAN_ARGMAX, NAN_MEAN, NAN_VAR};
+
+static const char *nanreduce_ops[] = {"sum", "min", "max", "argmin",
+                                      "argmax", "mean", "var", NULL};
+
+#define NAN_UPDATE(ACC, v, k, j)                                            \
+    if (!((v) != (v))) {                                                   \
+        switch (op) {                                                      \
+            case NAN_SUM:                                                  \
+            case NAN_MEAN:                                                 \
+                acc[j] += (v);                                             \
+                cnt[j]++;                                                  \
+                break;                                                     \
+            case NAN_MIN:                                                  \
+                if (!cnt[j] || (v) < acc[j]) {                             \
+                    acc[j] = (v);                                          \
+                }                                                          \
+                cnt[j] = 1;                                                \
+                break;                                                     \
+            case NAN_MAX:                                                  \
+                if (!cnt[j] || (v) > acc[j]) {                             \
+                    acc[j] = (v);                                          \
+                }                                                          \
+                cnt[j] = 1;                                                \
+                break;                                                     \
+            case NAN_ARGMIN:                                               \
+                if (cnt[j] < 0 || (v) < acc[j]) {                          \
+                    acc[j] = (v);                                          \
+                    cnt[j] = (k);                                          \
+                }                                                          \
+                break;                                                     \
+            case NAN_ARGMAX:                                               \
+                if (cnt[j] < 0 || (v) > acc[j]) {                          \
+                    acc[j] = (v);                                          \
+                    cnt[j] = (k);                                          \
+                }                                                          \
+                break;                                                     \
+            case NAN_VAR: {                                                \
+                ACC delta = (v) - acc[j];                                  \
+                cnt[j]++;                                                  \
+                acc[j] += delta / cnt[j];                                  \
+                acc2[j] += delta*((v) - acc[j]);                           \
+                break;                                                     \
+            }                                                              \
+        }                                                                  \
+    }
+
+/*
+ * Defines nanreduce_<NAME>, which reduces the array iterated by `it` into
+ * the accumulators.  With `n` < 0 the iterator covers the whole array and
+ * everything goes to the first accumulator.  Otherwise it covers all but
+ * the reduced axis, of length `n` and stride `stride`, and `lanes` says
+ * whether to run along the axis in the inner loop (best when the axis
+ * has the smallest stride) or in the outer one, so that the memory is
+ * always read in order.
+ */
+#define NAN_DEFINE_REDUCE(NAME, TYPE, ACC)                                  \
+static void                                                                \
+nanreduce_##NAME(PyArrayIterObject *it, npy_intp n, npy_intp stride,       \
+                 int lanes, int op, ACC *acc, ACC *acc2, npy_intp *cnt)    \
+{                                                                          \
+    npy_intp j, k;                                                         \
+    ACC v;                                                                 \
+                                                                           \
+    if (n < 0) {                                                           \
+        while (it->index < it->size) {                                     \
+            v = *(TYPE *)it->dataptr;                                      \
+            k = it->index;                                                 \
+            NAN_UPDATE(ACC, v, k, 0)                                       \
+            PyArray_ITER_NEXT(it);                                         \
+        }                                                                  \
+    }                                                                      \
+    else if (lanes) {                                                      \
+        while (it->index < it->size) {                                     \
+            j = it->index;                                                 \
+            for (k = 0; k < n; k++) {                                      \
+                v = *(TYPE *)(it->dataptr + k*stride);                     \
+                NAN_UPDATE(ACC, v, k, j)                                   \
+            }                                                              \
+            PyArray_ITER_NEXT(it);                                         \
+        }                                                                  \
+    }                                                                      \
+    else {                                                                 \
+        for (k = 0; k < n; k++) {                                          \
+            PyArray_ITER_RESET(it);                                        \
+            while (it->index < it->size) {                                 \
+                j = it->index;                                             \
+                v = *(TYPE *)(it->dataptr + k*stride);                     \
+                NAN_UPDATE(ACC, v, k, j)                                   \
+                PyArray_ITER_NEXT(it);                                     \
+            }                                                              \
+        }                                                                  \
+    }                                                                      \
+}                                                                          \
+                                                                           \
+static void                                                                \
+nanfinish_##NAME(char *out, npy_intp size, int op, npy_intp ddof,          \
+                 ACC *acc, ACC *acc2, npy_intp *cnt)                       \
+{                                                                          \
+    npy_intp j;                                                            \
+    TYPE *res = (TYPE *)out;                                               \
+    const ACC nan = (ACC)NPY_NAN;                                          \
+                                                                           \
+    for (j = 0; j < size; j++) {                                           \
+        if (op == NAN_ARGMIN || op == NAN_ARGMAX) {                        \
+            ((npy_intp *)out)[j] = cnt[j];                                 \
+        }                                                                  \
+        else if (op == NAN_VAR) {                                          \
+            res[j] = (TYPE)(cnt[j] > ddof ? acc2[j]/(cnt[j] - ddof) : nan);\
+        }                                                                  \
+        else if (op == NAN_MEAN) {                                         \
+            res[j] = (TYPE)(cnt[j] ? acc[j]/cnt[j] : nan);                 \
+        }                                                                  \
+        else {                                                             \
+            res[j] = (TYPE)(cnt[j] ? acc[j] : nan);                        \
+        }                                                                  \
+    }                                                                      \
+}
+
+NAN_DEFINE_REDUCE(float, npy_float, double)
+NAN_DEFINE_REDUCE(double, npy_double, double)
+NAN_DEFINE_REDUCE(longdouble, npy_longdouble, npy_longdouble)
+
+#undef NAN_DEFINE_REDUCE
+#undef NAN_UPDATE
+
+static NPY_INLINE npy_intp
+abs_intp(npy_intp x)
+{
+    return x < 0 ? -x : x;
+}
+
+static char arr_nanreduce__doc__[] =
+    "_nanreduce(a, op, axis=None, ddof=0)\n\n"
+    "Reduce the floating point array `a` over `axis`, or over all of it if\n"
+    "`axis` is None, skipping nans.  `op` is one of 'sum', 'min', 'max',\n"
+    "'argmin', 'argmax', 'mean' and 'var'.  The input is read once, in\n"
+    "memory order, and not copied unless it is byteswapped or misaligned.\n"
+    "Results over no non-nan values are nan, or -1 for argmin and argmax.\n"
+    "The float and double sums are accumulated in double precision.";
+
+static PyObject *
+arr_nanreduce(PyObject *NPY_UNUSED(self), PyObject *args, PyObject *kwds)
+{
+    PyObject *obj, *oaxis = Py_None;
+    PyArrayObject *arr = NULL, *out = NULL;
+    PyArrayIterObject *it = NULL;
+    const char *opname;
+    int op, axis = 0, type_num, lanes = 1, i;
+    npy_intp ddof = 0, n = -1, stride = 0, size, j, *cnt = NULL;
+    npy_intp dims[NPY_MAXDIMS];
+    int nd = 0;
+    void *acc = NULL, *acc2 = NULL;
+    size_t accsize;
+    static char *kwlist[] = {"a", "op", "axis", "ddof", NULL};
+    NPY_BEGIN_THREADS_DEF;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Os|On", kwlist,
+                &obj, &opname, &oaxis, &ddof)) {
+        return NULL;
+    }
+    for (op = 0; nanreduce_ops[op] != NULL; op++) {
+        if (strcmp(opname, nanreduce_ops[op]) == 0) {
+            break;
+        }
+    }
+    if (nanreduce_ops[op] == NULL) {
+        PyErr_Format(PyExc_ValueError, "unknown reduction '%s'", opname);
+        return NULL;
+    }
+    arr = (PyArrayObject *)PyArray_FROM_O(obj);
+    if (arr == NULL) {
+        return NULL;
+    }
+    type_num = PyArray_TYPE(arr);
+    if (type_num != PyArray_FLOAT && type_num != PyArray_DOUBLE &&
+            type_num != PyArray_LONGDOUBLE) {
+        PyErr_SetString(PyExc_TypeError,
+                "only float, double and longdouble arrays are supported");
+        goto fail;
+    }
+    if (!PyArray_ISBEHAVED_RO(arr)) {
+        PyArrayObject *tmp = (PyArrayObject *)PyArray_FromAny(
+                (PyObject *)arr, PyArray_DescrFromType(type_num), 0, 0,
+                NPY_ALIGNED, NULL);
+        Py_DECREF(arr);
+        if (tmp == NULL) {
+            return NULL;
+        }
+        arr = tmp;
+    }
+
+    if (oaxis == Py_None || PyArray_NDIM(arr) == 0) {
+        it = (PyArrayIterObject *)PyArray_IterNew((PyObject *)arr);
+    }
+    else {
+        axis = PyArray_PyIntAsInt(oaxis);
+        if (axis == -1 && PyErr_Occurred()) {
+            goto fail;
+        }
+        if (axis < 0) {
+            axis += PyArray_NDIM(arr);
+        }
+        if (axis < 0 || axis >= PyArray_NDIM(arr)) {
+            PyErr_SetString(PyExc_ValueError, "axis out of bounds");
+            goto fail;
+        }
+        n = PyArray_DIM(arr, axis);
+        stride = PyArray_STRIDE(arr, axis);
+        for (i = 0; i < PyArray_NDIM(arr); i++) {
+            if (i == axis) {
+                continue;
+            }
+            dims[nd++] = PyArray_DIM(arr, i);
+            if (PyArray_DIM(arr, i) > 1 && n > 1 &&
+                    abs_intp(PyArray_STRIDE(arr, i)) < abs_intp(stride)) {
+                lanes = 0;
+            }
+        }
+        it = (PyArrayIterObject *)PyArray_IterAllButAxis((PyObject *)arr,
+                                                         &axis);
+    }
+    if (it == NULL) {
+        goto fail;
+    }
+
+    out = (PyArrayObject *)PyArray_SimpleNew(nd, dims,
+            (op == NAN_ARGMIN || op == NAN_ARGMAX) ? PyArray_INTP : type_num);
+    if (out == NULL) {
+        goto fail;
+    }
+    size = PyArray_SIZE(out);
+    accsize = type_num == PyArray_LONGDOUBLE ? sizeof(npy_longdouble)
+                                             : sizeof(double);
+    acc = PyMem_Malloc((size + 1)*accsize);
+    acc2 = PyMem_Malloc((size + 1)*accsize);
+    cnt = PyMem_Malloc((size + 1)*sizeof(npy_intp));
+    if (acc == NULL || acc2 == NULL || cnt == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+    memset(acc, 0, (size + 1)*accsize);
+    memset(acc2, 0, (size + 1)*accsize);
+    for (j = 0; j < size; j++) {
+        cnt[j] = (op == NAN_ARGMIN || op == NAN_ARGMAX) ? -1 : 0;
+    }
+
+    NPY_BEGIN_THREADS;
+    if (size > 0) {
+        switch (type_num) {
+            case PyArray_FLOAT:
+                nanreduce_float(it, n, stride, lanes, op, acc, acc2, cnt);
+                nanfinish_float(PyArray_DATA(out), size, op, ddof,
+                                acc, acc2, cnt);
+                break;
+            case PyArray_DOUBLE:
+                nanreduce_double(it, n, stride, lanes, op, acc, acc2, cnt);
+                nanfinish_double(PyArray_DATA(out), size, op, ddof,
+                                 acc, acc2, cnt);
+                break;
+            default:
+                nanreduce_longdouble(it, n, stride, lanes, op, acc, acc2, cnt);
+                nanfinish_longdouble(PyArray_DATA(out), size, op, ddof,
+                                     acc, acc2, cnt);
+                break;
+        }
+    }
+    NPY_END_THREADS;
+
+    PyMem_Free(acc);
+    PyMem_Free(acc2);
+    PyMem_Free(cnt);
+    Py_DECREF(it);
+    Py_DECREF(arr);
+    return PyArray_Return(out);
+
+fail:
+    PyMem_Free(acc);
+    PyMem_Free(acc2);
+    PyMem_Free(cnt);
+    Py_XDECREF(it);
+    Py_XDECREF(out);
+    Py_DECREF(arr);
+    return NULL;
+}
+
+
 static struct PyMethodDef methods[] = {
     {"_insert", (PyCFunction)arr_insert,
         METH_VARARGS | METH_KEYWORDS, arr_insert__doc__},
@@ -904,6 +2286,18 @@ static struct PyMethodDef methods[] = {
         METH_VARARGS | METH_KEYWORDS, NULL},
     {"unpackbits", (PyCFunction)io_unpack,
         METH_VARARGS | METH_KEYWORDS, NULL},
+    {"_loadtxt", (PyCFunction)arr_loadtxt,
+        METH_VARARGS | METH_KEYWORDS, arr_loadtxt__doc__},
+    {"_convert_strings", (PyCFunction)arr_convert_strings,
+        METH_VARARGS | METH_KEYWORDS, arr_convert_strings__doc__},
+    {"_format_rows", (PyCFunction)arr_format_rows,
+        METH_VARARGS, arr_format_rows__doc__},
+    {"_unique_hash", (PyCFunction)arr_unique_hash,
+        METH_VARARGS, arr_unique_hash__doc__},
+    {"_in1d_hash", (PyCFunction)arr_in1d_hash,
+        METH_VARARGS, arr_in1d_hash__doc__},
+    {"_nanreduce", (PyCFunction)arr_nanreduce,
+        METH_VARARGS | METH_KEYWORDS, arr_nanreduce__doc__},
     {NULL, NULL, 0, NULL}    /* sentinel */
 };
 
@@ -315,5 +315,102 @@ class TestOpenFunc(TestCase):
         assert datasource.open(local_file)
 
 
+class TestDataSourceCache(TestCase):
+    # These tests download from a local HTTP server instead of the stub.
+    def setUp(self):
+        import threading
+        import BaseHTTPServer
+        import SimpleHTTPServer
+        self.srvdir = mkdtemp()
+        self.tmpdir = mkdtemp()
+        self.gets = gets = []
+        srvdir = self.srvdir
+
+        class Handler(SimpleHTTPServer.SimpleHTTPRequestHandler):
+            def translate_path(self, path):
+                return os.path.join(srvdir, path.lstrip('/'))
+            def do_GET(self):
+                gets.append(self.path)
+                SimpleHTTPServer.SimpleHTTPRequestHandler.do_GET(self)
+            def log_message(self, *args):
+                pass
+
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.setDaemon(True)
+        self.thread.start()
+        self.baseurl = 'http://127.0.0.1:%d/' % self.server.server_port
+        urllib2.urlopen = old_urlopen
+
+    def tearDown(self):
+        urllib2.urlopen = urlopen_stub
+        self.server.shutdown()
+        self.server.server_close()
+        rmtree(self.srvdir)
+        rmtree(self.tmpdir)
+
+    def write(self, name, data, mtime=None):
+        f = open(os.path.join(self.srvdir, name), 'wb')
+        f.write(asbytes(data))
+        f.close()
+        if mtime is not None:
+            os.utime(os.path.join(self.srvdir, name), (mtime, mtime))
+
+    def read(self, ds, name):
+        f = ds.open(self.baseurl + name)
+        try:
+            return f.read()
+        finally:
+            f.close()
+
+    def test_eviction(self):
+        for name in 'abc':
+            self.write(name, name * 100)
+        ds = datasource.DataSource(self.tmpdir, cache_size=250)
+        assert_equal(self.read(ds, 'a'), asbytes('a' * 100))
+        assert_equal(self.read(ds, 'b'), asbytes('b' * 100))
+        # a is used more recently than b, so b goes when c arrives
+        assert_equal(self.read(ds, 'a'), asbytes('a' * 100))
+        assert_equal(len(self.gets), 2)
+        self.read(ds, 'c')
+        assert os.path.exists(ds.abspath(self.baseurl + 'a'))
+        assert not os.path.exists(ds.abspath(self.baseurl + 'b'))
+        # The index is shared by all the instances using the directory
+        ds2 = datasource.DataSource(self.tmpdir, cache_size=100)
+        assert_equal(self.read(ds2, 'b'), asbytes('b' * 100))
+        assert_equal(sorted(os.listdir(os.path.dirname(
+            ds.abspath(self.baseurl + 'b')))), ['b'])
+
+    def test_validate(self):
+        self.write('a', 'old', mtime=1000000000)
+        ds = datasource.DataSource(self.tmpdir, validate=True)
+        assert_equal(self.read(ds, 'a'), asbytes('old'))
+        assert_equal(self.read(ds, 'a'), asbytes('old'))
+        self.write('a', 'new', mtime=1000000001)
+        assert_equal(self.read(ds, 'a'), asbytes('new'))
+        # Without validation, the downloaded file is used as is
+        self.write('a', 'newer', mtime=1000000002)
+        ds = datasource.DataSource(self.tmpdir)
+        assert_equal(self.read(ds, 'a'), asbytes('new'))
+        # The cached file is used if the server can not be reached
+        self.server.shutdown()
+        self.server.server_close()
+        ds = datasource.DataSource(self.tmpdir, validate=True)
+        assert_equal(self.read(ds, 'a'), asbytes('new'))
+
+    def test_prefetch(self):
+        names = ['f%d' % i for i in range(10)]
+        for name in names:
+            self.write(name, name)
+        ds = datasource.DataSource(self.tmpdir, cache_size=10**6)
+        paths = ds.prefetch([self.baseurl + name for name in names])
+        assert_equal(len(self.gets), 10)
+        for name, path in zip(names, paths):
+            assert_equal(path, ds.abspath(self.baseurl + name))
+            assert_equal(self.read(ds, name), asbytes(name))
+        assert_equal(len(self.gets), 10)
+        assert_raises(IOError, ds.prefetch, [self.baseurl + 'missing'])
+
+
 if __name__ == "__main__":
     run_module_suite()
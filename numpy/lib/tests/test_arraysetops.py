@@ -240,6 +240,70 @@ class TestAso(TestCase):
         c2 = setdiff1d( aux2, aux1 )
         assert_array_equal( c1, c2 )
 
+    def test_hash_method( self ):
+        np.random.seed(3)
+        for dtype in ['i1', '>i4', 'u8', 'f4', '>f8', 'c8', '?', 'S3', 'U2']:
+            a = np.random.randint(0, 30, 200).astype('S2').astype(dtype)
+            b = np.random.randint(10, 40, 50).astype('S2').astype(dtype)
+            for f in [intersect1d, setxor1d, in1d, union1d, setdiff1d]:
+                assert_array_equal(f(a, b, method='hash'),
+                                   f(a, b, method='sort'))
+            assert_array_equal(unique(a, method='hash'),
+                               unique(a, method='sort'))
+            u, i, j = unique(a, return_index=True, return_inverse=True,
+                             method='hash')
+            assert_array_equal(u, unique(a))
+            assert_array_equal(a[i], u)
+            assert_array_equal(u[j], a)
+
+    def test_hash_method_float_special( self ):
+        # -0.0 equals 0.0, nan never equals anything
+        a = np.array([0.0, -0.0, 1.0, np.nan, np.nan])
+        assert_equal(len(unique(a, method='hash')), 4)
+        assert_array_equal(in1d(a, [-0.0, np.nan], method='hash'),
+                           [True, True, False, False, False])
+        assert_array_equal(in1d([-0.0, 2], [0.0], method='hash'),
+                           [True, False])
+        assert_array_equal(in1d(np.arange(4), [1.0, 2.5], method='hash'),
+                           [False, True, False, False])
+
+    def test_hash_method_errors( self ):
+        a = np.array([1, None])
+        assert_raises(TypeError, unique, a, method='hash')
+        assert_raises(ValueError, in1d, [1], [2], method='bisect')
+        assert_equal(len(unique(a)), 2)
+        for dtype in [np.longdouble, np.clongdouble]:
+            assert_raises(TypeError, unique, np.arange(3, dtype=dtype),
+                          method='hash')
+
+    def test_longdouble( self ):
+        # equal long doubles may differ in their padding bytes
+        for dtype in [np.longdouble, np.clongdouble]:
+            x = np.arange(2000, dtype=dtype)/3
+            y = (np.arange(2000, dtype=dtype)*2)/6
+            assert_equal(in1d(x, y).sum(), 2000)
+            assert_array_equal(in1d(x, y), in1d(x, y, method='sort'))
+            u, j = unique(np.concatenate([x, y]), return_inverse=True)
+            assert_equal(len(u), 2000)
+            assert_array_equal(u[j], np.concatenate([x, y]))
+            assert_array_equal(intersect1d(x, y), np.sort(x))
+
+    def test_hash_method_default( self ):
+        a = np.arange(5000) % 7
+        assert_array_equal(unique(a), np.arange(7))
+        assert_array_equal(in1d(a, [3, 5]), (a == 3) | (a == 5))
+
+    def test_hash_method_choice( self ):
+        from numpy.lib.arraysetops import _use_hash
+        repeated = np.arange(5000) % 7
+        distinct = np.arange(5000)[::-1]
+        assert_(_use_hash([repeated], None, repeats=True))
+        # sorting is faster if the values are mostly distinct
+        assert_(not _use_hash([distinct], None, repeats=True))
+        assert_(_use_hash([distinct], None))
+        assert_(not _use_hash([repeated[:100]], None, repeats=True))
+        assert_(_use_hash([distinct], 'hash', repeats=True))
+
 
 if __name__ == "__main__":
     run_module_suite()
@@ -46,6 +46,62 @@ def test():
     # Check that all elements are iterated correctly
     assert list(c.flat) == list(d.flat)
 
+def test_prefetch():
+    a = np.arange(3 * 4 * 5).reshape(3, 4, 5)
+    blocks = [block.copy() for block in Arrayterator(a, 7)]
+    b = Arrayterator(a, 7, prefetch=2)
+    for (i, block) in enumerate(b):
+        expected = blocks[i]
+        assert block.shape == expected.shape
+        assert np.all(block == expected)
+    assert len(list(b)) == len(blocks)
+    # Blocks come from a fixed set of buffers
+    assert len(set([block.__array_interface__['data'][0]
+                    for block in b])) <= 4
+    c = b[1:, ::2]
+    assert c.prefetch == 2
+    assert list(c.flat) == list(a[1:, ::2].flat)
+    assert list(Arrayterator(np.zeros((0, 3)), prefetch=1)) == []
+
+def test_prefetch_errors():
+    class Failing(object):
+        shape = (4, 3)
+        def __init__(self):
+            self.reads = 0
+        def __getitem__(self, index):
+            self.reads += 1
+            if self.reads == 3:
+                raise IOError("read failed")
+            return np.zeros(3)[index[1:]]
+    it = iter(Arrayterator(Failing(), 3, prefetch=1))
+    it.next()
+    it.next()
+    try:
+        it.next()
+    except IOError:
+        pass
+    else:
+        raise AssertionError("error not raised")
+    try:
+        it.next()
+    except StopIteration:
+        pass
+    else:
+        raise AssertionError("iteration not stopped")
+
+def test_prefetch_close():
+    import threading
+    import time
+    nthreads = threading.activeCount()
+    it = iter(Arrayterator(np.arange(100), 1, prefetch=3))
+    it.next()
+    del it
+    for i in range(100):
+        if threading.activeCount() == nthreads:
+            break
+        time.sleep(0.01)
+    assert threading.activeCount() == nthreads
+
 if __name__ == '__main__':
     from numpy.testing import run_module_suite
     run_module_suite()
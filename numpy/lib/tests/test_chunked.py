@@ -0,0 +1,120 @@
+import os
+from tempfile import mkstemp
+
+import numpy as np
+from numpy.testing import *
+from numpy.lib import Arrayterator, ChunkedArray, save_chunked, open_chunked
+from numpy.compat import asbytes
+
+import sys
+if sys.version_info[0] >= 3:
+    from io import BytesIO
+else:
+    from cStringIO import StringIO as BytesIO
+
+
+def roundtrip(arr, **kwargs):
+    f = BytesIO()
+    save_chunked(f, arr, **kwargs)
+    f.seek(0)
+    return open_chunked(f)
+
+
+class TestChunkedArray(TestCase):
+    def test_roundtrip(self):
+        a = np.arange(7 * 11 * 5, dtype=np.float32).reshape(7, 11, 5)
+        for compression in [None, 'zlib', 'bz2']:
+            b = roundtrip(a, chunks=(3, 4, 5), compression=compression)
+            assert_equal(b.shape, a.shape)
+            assert_equal(b.dtype, a.dtype)
+            assert_equal(b.chunks, (3, 4, 5))
+            assert_array_equal(np.array(b), a)
+
+    def test_dtypes(self):
+        for a in [np.array(3.5), np.zeros((0, 4), int), np.arange(5)[::-1],
+                  np.arange(20, dtype='>i4').reshape(4, 5).T,
+                  np.array([(1, 'ab'), (2, 'cd')], dtype=[('x', int),
+                                                          ('y', 'S2')])]:
+            b = roundtrip(a, chunks=[2] * a.ndim)
+            assert_equal(b.dtype, a.dtype)
+            assert_array_equal(b[...], a)
+        assert_raises(ValueError, roundtrip, np.array([None]))
+
+    def test_zero_d(self):
+        b = roundtrip(np.array(3.5))
+        assert_equal(np.asarray(b).shape, ())
+        assert_array_equal(np.asarray(b), 3.5)
+        assert_equal(np.asarray(b, dtype=int).dtype, np.dtype(int))
+        assert_equal(np.array(b, dtype=np.float32), np.float32(3.5))
+
+    def test_default_chunks(self):
+        b = roundtrip(np.zeros((1000, 300, 10)))
+        assert_equal(b.chunks, (43, 300, 10))
+
+    def test_indexing(self):
+        a = np.arange(9 * 10 * 11).reshape(9, 10, 11)
+        b = roundtrip(a, chunks=(2, 3, 4))
+        for index in [0, -1, (1, 2, 3), (slice(None, None, -1), 5),
+                      (slice(1, 8, 3), Ellipsis, slice(9, 1, -2)),
+                      (Ellipsis, 4), (slice(5, 5), 1), (np.int32(3),)]:
+            assert_array_equal(b[index], a[index])
+        assert_equal(b[1, 2, 3], a[1, 2, 3])
+        assert_raises(IndexError, b.__getitem__, 9)
+        assert_raises(IndexError, b.__getitem__, (0, 0, 0, 0))
+        assert_raises(IndexError, b.__getitem__, [0, 1])
+
+    def test_reads_touched_chunks(self):
+        a = np.arange(100).reshape(10, 10)
+        b = roundtrip(a, chunks=(5, 5))
+        read = []
+        read_chunk = b._read_chunk
+        def record(pos):
+            read.append(pos)
+            return read_chunk(pos)
+        b._read_chunk = record
+        assert_array_equal(b[6:8, 1:3], a[6:8, 1:3])
+        assert_equal(read, [(1, 0)])
+        del read[:]
+        assert_array_equal(b[::6, 4:6], a[::6, 4:6])
+        assert_equal(read, [(0, 0), (0, 1), (1, 0), (1, 1)])
+
+    def test_arrayterator(self):
+        a = np.arange(6 * 8 * 4).reshape(6, 8, 4)
+        b = roundtrip(a, chunks=(2, 3, 4), compression='bz2')
+        it = Arrayterator(b, 20)
+        blocks = list(it)
+        assert_(max([block.size for block in blocks]) <= 20)
+        assert_equal(list(it.flat), list(a.flat))
+        assert_array_equal(it[1:5, ::3].__array__(), a[1:5, ::3])
+
+    def test_file(self):
+        a = np.random.rand(20, 30)
+        fd, name = mkstemp(suffix='.npy')
+        os.close(fd)
+        try:
+            save_chunked(name, a, chunks=(7, 7), compresslevel=1)
+            b = ChunkedArray(name)
+            assert_array_equal(b[3:17, 5:], a[3:17, 5:])
+            b.close()
+        finally:
+            os.remove(name)
+
+    def test_errors(self):
+        a = np.zeros((4, 4))
+        assert_raises(ValueError, roundtrip, a, chunks=(2,))
+        assert_raises(ValueError, roundtrip, a, chunks=(2, 0))
+        assert_raises(ValueError, roundtrip, a, compression='lzma')
+        assert_raises(ValueError, roundtrip, a, compresslevel=10)
+        assert_raises(ValueError, roundtrip, a, compression='bz2',
+                      compresslevel=0)
+        assert_raises(ValueError, open_chunked, BytesIO(asbytes('\x93NUMPY')))
+        f = BytesIO()
+        save_chunked(f, a, chunks=(2, 2))
+        f = BytesIO(f.getvalue()[:-1])
+        b = open_chunked(f)
+        assert_array_equal(b[:2, :2], a[:2, :2])
+        assert_raises(ValueError, b.__getitem__, (3, 3))
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -429,6 +429,47 @@ def test_roundtrip():
         arr2 = roundtrip(arr)
         yield assert_array_equal, arr, arr2
 
+def test_roundtrip_chunked():
+    # Arrays larger than the read buffer of non-file objects
+    arr = np.arange(3 * (format.BUFFER_SIZE // 16 + 1), dtype=np.float64)
+    assert_array_equal(roundtrip(arr), arr)
+    arr = np.asfortranarray(arr.reshape(-1, 3))
+    assert_array_equal(roundtrip(arr), arr)
+
+class ChunkRecorder(object):
+    """Minimal stream without `readinto`, recording the size of writes."""
+    def __init__(self, data=asbytes('')):
+        self.data = data
+        self.pos = 0
+        self.sizes = []
+
+    def write(self, data):
+        self.sizes.append(len(data))
+        self.data += data
+
+    def read(self, n):
+        data = self.data[self.pos:self.pos + n]
+        self.pos += len(data)
+        self.sizes.append(len(data))
+        return data
+
+def test_roundtrip_stream():
+    # Non-contiguous data is written, and read back, in bounded blocks
+    arr = np.arange(format.BUFFER_SIZE, dtype=np.float64).reshape(-1, 8)
+    for a in (arr, arr[::2], arr[:, ::2], arr.T):
+        f = ChunkRecorder()
+        format.write_array(f, a)
+        assert max(f.sizes) <= format.BUFFER_SIZE
+        f2 = ChunkRecorder(f.data)
+        assert_array_equal(format.read_array(f2), a)
+        assert max(f2.sizes) <= format.BUFFER_SIZE
+
+def test_read_array_truncated():
+    f = StringIO()
+    format.write_array(f, np.arange(format.BUFFER_SIZE, dtype=np.int16))
+    f2 = StringIO(f.getvalue()[:-1])
+    assert_raises(ValueError, format.read_array, f2)
+
 def test_memmap_roundtrip():
     # XXX: test crashes nose on windows. Fix this
     if not (sys.platform == 'win32' or sys.platform == 'cygwin'):
@@ -478,7 +519,6 @@ def test_write_version_1_0():
         (1, 1),
         (0, 0),
         (0, 1),
-        (2, 0),
         (2, 2),
         (255, 255),
     ]
@@ -491,11 +531,137 @@ def test_write_version_1_0():
             raise AssertionError("we should have raised a ValueError for the bad version %r" % (version,))
 
 
+def test_version_2_0():
+    f = StringIO()
+    # requires more than 2 byte for header
+    dt = [(("%d" % i) * 100, float) for i in range(500)]
+    d = np.ones(1000, dtype=dt)
+
+    format.write_array(f, d, version=(2, 0))
+    f.seek(0)
+    assert_equal(format.read_magic(f), (2, 0))
+    f.seek(0)
+    n = format.read_array(f)
+    assert_array_equal(d, n)
+
+    # 1.0 requested but data cannot be saved this way
+    assert_raises(ValueError, format.write_array, StringIO(), d, (1, 0))
+
+    # The version is picked automatically
+    f = StringIO()
+    format.write_array(f, d)
+    f.seek(0)
+    assert_equal(format.read_magic(f), (2, 0))
+    f = StringIO()
+    format.write_array(f, d[['0' * 100]].copy())
+    f.seek(0)
+    assert_equal(format.read_magic(f), (1, 0))
+
+def test_version_2_0_memmap():
+    # requires more than 2 byte for header
+    dt = [(("%d" % i) * 100, float) for i in range(500)]
+    d = np.ones(1000, dtype=dt)
+    tf = os.path.join(tempdir, 'version2.npy')
+
+    ma = format.open_memmap(tf, mode='w+', dtype=d.dtype, shape=d.shape)
+    ma[...] = d
+    del ma
+    ma = format.open_memmap(tf, mode='r')
+    assert_array_equal(ma, d)
+    del ma
+
+    assert_raises(ValueError, format.open_memmap, tf, mode='w+',
+                  dtype=d.dtype, shape=d.shape, version=(1, 0))
+
+def test_align():
+    arr = np.arange(10.)
+    for align in (16, 64, 4096):
+        f = StringIO()
+        format.write_array(f, arr, align=align)
+        f.seek(0)
+        format.read_magic(f)
+        format.read_array_header_1_0(f)
+        assert_equal(f.tell() % align, 0)
+        f.seek(0)
+        assert_array_equal(format.read_array(f), arr)
+    # The default alignment is unchanged
+    f = StringIO()
+    format.write_array(f, arr)
+    assert_equal(len(f.getvalue()) - arr.nbytes, 80)
+    assert_raises(ValueError, format.write_array, StringIO(), arr, None, 24)
+
+    tf = os.path.join(tempdir, 'aligned.npy')
+    ma = format.open_memmap(tf, mode='w+', dtype=arr.dtype, shape=arr.shape,
+                            align=4096)
+    ma[...] = arr
+    del ma
+    fp = open(tf, 'rb')
+    try:
+        format.read_magic(fp)
+        format.read_array_header_1_0(fp)
+        assert_equal(fp.tell(), 4096)
+    finally:
+        fp.close()
+    ma = format.open_memmap(tf, mode='r')
+    assert_array_equal(ma, arr)
+    del ma
+
+def test_open_appendable():
+    tf = os.path.join(tempdir, 'appendable.npy')
+    if os.path.exists(tf):
+        os.remove(tf)
+    rows = np.arange(30, dtype='>i4').reshape(10, 3)
+    app = format.open_appendable(tf, dtype=rows.dtype, row_shape=(3,))
+    assert_array_equal(np.load(tf), np.zeros((0, 3)))
+    app.append(rows[0])
+    app.append(rows[1:4])
+    assert_equal(app.shape, (4, 3))
+    # Nothing is visible until flushed
+    assert_equal(np.load(tf).shape, (0, 3))
+    app.flush()
+    ma = np.load(tf, mmap_mode='r')
+    assert_array_equal(ma, rows[:4])
+    del ma
+    assert_raises(ValueError, app.append, np.zeros((2, 2)))
+    app.close()
+
+    app = format.open_appendable(tf)
+    assert_equal(app.dtype, rows.dtype)
+    app.append(rows[4:])
+    app.close()
+    assert_array_equal(np.load(tf), rows)
+
+    assert_raises(ValueError, format.open_appendable, tf, dtype=float)
+    assert_raises(ValueError, format.open_appendable, tf, row_shape=(2,))
+
+def test_open_appendable_existing():
+    # Files written by save have their data moved to make room in the header
+    tf = os.path.join(tempdir, 'saved.npy')
+    arr = np.arange(12.).reshape(4, 3)
+    fp = open(tf, 'wb')
+    try:
+        format.write_array(fp, arr)
+    finally:
+        fp.close()
+    app = format.open_appendable(tf, dtype=float, row_shape=(3,))
+    assert_array_equal(np.load(tf), arr)
+    app.append(np.ones((10**4, 3)))
+    app.close()
+    arr2 = np.load(tf)
+    assert_array_equal(arr2[:4], arr)
+    assert_array_equal(arr2[4:], 1)
+
+    fp = open(tf, 'wb')
+    try:
+        format.write_array(fp, np.asfortranarray(arr))
+    finally:
+        fp.close()
+    assert_raises(ValueError, format.open_appendable, tf)
+
 bad_version_magic = asbytes_nested([
     '\x93NUMPY\x01\x01',
     '\x93NUMPY\x00\x00',
     '\x93NUMPY\x00\x01',
-    '\x93NUMPY\x02\x00',
     '\x93NUMPY\x02\x02',
     '\x93NUMPY\xff\xff',
 ])
@@ -607,6 +607,58 @@ class TestHistogram(TestCase):
         wa, wb = histogram([1, 2, 2, 4], bins=4, weights=[4, 3, 2, 1], normed=True)
         assert_array_equal(wa, array([4, 5, 0, 1]) / 10. / 3. * 4)
 
+    def test_uniform_edges(self):
+        # Values on and next to the edges of equal-width bins are counted
+        # as with a search in the edges
+        edges = linspace(-1.3, 2.9, 8)
+        v = concatenate((edges, np.nextafter(edges, -np.inf),
+                         np.nextafter(edges, np.inf), [np.nan]))
+        h, b = histogram(v, bins=7, range=(-1.3, 2.9))
+        assert_array_equal(b, edges)
+        control, b = histogram(v, bins=edges.tolist())
+        assert_array_equal(h, control)
+        assert_equal(h.sum(), 3 * 7 - 1 + 1 + 1)
+        w = arange(len(v), dtype=float)
+        h, b = histogram(v, bins=7, range=(-1.3, 2.9), weights=w)
+        control, b = histogram(v, bins=edges.tolist(), weights=w)
+        assert_array_almost_equal(h, control)
+        h, b = histogram(arange(10), bins=3, weights=ones(10, int))
+        assert_array_equal(h, [3, 3, 4])
+        assert(issubdtype(h.dtype, int))
+
+
+class TestHistogramAccumulator(TestCase):
+    def test_update(self):
+        v = rand(1000)
+        w = rand(1000)
+        h = Histogram(bins=7, range=(0.1, 0.9))
+        for i in range(0, 1000, 300):
+            h.update(v[i:i+300], weights=w[i:i+300])
+        control, edges = histogram(v, 7, range=(0.1, 0.9), weights=w)
+        assert_array_equal(h.bin_edges, edges)
+        assert_array_almost_equal(h.hist, control)
+        normed, edges = histogram(v, 7, range=(0.1, 0.9), weights=w,
+                                  normed=True)
+        assert_array_almost_equal(h.density(), normed)
+
+    def test_merge(self):
+        v = rand(2, 500)
+        h1 = Histogram(bins=[0, 0.5, 0.6, 1])
+        h2 = Histogram(bins=[0, 0.5, 0.6, 1])
+        h1.update(v[0])
+        h2.update(v[1])
+        h1.merge(h2)
+        control, edges = histogram(v, bins=[0, 0.5, 0.6, 1])
+        assert_array_equal(h1.hist, control)
+        assert(issubdtype(h1.hist.dtype, int))
+        assert_raises(ValueError, h1.merge, Histogram(3, range=(0, 1)))
+        assert_raises(ValueError, h1.update, v, weights=v[0])
+
+    def test_errors(self):
+        assert_raises(ValueError, Histogram, 10)
+        assert_raises(AttributeError, Histogram, 10, (1, 0))
+        assert_raises(AttributeError, Histogram, [1, 0])
+
 
 class TestHistogramdd(TestCase):
     def test_simple(self):
@@ -675,6 +727,24 @@ class TestHistogramdd(TestCase):
         w_hist, edges = histogramdd(v, weights=ones(100, int) * 2)
         assert_array_equal(w_hist, 2 * hist)
 
+    def test_uniform_edges(self):
+        # Equal-width bins put the values on their edges as explicit edges
+        edges = linspace(0.1, 0.7, 7)
+        x = concatenate((edges, np.nextafter(edges, np.inf),
+                         np.nextafter(edges, -np.inf)))
+        y = x[::-1].copy()
+        h, e = histogramdd((x, y), bins=6, range=[(0.1, 0.7), (0.1, 0.7)])
+        # The bins of each point, as with histogram
+        control = zeros((6, 6))
+        for (xi, yi) in zip(x, y):
+            hx = histogram([xi], bins=edges)[0]
+            hy = histogram([yi], bins=edges)[0]
+            control += hx[:, newaxis] * hy
+        assert_array_equal(h, control)
+        h, ex, ey = histogram2d(x, y, bins=[6, 3], range=[(0.1, 0.7),
+                                                          (0.1, 0.7)])
+        assert_array_equal(h, control.reshape(6, 3, 2).sum(-1))
+
     def test_identical_samples(self):
         x = zeros((10, 2), int)
         hist, edges = histogramdd(x, bins=2)
@@ -787,6 +857,54 @@ class TestNaNFuncts(TestCase):
         assert_equal(a._mask, ctrl_mask)
         assert_equal(np.isinf(a), np.zeros((2, 4), dtype=bool))
 
+    def test_nanmean_nanvar_nanstd(self):
+        A = self.A
+        ma = np.ma.masked_invalid(A)
+        filled = lambda x: np.ma.filled(np.ma.array(x, dtype=float), nan)
+        for axis in [None, 0, 1, 2, -1]:
+            assert_almost_equal(nanmean(A, axis), ma.mean(axis))
+            assert_almost_equal(nanvar(A, axis), ma.var(axis))
+            assert_almost_equal(nanvar(A, axis, ddof=1),
+                                filled(ma.var(axis, ddof=1)))
+            assert_almost_equal(nanstd(A, axis, ddof=1),
+                                filled(ma.std(axis, ddof=1)))
+        assert_(isnan(nanmean([nan, nan])))
+        assert_(isnan(nanvar([1, nan], ddof=1)))
+        assert_equal(nanmean([1, 2]), 1.5)
+        assert_almost_equal(nanvar(array([1+1j, nan, 3+1j])), 1)
+
+    def test_layouts_and_types(self):
+        # the single pass loops read any memory layout in place
+        for dtype in ['f4', '>f8', 'g']:
+            A = self.A.astype(dtype)
+            for B in [A, A.transpose(2, 0, 1), A[::-1, :, ::2],
+                      np.asfortranarray(A)]:
+                ma = np.ma.masked_invalid(B)
+                filled = lambda x: np.ma.filled(np.ma.array(x, dtype=float),
+                                                nan)
+                for axis in [None, 0, 1, 2]:
+                    assert_almost_equal(nansum(B, axis),
+                                        filled(ma.sum(axis)), 5)
+                    assert_almost_equal(nanmin(B, axis), filled(ma.min(axis)))
+                    assert_almost_equal(nanmax(B, axis), filled(ma.max(axis)))
+                    assert_almost_equal(nanmean(B, axis),
+                                        filled(ma.mean(axis)), 5)
+                    if isnan(B).all(axis).any():
+                        continue
+                    assert_equal(nanargmin(B, axis),
+                                 ma.argmin(axis, fill_value=inf))
+                    assert_equal(nanargmax(B, axis),
+                                 ma.argmax(axis, fill_value=-inf))
+            assert_equal(nanmin(A).dtype, A.dtype.newbyteorder('='))
+
+    def test_allnan(self):
+        assert_(nansum([nan, nan]) is nan)
+        assert_(nanargmin([nan, nan]) is nan)
+        assert_array_equal(isnan(nansum([[nan] * 2, [1, 2]], axis=1)),
+                           [True, False])
+        assert_raises(ValueError, nanargmax, [[nan] * 2, [1, 2]], 1)
+        assert_raises(ValueError, nanmin, np.zeros((0, 2)), 0)
+
 
 class TestNanFunctsIntTypes(TestCase):
 
@@ -1042,6 +1160,35 @@ def test_percentile_out():
     np.percentile(x, p, axis=1, out=y)
     assert_equal(y, np.percentile(x, p, axis=1))
 
+def test_percentile_sequence():
+    x = np.random.rand(101, 7)
+    s = np.sort(x, axis=0)
+    q = [0, 10, 25, 50, 100]
+    p = np.percentile(x, q, axis=0)
+    for qi, pi in zip(q, p):
+        assert_almost_equal(pi, s[qi] * 0.5 + s[qi] * 0.5)
+    p = np.percentile(x, np.array([12.5, 87.5]), axis=0)
+    assert_almost_equal(p[0], 0.5 * (s[12] + s[13]))
+    assert_almost_equal(p[1], 0.5 * (s[87] + s[88]))
+    assert_raises(ValueError, np.percentile, x, [50, 101])
+    y = x.copy()
+    np.percentile(y, [10, 90], overwrite_input=True)
+    assert_equal(np.sort(y, axis=None), np.sort(x, axis=None))
+
+def test_median_partition():
+    x = np.random.rand(11, 6)
+    s = np.sort(x, axis=0)
+    assert_equal(np.median(x, axis=0), s[5])
+    assert_equal(np.median(x[:10], axis=0), 0.5 * (np.sort(x[:10], axis=0)[4]
+                                                  + np.sort(x[:10], axis=0)[5]))
+    assert_equal(np.median(x), 0.5 * (np.sort(x, axis=None)[32]
+                                      + np.sort(x, axis=None)[33]))
+    y = x.copy()
+    assert_equal(np.median(y, axis=1, overwrite_input=True),
+                 np.median(x, axis=1))
+    assert_equal(np.median([[3, 1, 2]], axis=1), [2])
+
+
 
 if __name__ == "__main__":
     run_module_suite()
@@ -137,6 +137,104 @@ class TestSavezLoad(RoundtripTest, TestCase):
         assert_equal(a, l['file_a'])
         assert_equal(b, l['file_b'])
 
+    def test_mmap_members(self):
+        import zipfile
+        a = np.arange(12.).reshape(3, 4)
+        b = np.asfortranarray(np.arange(6).reshape(2, 3))
+        c = np.array([(1, 2.5)], dtype=[('x', 'i4'), ('y', 'f8')])
+        fd, tmp = mkstemp(suffix='.npz')
+        os.close(fd)
+        try:
+            np.savez(tmp, a=a, b=b, c=c, o=np.array([None, 1]))
+            data = np.load(tmp, mmap_mode='r')
+            for key, arr in (('a', a), ('b', b), ('c', c)):
+                assert_(isinstance(data[key], np.memmap))
+                assert_equal(data[key], arr)
+            assert_(data['b'].flags.f_contiguous)
+            assert_(not isinstance(data['o'], np.memmap))
+            assert_equal(data['o'], [None, 1])
+            data.zip.close()
+            data.fid.close()
+            # Compressed members are read into memory
+            zip = zipfile.ZipFile(tmp, mode='w',
+                                  compression=zipfile.ZIP_DEFLATED)
+            s = BytesIO()
+            np.save(s, a)
+            zip.writestr('a.npy', s.getvalue())
+            zip.close()
+            data = np.load(tmp, mmap_mode='r')
+            assert_(not isinstance(data['a'], np.memmap))
+            assert_equal(data['a'], a)
+            data.zip.close()
+            data.fid.close()
+        finally:
+            os.remove(tmp)
+
+    def test_plain_members(self):
+        import zipfile
+        c = BytesIO()
+        zip = zipfile.ZipFile(c, mode='w', compression=zipfile.ZIP_DEFLATED)
+        s = BytesIO()
+        np.save(s, np.arange(5))
+        zip.writestr('a.npy', s.getvalue())
+        zip.writestr('b.txt', asbytes('some text'))
+        zip.writestr('c', asbytes('ab'))
+        zip.close()
+        c.seek(0)
+        l = np.load(c)
+        assert_equal(l['a'], np.arange(5))
+        assert_equal(l['b.txt'], asbytes('some text'))
+        assert_equal(l['c'], asbytes('ab'))
+
+    def test_savez_compressed(self):
+        import zipfile
+        a = np.arange(20000.).reshape(200, 100)
+        b = np.zeros((300, 400), dtype=np.int8)[::2, ::3]
+        c = BytesIO()
+        np.savez_compressed(c, a, b=b, compresslevel=9)
+        c.seek(0)
+        zip = zipfile.ZipFile(c)
+        for info in zip.infolist():
+            assert_equal(info.compress_type, zipfile.ZIP_DEFLATED)
+        assert_(zip.getinfo('b.npy').compress_size < b.nbytes // 10)
+        zip.close()
+        c.seek(0)
+        l = np.load(c)
+        assert_equal(sorted(l.files), ['arr_0', 'b'])
+        assert_equal(l['arr_0'], a)
+        assert_equal(l['b'], b)
+        assert_raises(ValueError, np.savez_compressed, BytesIO(), a,
+                      compresslevel=10)
+
+    def test_savez_compressed_levels(self):
+        import zipfile
+        np.random.seed(3)
+        a = np.random.randint(0, 16, 100000).astype(np.int16)
+        b = np.arange(30000.)
+        sizes = []
+        for level in [0, 1, 9]:
+            c = BytesIO()
+            np.savez_compressed(c, a=a, b=b, compresslevel=level)
+            c.seek(0)
+            zip = zipfile.ZipFile(c)
+            assert_(zip.testzip() is None)
+            sizes.append(zip.getinfo('a.npy').compress_size)
+            zip.close()
+            c.seek(0)
+            l = np.load(c)
+            assert_equal(l['a'], a)
+            assert_equal(l['b'], b)
+        assert_(sizes[0] > a.nbytes)
+        assert_(sizes[0] > sizes[1] > sizes[2])
+
+    def test_savez_compressed_error(self):
+        class Unpicklable(object):
+            def __reduce__(self):
+                raise TypeError("cannot pickle")
+        c = BytesIO()
+        o = np.array([Unpicklable()], dtype=object)
+        assert_raises(TypeError, np.savez_compressed, c, np.arange(3), o)
+
     def test_savez_filename_clashes(self):
         # Test that issue #852 is fixed
         # and savez functions in multithreaded environment
@@ -226,6 +324,29 @@ class TestSaveTxt(TestCase):
         lines = c.readlines()
         assert_equal(lines, asbytes_nested(['01 : 2.0\n', '03 : 4.0\n']))
 
+    def test_compiled_formats(self):
+        # The compiled formatting must match the % operator exactly
+        f = np.array([[np.nan, np.inf, -np.inf, -0.0],
+                      [1e50, -1e60, 2.5, 1.5e-300],
+                      [1/3., -2/3., 1e22, 123456789.123456789]])
+        i = np.array([[-2**63, 2**63 - 1, 0, -1],
+                      [1, 2, 3, 4]], dtype=np.int64)
+        cases = [(f, '%.18e'), (f, '%.3f'), (f, '%e'), (f, '%f'),
+                 (f, ['%.0e', '%.0f', '%.10e', '%.30f']),
+                 (f.astype(np.float32), '%.9e'),
+                 (i, '%d'), (i, ['%i', '%.4e', '%d', '%.1f']),
+                 (i.astype(np.uint16), '%d'), (i > 0, '%d')]
+        for a, fmt in cases:
+            if isinstance(fmt, str):
+                fmts = [fmt] * a.shape[1]
+            else:
+                fmts = fmt
+            format = ','.join(fmts)
+            expected = ''.join([format % tuple(row) + '\r\n' for row in a])
+            c = StringIO()
+            np.savetxt(c, a, fmt=fmt, delimiter=',', newline='\r\n')
+            assert_equal(c.getvalue(), asbytes(expected))
+
     def test_file_roundtrip(self):
         f, name = mkstemp()
         os.close(f)
@@ -427,6 +548,80 @@ class TestLoadTxt(TestCase):
             os.unlink(name)
 
 
+    def test_compiled_parser(self):
+        "Check that the compiled parser agrees with the Python converters."
+        data = '1.5 -2.7 3e2\n# comment\n\n4 5 6 # trailing\n'
+        x = np.loadtxt(StringIO(data), dtype=int)
+        assert_array_equal(x, [[1, -2, 300], [4, 5, 6]])
+        x = np.loadtxt(StringIO(data), dtype=np.float32, usecols=(-1, 0))
+        assert_array_equal(x, np.array([[300, 1.5], [6, 4]], np.float32))
+        x = np.loadtxt(StringIO('nan inf -inf'))
+        assert_(np.isnan(x[0]))
+        assert_array_equal(x[1:], [np.inf, -np.inf])
+        x = np.loadtxt(StringIO('0 1\n-2 0'), dtype=bool)
+        assert_array_equal(x, [[False, True], [True, False]])
+
+        data = 'abc ; 1 ; 2.5\nd ; 3 ; 4'
+        ndtype = [('s', 'S2'), ('i', np.int16), ('f', np.float32)]
+        x = np.loadtxt(StringIO(data), dtype=ndtype, delimiter=';')
+        control = np.array([('ab', 1, 2.5), ('d ', 3, 4)], dtype=ndtype)
+        assert_array_equal(x, control)
+
+    def test_iterloadtxt(self):
+        data = '# header\n' + '\n'.join('%i %i' % (i, 2 * i)
+                                        for i in range(10))
+        chunks = list(np.iterloadtxt(StringIO(data), dtype=int, chunksize=4))
+        assert_equal([len(c) for c in chunks], [4, 4, 2])
+        assert_array_equal(np.concatenate(chunks),
+                           np.loadtxt(StringIO(data), dtype=int))
+        # Same thing with converters, handled in Python
+        chunks = list(np.iterloadtxt(StringIO(data), dtype=int, chunksize=5,
+                                     converters={1: lambda s: -int(s)}))
+        assert_equal([len(c) for c in chunks], [5, 5])
+        assert_array_equal(chunks[1][:, 1], [-10, -12, -14, -16, -18])
+        # Structured dtype, usecols, skiprows and unpack
+        ndtype = [('a', int), ('b', float)]
+        chunks = list(np.iterloadtxt(StringIO(data), dtype=ndtype,
+                                     skiprows=3, chunksize=3))
+        assert_equal([len(c) for c in chunks], [3, 3, 2])
+        assert_array_equal(chunks[0]['a'], [2, 3, 4])
+        x, y = np.iterloadtxt(StringIO(data), usecols=(1,), unpack=True,
+                              chunksize=8)
+        assert_array_equal(y, [[16, 18]])
+        assert_raises(ValueError, np.iterloadtxt, StringIO(data), chunksize=0)
+
+    def test_compiled_parser_errors(self):
+        assert_raises(ValueError, np.loadtxt, StringIO('1 2\n3 x'))
+        assert_raises(ValueError, np.loadtxt, StringIO('1,,3'), delimiter=',')
+        assert_raises(ValueError, np.loadtxt, StringIO('1 2\n3'))
+        assert_raises(IndexError, np.loadtxt, StringIO('1 2'), usecols=(2,))
+
+    def test_workers(self):
+        "Check that parsing in byte ranges matches the serial parser."
+        data = '# x y\r\nskipped\n\n' + ''.join('%i %i # c\n' % (i, -i)
+                                               for i in range(500))
+        f, name = mkstemp()
+        os.write(f, asbytes(data))
+        os.close(f)
+        range_min = np.lib.npyio._PARSE_RANGE_MIN
+        np.lib.npyio._PARSE_RANGE_MIN = 100
+        try:
+            for kwargs in [dict(skiprows=2), dict(dtype=int, skiprows=2),
+                           dict(dtype=[('a', int), ('b', 'S2')], skiprows=2),
+                           dict(usecols=(1,), unpack=True, skiprows=2),
+                           dict(converters={0: lambda s: 2 * int(s)},
+                                skiprows=2)]:
+                control = np.loadtxt(name, **kwargs)
+                test = np.loadtxt(name, workers=3, **kwargs)
+                assert_equal(test.dtype, control.dtype)
+                assert_array_equal(test, control)
+            # Errors come from the serial parser
+            assert_raises(ValueError, np.loadtxt, name, workers=3)
+            assert_raises(ValueError, np.loadtxt, name, workers=0)
+        finally:
+            np.lib.npyio._PARSE_RANGE_MIN = range_min
+            os.unlink(name)
+
 class Testfromregex(TestCase):
     def test_record(self):
         c = StringIO()
@@ -1134,6 +1329,91 @@ M   33  21.99
         assert_equal(test, ctrl)
 
 
+    def test_sample_rows(self):
+        "Test the type guessing on a sample of rows"
+        data = "\n".join("%i,%s,%s" % (i, "abc"[:i % 4], i) for i in range(20))
+        data += "\n20,,2.5\n21,x,"
+        kwargs = dict(delimiter=",", dtype=None)
+        control = np.genfromtxt(StringIO(data), **kwargs)
+        test = np.genfromtxt(StringIO(data), sample_rows=5, **kwargs)
+        assert_equal(test.dtype, control.dtype)
+        assert_equal(test.dtype['f2'], np.dtype(float))
+        for name in control.dtype.names:
+            assert_equal(test[name], control[name])
+        # Explicit dtype, with missing values
+        kwargs = dict(delimiter=",", dtype="i4,S2,f4", usemask=True)
+        control = np.genfromtxt(StringIO(data), **kwargs)
+        test = np.genfromtxt(StringIO(data), sample_rows=5, **kwargs)
+        assert_equal(test, control)
+        assert_equal(test.mask, control.mask)
+        # Locked converters can't be upgraded
+        kwargs = dict(delimiter=",", dtype=None,
+                      converters={2: lambda s: int(s or -1)})
+        assert_raises(ConverterError, np.genfromtxt, StringIO(data),
+                      sample_rows=5, **kwargs)
+
+    def test_itergenfromtxt(self):
+        data = "\n".join("%i, %i, %s" % (i, 10 * i, "abc"[:i % 4])
+                         for i in range(7))
+        kwargs = dict(delimiter=",", dtype=None, autostrip=True)
+        control = np.genfromtxt(StringIO(data), **kwargs)
+        chunks = list(np.itergenfromtxt(StringIO(data), chunksize=3,
+                                        **kwargs))
+        assert_equal([len(c) for c in chunks], [3, 3, 1])
+        for (i, chunk) in enumerate(chunks):
+            for name in control.dtype.names:
+                assert_equal(chunk[name], control[name][3 * i:3 * i + 3])
+        # The footer is held back until the end of the file
+        chunks = list(np.itergenfromtxt(StringIO(data), chunksize=2,
+                                        skip_footer=3, usecols=(0, 1),
+                                        **kwargs))
+        assert_equal([len(c) for c in chunks], [2, 2])
+        assert_equal(np.concatenate(chunks)[:, 1], [0, 10, 20, 30])
+        # Masks, and line numbers of invalid lines across chunks
+        data = "1,2\n3,N/A\n5,6,7\n7,8\n9,N/A"
+        kwargs = dict(delimiter=",", missing_values="N/A", usemask=True)
+        chunks = list(np.itergenfromtxt(StringIO(data), chunksize=2,
+                                        invalid_raise=False, **kwargs))
+        assert_equal(len(chunks), 2)
+        assert_equal(chunks[1].mask, [[False, False], [False, True]])
+        try:
+            list(np.itergenfromtxt(StringIO(data), chunksize=2, **kwargs))
+        except ValueError, e:
+            assert_("Line #3 " in str(e))
+        else:
+            raise AssertionError("invalid line not reported")
+
+    def test_workers(self):
+        "Check that parsing in byte ranges matches the serial parser."
+        data = "skipped\n# a, b\n" + "".join("%i, %s\n" % (i, "N/A"[:i % 4])
+                                             for i in range(400))
+        f, name = mkstemp()
+        os.write(f, asbytes(data))
+        os.close(f)
+        range_min = np.lib.npyio._PARSE_RANGE_MIN
+        np.lib.npyio._PARSE_RANGE_MIN = 100
+        try:
+            kwargs = dict(delimiter=",", skip_header=1, names=True,
+                          missing_values="N/A", filling_values=-1)
+            for extra in [dict(), dict(usemask=True), dict(usecols=(1, 0)),
+                          dict(dtype="i8,S3", invalid_raise=False)]:
+                extra.update(kwargs)
+                control = np.genfromtxt(name, **extra)
+                test = np.genfromtxt(name, workers=2, **extra)
+                assert_equal(test.dtype, control.dtype)
+                assert_equal(test, control)
+                if extra.get("usemask"):
+                    assert_equal(test.mask, control.mask)
+            # Invalid lines are reported by the serial parser
+            f = open(name, "a")
+            f.write("1, 2, 3\n")
+            f.close()
+            assert_warns(ConversionWarning, np.genfromtxt, name, workers=2,
+                         invalid_raise=False, **kwargs)
+        finally:
+            np.lib.npyio._PARSE_RANGE_MIN = range_min
+            os.unlink(name)
+
     def test_recfromtxt(self):
         #
         data = StringIO('A,B\n0,1\n2,3')
@@ -20,16 +20,13 @@ from numpy.core import array, asarray, zeros, empty, transpose, \
         maximum, flatnonzero, diagonal, arange, fastCopyAndTranspose, sum, \
         isfinite, size, finfo, absolute, log, exp
 from numpy.lib import triu
-from numpy.linalg import lapack_lite
+from numpy.linalg import lapack_lite, _umath_linalg
 from numpy.matrixlib.defmatrix import matrix_power
 from numpy.compat import asbytes
 
 # For Python2/3 compatibility
 _N = asbytes('N')
 _V = asbytes('V')
-_A = asbytes('A')
-_S = asbytes('S')
-_L = asbytes('L')
 
 fortran_int = intc
 
@@ -154,11 +151,35 @@ def _assertRank2(*arrays):
             raise LinAlgError, '%d-dimensional array given. Array must be \
             two-dimensional' % len(a.shape)
 
+def _assertRankAtLeast2(*arrays):
+    for a in arrays:
+        if len(a.shape) < 2:
+            raise LinAlgError('%d-dimensional array given. Array must be '
+                              'at least two-dimensional' % len(a.shape))
+
 def _assertSquareness(*arrays):
     for a in arrays:
         if max(a.shape) != min(a.shape):
             raise LinAlgError, 'Array must be square'
 
+def _assertNdSquareness(*arrays):
+    for a in arrays:
+        if max(a.shape[-2:]) != min(a.shape[-2:]):
+            raise LinAlgError('Last 2 dimensions of the array must be square')
+
+def _checkInfo(info, message):
+    # the gufuncs of _umath_linalg report LAPACK failures per matrix
+    if info.any():
+        raise LinAlgError(message)
+
+def _uploGufunc(UPLO, lower, upper):
+    UPLO = asbytes(UPLO).upper()
+    if UPLO == asbytes('L'):
+        return lower
+    elif UPLO == asbytes('U'):
+        return upper
+    raise ValueError("UPLO argument must be 'L' or 'U'")
+
 def _assertFinite(*arrays):
     for a in arrays:
         if not (isfinite(a).all()):
@@ -250,14 +271,14 @@ def solve(a, b):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         Coefficient matrix.
-    b : array_like, shape (M,) or (M, N)
+    b : array_like, shape (..., M) or (..., M, N)
         Ordinate or "dependent variable" values.
 
     Returns
     -------
-    x : ndarray, shape (M,) or (M, N) depending on b
+    x : ndarray, shape (..., M) or (..., M, N) depending on b
         Solution to the system a x = b
 
     Raises
@@ -282,6 +303,10 @@ def solve(a, b):
     `lstsq` for the least-squares best "solution" of the
     system/equation.
 
+    Stacks of systems are solved at once: the leading dimensions of `a`
+    and `b` broadcast against each other, and `b` is taken as a stack of
+    vectors when it has one dimension less than `a`.
+
     References
     ----------
     .. [1] G. Strang, *Linear Algebra and Its Applications*, 2nd Ed., Orlando,
@@ -305,31 +330,21 @@ def solve(a, b):
     """
     a, _ = _makearray(a)
     b, wrap = _makearray(b)
-    one_eq = len(b.shape) == 1
-    if one_eq:
-        b = b[:, newaxis]
-    _assertRank2(a, b)
-    _assertSquareness(a)
-    n_eq = a.shape[0]
-    n_rhs = b.shape[1]
-    if n_eq != b.shape[0]:
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
+    if len(b.shape) == len(a.shape) - 1:
+        gufunc = _umath_linalg.solve1
+        n_eq = b.shape[-1]
+    else:
+        _assertRankAtLeast2(b)
+        gufunc = _umath_linalg.solve
+        n_eq = b.shape[-2]
+    if n_eq != a.shape[-1]:
         raise LinAlgError, 'Incompatible dimensions'
     t, result_t = _commonType(a, b)
-#    lapack_routine = _findLapackRoutine('gesv', t)
-    if isComplexType(t):
-        lapack_routine = lapack_lite.zgesv
-    else:
-        lapack_routine = lapack_lite.dgesv
-    a, b = _fastCopyAndTranspose(t, a, b)
-    a, b = _to_native_byte_order(a, b)
-    pivots = zeros(n_eq, fortran_int)
-    results = lapack_routine(n_eq, n_rhs, a, n_eq, pivots, b, n_eq, 0)
-    if results['info'] > 0:
-        raise LinAlgError, 'Singular matrix'
-    if one_eq:
-        return wrap(b.ravel().astype(result_t))
-    else:
-        return wrap(b.transpose().astype(result_t))
+    x, info = gufunc(asarray(a, dtype=t), asarray(b, dtype=t))
+    _checkInfo(info, 'Singular matrix')
+    return wrap(x.astype(result_t))
 
 
 def tensorinv(a, ind=2):
@@ -410,12 +425,12 @@ def inv(a):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         Matrix to be inverted.
 
     Returns
     -------
-    ainv : ndarray or matrix, shape (M, M)
+    ainv : ndarray or matrix, shape (..., M, M)
         (Multiplicative) inverse of the matrix `a`.
 
     Raises
@@ -440,9 +455,23 @@ def inv(a):
     matrix([[-2. ,  1. ],
             [ 1.5, -0.5]])
 
+    Stacks of matrices are inverted at once:
+
+    >>> a = np.array([[[1., 2.], [3., 4.]], [[1, 3], [3, 5]]])
+    >>> LA.inv(a)
+    array([[[-2.  ,  1.  ],
+            [ 1.5 , -0.5 ]],
+           [[-1.25,  0.75],
+            [ 0.75, -0.25]]])
+
     """
     a, wrap = _makearray(a)
-    return wrap(solve(a, identity(a.shape[0], dtype=a.dtype)))
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
+    t, result_t = _commonType(a)
+    ainv, info = _umath_linalg.inv(asarray(a, dtype=t))
+    _checkInfo(info, 'Singular matrix')
+    return wrap(ainv.astype(result_t))
 
 
 # Cholesky decomposition
@@ -459,13 +488,13 @@ def cholesky(a):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         Hermitian (symmetric if all elements are real), positive-definite
         input matrix.
 
     Returns
     -------
-    L : ndarray, or matrix object if `a` is, shape (M, M)
+    L : ndarray, or matrix object if `a` is, shape (..., M, M)
         Lower-triangular Cholesky factor of a.
 
     Raises
@@ -514,22 +543,12 @@ def cholesky(a):
 
     """
     a, wrap = _makearray(a)
-    _assertRank2(a)
-    _assertSquareness(a)
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
     t, result_t = _commonType(a)
-    a = _fastCopyAndTranspose(t, a)
-    a = _to_native_byte_order(a)
-    m = a.shape[0]
-    n = a.shape[1]
-    if isComplexType(t):
-        lapack_routine = lapack_lite.zpotrf
-    else:
-        lapack_routine = lapack_lite.dpotrf
-    results = lapack_routine(_L, n, a, m, 0)
-    if results['info'] > 0:
-        raise LinAlgError, 'Matrix is not positive definite - \
-        Cholesky decomposition cannot be computed'
-    s = triu(a, k=0).transpose()
+    s, info = _umath_linalg.cholesky_lo(asarray(a, dtype=t))
+    _checkInfo(info, 'Matrix is not positive definite - '
+                     'Cholesky decomposition cannot be computed')
     if (s.dtype != result_t):
         s = s.astype(result_t)
     return wrap(s)
@@ -814,7 +833,7 @@ def eigvalsh(a, UPLO='L'):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         A complex- or real-valued matrix whose eigenvalues are to be
         computed.
     UPLO : {'L', 'U'}, optional
@@ -823,7 +842,7 @@ def eigvalsh(a, UPLO='L'):
 
     Returns
     -------
-    w : ndarray, shape (M,)
+    w : ndarray, shape (..., M)
         The eigenvalues, not necessarily ordered, each repeated according to
         its multiplicity.
 
@@ -853,45 +872,13 @@ def eigvalsh(a, UPLO='L'):
     array([ 0.17157288+0.j,  5.82842712+0.j])
 
     """
-    UPLO = asbytes(UPLO)
     a, wrap = _makearray(a)
-    _assertRank2(a)
-    _assertSquareness(a)
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
     t, result_t = _commonType(a)
-    real_t = _linalgRealType(t)
-    a = _fastCopyAndTranspose(t, a)
-    a = _to_native_byte_order(a)
-    n = a.shape[0]
-    liwork = 5*n+3
-    iwork = zeros((liwork,), fortran_int)
-    if isComplexType(t):
-        lapack_routine = lapack_lite.zheevd
-        w = zeros((n,), real_t)
-        lwork = 1
-        work = zeros((lwork,), t)
-        lrwork = 1
-        rwork = zeros((lrwork,), real_t)
-        results = lapack_routine(_N, UPLO, n, a, n, w, work, -1,
-                                 rwork, -1, iwork, liwork,  0)
-        lwork = int(abs(work[0]))
-        work = zeros((lwork,), t)
-        lrwork = int(rwork[0])
-        rwork = zeros((lrwork,), real_t)
-        results = lapack_routine(_N, UPLO, n, a, n, w, work, lwork,
-                                rwork, lrwork, iwork, liwork,  0)
-    else:
-        lapack_routine = lapack_lite.dsyevd
-        w = zeros((n,), t)
-        lwork = 1
-        work = zeros((lwork,), t)
-        results = lapack_routine(_N, UPLO, n, a, n, w, work, -1,
-                                 iwork, liwork, 0)
-        lwork = int(work[0])
-        work = zeros((lwork,), t)
-        results = lapack_routine(_N, UPLO, n, a, n, w, work, lwork,
-                                 iwork, liwork, 0)
-    if results['info'] > 0:
-        raise LinAlgError, 'Eigenvalues did not converge'
+    w, info = _uploGufunc(UPLO, _umath_linalg.eigvalsh_lo,
+                          _umath_linalg.eigvalsh_up)(asarray(a, dtype=t))
+    _checkInfo(info, 'Eigenvalues did not converge')
     return w.astype(result_t)
 
 def _convertarray(a):
@@ -1076,7 +1063,7 @@ def eigh(a, UPLO='L'):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         A complex Hermitian or real symmetric matrix.
     UPLO : {'L', 'U'}, optional
         Specifies whether the calculation is done with the lower triangular
@@ -1084,11 +1071,11 @@ def eigh(a, UPLO='L'):
 
     Returns
     -------
-    w : ndarray, shape (M,)
+    w : ndarray, shape (..., M)
         The eigenvalues, not necessarily ordered.
-    v : ndarray, or matrix object if `a` is, shape (M, M)
-        The column ``v[:, i]`` is the normalized eigenvector corresponding
-        to the eigenvalue ``w[i]``.
+    v : ndarray, or matrix object if `a` is, shape (..., M, M)
+        The column ``v[..., :, i]`` is the normalized eigenvector
+        corresponding to the eigenvalue ``w[..., i]``.
 
     Raises
     ------
@@ -1146,47 +1133,14 @@ def eigh(a, UPLO='L'):
             [ 0.00000000+0.38268343j,  0.00000000-0.92387953j]])
 
     """
-    UPLO = asbytes(UPLO)
     a, wrap = _makearray(a)
-    _assertRank2(a)
-    _assertSquareness(a)
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
     t, result_t = _commonType(a)
-    real_t = _linalgRealType(t)
-    a = _fastCopyAndTranspose(t, a)
-    a = _to_native_byte_order(a)
-    n = a.shape[0]
-    liwork = 5*n+3
-    iwork = zeros((liwork,), fortran_int)
-    if isComplexType(t):
-        lapack_routine = lapack_lite.zheevd
-        w = zeros((n,), real_t)
-        lwork = 1
-        work = zeros((lwork,), t)
-        lrwork = 1
-        rwork = zeros((lrwork,), real_t)
-        results = lapack_routine(_V, UPLO, n, a, n, w, work, -1,
-                                 rwork, -1, iwork, liwork,  0)
-        lwork = int(abs(work[0]))
-        work = zeros((lwork,), t)
-        lrwork = int(rwork[0])
-        rwork = zeros((lrwork,), real_t)
-        results = lapack_routine(_V, UPLO, n, a, n, w, work, lwork,
-                                 rwork, lrwork, iwork, liwork,  0)
-    else:
-        lapack_routine = lapack_lite.dsyevd
-        w = zeros((n,), t)
-        lwork = 1
-        work = zeros((lwork,), t)
-        results = lapack_routine(_V, UPLO, n, a, n, w, work, -1,
-                iwork, liwork, 0)
-        lwork = int(work[0])
-        work = zeros((lwork,), t)
-        results = lapack_routine(_V, UPLO, n, a, n, w, work, lwork,
-                iwork, liwork, 0)
-    if results['info'] > 0:
-        raise LinAlgError, 'Eigenvalues did not converge'
-    at = a.transpose().astype(result_t)
-    return w.astype(_realType(result_t)), wrap(at)
+    w, v, info = _uploGufunc(UPLO, _umath_linalg.eigh_lo,
+                             _umath_linalg.eigh_up)(asarray(a, dtype=t))
+    _checkInfo(info, 'Eigenvalues did not converge')
+    return w.astype(_realType(result_t)), wrap(v.astype(result_t))
 
 
 # Singular value decomposition
@@ -1201,7 +1155,8 @@ def svd(a, full_matrices=1, compute_uv=1):
     Parameters
     ----------
     a : array_like
-        A real or complex matrix of shape (`M`, `N`) .
+        A real or complex matrix of shape (`M`, `N`), or a stack of them
+        of shape (..., `M`, `N`), which are decomposed at once.
     full_matrices : bool, optional
         If True (default), `u` and `v` have the shapes (`M`, `M`) and
         (`N`, `N`), respectively.  Otherwise, the shapes are (`M`, `K`)
@@ -1268,60 +1223,34 @@ def svd(a, full_matrices=1, compute_uv=1):
 
     """
     a, wrap = _makearray(a)
-    _assertRank2(a)
+    _assertRankAtLeast2(a)
     _assertNonEmpty(a)
-    m, n = a.shape
+    m, n = a.shape[-2:]
     t, result_t = _commonType(a)
-    real_t = _linalgRealType(t)
-    a = _fastCopyAndTranspose(t, a)
-    a = _to_native_byte_order(a)
-    s = zeros((min(n, m),), real_t)
+    a = asarray(a, dtype=t)
     if compute_uv:
         if full_matrices:
-            nu = m
-            nvt = n
-            option = _A
+            if m < n:
+                gufunc = _umath_linalg.svd_m_f
+            else:
+                gufunc = _umath_linalg.svd_n_f
         else:
-            nu = min(n, m)
-            nvt = min(n, m)
-            option = _S
-        u = zeros((nu, m), t)
-        vt = zeros((n, nvt), t)
+            if m < n:
+                gufunc = _umath_linalg.svd_m_s
+            else:
+                gufunc = _umath_linalg.svd_n_s
+        u, s, vt, info = gufunc(a)
     else:
-        option = _N
-        nu = 1
-        nvt = 1
-        u = empty((1, 1), t)
-        vt = empty((1, 1), t)
-
-    iwork = zeros((8*min(m, n),), fortran_int)
-    if isComplexType(t):
-        lapack_routine = lapack_lite.zgesdd
-        rwork = zeros((5*min(m, n)*min(m, n) + 5*min(m, n),), real_t)
-        lwork = 1
-        work = zeros((lwork,), t)
-        results = lapack_routine(option, m, n, a, m, s, u, m, vt, nvt,
-                                 work, -1, rwork, iwork, 0)
-        lwork = int(abs(work[0]))
-        work = zeros((lwork,), t)
-        results = lapack_routine(option, m, n, a, m, s, u, m, vt, nvt,
-                                 work, lwork, rwork, iwork, 0)
-    else:
-        lapack_routine = lapack_lite.dgesdd
-        lwork = 1
-        work = zeros((lwork,), t)
-        results = lapack_routine(option, m, n, a, m, s, u, m, vt, nvt,
-                                 work, -1, iwork, 0)
-        lwork = int(work[0])
-        work = zeros((lwork,), t)
-        results = lapack_routine(option, m, n, a, m, s, u, m, vt, nvt,
-                                 work, lwork, iwork, 0)
-    if results['info'] > 0:
-        raise LinAlgError, 'SVD did not converge'
+        if m < n:
+            gufunc = _umath_linalg.svd_m
+        else:
+            gufunc = _umath_linalg.svd_n
+        s, info = gufunc(a)
+    _checkInfo(info, 'SVD did not converge')
     s = s.astype(_realType(result_t))
     if compute_uv:
-        u = u.transpose().astype(result_t)
-        vt = vt.transpose().astype(result_t)
+        u = u.astype(result_t)
+        vt = vt.astype(result_t)
         return wrap(u), s, wrap(vt)
     else:
         return s
@@ -1567,16 +1496,16 @@ def slogdet(a):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         Input array.
 
     Returns
     -------
-    sign : float or complex
+    sign : float or complex, or ndarray for a stack of matrices
         A number representing the sign of the determinant. For a real matrix,
         this is 1, 0, or -1. For a complex matrix, this is a complex number
         with absolute value 1 (i.e., it is on the unit circle), or else 0.
-    logdet : float
+    logdet : float, or ndarray for a stack of matrices
         The natural log of the absolute value of the determinant.
 
     If the determinant is zero, then `sign` will be 0 and `logdet` will be
@@ -1613,30 +1542,10 @@ def slogdet(a):
 
     """
     a = asarray(a)
-    _assertRank2(a)
-    _assertSquareness(a)
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
     t, result_t = _commonType(a)
-    a = _fastCopyAndTranspose(t, a)
-    a = _to_native_byte_order(a)
-    n = a.shape[0]
-    if isComplexType(t):
-        lapack_routine = lapack_lite.zgetrf
-    else:
-        lapack_routine = lapack_lite.dgetrf
-    pivots = zeros((n,), fortran_int)
-    results = lapack_routine(n, n, a, n, pivots, 0)
-    info = results['info']
-    if (info < 0):
-        raise TypeError, "Illegal input to Fortran routine"
-    elif (info > 0):
-        return (t(0.0), _realType(t)(-Inf))
-    sign = 1. - 2. * (add.reduce(pivots != arange(1, n + 1)) % 2)
-    d = diagonal(a)
-    absd = absolute(d)
-    sign *= multiply.reduce(d / absd)
-    log(absd, absd)
-    logdet = add.reduce(absd, axis=-1)
-    return sign, logdet
+    return _umath_linalg.slogdet(asarray(a, dtype=t))
 
 def det(a):
     """
@@ -1644,12 +1553,12 @@ def det(a):
 
     Parameters
     ----------
-    a : array_like, shape (M, M)
+    a : array_like, shape (..., M, M)
         Input array.
 
     Returns
     -------
-    det : ndarray
+    det : float or complex, or ndarray for a stack of matrices
         Determinant of `a`.
 
     Notes
@@ -1671,8 +1580,11 @@ def det(a):
       for large matrices where underflow/overflow may occur.
 
     """
-    sign, logdet = slogdet(a)
-    return sign * exp(logdet)
+    a = asarray(a)
+    _assertRankAtLeast2(a)
+    _assertNdSquareness(a)
+    t, result_t = _commonType(a)
+    return _umath_linalg.det(asarray(a, dtype=t))
 
 # Linear Least Squares
 
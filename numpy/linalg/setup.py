@@ -30,6 +30,24 @@ def configuration(parent_package='',top_path=None):
                          extra_info = lapack_info
                          )
 
+    # The gufuncs link against the same LAPACK as lapack_lite
+    def get_umath_linalg_sources(ext, build_dir):
+        if not lapack_info:
+            return ext.depends[:-1]
+        elif sys.platform=='win32':
+            return []
+        return ext.depends[:1]
+
+    config.add_extension('_umath_linalg',
+                         sources = ['umath_linalg.c.src',
+                                    get_umath_linalg_sources],
+                         depends=  ['python_xerbla.c',
+                                    'zlapack_lite.c', 'dlapack_lite.c',
+                                    'blas_lite.c', 'dlamch.c',
+                                    'f2c_lite.c','f2c.h'],
+                         extra_info = lapack_info
+                         )
+
     return config
 
 if __name__ == '__main__':
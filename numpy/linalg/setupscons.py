@@ -8,6 +8,7 @@ def configuration(parent_package='',top_path=None):
 
     config.add_sconscript('SConstruct',
                           source_files = ['lapack_litemodule.c',
+                                          'umath_linalg.c.src',
                                           'zlapack_lite.c', 'dlapack_lite.c',
                                           'blas_lite.c', 'dlamch.c',
                                           'f2c_lite.c','f2c.h'])
@@ -335,6 +335,97 @@ class TestNormSingle(_TestNorm):
     dec = 6
 
 
+class TestStacked(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        r = np.random.rand(2, 3, 4, 4)
+        self.a = r + 4*np.eye(4)
+        self.h = r + r.swapaxes(-1, -2) + 8*np.eye(4)
+        self.b = np.random.rand(2, 3, 4)
+
+    def each(self, func, *arrays):
+        # func applied matrix by matrix
+        res = [func(*[x[i, j] for x in arrays])
+               for i in range(2) for j in range(3)]
+        if isinstance(res[0], tuple):
+            return [np.array(r).reshape((2, 3) + np.shape(r[0]))
+                    for r in zip(*res)]
+        return np.array(res).reshape((2, 3) + np.shape(res[0]))
+
+    def test_solve_inv(self):
+        a, b = self.a, self.b
+        assert_almost_equal(linalg.solve(a, b), self.each(linalg.solve, a, b))
+        c = b[..., np.newaxis].repeat(2, -1)
+        assert_almost_equal(linalg.solve(a, c), self.each(linalg.solve, a, c))
+        assert_almost_equal(linalg.solve(a, c[0, 0]),
+                            self.each(lambda x: linalg.solve(x, c[0, 0]), a))
+        assert_almost_equal(linalg.inv(a), self.each(linalg.inv, a))
+        assert_equal(linalg.inv(np.zeros((0, 2, 2))).shape, (0, 2, 2))
+
+    def test_det(self):
+        a = self.a + 1j*self.a[::-1]
+        for x in [self.a, a]:
+            assert_almost_equal(linalg.det(x), self.each(linalg.det, x))
+            s, ld = linalg.slogdet(x)
+            s1, ld1 = self.each(linalg.slogdet, x)
+            assert_almost_equal(s, s1)
+            assert_almost_equal(ld, ld1)
+        a = self.a.copy()
+        a[1, 2] = 0
+        assert_equal(linalg.det(a)[1, 2], 0)
+        assert_equal(linalg.slogdet(a)[1][1, 2], -inf)
+
+    def test_hermitian(self):
+        h = self.h
+        l = linalg.cholesky(h)
+        assert_almost_equal(l, self.each(linalg.cholesky, h))
+        assert_almost_equal(np.triu(l[1, 2], 1), 0)
+        w, v = linalg.eigh(h)
+        w1, v1 = self.each(linalg.eigh, h)
+        assert_almost_equal(w, w1)
+        assert_almost_equal(np.abs(v), np.abs(v1))
+        assert_almost_equal(linalg.eigvalsh(h, 'U'), w)
+        hc = h + 1j*(self.a - self.a.swapaxes(-1, -2))
+        assert_almost_equal(linalg.eigvalsh(hc),
+                            self.each(linalg.eigvalsh, hc))
+        assert_raises(ValueError, linalg.eigh, h, 'X')
+
+    def test_svd(self):
+        for shape in [(2, 3, 4, 6), (2, 3, 6, 4)]:
+            a = np.random.rand(*shape)
+            for full in [True, False]:
+                u, s, vt = linalg.svd(a, full)
+                u1, s1, vt1 = self.each(lambda x: linalg.svd(x, full), a)
+                assert_equal(u.shape, u1.shape)
+                assert_equal(vt.shape, vt1.shape)
+                assert_almost_equal(s, s1)
+                k = min(shape[-2:])
+                assert_almost_equal(
+                    np.sum(u[..., :, :k, None] * s[..., None, :, None] *
+                           vt[..., None, :k, :], -2), a)
+            assert_almost_equal(linalg.svd(a, compute_uv=False), s)
+
+    def test_types(self):
+        a = self.a
+        for t in [single, csingle]:
+            assert_equal(linalg.inv(a.astype(t)).dtype, t)
+            assert_equal(linalg.eigvalsh(self.h.astype(t)).dtype, t)
+        assert_equal(linalg.solve(a.astype(single), self.b).dtype, double)
+        x = linalg.solve(a.astype('>f8'), self.b[::-1, :, :])
+        assert_almost_equal(x, self.each(linalg.solve, a, self.b[::-1]))
+
+    def test_errors(self):
+        a = self.a.copy()
+        a[1, 1] = 0
+        assert_raises(linalg.LinAlgError, linalg.inv, a)
+        assert_raises(linalg.LinAlgError, linalg.solve, a, self.b)
+        assert_raises(linalg.LinAlgError, linalg.cholesky, -self.h)
+        assert_raises(linalg.LinAlgError, linalg.inv, np.ones((2, 3, 4)))
+        assert_raises(linalg.LinAlgError, linalg.solve, self.a,
+                      np.ones((2, 3, 5)))
+        assert_raises(linalg.LinAlgError, linalg.det, np.ones(3))
+
+
 def test_matrix_rank():
     # Full rank matrix
     yield assert_equal, 4, matrix_rank(np.eye(4))
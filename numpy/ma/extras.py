@@ -602,7 +602,7 @@ def median(a, axis=None, out=None, overwrite_input=False):
         calculations. The input array will be modified by the call to
         median. This will save memory when you do not need to preserve
         the contents of the input array. Treat the input as undefined,
-        but it will probably be fully or partially sorted. Default is
+        but it will probably be partially sorted. Default is
         False. Note that, if `overwrite_input` is True, and the input
         is not already an `ndarray`, an error will be raised.
 
@@ -641,27 +641,24 @@ def median(a, axis=None, out=None, overwrite_input=False):
 
     """
     def _median1D(data):
-        counts = filled(count(data), 0)
-        (idx, rmd) = divmod(counts, 2)
+        # Only the middle of the unmasked values has to be in place
+        data = data.compressed()
+        (idx, rmd) = divmod(data.size, 2)
+        if not data.size:
+            return masked
         if rmd:
+            data.partition(idx)
             choice = slice(idx, idx + 1)
         else:
+            data.partition([idx - 1, idx])
             choice = slice(idx - 1, idx + 1)
         return data[choice].mean(0)
     #
-    if overwrite_input:
-        if axis is None:
-            asorted = a.ravel()
-            asorted.sort()
-        else:
-            a.sort(axis=axis)
-            asorted = a
-    else:
-        asorted = sort(a, axis=axis)
+    a = asarray(a)
     if axis is None:
-        result = _median1D(asorted)
+        result = _median1D(a.ravel())
     else:
-        result = apply_along_axis(_median1D, axis, asorted)
+        result = apply_along_axis(_median1D, axis, a)
     if out is not None:
         out = result
     return result
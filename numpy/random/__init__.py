@@ -90,12 +90,12 @@ from mtrand import *
 ranf = random = sample = random_sample
 __all__.extend(['ranf','random','sample'])
 
-def __RandomState_ctor():
+def __RandomState_ctor(ziggurat=False):
     """Return a RandomState instance.
 
     This function exists solely to assist (un)pickling.
     """
-    return RandomState()
+    return RandomState(ziggurat=ziggurat)
 
 from numpy.testing import Tester
 test = Tester().test
@@ -104,8 +104,47 @@ double rk_normal(rk_state *state, double loc, double scale)
     return loc + scale*rk_gauss(state);
 }
 
+#include "distributions_ziggurat.h"
+
+/* Ziggurat method for the exponential, drawing the layer and the position
+ * in it as rk_gauss does (see randomkit.c). */
+static double rk_standard_exponential_ziggurat(rk_state *state)
+{
+    unsigned long a, b;
+    int i;
+    double x;
+
+    for (;;)
+    {
+        a = rk_random(state);
+        b = rk_random(state);
+        i = (int)(b & 0xff);
+        x = ((long)(a >> 1) * 2097152.0 + (long)(b >> 11))
+            * (1.0 / 4503599627370496.0)
+            * rk_zig_exp_x[i];
+        if (x < rk_zig_exp_x[i + 1])
+        {
+            return x;
+        }
+        if (i == 0)
+        {
+            /* the tail beyond r is r plus an exponential */
+            return RK_ZIG_EXP_R - log(1.0 - rk_double(state));
+        }
+        if (rk_zig_exp_f[i] + rk_double(state) *
+            (rk_zig_exp_f[i + 1] - rk_zig_exp_f[i]) < exp(-x))
+        {
+            return x;
+        }
+    }
+}
+
 double rk_standard_exponential(rk_state *state)
 {
+    if (state->ziggurat)
+    {
+        return rk_standard_exponential_ziggurat(state);
+    }
     /* We use -log(1-U) since U is [0, 1) */
     return -log(1.0 - rk_double(state));
 }
@@ -45,13 +45,16 @@ extern "C" {
  * Marsaglia, G. and Tsang, W. W. A Simple Method for Generating Gamma 
  * Variables. ACM Transactions on Mathematical Software, Vol. 26, No. 3,
  * September 2000, Pages 363–372.
+ *
+ * Marsaglia, G. and Tsang, W. W. The Ziggurat Method for Generating Random
+ * Variables. Journal of Statistical Software, Vol. 5, No. 8, 2000.
  */
  
 /* Normal distribution with mean=loc and standard deviation=scale. */
 extern double rk_normal(rk_state *state, double loc, double scale);
 
 /* Standard exponential distribution (mean=1) computed by inversion of the 
- * CDF. */
+ * CDF, or with the ziggurat method if state->ziggurat is set. */
 extern double rk_standard_exponential(rk_state *state);
 
 /* Exponential distribution with mean=scale. */
@@ -61,6 +64,8 @@ extern double rk_exponential(rk_state *state, double scale);
 extern double rk_uniform(rk_state *state, double loc, double scale);
 
 /* Standard gamma distribution with shape parameter. 
+ * Its normal and exponential variates come from rk_gauss and
+ * rk_standard_exponential, so it follows state->ziggurat.
  * When shape < 1, the algorithm given by (Devroye p. 304) is used.
  * When shape == 1, a Exponential variate is generated.
  * When shape > 1, the small and fast method of (Marsaglia and Tsang 2000) 
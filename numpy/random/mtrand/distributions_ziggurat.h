@@ -0,0 +1,187 @@
+/*
+ * Generated by generate_ziggurat.py, do not edit.
+ *
+ * Ziggurat layers for the standard exponential, f(x) = exp(-x).
+ * x is the width of each layer, f the density at that width.
+ */
+
+#define RK_ZIG_EXP_R 7.6971174701310501
+
+static const double rk_zig_exp_x[257] = {
+    8.69711747013105096e+00, 7.69711747013105008e+00, 6.94103362937721258e+00,
+    6.47837849383256970e+00, 6.14416466577247267e+00, 5.88214431579539987e+00,
+    5.66641016745403370e+00, 5.48289062752606249e+00, 5.32309050575439802e+00,
+    5.18148728130150005e+00, 5.05428848998130409e+00, 4.93877708590125053e+00,
+    4.83293974102511203e+00, 4.73524299660174108e+00, 4.64449188542008518e+00,
+    4.55973706170735138e+00, 4.48021174652842191e+00, 4.40528769347357319e+00,
+    4.33444368031727301e+00, 4.26724248027736586e+00, 4.20331371373518436e+00,
+    4.14234086566405146e+00, 4.08405131040829783e+00, 4.02820854464793676e+00,
+    3.97460606667378880e+00, 3.92306250013548974e+00, 3.87341767039950913e+00,
+    3.82552941852233674e+00, 3.77927099241166786e+00, 3.73452889403979738e+00,
+    3.69120109023741882e+00, 3.64919551576085377e+00, 3.60842881312890951e+00,
+    3.56882526564833702e+00, 3.53031588912934335e+00, 3.49283765477405961e+00,
+    3.45633282113276019e+00, 3.42074835725111992e+00, 3.38603544246030097e+00,
+    3.35214903090010941e+00, 3.31904747097074804e+00, 3.28669217159906868e+00,
+    3.25504730857044988e+00, 3.22407956528626416e+00, 3.19375790321224029e+00,
+    3.16405335802597287e+00, 3.13493885808444039e+00, 3.10638906233982448e+00,
+    3.07838021525409022e+00, 3.05089001661545511e+00, 3.02389750445567662e+00,
+    2.99738294951613060e+00, 2.97132775992108966e+00, 2.94571439489504572e+00,
+    2.92052628651274082e+00, 2.89574776860014182e+00, 2.87136401201553637e+00,
+    2.84736096563518881e+00, 2.82372530245003528e+00, 2.80044437025073778e+00,
+    2.77750614643975657e+00, 2.75489919656234461e+00, 2.73261263619470007e+00,
+    2.71063609586792875e+00, 2.68895968874180369e+00, 2.66757398077326657e+00,
+    2.64646996315180916e+00, 2.62563902679778849e+00, 2.60507293874083556e+00,
+    2.58476382021414075e+00, 2.56470412631690525e+00, 2.54488662711186997e+00,
+    2.52530439003782803e+00, 2.50595076352859403e+00, 2.48681936174020946e+00,
+    2.46790405029736482e+00, 2.44919893297824975e+00, 2.43069833926441969e+00,
+    2.41239681268887063e+00, 2.39428909992145789e+00, 2.37637014053614060e+00,
+    2.35863505740933732e+00, 2.34107914770303438e+00, 2.32369787439019637e+00,
+    2.30648685828357980e+00, 2.28944187053226944e+00, 2.27255882555315480e+00,
+    2.25583377436721921e+00, 2.23926289831290903e+00, 2.22284250311103682e+00,
+    2.20656901325766386e+00, 2.19043896672322003e+00, 2.17444900993777468e+00,
+    2.15859589304388599e+00, 2.14287646539984200e+00, 2.12728767131736829e+00,
+    2.11182654601904218e+00, 2.09649021180171502e+00, 2.08127587439322514e+00,
+    2.06618081949057553e+00, 2.05120240946858479e+00, 2.03633808024876961e+00,
+    2.02158533831892617e+00, 2.00694175789451856e+00, 1.99240497821357665e+00,
+    1.97797270095736044e+00, 1.96364268778954831e+00, 1.94941275800718494e+00,
+    1.93528078629705136e+00, 1.92124470059152808e+00, 1.90730248001838754e+00,
+    1.89345215293930824e+00, 1.87969179507221118e+00, 1.86601952769282797e+00,
+    1.85243351591117555e+00, 1.83893196701887995e+00, 1.82551312890351980e+00,
+    1.81217528852639065e+00, 1.79891677046029086e+00, 1.78573593548412601e+00,
+    1.77263117923130564e+00, 1.75960093088907477e+00, 1.74664365194607440e+00,
+    1.73375783498557157e+00, 1.72094200252193530e+00, 1.70819470587805777e+00,
+    1.69551452410153791e+00, 1.68290006291755390e+00, 1.67034995371645212e+00,
+    1.65786285257417276e+00, 1.64543743930372366e+00, 1.63307241653599133e+00,
+    1.62076650882825790e+00, 1.60851846179885838e+00, 1.59632704128648339e+00,
+    1.58419103253268889e+00, 1.57210923938622971e+00, 1.56008048352788808e+00,
+    1.54810360371451350e+00, 1.53617745504103209e+00, 1.52430090821922626e+00,
+    1.51247284887211708e+00, 1.50069217684281675e+00, 1.48895780551674606e+00,
+    1.47726866115613387e+00, 1.46562368224574535e+00, 1.45402181884879345e+00,
+    1.44246203197201250e+00, 1.43094329293887967e+00, 1.41946458276998322e+00,
+    1.40802489156953570e+00, 1.39662321791704214e+00, 1.38525856826312221e+00,
+    1.37392995632849080e+00, 1.36263640250508700e+00, 1.35137693325833541e+00,
+    1.34015058052950509e+00, 1.32895638113711700e+00, 1.31779337617632519e+00,
+    1.30666061041517456e+00, 1.29555713168660147e+00, 1.28448199027501309e+00,
+    1.27343423829624158e+00, 1.26241292906961577e+00, 1.25141711648085296e+00,
+    1.24044585433440702e+00, 1.22949819569384977e+00, 1.21857319220879101e+00,
+    1.20766989342676223e+00, 1.19678734608840398e+00, 1.18592459340420309e+00,
+    1.17508067431091234e+00, 1.16425462270567959e+00, 1.15344546665577541e+00,
+    1.14265222758167351e+00, 1.13187391941107918e+00, 1.12110954770133109e+00,
+    1.11035810872741192e+00, 1.09961858853259820e+00, 1.08888996193854792e+00,
+    1.07817119151137319e+00, 1.06746122647996877e+00, 1.05675900160255232e+00,
+    1.04606343597704510e+00, 1.03537343179052943e+00, 1.02468787300261832e+00,
+    1.01400562395709781e+00, 1.00332552791569807e+00, 9.92646405507277230e-01,
+    9.81967053085063935e-01, 9.71286240983904814e-01, 9.60602711668667952e-01,
+    9.49915177764077412e-01, 9.39222319955263840e-01, 9.28522784747211949e-01,
+    9.17815182070045754e-01, 9.07098082715691811e-01, 8.96370015589891489e-01,
+    8.85629464761753082e-01, 8.74874866291026732e-01, 8.64104604811006038e-01,
+    8.53317009842374907e-01, 8.42510351810370040e-01, 8.31682837734274649e-01,
+    8.20832606554413369e-01, 8.09957724057419948e-01, 7.99056177355488728e-01,
+    7.88125868869494095e-01, 7.77164609759131264e-01, 7.66170112735436226e-01,
+    7.55139984181983803e-01, 7.44071715500509545e-01, 7.32962673584366953e-01,
+    7.21810090308757757e-01, 7.10611050909656483e-01, 6.99362481103233402e-01,
+    6.88061132773749362e-01, 6.76703568029524138e-01, 6.65286141392679387e-01,
+    6.53804979847666501e-01, 6.42255960424537919e-01, 6.30634684933491951e-01,
+    6.18936451394877740e-01, 6.07156221620301695e-01, 5.95288584291504441e-01,
+    5.83327712748771154e-01, 5.71267316532589886e-01, 5.59100585511542181e-01,
+    5.46820125163312132e-01, 5.34417881237167047e-01, 5.21885051592136606e-01,
+    5.09211982443655953e-01, 4.96388045518672605e-01, 4.83401491653463300e-01,
+    4.70239275082170449e-01, 4.56886840931421789e-01, 4.43327866073554122e-01,
+    4.29543940225412590e-01, 4.15514169600358252e-01, 4.01214678896279597e-01,
+    3.86617977941121405e-01, 3.71692145329919177e-01, 3.56399760258395704e-01,
+    3.40696481064851175e-01, 3.24529117016911450e-01, 3.07832954674934267e-01,
+    2.90527955491232615e-01, 2.72513185478467035e-01, 2.53658363385914465e-01,
+    2.33790483059677257e-01, 2.12671510630969229e-01, 1.89958689622434673e-01,
+    1.65127622564190418e-01, 1.37304980940016280e-01, 1.04838507565823219e-01,
+    6.38521638150076065e-02, 0.00000000000000000e+00
+};
+
+static const double rk_zig_exp_f[257] = {
+    1.67066692307963672e-04, 4.54134353841496603e-04, 9.67269282327174319e-04,
+    1.53629978030157257e-03, 2.14596774371890713e-03, 2.78879879357407569e-03,
+    3.46026477783690405e-03, 4.15729512083379705e-03, 4.87765598354239580e-03,
+    5.61964220720548909e-03, 6.38190593731918342e-03, 7.16335318363499080e-03,
+    7.96307743801704347e-03, 8.78031498580897699e-03, 9.61441364250221163e-03,
+    1.04648101810299807e-02, 1.13310135978346004e-02, 1.22125924262553778e-02,
+    1.31091649312549911e-02, 1.40203914031819428e-02, 1.49459680116911485e-02,
+    1.58856218399731561e-02, 1.68391068260399408e-02, 1.78062004109113547e-02,
+    1.87867007446960235e-02, 1.97804243380097396e-02, 2.07872040725781138e-02,
+    2.18068875042835807e-02, 2.28393354063852402e-02, 2.38844205115581742e-02,
+    2.49420264197317866e-02, 2.60120466451342208e-02, 2.70943837809558032e-02,
+    2.81889487639786461e-02, 2.92956602246374105e-02, 3.04144439104666216e-02,
+    3.15452321728936225e-02, 3.26879635089595555e-02, 3.38425821508743577e-02,
+    3.50090376973974313e-02, 3.61872847819314433e-02, 3.73772827729593818e-02,
+    3.85789955030748713e-02, 3.97923910233741393e-02, 4.10174413804148402e-02,
+    4.22541224133162543e-02, 4.35024135688881972e-02, 4.47622977329432889e-02,
+    4.60337610761751836e-02, 4.73167929131815615e-02, 4.86113855733795036e-02,
+    4.99175342827063787e-02, 5.12352370551262815e-02, 5.25644945930716853e-02,
+    5.39053101960460801e-02, 5.52576896766970305e-02, 5.66216412837428698e-02,
+    5.79971756312006592e-02, 5.93843056334202798e-02, 6.07830464454796604e-02,
+    6.21934154085410362e-02, 6.36154319998073758e-02, 6.50491177867538045e-02,
+    6.64944963853398158e-02, 6.79515934219366430e-02, 6.94204364987287825e-02,
+    7.09010551623718427e-02, 7.23934808757087517e-02, 7.38977469923647462e-02,
+    7.54138887340584096e-02, 7.69419431704805173e-02, 7.84819492016064352e-02,
+    8.00339475423199054e-02, 8.15979807092374193e-02, 8.31740930096323966e-02,
+    8.47623305323681464e-02, 8.63627411407569268e-02, 8.79753744672702315e-02,
+    8.96002819100328862e-02, 9.12375166310401969e-02, 9.28871335560435690e-02,
+    9.45491893760558727e-02, 9.62237425504328253e-02, 9.79108533114922130e-02,
+    9.96105836706371317e-02, 1.01322997425953631e-01, 1.03048160171257702e-01,
+    1.04786139306570159e-01, 1.06537004050001632e-01, 1.08300825451033755e-01,
+    1.10077676405185357e-01, 1.11867631670056283e-01, 1.13670767882744286e-01,
+    1.15487163578633506e-01, 1.17316899211555525e-01, 1.19160057175327641e-01,
+    1.21016721826674792e-01, 1.22886979509545108e-01, 1.24770918580830933e-01,
+    1.26668629437510671e-01, 1.28580204545228199e-01, 1.30505738468330773e-01,
+    1.32445327901387494e-01, 1.34399071702213602e-01, 1.36367070926428829e-01,
+    1.38349428863580176e-01, 1.40346251074862399e-01, 1.42357645432472146e-01,
+    1.44383722160634720e-01, 1.46424593878344889e-01, 1.48480375643866735e-01,
+    1.50551185001039839e-01, 1.52637142027442801e-01, 1.54738369384468027e-01,
+    1.56854992369365148e-01, 1.58987138969314129e-01, 1.61134939917591952e-01,
+    1.63298528751901734e-01, 1.65478041874935922e-01, 1.67673618617250081e-01,
+    1.69885401302527550e-01, 1.72113535315319977e-01, 1.74358169171353411e-01,
+    1.76619454590494829e-01, 1.78897546572478278e-01, 1.81192603475496261e-01,
+    1.83504787097767436e-01, 1.85834262762197083e-01, 1.88181199404254262e-01,
+    1.90545769663195363e-01, 1.92928149976771296e-01, 1.95328520679563189e-01,
+    1.97747066105098818e-01, 2.00183974691911210e-01, 2.02639439093708962e-01,
+    2.05113656293837654e-01, 2.07606827724221982e-01, 2.10119159388988230e-01,
+    2.12650861992978224e-01, 2.15202151075378628e-01, 2.17773247148700472e-01,
+    2.20364375843359439e-01, 2.22975768058120111e-01, 2.25607660116683956e-01,
+    2.28260293930716618e-01, 2.30933917169627356e-01, 2.33628783437433291e-01,
+    2.36345152457059560e-01, 2.39083290262449094e-01, 2.41843469398877131e-01,
+    2.44625969131892024e-01, 2.47431075665327543e-01, 2.50259082368862185e-01,
+    2.53110290015629347e-01, 2.55985007030415268e-01, 2.58883549749016062e-01,
+    2.61806242689362811e-01, 2.64753418835062038e-01, 2.67725419932044628e-01,
+    2.70722596799059856e-01, 2.73745309652802804e-01, 2.76793928448517190e-01,
+    2.79868833236972758e-01, 2.82970414538780635e-01, 2.86099073737076715e-01,
+    2.89255223489677582e-01, 2.92439288161892408e-01, 2.95651704281260974e-01,
+    2.98892921015581514e-01, 3.02163400675693306e-01, 3.05463619244590034e-01,
+    3.08794066934559963e-01, 3.12155248774179384e-01, 3.15547685227128727e-01,
+    3.18971912844957017e-01, 3.22428484956089001e-01, 3.25917972393556021e-01,
+    3.29440964264136160e-01, 3.32998068761808763e-01, 3.36589914028677384e-01,
+    3.40217149066779856e-01, 3.43880444704502242e-01, 3.47580494621636815e-01,
+    3.51318016437483172e-01, 3.55093752866787293e-01, 3.58908472948749557e-01,
+    3.62762973354817497e-01, 3.66658079781513879e-01, 3.70594648435145724e-01,
+    3.74573567615901881e-01, 3.78595759409580512e-01, 3.82662181496009501e-01,
+    3.86773829084137377e-01, 3.90931736984796774e-01, 3.95136981833289824e-01,
+    3.99390684475230739e-01, 4.03694012530529944e-01, 4.08048183152032062e-01,
+    4.12454465997160846e-01, 4.16914186433002543e-01, 4.21428728997616242e-01,
+    4.25999541143034011e-01, 4.30628137288458501e-01, 4.35316103215636241e-01,
+    4.40065100842353507e-01, 4.44876873414548124e-01, 4.49753251162754608e-01,
+    4.54696157474615115e-01, 4.59707615642137302e-01, 4.64789756250425790e-01,
+    4.69944825283959589e-01, 4.75175193037376986e-01, 4.80483363930453822e-01,
+    4.85871987341884526e-01, 4.91343869594032145e-01, 4.96901987241549159e-01,
+    5.02549501841347279e-01, 5.08289776410642435e-01, 5.14126393814748117e-01,
+    5.20063177368233154e-01, 5.26104213983619284e-01, 5.32253880263042767e-01,
+    5.38516872002861358e-01, 5.44898237672439167e-01, 5.51403416540640845e-01,
+    5.58038282262587004e-01, 5.64809192912399727e-01, 5.71723048664825262e-01,
+    5.78787358602844471e-01, 5.86010318477267478e-01, 5.93400901691732874e-01,
+    6.00968966365231672e-01, 6.08725382079621458e-01, 6.16682180915206990e-01,
+    6.24852738703665311e-01, 6.33251994214365399e-01, 6.41896716427265313e-01,
+    6.50805833414570212e-01, 6.60000841078998923e-01, 6.69506316731923956e-01,
+    6.79350572264764585e-01, 6.89566496117077099e-01, 7.00192655082787274e-01,
+    7.11274760805075013e-01, 7.22867659593571021e-01, 7.35038092431422485e-01,
+    7.47868621985193993e-01, 7.61463388849895062e-01, 7.75956852040114331e-01,
+    7.91527636972494286e-01, 8.08421651523006934e-01, 8.26993296643048770e-01,
+    8.47785500623987831e-01, 8.71704332381201485e-01, 9.00469929925743706e-01,
+    9.38143680862170815e-01, 1.00000000000000000e+00
+};
+
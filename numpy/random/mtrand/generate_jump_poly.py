@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Generate randomkit_jump.h, the polynomial used by rk_jump to advance the
+Mersenne Twister by 2**128 steps.
+
+Advancing the generator by one step is a linear map F on the state.  Its
+minimal polynomial phi (degree 19937) is found with the Berlekamp-Massey
+algorithm from an output bit sequence; then F**J = q(F) with
+q(x) = x**J mod x*phi(x).  The extra factor x accounts for the 31 unused
+low bits of the oldest state word, which F discards.
+
+Run it from this directory:  python generate_jump_poly.py
+"""
+import sys
+
+N = 624
+M = 397
+MATRIX_A = 0x9908b0df
+UPPER_MASK = 0x80000000
+LOWER_MASK = 0x7fffffff
+JUMP_LOG2 = 128
+
+
+def seed_key(seed):
+    key = [0] * N
+    for i in range(N):
+        key[i] = seed
+        seed = (1812433253 * (seed ^ (seed >> 30)) + i + 1) & 0xffffffff
+    return key
+
+
+def step(key, i):
+    """Replace the oldest word key[i] by the next one, return new index."""
+    y = (key[i] & UPPER_MASK) | (key[(i + 1) % N] & LOWER_MASK)
+    key[i] = key[(i + M) % N] ^ (y >> 1) ^ (MATRIX_A * (y & 1))
+    return (i + 1) % N
+
+
+def minimal_polynomial(bits):
+    """Berlekamp-Massey over GF(2); polynomials are ints, bit k is x**k."""
+    c, b, L, m = 1, 1, 0, 1
+    window = 0
+    for n, s in enumerate(bits):
+        window = (window << 1) | s
+        # discrepancy: s_n + sum c_k s_(n-k)
+        if bin(c & window).count('1') & 1:
+            t = c
+            c ^= b << m
+            if 2 * L <= n:
+                L, b, m = n + 1 - L, t, 1
+            else:
+                m += 1
+        else:
+            m += 1
+    # reverse the connection polynomial into the characteristic one
+    return int(bin(c)[2:].zfill(L + 1)[::-1], 2), L
+
+
+def polymod(a, p, degree):
+    while a.bit_length() > degree:
+        a ^= p << (a.bit_length() - 1 - degree)
+    return a
+
+
+def jump_polynomial(log2=JUMP_LOG2):
+    key, i = seed_key(5489), 0
+    bits = []
+    for k in range(2 * 19937 + 100):
+        bits.append(key[i] >> 31)
+        i = step(key, i)
+    phi, degree = minimal_polynomial(bits)
+    assert degree == 19937, degree
+    r = 2  # x
+    for k in range(log2):
+        r = polymod(int('0'.join(bin(r)[2:]), 2), phi, degree)
+    # q = 0 mod x and q = r mod phi
+    if r & 1:
+        r ^= phi
+    return r
+
+
+def jump(key, poly):
+    """Python version of rk_jump, used to check the polynomial."""
+    r, ri = [0] * N, 0
+    for j in range(poly.bit_length() - 1, -1, -1):
+        ri = step(r, ri)
+        if (poly >> j) & 1:
+            for k in range(N):
+                r[(ri + k) % N] ^= key[k]
+    return [r[(ri + k) % N] for k in range(N)]
+
+
+def check(poly_for):
+    # compare against stepping directly for a small jump size
+    key = seed_key(1234)
+    key[0] ^= 0x1234567   # exercise the unused low bits
+    direct, i = list(key), 0
+    for k in range(poly_for[0]):
+        i = step(direct, i)
+    direct = [direct[(i + k) % N] for k in range(N)]
+    assert jump(key, poly_for[1]) == direct
+
+
+if __name__ == '__main__':
+    poly = jump_polynomial()
+    if '--check' in sys.argv:
+        check((2 ** 15, jump_polynomial(15)))
+    words = []
+    while poly:
+        words.append(poly & 0xffffffff)
+        poly >>= 32
+    out = open('randomkit_jump.h', 'w')
+    out.write('/*\n * Generated by generate_jump_poly.py, do not edit.\n'
+              ' *\n * Coefficients of q(x) = x**(2**%d) mod x*phi(x), phi being'
+              ' the minimal\n * polynomial of the Mersenne Twister, 32 per'
+              ' word starting with x**0.\n */\n\n' % JUMP_LOG2)
+    out.write('#define RK_JUMP_POLY_LEN %d\n\n' % len(words))
+    out.write('static const unsigned long rk_jump_poly[RK_JUMP_POLY_LEN] = {\n')
+    for k in range(0, len(words), 5):
+        out.write('    ' + ', '.join(['0x%08xUL' % w for w in words[k:k+5]]))
+        if k + 5 < len(words):
+            out.write(',')
+        out.write('\n')
+    out.write('};\n')
+    out.close()
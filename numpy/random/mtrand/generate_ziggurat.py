@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Generate the ziggurat tables used by rk_gauss and rk_standard_exponential
+when the ziggurat method is selected.
+
+The area under the (unnormalized) density f is split into 256 layers of
+equal area v: a base strip made of the rectangle [0, r] x [0, f(r)] and
+the tail beyond r, and 255 rectangles [0, x[i]] x [f(x[i]), f(x[i+1])]
+stacked on top of it.  x[0] = v/f(r) is the width of a rectangle of the
+same area as the base strip, x[1] = r and x[256] = 0.  r is found by
+bisection so that the top layer closes at f(0) (Marsaglia and Tsang,
+"The Ziggurat Method for Generating Random Variables", 2000).
+
+Run it from this directory:  python generate_ziggurat.py
+"""
+import math
+
+LAYERS = 256
+
+
+def normal_pdf(x):
+    return math.exp(-0.5 * x * x)
+
+
+def normal_inv(y):
+    return math.sqrt(-2.0 * math.log(y))
+
+
+def normal_area(r):
+    return r * normal_pdf(r) + math.sqrt(0.5 * math.pi) * \
+           math.erfc(r / math.sqrt(2.0))
+
+
+def exponential_pdf(x):
+    return math.exp(-x)
+
+
+def exponential_inv(y):
+    return -math.log(y)
+
+
+def exponential_area(r):
+    return (r + 1.0) * exponential_pdf(r)
+
+
+def layers(r, pdf, inv, area):
+    """Return the layer edges for base width r, or None if r is too small."""
+    v = area(r)
+    x = [v / pdf(r), r]
+    for i in range(1, LAYERS - 1):
+        y = pdf(x[i]) + v / x[i]
+        if y >= 1.0:
+            return None
+        x.append(inv(y))
+    # excess area of the top layer, zero for the right r
+    x.append(0.0)
+    return x, x[LAYERS - 1] * (1.0 - pdf(x[LAYERS - 1])) - v
+
+
+def solve(pdf, inv, area, lo, hi):
+    for k in range(200):
+        mid = 0.5 * (lo + hi)
+        res = layers(mid, pdf, inv, area)
+        if res is None or res[1] < 0:
+            lo = mid
+        else:
+            hi = mid
+    x = layers(hi, pdf, inv, area)[0]
+    return hi, x, [pdf(t) for t in x]
+
+
+def write(filename, prefix, doc, r, x, f):
+    out = open(filename, 'w')
+    out.write('/*\n * Generated by generate_ziggurat.py, do not edit.\n'
+              ' *\n * Ziggurat layers for the %s.\n'
+              ' * x is the width of each layer, f the density at that'
+              ' width.\n */\n\n' % doc)
+    out.write('#define %s_R %.17g\n\n' % (prefix.upper(), r))
+    for name, values in (('x', x), ('f', f)):
+        out.write('static const double %s_%s[%d] = {\n'
+                  % (prefix, name, len(values)))
+        for k in range(0, len(values), 3):
+            out.write('    ' + ', '.join(['%.17e' % t
+                                          for t in values[k:k+3]]))
+            if k + 3 < len(values):
+                out.write(',')
+            out.write('\n')
+        out.write('};\n\n')
+    out.close()
+
+
+if __name__ == '__main__':
+    r, x, f = solve(normal_pdf, normal_inv, normal_area, 3.0, 4.0)
+    write('randomkit_ziggurat.h', 'rk_zig_normal',
+          'standard normal, f(x) = exp(-x**2/2)', r, x, f)
+    r, x, f = solve(exponential_pdf, exponential_inv, exponential_area,
+                    7.0, 8.0)
+    write('distributions_ziggurat.h', 'rk_zig_exp',
+          'standard exponential, f(x) = exp(-x)', r, x, f)
@@ -33,14 +33,22 @@ cdef extern from "math.h":
 
 cdef extern from "mtrand_py_helper.h":
     object empty_py_bytes(unsigned long length, void **bytes)
+    void *state_lock_new()
+    void state_lock_free(void *lock)
+    void state_lock_acquire(void *lock)
 
-cdef extern from "randomkit.h":
+cdef extern from "mtrand_py_helper.h" nogil:
+    void state_lock_acquire_nogil(void *lock)
+    void state_lock_release(void *lock)
+
+cdef extern from "randomkit.h" nogil:
 
     ctypedef struct rk_state:
         unsigned long key[624]
         int pos
         int has_gauss
         double gauss
+        int ziggurat
 
     ctypedef enum rk_error:
         RK_NOERR = 0
@@ -64,8 +72,9 @@ cdef extern from "randomkit.h":
     rk_error rk_altfill(void *buffer, size_t size, int strong,
             rk_state *state)
     double rk_gauss(rk_state *state)
+    void rk_jump(rk_state *state)
 
-cdef extern from "distributions.h":
+cdef extern from "distributions.h" nogil:
 
     double rk_normal(rk_state *state, double loc, double scale)
     double rk_standard_exponential(rk_state *state)
@@ -104,16 +113,16 @@ cdef extern from "distributions.h":
     long rk_hypergeometric(rk_state *state, long good, long bad, long sample)
     long rk_logseries(rk_state *state, double p)
 
-ctypedef double (* rk_cont0)(rk_state *state)
-ctypedef double (* rk_cont1)(rk_state *state, double a)
-ctypedef double (* rk_cont2)(rk_state *state, double a, double b)
-ctypedef double (* rk_cont3)(rk_state *state, double a, double b, double c)
+ctypedef double (* rk_cont0)(rk_state *state) nogil
+ctypedef double (* rk_cont1)(rk_state *state, double a) nogil
+ctypedef double (* rk_cont2)(rk_state *state, double a, double b) nogil
+ctypedef double (* rk_cont3)(rk_state *state, double a, double b, double c) nogil
 
-ctypedef long (* rk_disc0)(rk_state *state)
-ctypedef long (* rk_discnp)(rk_state *state, long n, double p)
-ctypedef long (* rk_discdd)(rk_state *state, double n, double p)
-ctypedef long (* rk_discnmN)(rk_state *state, long n, long m, long N)
-ctypedef long (* rk_discd)(rk_state *state, double a)
+ctypedef long (* rk_disc0)(rk_state *state) nogil
+ctypedef long (* rk_discnp)(rk_state *state, long n, double p) nogil
+ctypedef long (* rk_discdd)(rk_state *state, double n, double p) nogil
+ctypedef long (* rk_discnmN)(rk_state *state, long n, long m, long N) nogil
+ctypedef long (* rk_discd)(rk_state *state, double a) nogil
 
 
 cdef extern from "initarray.h":
@@ -125,40 +134,80 @@ import_array()
 
 import numpy as np
 
-cdef object cont0_array(rk_state *state, rk_cont0 func, object size):
+cdef class _StateLock:
+    """
+    Lock guarding the state of a `RandomState`, held while the state is
+    used.  The array fills take it without the GIL and the scalar draws
+    directly through ``lock``; the other methods use it in a with block.
+    """
+    cdef void *lock
+
+    def __cinit__(self):
+        self.lock = state_lock_new()
+        if self.lock == NULL:
+            raise MemoryError("could not allocate a lock")
+
+    def __dealloc__(self):
+        if self.lock != NULL:
+            state_lock_free(self.lock)
+
+    def __enter__(self):
+        state_lock_acquire(self.lock)
+
+    def __exit__(self, *args):
+        state_lock_release(self.lock)
+
+cdef object cont0_array(rk_state *state, rk_cont0 func, object size,
+                        _StateLock lock):
     cdef double *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef double rv
 
     if size is None:
-        return func(state)
+        state_lock_acquire(lock.lock)
+        rv = func(state)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, np.float64)
         length = PyArray_SIZE(array)
         array_data = <double *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state)
+            state_lock_release(lock.lock)
         return array
 
 
-cdef object cont1_array_sc(rk_state *state, rk_cont1 func, object size, double a):
+cdef object cont1_array_sc(rk_state *state, rk_cont1 func, object size,
+                           double a, _StateLock lock):
     cdef double *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef double rv
 
     if size is None:
-        return func(state, a)
+        state_lock_acquire(lock.lock)
+        rv = func(state, a)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, np.float64)
         length = PyArray_SIZE(array)
         array_data = <double *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, a)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, a)
+            state_lock_release(lock.lock)
         return array
 
-cdef object cont1_array(rk_state *state, rk_cont1 func, object size, ndarray oa):
+cdef object cont1_array(rk_state *state, rk_cont1 func, object size,
+                        ndarray oa, _StateLock lock):
     cdef double *array_data
     cdef double *oa_data
     cdef ndarray array "arrayObject"
@@ -172,9 +221,12 @@ cdef object cont1_array(rk_state *state, rk_cont1 func, object size, ndarray oa)
         length = PyArray_SIZE(array)
         array_data = <double *>array.data
         itera = <flatiter>PyArray_IterNew(<object>oa)
-        for i from 0 <= i < length:
-            array_data[i] = func(state, (<double *>(itera.dataptr))[0])
-            PyArray_ITER_NEXT(itera)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, (<double *>(itera.dataptr))[0])
+                PyArray_ITER_NEXT(itera)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, np.float64)
         array_data = <double *>array.data
@@ -182,32 +234,42 @@ cdef object cont1_array(rk_state *state, rk_cont1 func, object size, ndarray oa)
                                                 <void *>oa)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            array_data[i] = func(state, oa_data[0])
-            PyArray_MultiIter_NEXTi(multi, 1)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                array_data[i] = func(state, oa_data[0])
+                PyArray_MultiIter_NEXTi(multi, 1)
+            state_lock_release(lock.lock)
     return array
 
-cdef object cont2_array_sc(rk_state *state, rk_cont2 func, object size, double a,
-                           double b):
+cdef object cont2_array_sc(rk_state *state, rk_cont2 func, object size,
+                           double a, double b, _StateLock lock):
     cdef double *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef double rv
 
     if size is None:
-        return func(state, a, b)
+        state_lock_acquire(lock.lock)
+        rv = func(state, a, b)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, np.float64)
         length = PyArray_SIZE(array)
         array_data = <double *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, a, b)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, a, b)
+            state_lock_release(lock.lock)
         return array
 
 
 cdef object cont2_array(rk_state *state, rk_cont2 func, object size,
-                        ndarray oa, ndarray ob):
+                        ndarray oa, ndarray ob, _StateLock lock):
     cdef double *array_data
     cdef double *oa_data
     cdef double *ob_data
@@ -220,45 +282,58 @@ cdef object cont2_array(rk_state *state, rk_cont2 func, object size,
         multi = <broadcast> PyArray_MultiIterNew(2, <void *>oa, <void *>ob)
         array = <ndarray> PyArray_SimpleNew(multi.nd, multi.dimensions, NPY_DOUBLE)
         array_data = <double *>array.data
-        for i from 0 <= i < multi.size:
-            oa_data = <double *>PyArray_MultiIter_DATA(multi, 0)
-            ob_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            array_data[i] = func(state, oa_data[0], ob_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                oa_data = <double *>PyArray_MultiIter_DATA(multi, 0)
+                ob_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                array_data[i] = func(state, oa_data[0], ob_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, np.float64)
         array_data = <double *>array.data
         multi = <broadcast>PyArray_MultiIterNew(3, <void*>array, <void *>oa, <void *>ob)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            ob_data = <double *>PyArray_MultiIter_DATA(multi, 2)
-            array_data[i] = func(state, oa_data[0], ob_data[0])
-            PyArray_MultiIter_NEXTi(multi, 1)
-            PyArray_MultiIter_NEXTi(multi, 2)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                ob_data = <double *>PyArray_MultiIter_DATA(multi, 2)
+                array_data[i] = func(state, oa_data[0], ob_data[0])
+                PyArray_MultiIter_NEXTi(multi, 1)
+                PyArray_MultiIter_NEXTi(multi, 2)
+            state_lock_release(lock.lock)
     return array
 
-cdef object cont3_array_sc(rk_state *state, rk_cont3 func, object size, double a,
-                           double b, double c):
+cdef object cont3_array_sc(rk_state *state, rk_cont3 func, object size,
+                           double a, double b, double c, _StateLock lock):
 
     cdef double *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef double rv
 
     if size is None:
-        return func(state, a, b, c)
+        state_lock_acquire(lock.lock)
+        rv = func(state, a, b, c)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, np.float64)
         length = PyArray_SIZE(array)
         array_data = <double *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, a, b, c)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, a, b, c)
+            state_lock_release(lock.lock)
         return array
 
-cdef object cont3_array(rk_state *state, rk_cont3 func, object size, ndarray oa,
-    ndarray ob, ndarray oc):
+cdef object cont3_array(rk_state *state, rk_cont3 func, object size,
+                        ndarray oa, ndarray ob, ndarray oc, _StateLock lock):
 
     cdef double *array_data
     cdef double *oa_data
@@ -273,12 +348,15 @@ cdef object cont3_array(rk_state *state, rk_cont3 func, object size, ndarray oa,
         multi = <broadcast> PyArray_MultiIterNew(3, <void *>oa, <void *>ob, <void *>oc)
         array = <ndarray> PyArray_SimpleNew(multi.nd, multi.dimensions, NPY_DOUBLE)
         array_data = <double *>array.data
-        for i from 0 <= i < multi.size:
-            oa_data = <double *>PyArray_MultiIter_DATA(multi, 0)
-            ob_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            oc_data = <double *>PyArray_MultiIter_DATA(multi, 2)
-            array_data[i] = func(state, oa_data[0], ob_data[0], oc_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                oa_data = <double *>PyArray_MultiIter_DATA(multi, 0)
+                ob_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                oc_data = <double *>PyArray_MultiIter_DATA(multi, 2)
+                array_data[i] = func(state, oa_data[0], ob_data[0], oc_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, np.float64)
         array_data = <double *>array.data
@@ -286,47 +364,67 @@ cdef object cont3_array(rk_state *state, rk_cont3 func, object size, ndarray oa,
                                                 <void *>ob, <void *>oc)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            ob_data = <double *>PyArray_MultiIter_DATA(multi, 2)
-            oc_data = <double *>PyArray_MultiIter_DATA(multi, 3)
-            array_data[i] = func(state, oa_data[0], ob_data[0], oc_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                ob_data = <double *>PyArray_MultiIter_DATA(multi, 2)
+                oc_data = <double *>PyArray_MultiIter_DATA(multi, 3)
+                array_data[i] = func(state, oa_data[0], ob_data[0], oc_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
     return array
 
-cdef object disc0_array(rk_state *state, rk_disc0 func, object size):
+cdef object disc0_array(rk_state *state, rk_disc0 func, object size,
+                        _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef long rv
 
     if size is None:
-        return func(state)
+        state_lock_acquire(lock.lock)
+        rv = func(state)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, int)
         length = PyArray_SIZE(array)
         array_data = <long *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state)
+            state_lock_release(lock.lock)
         return array
 
-cdef object discnp_array_sc(rk_state *state, rk_discnp func, object size, long n, double p):
+cdef object discnp_array_sc(rk_state *state, rk_discnp func, object size,
+                            long n, double p, _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef long rv
 
     if size is None:
-        return func(state, n, p)
+        state_lock_acquire(lock.lock)
+        rv = func(state, n, p)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, int)
         length = PyArray_SIZE(array)
         array_data = <long *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, n, p)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, n, p)
+            state_lock_release(lock.lock)
         return array
 
-cdef object discnp_array(rk_state *state, rk_discnp func, object size, ndarray on, ndarray op):
+cdef object discnp_array(rk_state *state, rk_discnp func, object size,
+                         ndarray on, ndarray op, _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef npy_intp length
@@ -339,43 +437,58 @@ cdef object discnp_array(rk_state *state, rk_discnp func, object size, ndarray o
         multi = <broadcast> PyArray_MultiIterNew(2, <void *>on, <void *>op)
         array = <ndarray> PyArray_SimpleNew(multi.nd, multi.dimensions, NPY_LONG)
         array_data = <long *>array.data
-        for i from 0 <= i < multi.size:
-            on_data = <long *>PyArray_MultiIter_DATA(multi, 0)
-            op_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            array_data[i] = func(state, on_data[0], op_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                on_data = <long *>PyArray_MultiIter_DATA(multi, 0)
+                op_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                array_data[i] = func(state, on_data[0], op_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, int)
         array_data = <long *>array.data
         multi = <broadcast>PyArray_MultiIterNew(3, <void*>array, <void *>on, <void *>op)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            on_data = <long *>PyArray_MultiIter_DATA(multi, 1)
-            op_data = <double *>PyArray_MultiIter_DATA(multi, 2)
-            array_data[i] = func(state, on_data[0], op_data[0])
-            PyArray_MultiIter_NEXTi(multi, 1)
-            PyArray_MultiIter_NEXTi(multi, 2)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                on_data = <long *>PyArray_MultiIter_DATA(multi, 1)
+                op_data = <double *>PyArray_MultiIter_DATA(multi, 2)
+                array_data[i] = func(state, on_data[0], op_data[0])
+                PyArray_MultiIter_NEXTi(multi, 1)
+                PyArray_MultiIter_NEXTi(multi, 2)
+            state_lock_release(lock.lock)
 
     return array
 
-cdef object discdd_array_sc(rk_state *state, rk_discdd func, object size, double n, double p):
+cdef object discdd_array_sc(rk_state *state, rk_discdd func, object size,
+                            double n, double p, _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef long rv
 
     if size is None:
-        return func(state, n, p)
+        state_lock_acquire(lock.lock)
+        rv = func(state, n, p)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, int)
         length = PyArray_SIZE(array)
         array_data = <long *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, n, p)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, n, p)
+            state_lock_release(lock.lock)
         return array
 
-cdef object discdd_array(rk_state *state, rk_discdd func, object size, ndarray on, ndarray op):
+cdef object discdd_array(rk_state *state, rk_discdd func, object size,
+                         ndarray on, ndarray op, _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef npy_intp length
@@ -388,45 +501,58 @@ cdef object discdd_array(rk_state *state, rk_discdd func, object size, ndarray o
         multi = <broadcast> PyArray_MultiIterNew(2, <void *>on, <void *>op)
         array = <ndarray> PyArray_SimpleNew(multi.nd, multi.dimensions, NPY_LONG)
         array_data = <long *>array.data
-        for i from 0 <= i < multi.size:
-            on_data = <double *>PyArray_MultiIter_DATA(multi, 0)
-            op_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            array_data[i] = func(state, on_data[0], op_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                on_data = <double *>PyArray_MultiIter_DATA(multi, 0)
+                op_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                array_data[i] = func(state, on_data[0], op_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, int)
         array_data = <long *>array.data
         multi = <broadcast>PyArray_MultiIterNew(3, <void*>array, <void *>on, <void *>op)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            on_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            op_data = <double *>PyArray_MultiIter_DATA(multi, 2)
-            array_data[i] = func(state, on_data[0], op_data[0])
-            PyArray_MultiIter_NEXTi(multi, 1)
-            PyArray_MultiIter_NEXTi(multi, 2)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                on_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                op_data = <double *>PyArray_MultiIter_DATA(multi, 2)
+                array_data[i] = func(state, on_data[0], op_data[0])
+                PyArray_MultiIter_NEXTi(multi, 1)
+                PyArray_MultiIter_NEXTi(multi, 2)
+            state_lock_release(lock.lock)
 
     return array
 
 cdef object discnmN_array_sc(rk_state *state, rk_discnmN func, object size,
-    long n, long m, long N):
+    long n, long m, long N, _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef long rv
 
     if size is None:
-        return func(state, n, m, N)
+        state_lock_acquire(lock.lock)
+        rv = func(state, n, m, N)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, int)
         length = PyArray_SIZE(array)
         array_data = <long *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, n, m, N)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, n, m, N)
+            state_lock_release(lock.lock)
         return array
 
 cdef object discnmN_array(rk_state *state, rk_discnmN func, object size,
-    ndarray on, ndarray om, ndarray oN):
+    ndarray on, ndarray om, ndarray oN, _StateLock lock):
     cdef long *array_data
     cdef long *on_data
     cdef long *om_data
@@ -440,12 +566,15 @@ cdef object discnmN_array(rk_state *state, rk_discnmN func, object size,
         multi = <broadcast> PyArray_MultiIterNew(3, <void *>on, <void *>om, <void *>oN)
         array = <ndarray> PyArray_SimpleNew(multi.nd, multi.dimensions, NPY_LONG)
         array_data = <long *>array.data
-        for i from 0 <= i < multi.size:
-            on_data = <long *>PyArray_MultiIter_DATA(multi, 0)
-            om_data = <long *>PyArray_MultiIter_DATA(multi, 1)
-            oN_data = <long *>PyArray_MultiIter_DATA(multi, 2)
-            array_data[i] = func(state, on_data[0], om_data[0], oN_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                on_data = <long *>PyArray_MultiIter_DATA(multi, 0)
+                om_data = <long *>PyArray_MultiIter_DATA(multi, 1)
+                oN_data = <long *>PyArray_MultiIter_DATA(multi, 2)
+                array_data[i] = func(state, on_data[0], om_data[0], oN_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, int)
         array_data = <long *>array.data
@@ -453,32 +582,44 @@ cdef object discnmN_array(rk_state *state, rk_discnmN func, object size,
                                                 <void *>oN)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            on_data = <long *>PyArray_MultiIter_DATA(multi, 1)
-            om_data = <long *>PyArray_MultiIter_DATA(multi, 2)
-            oN_data = <long *>PyArray_MultiIter_DATA(multi, 3)
-            array_data[i] = func(state, on_data[0], om_data[0], oN_data[0])
-            PyArray_MultiIter_NEXT(multi)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                on_data = <long *>PyArray_MultiIter_DATA(multi, 1)
+                om_data = <long *>PyArray_MultiIter_DATA(multi, 2)
+                oN_data = <long *>PyArray_MultiIter_DATA(multi, 3)
+                array_data[i] = func(state, on_data[0], om_data[0], oN_data[0])
+                PyArray_MultiIter_NEXT(multi)
+            state_lock_release(lock.lock)
 
     return array
 
-cdef object discd_array_sc(rk_state *state, rk_discd func, object size, double a):
+cdef object discd_array_sc(rk_state *state, rk_discd func, object size,
+                           double a, _StateLock lock):
     cdef long *array_data
     cdef ndarray array "arrayObject"
     cdef long length
     cdef long i
+    cdef long rv
 
     if size is None:
-        return func(state, a)
+        state_lock_acquire(lock.lock)
+        rv = func(state, a)
+        state_lock_release(lock.lock)
+        return rv
     else:
         array = <ndarray>np.empty(size, int)
         length = PyArray_SIZE(array)
         array_data = <long *>array.data
-        for i from 0 <= i < length:
-            array_data[i] = func(state, a)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, a)
+            state_lock_release(lock.lock)
         return array
 
-cdef object discd_array(rk_state *state, rk_discd func, object size, ndarray oa):
+cdef object discd_array(rk_state *state, rk_discd func, object size,
+                        ndarray oa, _StateLock lock):
     cdef long *array_data
     cdef double *oa_data
     cdef ndarray array "arrayObject"
@@ -492,19 +633,25 @@ cdef object discd_array(rk_state *state, rk_discd func, object size, ndarray oa)
         length = PyArray_SIZE(array)
         array_data = <long *>array.data
         itera = <flatiter>PyArray_IterNew(<object>oa)
-        for i from 0 <= i < length:
-            array_data[i] = func(state, (<double *>(itera.dataptr))[0])
-            PyArray_ITER_NEXT(itera)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < length:
+                array_data[i] = func(state, (<double *>(itera.dataptr))[0])
+                PyArray_ITER_NEXT(itera)
+            state_lock_release(lock.lock)
     else:
         array = <ndarray>np.empty(size, int)
         array_data = <long *>array.data
         multi = <broadcast>PyArray_MultiIterNew(2, <void *>array, <void *>oa)
         if (multi.size != PyArray_SIZE(array)):
             raise ValueError("size is not compatible with inputs")
-        for i from 0 <= i < multi.size:
-            oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
-            array_data[i] = func(state, oa_data[0])
-            PyArray_MultiIter_NEXTi(multi, 1)
+        with nogil:
+            state_lock_acquire_nogil(lock.lock)
+            for i from 0 <= i < multi.size:
+                oa_data = <double *>PyArray_MultiIter_DATA(multi, 1)
+                array_data[i] = func(state, oa_data[0])
+                PyArray_MultiIter_NEXTi(multi, 1)
+            state_lock_release(lock.lock)
     return array
 
 cdef double kahan_sum(double *darr, long n):
@@ -521,7 +668,7 @@ cdef double kahan_sum(double *darr, long n):
 
 cdef class RandomState:
     """
-    RandomState(seed=None)
+    RandomState(seed=None, ziggurat=False)
 
     Container for the Mersenne Twister pseudo-random number generator.
 
@@ -542,6 +689,12 @@ cdef class RandomState:
         If `seed` is ``None``, then `RandomState` will try to read data from
         ``/dev/urandom`` (or the Windows analogue) if available or seed from
         the clock otherwise.
+    ziggurat : bool, optional
+        If True, draw normal and exponential variates, and the gamma
+        variates and other distributions built on them, with the faster
+        ziggurat method [1]_.  The default uses the polar method and
+        inversion, which reproduces the streams of earlier versions for
+        a given seed.
 
     Notes
     -----
@@ -551,11 +704,24 @@ cdef class RandomState:
     NumPy-aware, has the advantage that it provides a much larger number
     of probability distributions to choose from.
 
+    References
+    ----------
+    .. [1] G. Marsaglia and W. W. Tsang, "The Ziggurat Method for Generating
+       Random Variables", *Journal of Statistical Software*, Vol. 5, No. 8,
+       2000.
+
     """
     cdef rk_state *internal_state
+    cdef _StateLock lock
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, ziggurat=False):
         self.internal_state = <rk_state*>PyMem_Malloc(sizeof(rk_state))
+        # held while the state is used, the bulk fills run without the GIL
+        self.lock = _StateLock()
+        if ziggurat:
+            self.internal_state.ziggurat = 1
+        else:
+            self.internal_state.ziggurat = 0
 
         self.seed(seed)
 
@@ -564,6 +730,11 @@ cdef class RandomState:
             PyMem_Free(self.internal_state)
             self.internal_state = NULL
 
+    property ziggurat:
+        """Whether the ziggurat method is used, see `RandomState`."""
+        def __get__(self):
+            return self.internal_state.ziggurat != 0
+
     def seed(self, seed=None):
         """
         seed(seed=None)
@@ -586,16 +757,20 @@ cdef class RandomState:
         cdef rk_error errcode
         cdef ndarray obj "arrayObject_obj"
         if seed is None:
-            errcode = rk_randomseed(self.internal_state)
+            with self.lock:
+                errcode = rk_randomseed(self.internal_state)
         elif type(seed) is int:
-            rk_seed(seed, self.internal_state)
+            with self.lock:
+                rk_seed(seed, self.internal_state)
         elif isinstance(seed, np.integer):
             iseed = int(seed)
-            rk_seed(iseed, self.internal_state)
+            with self.lock:
+                rk_seed(iseed, self.internal_state)
         else:
             obj = <ndarray>PyArray_ContiguousFromObject(seed, NPY_LONG, 1, 1)
-            init_by_array(self.internal_state, <unsigned long *>(obj.data),
-                obj.dimensions[0])
+            with self.lock:
+                init_by_array(self.internal_state,
+                              <unsigned long *>(obj.data), obj.dimensions[0])
 
     def get_state(self):
         """
@@ -629,10 +804,13 @@ cdef class RandomState:
         """
         cdef ndarray state "arrayObject_state"
         state = <ndarray>np.empty(624, np.uint)
-        memcpy(<void*>(state.data), <void*>(self.internal_state.key), 624*sizeof(long))
+        with self.lock:
+            memcpy(<void*>(state.data), <void*>(self.internal_state.key), 624*sizeof(long))
+            pos = self.internal_state.pos
+            has_gauss = self.internal_state.has_gauss
+            gauss = self.internal_state.gauss
         state = <ndarray>np.asarray(state, np.uint32)
-        return ('MT19937', state, self.internal_state.pos,
-            self.internal_state.has_gauss, self.internal_state.gauss)
+        return ('MT19937', state, pos, has_gauss, gauss)
 
     def set_state(self, state):
         """
@@ -699,10 +877,11 @@ cdef class RandomState:
             obj = <ndarray>PyArray_ContiguousFromObject(key, NPY_LONG, 1, 1)
         if obj.dimensions[0] != 624:
             raise ValueError("state must be 624 longs")
-        memcpy(<void*>(self.internal_state.key), <void*>(obj.data), 624*sizeof(long))
-        self.internal_state.pos = pos
-        self.internal_state.has_gauss = has_gauss
-        self.internal_state.gauss = cached_gaussian
+        with self.lock:
+            memcpy(<void*>(self.internal_state.key), <void*>(obj.data), 624*sizeof(long))
+            self.internal_state.pos = pos
+            self.internal_state.has_gauss = has_gauss
+            self.internal_state.gauss = cached_gaussian
 
     # Pickling support:
     def __getstate__(self):
@@ -712,8 +891,111 @@ cdef class RandomState:
         self.set_state(state)
 
     def __reduce__(self):
+        if self.internal_state.ziggurat:
+            return (np.random.__RandomState_ctor, (True,), self.get_state())
         return (np.random.__RandomState_ctor, (), self.get_state())
 
+    def jump(self, jumps=1):
+        """
+        jump(jumps=1)
+
+        Advance the generator as if ``jumps * 2**128`` random 32-bit
+        integers had been drawn.
+
+        Starting from one seed, generators that are different numbers of
+        jumps apart produce streams that do not overlap in any feasible
+        computation, which makes them suitable for parallel workers.
+
+        Parameters
+        ----------
+        jumps : int, optional
+            Number of jumps of ``2**128`` steps to take.  Default is 1.
+
+        See Also
+        --------
+        spawn : Create several generators jumped apart from this one.
+
+        Notes
+        -----
+        The jump is computed as a polynomial in the linear map advancing
+        the Mersenne Twister by one step [1]_, which takes a few
+        milliseconds.  A cached Gaussian deviate is discarded.
+
+        References
+        ----------
+        .. [1] H. Haramoto, M. Matsumoto, T. Nishimura, F. Panneton, and
+           P. L'Ecuyer, "Efficient Jump Ahead for F2-Linear Random Number
+           Generators", INFORMS Journal on Computing, 20(3), 2008.
+
+        Examples
+        --------
+        >>> r1 = np.random.RandomState(12345)
+        >>> r2 = np.random.RandomState(12345)
+        >>> r2.jump()
+        >>> r1.random_sample() == r2.random_sample()
+        False
+
+        """
+        cdef long i, n
+        cdef rk_state *state
+        n = jumps
+        if n < 0:
+            raise ValueError("jumps < 0")
+        state = self.internal_state
+        with nogil:
+            state_lock_acquire_nogil(self.lock.lock)
+            for i from 0 <= i < n:
+                rk_jump(state)
+            state_lock_release(self.lock.lock)
+
+    def spawn(self, n):
+        """
+        spawn(n)
+
+        Return `n` new generators with independent streams.
+
+        The k-th generator returned starts where this one would be after
+        k jumps of ``2**128`` steps (see `jump`).  This generator is then
+        advanced by ``n + 1`` jumps, past all of the new streams, so that
+        it can keep being used or spawn again.
+
+        Parameters
+        ----------
+        n : int
+            Number of generators to create.
+
+        Returns
+        -------
+        out : list of RandomState
+            The new generators.
+
+        See Also
+        --------
+        jump
+
+        Examples
+        --------
+        One seed for a whole parallel computation, one stream per worker:
+
+        >>> streams = np.random.RandomState(12345).spawn(4)
+        >>> samples = [s.random_sample(1000) for s in streams]
+
+        """
+        if n < 0:
+            raise ValueError("n < 0")
+        streams = []
+        prev = self
+        for i in range(n):
+            child = RandomState(0, self.ziggurat)
+            child.set_state(prev.get_state())
+            child.jump()
+            streams.append(child)
+            prev = child
+        if prev is not self:
+            self.set_state(prev.get_state())
+        self.jump()
+        return streams
+
     # Basic distributions:
     def random_sample(self, size=None):
         """
@@ -756,7 +1038,7 @@ cdef class RandomState:
                [-1.23204345, -1.75224494]])
 
         """
-        return cont0_array(self.internal_state, rk_double, size)
+        return cont0_array(self.internal_state, rk_double, size, self.lock)
 
     def tomaxint(self, size=None):
         """
@@ -784,7 +1066,7 @@ cdef class RandomState:
             integers.
 
         """
-        return disc0_array(self.internal_state, rk_long, size)
+        return disc0_array(self.internal_state, rk_long, size, self.lock)
 
     def randint(self, low, high=None, size=None):
         """
@@ -841,6 +1123,9 @@ cdef class RandomState:
         cdef ndarray array "arrayObject"
         cdef long length
         cdef long i
+        cdef long ilo
+        cdef unsigned long idiff
+        cdef long rv
 
         if high is None:
             lo = 0
@@ -854,13 +1139,22 @@ cdef class RandomState:
             raise ValueError("low >= high")
 
         if size is None:
-            return <long>rk_interval(diff, self.internal_state) + lo
+            state_lock_acquire(self.lock.lock)
+            rv = <long>rk_interval(diff, self.internal_state) + lo
+            state_lock_release(self.lock.lock)
+            return rv
         else:
             array = <ndarray>np.empty(size, int)
             length = PyArray_SIZE(array)
             array_data = <long *>array.data
-            for i from 0 <= i < length:
-                array_data[i] = lo + <long>rk_interval(diff, self.internal_state)
+            ilo = lo
+            idiff = diff
+            with nogil:
+                state_lock_acquire_nogil(self.lock.lock)
+                for i from 0 <= i < length:
+                    array_data[i] = ilo + <long>rk_interval(idiff,
+                                                self.internal_state)
+                state_lock_release(self.lock.lock)
             return array
 
     def bytes(self, unsigned int length):
@@ -887,7 +1181,10 @@ cdef class RandomState:
         """
         cdef void *bytes
         bytestring = empty_py_bytes(length, &bytes)
-        rk_fill(bytes, length, self.internal_state)
+        with nogil:
+            state_lock_acquire_nogil(self.lock.lock)
+            rk_fill(bytes, length, self.internal_state)
+            state_lock_release(self.lock.lock)
         return bytestring
 
     def uniform(self, low=0.0, high=1.0, size=None):
@@ -968,7 +1265,7 @@ cdef class RandomState:
         flow = PyFloat_AsDouble(low)
         fhigh = PyFloat_AsDouble(high)
         if not PyErr_Occurred():
-            return cont2_array_sc(self.internal_state, rk_uniform, size, flow, fhigh-flow)
+            return cont2_array_sc(self.internal_state, rk_uniform, size, flow, fhigh-flow, self.lock)
         PyErr_Clear()
         olow = <ndarray>PyArray_FROM_OTF(low, NPY_DOUBLE, NPY_ALIGNED)
         ohigh = <ndarray>PyArray_FROM_OTF(high, NPY_DOUBLE, NPY_ALIGNED)
@@ -976,7 +1273,7 @@ cdef class RandomState:
         Py_INCREF(temp) # needed to get around Pyrex's automatic reference-counting
                         #  rules because EnsureArray steals a reference
         odiff = <ndarray>PyArray_EnsureArray(temp)
-        return cont2_array(self.internal_state, rk_uniform, size, olow, odiff)
+        return cont2_array(self.internal_state, rk_uniform, size, olow, odiff, self.lock)
 
     def rand(self, *args):
         """
@@ -1172,6 +1469,12 @@ cdef class RandomState:
         out : float or ndarray
             Drawn samples.
 
+        Notes
+        -----
+        The samples come from the polar Box-Muller method, which caches
+        every other deviate, or from the ziggurat method for a
+        `RandomState` created with ``ziggurat=True``.
+
         Examples
         --------
         >>> s = np.random.standard_normal(8000)
@@ -1185,7 +1488,7 @@ cdef class RandomState:
         (3, 4, 2)
 
         """
-        return cont0_array(self.internal_state, rk_gauss, size)
+        return cont0_array(self.internal_state, rk_gauss, size, self.lock)
 
     def normal(self, loc=0.0, scale=1.0, size=None):
         """
@@ -1277,7 +1580,7 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_normal, size, floc, fscale)
+            return cont2_array_sc(self.internal_state, rk_normal, size, floc, fscale, self.lock)
 
         PyErr_Clear()
 
@@ -1285,7 +1588,7 @@ cdef class RandomState:
         oscale = <ndarray>PyArray_FROM_OTF(scale, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oscale, 0)):
             raise ValueError("scale <= 0")
-        return cont2_array(self.internal_state, rk_normal, size, oloc, oscale)
+        return cont2_array(self.internal_state, rk_normal, size, oloc, oscale, self.lock)
 
     def beta(self, a, b, size=None):
         """
@@ -1334,7 +1637,7 @@ cdef class RandomState:
                 raise ValueError("a <= 0")
             if fb <= 0:
                 raise ValueError("b <= 0")
-            return cont2_array_sc(self.internal_state, rk_beta, size, fa, fb)
+            return cont2_array_sc(self.internal_state, rk_beta, size, fa, fb, self.lock)
 
         PyErr_Clear()
 
@@ -1344,7 +1647,7 @@ cdef class RandomState:
             raise ValueError("a <= 0")
         if np.any(np.less_equal(ob, 0)):
             raise ValueError("b <= 0")
-        return cont2_array(self.internal_state, rk_beta, size, oa, ob)
+        return cont2_array(self.internal_state, rk_beta, size, oa, ob, self.lock)
 
     def exponential(self, scale=1.0, size=None):
         """
@@ -1391,14 +1694,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont1_array_sc(self.internal_state, rk_exponential, size, fscale)
+            return cont1_array_sc(self.internal_state, rk_exponential, size, fscale, self.lock)
 
         PyErr_Clear()
 
         oscale = <ndarray> PyArray_FROM_OTF(scale, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oscale, 0.0)):
             raise ValueError("scale <= 0")
-        return cont1_array(self.internal_state, rk_exponential, size, oscale)
+        return cont1_array(self.internal_state, rk_exponential, size, oscale, self.lock)
 
     def standard_exponential(self, size=None):
         """
@@ -1419,6 +1722,12 @@ cdef class RandomState:
         out : float or ndarray
             Drawn samples.
 
+        Notes
+        -----
+        The samples are computed as ``-log(1 - U)`` from uniform samples
+        ``U``, or with the ziggurat method for a `RandomState` created
+        with ``ziggurat=True``.
+
         Examples
         --------
         Output a 3x8000 array:
@@ -1426,7 +1735,7 @@ cdef class RandomState:
         >>> n = np.random.standard_exponential((3, 8000))
 
         """
-        return cont0_array(self.internal_state, rk_standard_exponential, size)
+        return cont0_array(self.internal_state, rk_standard_exponential, size, self.lock)
 
     def standard_gamma(self, shape, size=None):
         """
@@ -1468,6 +1777,10 @@ cdef class RandomState:
         electronic components, and arises naturally in processes for which the
         waiting times between Poisson distributed events are relevant.
 
+        The samples are built from normal and exponential variates, which
+        come from the ziggurat method for a `RandomState` created with
+        ``ziggurat=True``.
+
         References
         ----------
         .. [1] Weisstein, Eric W. "Gamma Distribution." From MathWorld--A
@@ -1502,13 +1815,13 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fshape <= 0:
                 raise ValueError("shape <= 0")
-            return cont1_array_sc(self.internal_state, rk_standard_gamma, size, fshape)
+            return cont1_array_sc(self.internal_state, rk_standard_gamma, size, fshape, self.lock)
 
         PyErr_Clear()
         oshape = <ndarray> PyArray_FROM_OTF(shape, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oshape, 0.0)):
             raise ValueError("shape <= 0")
-        return cont1_array(self.internal_state, rk_standard_gamma, size, oshape)
+        return cont1_array(self.internal_state, rk_standard_gamma, size, oshape, self.lock)
 
     def gamma(self, shape, scale=1.0, size=None):
         """
@@ -1590,7 +1903,7 @@ cdef class RandomState:
                 raise ValueError("shape <= 0")
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_gamma, size, fshape, fscale)
+            return cont2_array_sc(self.internal_state, rk_gamma, size, fshape, fscale, self.lock)
 
         PyErr_Clear()
         oshape = <ndarray>PyArray_FROM_OTF(shape, NPY_DOUBLE, NPY_ALIGNED)
@@ -1599,7 +1912,7 @@ cdef class RandomState:
             raise ValueError("shape <= 0")
         if np.any(np.less_equal(oscale, 0.0)):
             raise ValueError("scale <= 0")
-        return cont2_array(self.internal_state, rk_gamma, size, oshape, oscale)
+        return cont2_array(self.internal_state, rk_gamma, size, oshape, oscale, self.lock)
 
     def f(self, dfnum, dfden, size=None):
         """
@@ -1692,7 +2005,7 @@ cdef class RandomState:
                 raise ValueError("shape <= 0")
             if fdfden <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_f, size, fdfnum, fdfden)
+            return cont2_array_sc(self.internal_state, rk_f, size, fdfnum, fdfden, self.lock)
 
         PyErr_Clear()
 
@@ -1702,7 +2015,7 @@ cdef class RandomState:
             raise ValueError("dfnum <= 0")
         if np.any(np.less_equal(odfden, 0.0)):
             raise ValueError("dfden <= 0")
-        return cont2_array(self.internal_state, rk_f, size, odfnum, odfden)
+        return cont2_array(self.internal_state, rk_f, size, odfnum, odfden, self.lock)
 
     def noncentral_f(self, dfnum, dfden, nonc, size=None):
         """
@@ -1782,7 +2095,7 @@ cdef class RandomState:
             if fnonc < 0:
                 raise ValueError("nonc < 0")
             return cont3_array_sc(self.internal_state, rk_noncentral_f, size,
-                                  fdfnum, fdfden, fnonc)
+                                  fdfnum, fdfden, fnonc, self.lock)
 
         PyErr_Clear()
 
@@ -1797,7 +2110,7 @@ cdef class RandomState:
         if np.any(np.less(ononc, 0.0)):
             raise ValueError("nonc < 0")
         return cont3_array(self.internal_state, rk_noncentral_f, size, odfnum,
-            odfden, ononc)
+            odfden, ononc, self.lock)
 
     def chisquare(self, df, size=None):
         """
@@ -1870,14 +2183,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fdf <= 0:
                 raise ValueError("df <= 0")
-            return cont1_array_sc(self.internal_state, rk_chisquare, size, fdf)
+            return cont1_array_sc(self.internal_state, rk_chisquare, size, fdf, self.lock)
 
         PyErr_Clear()
 
         odf = <ndarray>PyArray_FROM_OTF(df, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(odf, 0.0)):
             raise ValueError("df <= 0")
-        return cont1_array(self.internal_state, rk_chisquare, size, odf)
+        return cont1_array(self.internal_state, rk_chisquare, size, odf, self.lock)
 
     def noncentral_chisquare(self, df, nonc, size=None):
         """
@@ -1958,7 +2271,7 @@ cdef class RandomState:
             if fnonc <= 0:
                 raise ValueError("nonc <= 0")
             return cont2_array_sc(self.internal_state, rk_noncentral_chisquare,
-                                  size, fdf, fnonc)
+                                  size, fdf, fnonc, self.lock)
 
         PyErr_Clear()
 
@@ -1969,7 +2282,7 @@ cdef class RandomState:
         if np.any(np.less_equal(ononc, 0.0)):
             raise ValueError("nonc < 0")
         return cont2_array(self.internal_state, rk_noncentral_chisquare, size,
-            odf, ononc)
+            odf, ononc, self.lock)
 
     def standard_cauchy(self, size=None):
         """
@@ -2030,7 +2343,7 @@ cdef class RandomState:
         >>> plt.show()
 
         """
-        return cont0_array(self.internal_state, rk_standard_cauchy, size)
+        return cont0_array(self.internal_state, rk_standard_cauchy, size, self.lock)
 
     def standard_t(self, df, size=None):
         """
@@ -2124,14 +2437,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fdf <= 0:
                 raise ValueError("df <= 0")
-            return cont1_array_sc(self.internal_state, rk_standard_t, size, fdf)
+            return cont1_array_sc(self.internal_state, rk_standard_t, size, fdf, self.lock)
 
         PyErr_Clear()
 
         odf = <ndarray> PyArray_FROM_OTF(df, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(odf, 0.0)):
             raise ValueError("df <= 0")
-        return cont1_array(self.internal_state, rk_standard_t, size, odf)
+        return cont1_array(self.internal_state, rk_standard_t, size, odf, self.lock)
 
     def vonmises(self, mu, kappa, size=None):
         """
@@ -2218,7 +2531,7 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fkappa < 0:
                 raise ValueError("kappa < 0")
-            return cont2_array_sc(self.internal_state, rk_vonmises, size, fmu, fkappa)
+            return cont2_array_sc(self.internal_state, rk_vonmises, size, fmu, fkappa, self.lock)
 
         PyErr_Clear()
 
@@ -2226,7 +2539,7 @@ cdef class RandomState:
         okappa = <ndarray> PyArray_FROM_OTF(kappa, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less(okappa, 0.0)):
             raise ValueError("kappa < 0")
-        return cont2_array(self.internal_state, rk_vonmises, size, omu, okappa)
+        return cont2_array(self.internal_state, rk_vonmises, size, omu, okappa, self.lock)
 
     def pareto(self, a, size=None):
         """
@@ -2308,14 +2621,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fa <= 0:
                 raise ValueError("a <= 0")
-            return cont1_array_sc(self.internal_state, rk_pareto, size, fa)
+            return cont1_array_sc(self.internal_state, rk_pareto, size, fa, self.lock)
 
         PyErr_Clear()
 
         oa = <ndarray>PyArray_FROM_OTF(a, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oa, 0.0)):
             raise ValueError("a <= 0")
-        return cont1_array(self.internal_state, rk_pareto, size, oa)
+        return cont1_array(self.internal_state, rk_pareto, size, oa, self.lock)
 
     def weibull(self, a, size=None):
         """
@@ -2408,14 +2721,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fa <= 0:
                 raise ValueError("a <= 0")
-            return cont1_array_sc(self.internal_state, rk_weibull, size, fa)
+            return cont1_array_sc(self.internal_state, rk_weibull, size, fa, self.lock)
 
         PyErr_Clear()
 
         oa = <ndarray>PyArray_FROM_OTF(a, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oa, 0.0)):
             raise ValueError("a <= 0")
-        return cont1_array(self.internal_state, rk_weibull, size, oa)
+        return cont1_array(self.internal_state, rk_weibull, size, oa, self.lock)
 
     def power(self, a, size=None):
         """
@@ -2517,14 +2830,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fa <= 0:
                 raise ValueError("a <= 0")
-            return cont1_array_sc(self.internal_state, rk_power, size, fa)
+            return cont1_array_sc(self.internal_state, rk_power, size, fa, self.lock)
 
         PyErr_Clear()
 
         oa = <ndarray>PyArray_FROM_OTF(a, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oa, 0.0)):
             raise ValueError("a <= 0")
-        return cont1_array(self.internal_state, rk_power, size, oa)
+        return cont1_array(self.internal_state, rk_power, size, oa, self.lock)
 
     def laplace(self, loc=0.0, scale=1.0, size=None):
         """
@@ -2607,14 +2920,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_laplace, size, floc, fscale)
+            return cont2_array_sc(self.internal_state, rk_laplace, size, floc, fscale, self.lock)
 
         PyErr_Clear()
         oloc = PyArray_FROM_OTF(loc, NPY_DOUBLE, NPY_ALIGNED)
         oscale = PyArray_FROM_OTF(scale, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oscale, 0.0)):
             raise ValueError("scale <= 0")
-        return cont2_array(self.internal_state, rk_laplace, size, oloc, oscale)
+        return cont2_array(self.internal_state, rk_laplace, size, oloc, oscale, self.lock)
 
     def gumbel(self, loc=0.0, scale=1.0, size=None):
         """
@@ -2731,14 +3044,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_gumbel, size, floc, fscale)
+            return cont2_array_sc(self.internal_state, rk_gumbel, size, floc, fscale, self.lock)
 
         PyErr_Clear()
         oloc = PyArray_FROM_OTF(loc, NPY_DOUBLE, NPY_ALIGNED)
         oscale = PyArray_FROM_OTF(scale, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oscale, 0.0)):
             raise ValueError("scale <= 0")
-        return cont2_array(self.internal_state, rk_gumbel, size, oloc, oscale)
+        return cont2_array(self.internal_state, rk_gumbel, size, oloc, oscale, self.lock)
 
     def logistic(self, loc=0.0, scale=1.0, size=None):
         """
@@ -2819,14 +3132,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_logistic, size, floc, fscale)
+            return cont2_array_sc(self.internal_state, rk_logistic, size, floc, fscale, self.lock)
 
         PyErr_Clear()
         oloc = PyArray_FROM_OTF(loc, NPY_DOUBLE, NPY_ALIGNED)
         oscale = PyArray_FROM_OTF(scale, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oscale, 0.0)):
             raise ValueError("scale <= 0")
-        return cont2_array(self.internal_state, rk_logistic, size, oloc, oscale)
+        return cont2_array(self.internal_state, rk_logistic, size, oloc, oscale, self.lock)
 
     def lognormal(self, mean=0.0, sigma=1.0, size=None):
         """
@@ -2949,7 +3262,7 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fsigma <= 0:
                 raise ValueError("sigma <= 0")
-            return cont2_array_sc(self.internal_state, rk_lognormal, size, fmean, fsigma)
+            return cont2_array_sc(self.internal_state, rk_lognormal, size, fmean, fsigma, self.lock)
 
         PyErr_Clear()
 
@@ -2957,7 +3270,7 @@ cdef class RandomState:
         osigma = PyArray_FROM_OTF(sigma, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(osigma, 0.0)):
             raise ValueError("sigma <= 0.0")
-        return cont2_array(self.internal_state, rk_lognormal, size, omean, osigma)
+        return cont2_array(self.internal_state, rk_lognormal, size, omean, osigma, self.lock)
 
     def rayleigh(self, scale=1.0, size=None):
         """
@@ -3022,14 +3335,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont1_array_sc(self.internal_state, rk_rayleigh, size, fscale)
+            return cont1_array_sc(self.internal_state, rk_rayleigh, size, fscale, self.lock)
 
         PyErr_Clear()
 
         oscale = <ndarray>PyArray_FROM_OTF(scale, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oscale, 0.0)):
             raise ValueError("scale <= 0.0")
-        return cont1_array(self.internal_state, rk_rayleigh, size, oscale)
+        return cont1_array(self.internal_state, rk_rayleigh, size, oscale, self.lock)
 
     def wald(self, mean, scale, size=None):
         """
@@ -3104,7 +3417,7 @@ cdef class RandomState:
                 raise ValueError("mean <= 0")
             if fscale <= 0:
                 raise ValueError("scale <= 0")
-            return cont2_array_sc(self.internal_state, rk_wald, size, fmean, fscale)
+            return cont2_array_sc(self.internal_state, rk_wald, size, fmean, fscale, self.lock)
 
         PyErr_Clear()
         omean = PyArray_FROM_OTF(mean, NPY_DOUBLE, NPY_ALIGNED)
@@ -3113,7 +3426,7 @@ cdef class RandomState:
             raise ValueError("mean <= 0.0")
         elif np.any(np.less_equal(oscale,0.0)):
             raise ValueError("scale <= 0.0")
-        return cont2_array(self.internal_state, rk_wald, size, omean, oscale)
+        return cont2_array(self.internal_state, rk_wald, size, omean, oscale, self.lock)
 
 
 
@@ -3188,7 +3501,7 @@ cdef class RandomState:
             if fleft == fright:
                 raise ValueError("left == right")
             return cont3_array_sc(self.internal_state, rk_triangular, size, fleft,
-                                  fmode, fright)
+                                  fmode, fright, self.lock)
 
         PyErr_Clear()
         oleft = <ndarray>PyArray_FROM_OTF(left, NPY_DOUBLE, NPY_ALIGNED)
@@ -3202,7 +3515,7 @@ cdef class RandomState:
         if np.any(np.equal(oleft, oright)):
             raise ValueError("left == right")
         return cont3_array(self.internal_state, rk_triangular, size, oleft,
-            omode, oright)
+            omode, oright, self.lock)
 
     # Complicated, discrete distributions:
     def binomial(self, n, p, size=None):
@@ -3299,7 +3612,7 @@ cdef class RandomState:
                 raise ValueError("p < 0")
             elif fp > 1:
                 raise ValueError("p > 1")
-            return discnp_array_sc(self.internal_state, rk_binomial, size, ln, fp)
+            return discnp_array_sc(self.internal_state, rk_binomial, size, ln, fp, self.lock)
 
         PyErr_Clear()
 
@@ -3311,7 +3624,7 @@ cdef class RandomState:
             raise ValueError("p < 0")
         if np.any(np.greater(p, 1)):
             raise ValueError("p > 1")
-        return discnp_array(self.internal_state, rk_binomial, size, on, op)
+        return discnp_array(self.internal_state, rk_binomial, size, on, op, self.lock)
 
     def negative_binomial(self, n, p, size=None):
         """
@@ -3393,7 +3706,7 @@ cdef class RandomState:
             elif fp > 1:
                 raise ValueError("p > 1")
             return discdd_array_sc(self.internal_state, rk_negative_binomial,
-                                   size, fn, fp)
+                                   size, fn, fp, self.lock)
 
         PyErr_Clear()
 
@@ -3406,7 +3719,7 @@ cdef class RandomState:
         if np.any(np.greater(p, 1)):
             raise ValueError("p > 1")
         return discdd_array(self.internal_state, rk_negative_binomial, size,
-                            on, op)
+                            on, op, self.lock)
 
     def poisson(self, lam=1.0, size=None):
         """
@@ -3462,14 +3775,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if lam < 0:
                 raise ValueError("lam < 0")
-            return discd_array_sc(self.internal_state, rk_poisson, size, flam)
+            return discd_array_sc(self.internal_state, rk_poisson, size, flam, self.lock)
 
         PyErr_Clear()
 
         olam = <ndarray>PyArray_FROM_OTF(lam, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less(olam, 0)):
             raise ValueError("lam < 0")
-        return discd_array(self.internal_state, rk_poisson, size, olam)
+        return discd_array(self.internal_state, rk_poisson, size, olam, self.lock)
 
     def zipf(self, a, size=None):
         """
@@ -3554,14 +3867,14 @@ cdef class RandomState:
         if not PyErr_Occurred():
             if fa <= 1.0:
                 raise ValueError("a <= 1.0")
-            return discd_array_sc(self.internal_state, rk_zipf, size, fa)
+            return discd_array_sc(self.internal_state, rk_zipf, size, fa, self.lock)
 
         PyErr_Clear()
 
         oa = <ndarray>PyArray_FROM_OTF(a, NPY_DOUBLE, NPY_ALIGNED)
         if np.any(np.less_equal(oa, 1.0)):
             raise ValueError("a <= 1.0")
-        return discd_array(self.internal_state, rk_zipf, size, oa)
+        return discd_array(self.internal_state, rk_zipf, size, oa, self.lock)
 
     def geometric(self, p, size=None):
         """
@@ -3617,7 +3930,7 @@ cdef class RandomState:
                 raise ValueError("p < 0.0")
             if fp > 1.0:
                 raise ValueError("p > 1.0")
-            return discd_array_sc(self.internal_state, rk_geometric, size, fp)
+            return discd_array_sc(self.internal_state, rk_geometric, size, fp, self.lock)
 
         PyErr_Clear()
 
@@ -3627,7 +3940,7 @@ cdef class RandomState:
             raise ValueError("p < 0.0")
         if np.any(np.greater(op, 1.0)):
             raise ValueError("p > 1.0")
-        return discd_array(self.internal_state, rk_geometric, size, op)
+        return discd_array(self.internal_state, rk_geometric, size, op, self.lock)
 
     def hypergeometric(self, ngood, nbad, nsample, size=None):
         """
@@ -3729,7 +4042,7 @@ cdef class RandomState:
             if ngood + nbad < nsample:
                 raise ValueError("ngood + nbad < nsample")
             return discnmN_array_sc(self.internal_state, rk_hypergeometric, size,
-                                    lngood, lnbad, lnsample)
+                                    lngood, lnbad, lnsample, self.lock)
 
 
         PyErr_Clear()
@@ -3746,7 +4059,7 @@ cdef class RandomState:
         if np.any(np.less(np.add(ongood, onbad),onsample)):
             raise ValueError("ngood + nbad < nsample")
         return discnmN_array(self.internal_state, rk_hypergeometric, size,
-            ongood, onbad, onsample)
+            ongood, onbad, onsample, self.lock)
 
     def logseries(self, p, size=None):
         """
@@ -3831,7 +4144,7 @@ cdef class RandomState:
                 raise ValueError("p <= 0.0")
             if fp >= 1.0:
                 raise ValueError("p >= 1.0")
-            return discd_array_sc(self.internal_state, rk_logseries, size, fp)
+            return discd_array_sc(self.internal_state, rk_logseries, size, fp, self.lock)
 
         PyErr_Clear()
 
@@ -3840,7 +4153,7 @@ cdef class RandomState:
             raise ValueError("p <= 0.0")
         if np.any(np.greater_equal(op, 1.0)):
             raise ValueError("p >= 1.0")
-        return discd_array(self.internal_state, rk_logseries, size, op)
+        return discd_array(self.internal_state, rk_logseries, size, op, self.lock)
 
     # Multivariate distributions:
     def multivariate_normal(self, mean, cov, size=None):
@@ -4053,19 +4366,20 @@ cdef class RandomState:
         mnarr = <ndarray>multin
         mnix = <long*>mnarr.data
         i = 0
-        while i < PyArray_SIZE(mnarr):
-            Sum = 1.0
-            dn = n
-            for j from 0 <= j < d-1:
-                mnix[i+j] = rk_binomial(self.internal_state, dn, pix[j]/Sum)
-                dn = dn - mnix[i+j]
-                if dn <= 0:
-                    break
-                Sum = Sum - pix[j]
-            if dn > 0:
-                mnix[i+d-1] = dn
-
-            i = i + d
+        with self.lock:
+            while i < PyArray_SIZE(mnarr):
+                Sum = 1.0
+                dn = n
+                for j from 0 <= j < d-1:
+                    mnix[i+j] = rk_binomial(self.internal_state, dn, pix[j]/Sum)
+                    dn = dn - mnix[i+j]
+                    if dn <= 0:
+                        break
+                    Sum = Sum - pix[j]
+                if dn > 0:
+                    mnix[i+d-1] = dn
+
+                i = i + d
 
         return multin
 
@@ -4150,15 +4464,16 @@ cdef class RandomState:
 
         i = 0
         totsize = PyArray_SIZE(val_arr)
-        while i < totsize:
-            acc = 0.0
-            for j from 0 <= j < k:
-                val_data[i+j]   = rk_standard_gamma(self.internal_state, alpha_data[j])
-                acc             = acc + val_data[i+j]
-            invacc  = 1/acc
-            for j from 0 <= j < k:
-                val_data[i+j]   = val_data[i+j] * invacc
-            i = i + k
+        with self.lock:
+            while i < totsize:
+                acc = 0.0
+                for j from 0 <= j < k:
+                    val_data[i+j]   = rk_standard_gamma(self.internal_state, alpha_data[j])
+                    acc             = acc + val_data[i+j]
+                invacc  = 1/acc
+                for j from 0 <= j < k:
+                    val_data[i+j]   = val_data[i+j] * invacc
+                i = i + k
 
         return diric
 
@@ -4181,23 +4496,25 @@ cdef class RandomState:
 
         if (j == 0):
             # adaptation of random.shuffle()
-            while i > 0:
-                j = rk_interval(i, self.internal_state)
-                x[i], x[j] = x[j], x[i]
-                i = i - 1
+            with self.lock:
+                while i > 0:
+                    j = rk_interval(i, self.internal_state)
+                    x[i], x[j] = x[j], x[i]
+                    i = i - 1
         else:
             # make copies
             copy = hasattr(x[0], 'copy')
-            if copy:
-                while(i > 0):
-                    j = rk_interval(i, self.internal_state)
-                    x[i], x[j] = x[j].copy(), x[i].copy()
-                    i = i - 1
-            else:
-                while(i > 0):
-                    j = rk_interval(i, self.internal_state)
-                    x[i], x[j] = x[j][:], x[i][:]
-                    i = i - 1
+            with self.lock:
+                if copy:
+                    while(i > 0):
+                        j = rk_interval(i, self.internal_state)
+                        x[i], x[j] = x[j].copy(), x[i].copy()
+                        i = i - 1
+                else:
+                    while(i > 0):
+                        j = rk_interval(i, self.internal_state)
+                        x[i], x[j] = x[j][:], x[i][:]
+                        i = i - 1
 
     def permutation(self, object x):
         """
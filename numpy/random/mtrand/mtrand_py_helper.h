@@ -20,4 +20,56 @@ static PyObject *empty_py_bytes(unsigned long length, void **bytes)
     return b;
 }
 
+/*
+ * Lock guarding the state of a RandomState, whose array fills run without
+ * the GIL.  state_lock_acquire is called with the GIL held and releases it
+ * while waiting, so that a fill holding the lock can take the GIL back
+ * when it is done; state_lock_acquire_nogil is called without the GIL.
+ * Without thread support there is nothing to guard against.
+ */
+#ifdef WITH_THREAD
+#include <pythread.h>
+
+static void *state_lock_new(void)
+{
+    return PyThread_allocate_lock();
+}
+
+static void state_lock_free(void *lock)
+{
+    PyThread_free_lock(lock);
+}
+
+static void state_lock_acquire(void *lock)
+{
+    if (!PyThread_acquire_lock(lock, NOWAIT_LOCK)) {
+        Py_BEGIN_ALLOW_THREADS
+        PyThread_acquire_lock(lock, WAIT_LOCK);
+        Py_END_ALLOW_THREADS
+    }
+}
+
+static void state_lock_acquire_nogil(void *lock)
+{
+    PyThread_acquire_lock(lock, WAIT_LOCK);
+}
+
+static void state_lock_release(void *lock)
+{
+    PyThread_release_lock(lock);
+}
+#else
+static int state_lock_dummy;
+
+static void *state_lock_new(void)
+{
+    return &state_lock_dummy;
+}
+
+static void state_lock_free(void *lock) {}
+static void state_lock_acquire(void *lock) {}
+static void state_lock_acquire_nogil(void *lock) {}
+static void state_lock_release(void *lock) {}
+#endif
+
 #endif /* _MTRAND_PY_HELPER_H_ */
@@ -123,11 +123,11 @@ cdef extern from "numpy/arrayobject.h":
 
     object PyArray_MultiIterNew(int n, ...)
 
-    char *PyArray_MultiIter_DATA(broadcast multi, int i)
-    void PyArray_MultiIter_NEXTi(broadcast multi, int i)
-    void PyArray_MultiIter_NEXT(broadcast multi)
+    char *PyArray_MultiIter_DATA(broadcast multi, int i) nogil
+    void PyArray_MultiIter_NEXTi(broadcast multi, int i) nogil
+    void PyArray_MultiIter_NEXT(broadcast multi) nogil
 
     object PyArray_IterNew(object arr)
-    void PyArray_ITER_NEXT(flatiter it)
+    void PyArray_ITER_NEXT(flatiter it) nogil
 
     void import_array()
@@ -70,6 +70,7 @@
 #include <errno.h>
 #include <limits.h>
 #include <math.h>
+#include <string.h>
 
 #ifdef _WIN32
 /*
@@ -240,6 +241,50 @@ rk_random(rk_state *state)
     return y;
 }
 
+#include "randomkit_jump.h"
+
+/*
+ * The state is advanced by J steps as q(F) applied to it, F being the
+ * (linear) one step map on the last N generated words and q the
+ * polynomial in randomkit_jump.h.  q(F) is evaluated with Horner's rule on
+ * a circular buffer of words; the generated words not yet returned stay
+ * unreturned, so pos is unchanged.
+ */
+void
+rk_jump(rk_state *state)
+{
+    unsigned long acc[N];
+    unsigned long y;
+    int i, j, k;
+
+    memset(acc, 0, sizeof(acc));
+    /* acc[i] is the oldest word */
+    i = 0;
+    for (j = RK_JUMP_POLY_LEN*32 - 1; j >= 0; j--) {
+        /* acc = F(acc) */
+        y = (acc[i] & UPPER_MASK) | (acc[(i + 1) % N] & LOWER_MASK);
+        acc[i] = acc[(i + M) % N] ^ (y >> 1) ^ (-(y & 1) & MATRIX_A);
+        i = (i + 1) % N;
+        /* acc += state */
+        if ((rk_jump_poly[j/32] >> (j % 32)) & 1) {
+            for (k = 0; k < N - i; k++) {
+                acc[i + k] ^= state->key[k];
+            }
+            for (; k < N; k++) {
+                acc[i + k - N] ^= state->key[k];
+            }
+        }
+    }
+    for (k = 0; k < N - i; k++) {
+        state->key[k] = acc[i + k];
+    }
+    for (; k < N; k++) {
+        state->key[k] = acc[i + k - N];
+    }
+    state->gauss = 0;
+    state->has_gauss = 0;
+}
+
 long
 rk_long(rk_state *state)
 {
@@ -373,9 +418,56 @@ rk_altfill(void *buffer, size_t size, int strong, rk_state *state)
     return err;
 }
 
+#include "randomkit_ziggurat.h"
+
+/*
+ * Ziggurat method of Marsaglia and Tsang (2000) with the layers of
+ * randomkit_ziggurat.h.  Each try uses two words: the low 8 bits of the
+ * second one pick the layer and the next bit the sign, the first word and
+ * the top 20 bits of the second the position in the layer, so that the
+ * layer index is not correlated with the value (Doornik 2005).
+ */
+static double
+rk_gauss_ziggurat(rk_state *state)
+{
+    unsigned long a, b;
+    int i;
+    double x, xx, yy;
+
+    for (;;) {
+        a = rk_random(state);
+        b = rk_random(state);
+        i = (int)(b & 0xff);
+        x = ((long)(a >> 1) * 2097152.0 + (long)(b >> 11))
+            * (1.0 / 4503599627370496.0)
+            * rk_zig_normal_x[i];
+        if (x < rk_zig_normal_x[i + 1]) {
+            /* inside the rectangle, about 99% of the tries */
+        }
+        else if (i == 0) {
+            /* tail beyond r (Marsaglia 1964) */
+            do {
+                xx = -log(1.0 - rk_double(state)) / RK_ZIG_NORMAL_R;
+                yy = -log(1.0 - rk_double(state));
+            } while (yy + yy < xx * xx);
+            x = RK_ZIG_NORMAL_R + xx;
+        }
+        else if (rk_zig_normal_f[i] + rk_double(state) *
+                 (rk_zig_normal_f[i + 1] - rk_zig_normal_f[i])
+                 >= exp(-0.5 * x * x)) {
+            continue;
+        }
+        /* bit 8 gives the sign, without an unpredictable branch */
+        return (1.0 - (double)((b >> 7) & 2)) * x;
+    }
+}
+
 double
 rk_gauss(rk_state *state)
 {
+    if (state->ziggurat) {
+        return rk_gauss_ziggurat(state);
+    }
     if (state->has_gauss) {
         const double tmp = state->gauss;
         state->gauss = 0;
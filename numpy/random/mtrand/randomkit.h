@@ -94,6 +94,10 @@ typedef struct rk_state_
     double p3;
     double p4;
 
+    /* !=0: rk_gauss and rk_standard_exponential use the ziggurat method
+     * instead of the polar method and inversion.  rk_seed leaves it alone,
+     * it must be set by whoever allocates the state. */
+    int ziggurat;
 }
 rk_state;
 
@@ -133,6 +137,13 @@ extern rk_error rk_randomseed(rk_state *state);
  */
 extern unsigned long rk_random(rk_state *state);
 
+/*
+ * Advance the RNG state by 2**128 steps, as if that many random unsigned
+ * longs had been drawn with rk_random.  Streams started from states that
+ * are a jump apart do not overlap in any practical computation.
+ */
+extern void rk_jump(rk_state *state);
+
 /*
  * Returns a random long between 0 and LONG_MAX inclusive
  */
@@ -178,7 +189,8 @@ extern rk_error rk_altfill(void *buffer, size_t size, int strong,
                             rk_state *state);
 
 /*
- * return a random gaussian deviate with variance unity and zero mean.
+ * return a random gaussian deviate with variance unity and zero mean,
+ * using the polar method or, if state->ziggurat is set, the ziggurat method.
  */
 extern double rk_gauss(rk_state *state);
 
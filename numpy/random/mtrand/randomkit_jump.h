@@ -0,0 +1,136 @@
+/*
+ * Generated by generate_jump_poly.py, do not edit.
+ *
+ * Coefficients of q(x) = x**(2**128) mod x*phi(x), phi being the minimal
+ * polynomial of the Mersenne Twister, 32 per word starting with x**0.
+ */
+
+#define RK_JUMP_POLY_LEN 624
+
+static const unsigned long rk_jump_poly[RK_JUMP_POLY_LEN] = {
+    0x72de3962UL, 0xb5709ec4UL, 0x88279bb6UL, 0xa823f8e5UL, 0x26d83e59UL,
+    0x041f2259UL, 0xe7fdbb15UL, 0x8b521777UL, 0x48b5e756UL, 0xbf2812d5UL,
+    0xe4b0adb9UL, 0x0b4849aaUL, 0x3e928b83UL, 0xe96d39ceUL, 0xaf6131d3UL,
+    0x09eaf2e8UL, 0x33548456UL, 0xc1814c7bUL, 0x893a7c83UL, 0xfebd07bcUL,
+    0x01bd8267UL, 0x5147dcbfUL, 0xe2a67de6UL, 0x9afef574UL, 0xb8334d09UL,
+    0xf0d3decaUL, 0x5561fd58UL, 0xd884703bUL, 0xef5c803bUL, 0xb39b8f42UL,
+    0x20dfb761UL, 0xd61cfed3UL, 0xcf5f3e5bUL, 0x47416177UL, 0x8e8442e9UL,
+    0x8ea9cfabUL, 0x585d0ec0UL, 0x60ddf7adUL, 0x2c9b8528UL, 0xf0f7d60eUL,
+    0xb2bb3bfcUL, 0xca3ee37dUL, 0x81c9e659UL, 0x870ed969UL, 0x9573a1deUL,
+    0xce524851UL, 0x77683b94UL, 0x73cda5edUL, 0x56bcfcbcUL, 0xf439956cUL,
+    0x1f91de14UL, 0xbf04bc00UL, 0x9438c481UL, 0x1d859831UL, 0xca6ae0a2UL,
+    0x9d97aed5UL, 0x9e464218UL, 0xe75c9519UL, 0x253c1486UL, 0xcd43455cUL,
+    0x73b5ccd8UL, 0x7f8282d4UL, 0xc8cacd44UL, 0x192ddf99UL, 0xd6be8546UL,
+    0x5288b589UL, 0xb4f26ca7UL, 0x9819557fUL, 0x200570ebUL, 0x03e73d28UL,
+    0x264acc04UL, 0x78a114c9UL, 0x95f0fb7bUL, 0x42eee897UL, 0xabcc80c2UL,
+    0x67e751e8UL, 0x1330cc85UL, 0x340e87efUL, 0x913b9a96UL, 0xd3f8525eUL,
+    0x3ee3d205UL, 0x1ba1158fUL, 0x2c4cdb89UL, 0x1f6aa87dUL, 0x9b5e9a3aUL,
+    0x878b3223UL, 0xa4b8c3edUL, 0xa48c7778UL, 0x974ac066UL, 0x1d08f055UL,
+    0xc8a08242UL, 0xd6de80e9UL, 0xa1cf0b40UL, 0x2992ce4cUL, 0x842731c7UL,
+    0x604168aeUL, 0xdd23ee6dUL, 0xbecff8b2UL, 0xdfac7287UL, 0xa4369751UL,
+    0xb28bc89dUL, 0x4a5840d9UL, 0xa7a58582UL, 0xf53bdbedUL, 0xcfba4997UL,
+    0xa4149d1cUL, 0xd5c66fc3UL, 0xb2c72905UL, 0xce68ad39UL, 0xae4d8e96UL,
+    0xf213a9b5UL, 0xc588f396UL, 0x9d6116bbUL, 0x2c618d4eUL, 0xb34420d1UL,
+    0xebfb61f1UL, 0x3b702ed7UL, 0xcbdca6f2UL, 0x7cb78166UL, 0xbe283395UL,
+    0x03a2436aUL, 0x20c0d096UL, 0xe190aa7fUL, 0xbf49b815UL, 0x49d78dc3UL,
+    0x9b45b903UL, 0x0aa4c4c8UL, 0x67eb90e3UL, 0xf32b13f0UL, 0x7f5cea31UL,
+    0xccc48294UL, 0x641eaedbUL, 0x6d6aafb6UL, 0x80b55358UL, 0x72b55832UL,
+    0xf1fa779aUL, 0x3b60ab74UL, 0x8992aefdUL, 0x4fa609f2UL, 0x28359472UL,
+    0x61e7aaf1UL, 0x527dc1a9UL, 0x834e8087UL, 0xbcad693fUL, 0xc9ca3bf6UL,
+    0x95171796UL, 0x9f41164aUL, 0xb7d36775UL, 0xcf22cf3bUL, 0x5c77677bUL,
+    0xf4765b01UL, 0x47dfd69fUL, 0xd90d6e15UL, 0xd708247fUL, 0x5fe95113UL,
+    0xad799628UL, 0xc627f9f2UL, 0xfcfb0ce2UL, 0x0f2441ceUL, 0x4b003380UL,
+    0x72161100UL, 0x50fa780bUL, 0x1f72b11aUL, 0xb71ca8b7UL, 0xffab42fdUL,
+    0x5475baceUL, 0x91c28b39UL, 0x356eef78UL, 0x1441c9c3UL, 0xdc80086dUL,
+    0x96c47491UL, 0xb5c30ec9UL, 0xa254e42dUL, 0xa9321addUL, 0x963a3612UL,
+    0xc30bee5bUL, 0x435c75c7UL, 0xdf141323UL, 0x38308f58UL, 0x8926e38fUL,
+    0x71b69592UL, 0x897754d8UL, 0x3cddde5eUL, 0x5bc06174UL, 0xad520904UL,
+    0xbebb80a7UL, 0x5cc284d4UL, 0xd91d5d33UL, 0x8c6ba748UL, 0x11090e41UL,
+    0x33bb9929UL, 0x462cffbcUL, 0xc42a508eUL, 0xefc68605UL, 0x602a3a14UL,
+    0x230e6cd9UL, 0x26c6f9f4UL, 0x49b8eb31UL, 0x51bd358dUL, 0x7c49e7a4UL,
+    0x47b592cbUL, 0x1910bb39UL, 0x3ced6a5bUL, 0xad0ca518UL, 0x93461dcbUL,
+    0xd98ca779UL, 0x9526948eUL, 0xecc5cb65UL, 0xfd1a431bUL, 0x0bddc87dUL,
+    0x5d694024UL, 0x7d9820acUL, 0xffeb5538UL, 0x716c1ae1UL, 0x13cffb2fUL,
+    0x04f8ed86UL, 0xd777f039UL, 0x1b32eb97UL, 0x87c1a95fUL, 0x893da4eeUL,
+    0xc235f16cUL, 0x965118d4UL, 0xea7994baUL, 0xf99023e2UL, 0xbb8c4545UL,
+    0x891268a5UL, 0xe7cf46b4UL, 0x4d163861UL, 0x0b2c5681UL, 0xca688c0eUL,
+    0x36702e5fUL, 0xb86346b5UL, 0x55e311bbUL, 0x72860137UL, 0x142fdc5cUL,
+    0x47d10e33UL, 0x234ce0cbUL, 0xac088c30UL, 0x8f9503feUL, 0x4d79a2e8UL,
+    0x937670c7UL, 0x02b4c095UL, 0x20f8f4e0UL, 0x080533c0UL, 0x81fe8f32UL,
+    0xab1d0c25UL, 0x048f776dUL, 0xb601bb28UL, 0x96004a47UL, 0xf8b8e96eUL,
+    0x6862af7bUL, 0x4a9fa042UL, 0xb0b6f662UL, 0x54384ad4UL, 0xa350c0eeUL,
+    0x81670a57UL, 0x26065dc1UL, 0x3a2c2820UL, 0xb575f899UL, 0xb9749667UL,
+    0x738dfc2aUL, 0xaa853838UL, 0x00ccc442UL, 0xa53a92a4UL, 0xcfaf5a3eUL,
+    0xbdc8cfa2UL, 0x09884265UL, 0x529fee9dUL, 0xa4d7f84fUL, 0x966c709eUL,
+    0x4c80bc42UL, 0xd14265d4UL, 0xf5ebe7f3UL, 0xb23c2aedUL, 0x804523f1UL,
+    0xb7d47c42UL, 0xa7cb0aa9UL, 0x73370568UL, 0x06d90ac5UL, 0x66158a1eUL,
+    0x9805c7adUL, 0xc4a3898cUL, 0x7890addeUL, 0x7fc53690UL, 0x85c39b20UL,
+    0xc5427e08UL, 0xc0c864f8UL, 0x2fba05edUL, 0xc365017aUL, 0x210ad2bfUL,
+    0x8ffb95eaUL, 0x609ca003UL, 0x8e6c4f72UL, 0x84e663c4UL, 0x3c110562UL,
+    0x753c1ca8UL, 0x8700b723UL, 0x48642afeUL, 0x14ac952cUL, 0xcef1123eUL,
+    0xed84973cUL, 0xf075b8b8UL, 0x0ceac5c9UL, 0xf00a255aUL, 0xdfcd487cUL,
+    0x7e77e0daUL, 0x8be5750cUL, 0x0071cb97UL, 0x560827feUL, 0x28c4186fUL,
+    0xaf4049f0UL, 0xbf693ad6UL, 0xa911aaddUL, 0x2e3006d1UL, 0x5eb5bb74UL,
+    0x2e8489f9UL, 0xc36eb83dUL, 0x84278164UL, 0x82302b47UL, 0x61e0e6beUL,
+    0x0422260eUL, 0x11b59c56UL, 0xe4f20c9cUL, 0x9cd5ecaaUL, 0xf866e2daUL,
+    0x9bc72523UL, 0x52c41667UL, 0x816f533cUL, 0x47a3235eUL, 0xa0dbff9eUL,
+    0x0c62a756UL, 0xea9ca5a3UL, 0xde0761a6UL, 0xc51267e9UL, 0x3eed2ad6UL,
+    0xf28b8866UL, 0x695ed21fUL, 0xfd769663UL, 0x9065af4eUL, 0xbc47fcdfUL,
+    0xdfca6259UL, 0x424e399cUL, 0x166c2c1bUL, 0xbb03335eUL, 0x2a73a1a1UL,
+    0xc4be33ddUL, 0xe692d058UL, 0x45746bc2UL, 0x94943c07UL, 0x07d38d7fUL,
+    0x6085cfb3UL, 0x74b851e4UL, 0xdb3d2ac2UL, 0xdb9df507UL, 0x86d3323bUL,
+    0x5c6c654cUL, 0x82bfac22UL, 0xb4dd3032UL, 0x927e023bUL, 0xb7261a5fUL,
+    0x34fe8179UL, 0x40f361bfUL, 0x649e7858UL, 0xe716500eUL, 0x65873b06UL,
+    0x35c6ee0bUL, 0xfb2864c6UL, 0xe4c5d4fcUL, 0x281901c6UL, 0xc58ee284UL,
+    0xe5fca3cdUL, 0x44803865UL, 0xf850f7f6UL, 0xf9f41f41UL, 0x45eb5539UL,
+    0x87cbf3c9UL, 0xbe2f8074UL, 0xae056412UL, 0x3c5cb955UL, 0xd8fe916fUL,
+    0xaec289dfUL, 0xd18ccb5eUL, 0x0eef81bfUL, 0x444157f2UL, 0x4690364aUL,
+    0xde98a175UL, 0xc1597ea0UL, 0xd0945b1bUL, 0xb1ed3e17UL, 0x79676e7aUL,
+    0xe595ebc1UL, 0xa283bdf6UL, 0x648c3570UL, 0x6a06b25cUL, 0x398b1580UL,
+    0x0deb138cUL, 0xe51108efUL, 0x463d096aUL, 0x1dda7417UL, 0xaffe012bUL,
+    0x722f0317UL, 0xcb001892UL, 0x23875cf7UL, 0x82d754d2UL, 0x899114deUL,
+    0x2091ce4cUL, 0xd24757b4UL, 0x8a944ef9UL, 0x8594145aUL, 0xedf8f12bUL,
+    0x998e4affUL, 0xf30c0ce9UL, 0x9ce601e2UL, 0xb2657a58UL, 0x36a851ddUL,
+    0x94c6ec8dUL, 0xed46b938UL, 0x86ada470UL, 0x409b507dUL, 0x46c714a9UL,
+    0x05c862a8UL, 0xb628043eUL, 0x5bc4a188UL, 0x8d763a8cUL, 0x0adc18b6UL,
+    0x7f5ba797UL, 0x69073519UL, 0x5db4bc6bUL, 0x444d59d1UL, 0x3d087e22UL,
+    0xe9c04e88UL, 0x61666f51UL, 0x548aa4e6UL, 0x151fd005UL, 0x91555389UL,
+    0x60905661UL, 0x5e8d5619UL, 0x3e3c8561UL, 0x39c6b81cUL, 0x2491156cUL,
+    0xfc2ff4a6UL, 0x17b4d42cUL, 0x82c9bc79UL, 0x2bd704cfUL, 0x7b2568eeUL,
+    0x05403240UL, 0x5d2268d9UL, 0x7e227b6bUL, 0xd86bec7aUL, 0x231f10e7UL,
+    0xba016830UL, 0x964f8511UL, 0xa3b7321fUL, 0x9873c321UL, 0x3402c2ddUL,
+    0xa5a250e1UL, 0x2657a385UL, 0xc738d247UL, 0x012541caUL, 0xcd33873cUL,
+    0xc5907f1bUL, 0xd88dc82cUL, 0x5c2b540aUL, 0x5656cca4UL, 0x1f887dd1UL,
+    0xa3d987b8UL, 0x83e7fe48UL, 0x06a28678UL, 0xd65682dbUL, 0x465f2df8UL,
+    0x9b414ce1UL, 0xfac8ffbcUL, 0x598f19cdUL, 0xb12ac825UL, 0xfa99231bUL,
+    0x2e5c217eUL, 0x3b2d8ba2UL, 0xe550fdbaUL, 0x8e510006UL, 0x844b6733UL,
+    0x3e573194UL, 0xee48a926UL, 0xdccd36bdUL, 0x41c394c8UL, 0x12a79620UL,
+    0xa19b67f2UL, 0x8a3fd2a6UL, 0x8a285c06UL, 0x3a17b7d9UL, 0x3637050aUL,
+    0x63dfca03UL, 0x7295647eUL, 0x7a7b3bbaUL, 0xbe8e7601UL, 0xea660549UL,
+    0x3c1e511aUL, 0xc7a1931aUL, 0x06c40c05UL, 0xb796cf70UL, 0x7d188664UL,
+    0xced9fa38UL, 0xb9f70031UL, 0x601e2c75UL, 0x87fe9735UL, 0xf8cd49b0UL,
+    0xef645dd6UL, 0x7d05b323UL, 0x435d7138UL, 0x5c02f47fUL, 0x90327a26UL,
+    0x63ecd3b2UL, 0xabd4e225UL, 0x01624325UL, 0x302c1661UL, 0xdbfbeb93UL,
+    0x1cdfa6bcUL, 0x846519a2UL, 0xb15987edUL, 0x113ad6f1UL, 0x0c31ec84UL,
+    0x232a35b2UL, 0xb4132090UL, 0x92d0c3c5UL, 0x535172e3UL, 0x095ffccbUL,
+    0xfc66a0a9UL, 0x932c038eUL, 0x25463a6eUL, 0xccc15e47UL, 0x1bbafc74UL,
+    0x3cf2a838UL, 0xa8486630UL, 0x1047e025UL, 0x8405b4aeUL, 0xda36738dUL,
+    0x1eec4c73UL, 0x88b30e90UL, 0x4f9ff104UL, 0x85eea780UL, 0x6e2b7da8UL,
+    0x40d9fdbeUL, 0x6feb593dUL, 0x3c850d3cUL, 0x65606c0cUL, 0xb078a231UL,
+    0x70308a14UL, 0x675af9bdUL, 0x6d9a7cbeUL, 0xed73ee32UL, 0x63660519UL,
+    0x1701dd8dUL, 0x0e62955fUL, 0x180db0e9UL, 0xbcb66a13UL, 0xd3c2cd3eUL,
+    0x787b88aaUL, 0x85fdbe48UL, 0xa2879c52UL, 0x9579f8f8UL, 0x902ffd41UL,
+    0x4b7c6a7bUL, 0x1f5e048bUL, 0x8e262d89UL, 0x706d2495UL, 0xebabd878UL,
+    0x816d7f42UL, 0x88cdfbf1UL, 0x3e6cc58aUL, 0x754a64a3UL, 0x8a7dfafdUL,
+    0xe98d0a02UL, 0xb63cd2f7UL, 0x38c8c85cUL, 0x72c5b57fUL, 0xb97f2b0aUL,
+    0xe479da74UL, 0x553e33f7UL, 0x7c86232aUL, 0xb35cc8f8UL, 0xedc6266dUL,
+    0xca67e7feUL, 0x14b7f688UL, 0x072d9b7bUL, 0xb3d3d66fUL, 0x528c6a4aUL,
+    0x121005b9UL, 0x0df2b622UL, 0x87d31f39UL, 0x12ce5fd4UL, 0xedaecb37UL,
+    0x49dec2f4UL, 0x8e53ff25UL, 0xe79e435aUL, 0x764041aaUL, 0x29a3ee70UL,
+    0xb359bd5eUL, 0x5aa23047UL, 0x303acd04UL, 0xb82a2d07UL, 0x165795c2UL,
+    0xa64ab733UL, 0x950faac1UL, 0xdfa2861fUL, 0xff1d5e03UL, 0x8cd6e865UL,
+    0x5eb360ecUL, 0x639cb063UL, 0x19e1a74dUL, 0x7ec12528UL, 0x775c20d6UL,
+    0xa44c4ddfUL, 0x08722d7fUL, 0xb0c92d32UL, 0x83d145bcUL, 0x3b2207e8UL,
+    0x73da60e4UL, 0xa13d0929UL, 0x962813b9UL, 0x738f420bUL, 0xeb6572d6UL,
+    0x151a52caUL, 0x80a4a0efUL, 0x23eee457UL, 0x00000002UL
+};
@@ -0,0 +1,187 @@
+/*
+ * Generated by generate_ziggurat.py, do not edit.
+ *
+ * Ziggurat layers for the standard normal, f(x) = exp(-x**2/2).
+ * x is the width of each layer, f the density at that width.
+ */
+
+#define RK_ZIG_NORMAL_R 3.6541528853610092
+
+static const double rk_zig_normal_x[257] = {
+    3.91075795952491667e+00, 3.65415288536100924e+00, 3.44927829856143164e+00,
+    3.32024473383982599e+00, 3.22457505204780226e+00, 3.14788928951800129e+00,
+    3.08352613200214387e+00, 3.02783779176959378e+00, 2.97860327988184359e+00,
+    2.93436686720888806e+00, 2.89412105361341254e+00, 2.85713873087322501e+00,
+    2.82287739682644334e+00, 2.79092117400192796e+00, 2.76094400527998696e+00,
+    2.73268535904401233e+00, 2.70593365612306336e+00, 2.68051464328574607e+00,
+    2.65628303757674411e+00, 2.63311639363158356e+00, 2.61091051848882438e+00,
+    2.58957598670828748e+00, 2.56903545268184441e+00, 2.54922155032478370e+00,
+    2.53007523215985453e+00, 2.51154444162669455e+00, 2.49358304127104669e+00,
+    2.47614993967052310e+00, 2.45920837433470485e+00, 2.44272531820036409e+00,
+    2.42667098493714661e+00, 2.41101841390111948e+00, 2.39574311978192744e+00,
+    2.38082279517208573e+00, 2.36623705671729079e+00, 2.35196722737914454e+00,
+    2.33799614879652840e+00, 2.32430801887113248e+00, 2.31088825060137193e+00,
+    2.29772334890286345e+00, 2.28480080272449193e+00, 2.27210899022838175e+00,
+    2.25963709517378764e+00, 2.24737503294738916e+00, 2.23531338492992093e+00,
+    2.22344334009251021e+00, 2.21175664288416041e+00, 2.20024554661127603e+00,
+    2.18890277162636027e+00, 2.17772146774029229e+00, 2.16669518035430775e+00,
+    2.15581781987673660e+00, 2.14508363404788804e+00, 2.13448718284601613e+00,
+    2.12402331568952274e+00, 2.11368715068665258e+00, 2.10347405571487656e+00,
+    2.09337963113879155e+00, 2.08339969399830416e+00, 2.07353026351874270e+00,
+    2.06376754781173188e+00, 2.05410793165065186e+00, 2.04454796521753135e+00,
+    2.03508435372961882e+00, 2.02571394786385417e+00, 2.01643373490620403e+00,
+    2.00724083056052871e+00, 1.99813247135841965e+00, 1.98910600761743805e+00,
+    1.98015889690047664e+00, 1.97128869793365924e+00, 1.96249306494436304e+00,
+    1.95376974238464673e+00, 1.94511656000867839e+00, 1.93653142827569469e+00,
+    1.92801233405266581e+00, 1.91955733659318817e+00, 1.91116456377125354e+00,
+    1.90283220855042967e+00, 1.89455852567070515e+00, 1.88634182853678345e+00,
+    1.87818048629299650e+00, 1.87007292107126744e+00, 1.86201760539967487e+00,
+    1.85401305976020248e+00, 1.84605785028518610e+00, 1.83815058658280717e+00,
+    1.83028991968275756e+00, 1.82247454009388643e+00, 1.81470317596628328e+00,
+    1.80697459135082150e+00, 1.79928758454972071e+00, 1.79164098655216297e+00,
+    1.78403365954944193e+00, 1.77646449552452346e+00, 1.76893241491126907e+00,
+    1.76143636531891068e+00, 1.75397532031767200e+00, 1.74654827828172277e+00,
+    1.73915426128591211e+00, 1.73179231405296363e+00, 1.72446150294804545e+00,
+    1.71716091501782375e+00, 1.70988965707130247e+00, 1.70264685479992384e+00,
+    1.69543165193456224e+00, 1.68824320943719619e+00, 1.68108070472517457e+00,
+    1.67394333092612557e+00, 1.66683029616166611e+00, 1.65974082285818314e+00,
+    1.65267414708305660e+00, 1.64562951790478307e+00, 1.63860619677554853e+00,
+    1.63160345693487430e+00, 1.62462058283303556e+00, 1.61765686957301624e+00,
+    1.61071162236983079e+00, 1.60378415602609525e+00, 1.59687379442278887e+00,
+    1.58997987002419161e+00, 1.58310172339603006e+00, 1.57623870273590727e+00,
+    1.56939016341512461e+00, 1.56255546753104579e+00, 1.55573398346917724e+00,
+    1.54892508547417429e+00, 1.54212815322900298e+00, 1.53534257144151520e+00,
+    1.52856772943771335e+00, 1.52180302076099916e+00, 1.51504784277671578e+00,
+    1.50830159628131288e+00, 1.50156368511546501e+00, 1.49483351578049506e+00,
+    1.48811049705744902e+00, 1.48139403962818883e+00, 1.47468355569785681e+00,
+    1.46797845861808085e+00, 1.46127816251027687e+00, 1.45458208188841165e+00,
+    1.44788963128057735e+00, 1.44120022484872523e+00, 1.43451327600589340e+00,
+    1.42782819703025710e+00, 1.42114439867531028e+00, 1.41446128977547247e+00,
+    1.40777827684640022e+00, 1.40109476367925234e+00, 1.39441015092814236e+00,
+    1.38772383568997726e+00, 1.38103521107585658e+00, 1.37434366577316736e+00,
+    1.36764858359747721e+00, 1.36094934303328419e+00, 1.35424531676263604e+00,
+    1.34753587118058826e+00, 1.34082036589640508e+00, 1.33409815321936098e+00,
+    1.32736857762792693e+00, 1.32063097522105721e+00, 1.31388467315022139e+00,
+    1.30712898903073205e+00, 1.30036323033083812e+00, 1.29358669373694868e+00,
+    1.28679866449324454e+00, 1.27999841571381889e+00, 1.27318520766535737e+00,
+    1.26635828701823039e+00, 1.25951688606371515e+00, 1.25266022189489812e+00,
+    1.24578749554862811e+00, 1.23889789110568826e+00, 1.23199057474613682e+00,
+    1.22506469375653149e+00, 1.21811937548548244e+00, 1.21115372624369999e+00,
+    1.20416683014438242e+00, 1.19715774787944240e+00, 1.19012551542669276e+00,
+    1.18306914268268759e+00, 1.17598761201545288e+00, 1.16887987673083416e+00,
+    1.16174485944561234e+00, 1.15458145035992876e+00, 1.14738850542085014e+00,
+    1.14016484436815224e+00, 1.13290924865253495e+00, 1.12562045921553455e+00,
+    1.11829717411934615e+00, 1.11093804601357693e+00, 1.10354167942464110e+00,
+    1.09610662785202284e+00, 1.08863139065398129e+00, 1.08111440970340533e+00,
+    1.07355406579243762e+00, 1.06594867476212385e+00, 1.05829648333067650e+00,
+    1.05059566459093134e+00, 1.04284431314415049e+00, 1.03504043983344252e+00,
+    1.02718196603564760e+00, 1.01926671746548592e+00, 1.01129241743999732e+00,
+    1.00325667954467468e+00, 9.95156999635092632e-01, 9.86990747099064203e-01,
+    9.78755155294226298e-01, 9.70447311064226104e-01, 9.62064143223042234e-01,
+    9.53602409881087798e-01, 9.45058684468167209e-01, 9.36429340286576872e-01,
+    9.27710533402001825e-01, 9.18898183649592415e-01, 9.09987953496720348e-01,
+    9.00975224461223578e-01, 8.91855070732943456e-01, 8.82622229585167450e-01,
+    8.73271068088862568e-01, 8.63795545553310840e-01, 8.54189171008165826e-01,
+    8.44444954909155943e-01, 8.34555354086384260e-01, 8.24512208752294251e-01,
+    8.14306670135217514e-01, 8.03929116989973602e-01, 7.93369058840625696e-01,
+    7.82615023307235536e-01, 7.71654424224570534e-01, 7.60473406430110632e-01,
+    7.49056662017817954e-01, 7.37387211434298306e-01, 7.25446140910002479e-01,
+    7.13212285190978790e-01, 7.00661841106818062e-01, 6.87767892795791647e-01,
+    6.74499822837297036e-01, 6.60822574244423033e-01, 6.46695714894997331e-01,
+    6.32072236386064801e-01, 6.16896990007755219e-01, 6.01104617755996440e-01,
+    5.84616766106383468e-01, 5.67338257053823236e-01, 5.49151702327169922e-01,
+    5.29909720661563166e-01, 5.09423329602097241e-01, 4.87443966139241958e-01,
+    4.63634336790888724e-01, 4.37518402207878909e-01, 4.08389134611999494e-01,
+    3.75121332878390279e-01, 3.35737519214436952e-01, 2.86174591792088040e-01,
+    2.15241895984906395e-01, 0.00000000000000000e+00
+};
+
+static const double rk_zig_normal_f[257] = {
+    4.77467764609386196e-04, 1.26028593049859559e-03, 2.60907274610215926e-03,
+    4.03797259336302356e-03, 5.52240329925098635e-03, 7.05087547137321635e-03,
+    8.61658276939871945e-03, 1.02149714397014590e-02, 1.18427578579078790e-02,
+    1.34974506017398674e-02, 1.51770883079353092e-02, 1.68800831525431419e-02,
+    1.86051212757246225e-02, 2.03510962300444825e-02, 2.21170627073088190e-02,
+    2.39022033057958230e-02, 2.57058040085488167e-02, 2.75272356696030125e-02,
+    2.93659397581332547e-02, 3.12214171919201894e-02, 3.30932194585784600e-02,
+    3.49809414617160211e-02, 3.68842156885672220e-02, 3.88027074045260642e-02,
+    4.07361106559408978e-02, 4.26841449164744244e-02, 4.46465522512944635e-02,
+    4.66230949019303814e-02, 4.86135532158685421e-02, 5.06177238609477817e-02,
+    5.26354182767921897e-02, 5.46664613248889208e-02, 5.67106901062029017e-02,
+    5.87679529209337373e-02, 6.08381083495398781e-02, 6.29210244377581412e-02,
+    6.50165779712428976e-02, 6.71246538277884969e-02, 6.92451443970067554e-02,
+    7.13779490588904025e-02, 7.35229737139813239e-02, 7.56801303589271085e-02,
+    7.78493367020960531e-02, 8.00305158146630696e-02, 8.22235958132029043e-02,
+    8.44285095703534716e-02, 8.66451944505580718e-02, 8.88735920682758862e-02,
+    9.11136480663737591e-02, 9.33653119126910125e-02, 9.56285367130089992e-02,
+    9.79032790388624646e-02, 1.00189498768810017e-01, 1.02487158941935247e-01,
+    1.04796225622487069e-01, 1.07116667774683802e-01, 1.09448457146811798e-01,
+    1.11791568163838090e-01, 1.14145977827838488e-01, 1.16511665625610869e-01,
+    1.18888613442910060e-01, 1.21276805484790307e-01, 1.23676228201596572e-01,
+    1.26086870220185887e-01, 1.28508722279999571e-01, 1.30941777173644358e-01,
+    1.33386029691669156e-01, 1.35841476571253755e-01, 1.38308116448550733e-01,
+    1.40785949814444700e-01, 1.43274978973513462e-01, 1.45775208005994028e-01,
+    1.48286642732574553e-01, 1.50809290681845676e-01, 1.53343161060262856e-01,
+    1.55888264724479197e-01, 1.58444614155924285e-01, 1.61012223437511010e-01,
+    1.63591108232365584e-01, 1.66181285764481906e-01, 1.68782774801211288e-01,
+    1.71395595637505754e-01, 1.74019770081838554e-01, 1.76655321443734775e-01,
+    1.79302274522847499e-01, 1.81960655599522375e-01, 1.84630492426799103e-01,
+    1.87311814223800055e-01, 1.90004651670464791e-01, 1.92709036903588926e-01,
+    1.95425003514134110e-01, 1.98152586545774945e-01, 2.00891822494656452e-01,
+    2.03642749310334714e-01, 2.06405406397880520e-01, 2.09179834621124855e-01,
+    2.11966076307030044e-01, 2.14764175251173445e-01, 2.17574176724331020e-01,
+    2.20396127480151777e-01, 2.23230075763917263e-01, 2.26076071322379973e-01,
+    2.28934165414679980e-01, 2.31804410824338364e-01, 2.34686861872329650e-01,
+    2.37581574431237730e-01, 2.40488605940500089e-01, 2.43408015422749896e-01,
+    2.46339863501263440e-01, 2.49284212418528023e-01, 2.52241126055941678e-01,
+    2.55210669954661407e-01, 2.58192911337618625e-01, 2.61187919132720547e-01,
+    2.64195763997260469e-01, 2.67216518343560805e-01, 2.70250256365874963e-01,
+    2.73297054068576573e-01, 2.76356989295667821e-01, 2.79430141761637441e-01,
+    2.82516593083707079e-01, 2.85616426815501201e-01, 2.88729728482182313e-01,
+    2.91856585617094599e-01, 2.94997087799961255e-01, 2.98151326696684982e-01,
+    3.01319396100802495e-01, 3.04501391976649383e-01, 3.07697412504291445e-01,
+    3.10907558126285899e-01, 3.14131931596336511e-01, 3.17370638029912888e-01,
+    3.20623784956904689e-01, 3.23891482376390427e-01, 3.27173842813600568e-01,
+    3.30470981379162754e-01, 3.33783015830717567e-01, 3.37110066637005323e-01,
+    3.40452257044521034e-01, 3.43809713146849938e-01, 3.47182563956792867e-01,
+    3.50570941481405329e-01, 3.53974980800075945e-01, 3.57394820145779724e-01,
+    3.60830600989647199e-01, 3.64282468129003112e-01, 3.67750569779031644e-01,
+    3.71235057668238555e-01, 3.74736087137890195e-01, 3.78253817245618296e-01,
+    3.81788410873392825e-01, 3.85340034840076506e-01, 3.88908860018787994e-01,
+    3.92495061459314842e-01, 3.96098818515831619e-01, 3.99720314980196501e-01,
+    4.03359739221113789e-01, 4.07017284329472651e-01, 4.10693148270187547e-01,
+    4.14387534040890404e-01, 4.18100649837847504e-01, 4.21832709229495284e-01,
+    4.25583931338021304e-01, 4.29354541029440817e-01, 4.33144769112651651e-01,
+    4.36954852547984884e-01, 4.40785034665803266e-01, 4.44635565395738619e-01,
+    4.48506701507202288e-01, 4.52398706861847799e-01, 4.56311852678715657e-01,
+    4.60246417812842090e-01, 4.64202689048173522e-01, 4.68180961405692819e-01,
+    4.72181538467729423e-01, 4.76204732719505142e-01, 4.80250865909045976e-01,
+    4.84320269426682437e-01, 4.88413284705457196e-01, 4.92530263643867761e-01,
+    4.96671569052488937e-01, 5.00837575126147905e-01, 5.05028667943467346e-01,
+    5.09245245995747053e-01, 5.13487720747325960e-01, 5.17756517229755353e-01,
+    5.22052074672320843e-01, 5.26374847171683369e-01, 5.30725304403660947e-01,
+    5.35103932380456504e-01, 5.39511234256950911e-01, 5.43947731190025041e-01,
+    5.48413963255264592e-01, 5.52910490425831069e-01, 5.57437893618764724e-01,
+    5.61996775814523231e-01, 5.66587763256163113e-01, 5.71211506735251895e-01,
+    5.75868682972352386e-01, 5.80559996100789566e-01, 5.85286179263369899e-01,
+    5.90047996332824454e-01, 5.94846243767986005e-01, 5.99681752619123931e-01,
+    6.04555390697466444e-01, 6.09468064925772102e-01, 6.14420723888912557e-01,
+    6.19414360605832992e-01, 6.24450015547025172e-01, 6.29528779924835358e-01,
+    6.34651799287622276e-01, 6.39820277453055253e-01, 6.45035480820820961e-01,
+    6.50298743110815369e-01, 6.55611470579695932e-01, 6.60975147776661776e-01,
+    6.66391343908748768e-01, 6.71861719897080656e-01, 6.77388036218771972e-01,
+    6.82972161644993303e-01, 6.88616083004670254e-01, 6.94321916126115157e-01,
+    7.00091918136510061e-01, 7.05928501332752645e-01, 7.11834248878246756e-01,
+    7.17811932630720295e-01, 7.23864533468628446e-01, 7.29995264561474455e-01,
+    7.36207598126860874e-01, 7.42505296340149279e-01, 7.48892447219155044e-01,
+    7.55373506507094228e-01, 7.61953346836793388e-01, 7.68637315798484266e-01,
+    7.75431304981185177e-01, 7.82341832654800395e-01, 7.89376143566022481e-01,
+    7.96542330422956857e-01, 8.03849483170962165e-01, 8.11307874312654054e-01,
+    8.18929191603700146e-01, 8.26726833946219153e-01, 8.34716292986881214e-01,
+    8.42915653112201846e-01, 8.51346258458675509e-01, 8.60033621196328979e-01,
+    8.69008688036854382e-01, 8.78309655808914624e-01, 8.87984660755830491e-01,
+    8.98095921898340421e-01, 9.08726440052127660e-01, 9.19991505039343571e-01,
+    9.32060075959226797e-01, 9.45198953442295653e-01, 9.59879091800102113e-01,
+    9.77101701267666045e-01, 1.00000000000000000e+00
+};
+
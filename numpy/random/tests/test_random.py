@@ -56,6 +56,130 @@ class TestMultinomial(TestCase):
 
 
 
+class TestJump(TestCase):
+    def test_regression(self):
+        # checked against a pure Python evaluation of the jump polynomial
+        r = random.RandomState(1234)
+        r.jump()
+        state = r.get_state()
+        assert_array_equal(state[1][:3], [1457819116, 552020585, 2220995384])
+        assert_equal(state[2], 624)
+
+    def test_commutes_with_draws(self):
+        a = random.RandomState(5)
+        a.random_sample(1001)
+        a.jump()
+        b = random.RandomState(5)
+        b.jump()
+        b.random_sample(1001)
+        assert_array_equal(a.random_sample(5), b.random_sample(5))
+        a.jump(2)
+        b.jump()
+        b.jump()
+        assert_array_equal(a.random_sample(5), b.random_sample(5))
+        assert_raises(ValueError, a.jump, -1)
+
+    def test_spawn(self):
+        r = random.RandomState(7)
+        streams = r.spawn(3)
+        for k in range(3):
+            ref = random.RandomState(7)
+            ref.jump(k + 1)
+            assert_array_equal(streams[k].random_sample(10),
+                               ref.random_sample(10))
+        ref = random.RandomState(7)
+        ref.jump(4)
+        assert_array_equal(r.random_sample(10), ref.random_sample(10))
+        assert_equal(r.spawn(0), [])
+
+
+class TestThreading(TestCase):
+    def run_threads(self, function, n):
+        import threading
+        threads = [threading.Thread(target=function, args=(i,))
+                   for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def test_independent_states(self):
+        out = [None]*4
+        def fill(i):
+            out[i] = random.RandomState(i).standard_normal(10000)
+        self.run_threads(fill, 4)
+        for i in range(4):
+            assert_array_equal(out[i],
+                               random.RandomState(i).standard_normal(10000))
+
+    def test_shared_state(self):
+        # concurrent draws from one state take turns, none get lost
+        r = random.RandomState(3)
+        out = [None]*4
+        def fill(i):
+            if i % 2:
+                # scalar draws wait for the fills running without the GIL
+                out[i] = [r.randint(1000000) for j in range(10000)]
+            else:
+                out[i] = r.randint(1000000, size=10000)
+        self.run_threads(fill, 4)
+        expected = random.RandomState(3).randint(1000000, size=40000)
+        assert_array_equal(np.sort(np.concatenate(out)), np.sort(expected))
+
+
+class TestZiggurat(TestCase):
+    def check_cdf(self, x, points, cdf):
+        # fraction of samples below each point, within 5 standard errors
+        n = len(x)
+        for q, p in zip(points, cdf):
+            assert_(abs(np.mean(x < q) - p) < 5*np.sqrt(p*(1 - p)/n),
+                    (q, np.mean(x < q), p))
+
+    def test_regression(self):
+        r = random.RandomState(1234, ziggurat=True)
+        assert_array_almost_equal(r.standard_normal(3),
+                [0.18099711962052623, 1.32788318890911827,
+                 -0.70809328161082774], decimal=14)
+        assert_array_almost_equal(r.standard_exponential(3),
+                [0.18360936270827552, 0.86605246010013515,
+                 0.13177167397481884], decimal=14)
+
+    def test_legacy_default(self):
+        assert_(not random.RandomState(1234).ziggurat)
+        assert_array_equal(random.RandomState(1234).standard_normal(10),
+                random.RandomState(1234, ziggurat=False).standard_normal(10))
+        assert_(np.all(random.RandomState(1234).standard_normal(10) !=
+                random.RandomState(1234, ziggurat=True).standard_normal(10)))
+
+    def test_normal(self):
+        x = random.RandomState(5, ziggurat=True).standard_normal(1000000)
+        # -3.7 and 3.7 are in the tail beyond the base layer
+        self.check_cdf(x, [-4, -3.7, -2, -1, 0, 0.5, 3.7],
+                       [3.167124183312003e-05, 0.00010779973347738831,
+                        0.022750131948179264, 0.15865525393145702, 0.5,
+                        0.6914624612740131, 0.9998922002665226])
+
+    def test_exponential(self):
+        x = random.RandomState(5, ziggurat=True).standard_exponential(1000000)
+        points = np.array([0.01, 0.5, 1, 3, 7.5, 8])
+        self.check_cdf(x, points, 1 - np.exp(-points))
+
+    def test_gamma(self):
+        r = random.RandomState(5, ziggurat=True)
+        for shape in [0.5, 1, 2.5]:
+            x = r.standard_gamma(shape, 1000000)
+            assert_almost_equal(x.mean(), shape, decimal=2)
+            assert_almost_equal(x.var(), shape, decimal=1)
+
+    def test_pickle_and_spawn(self):
+        import pickle
+        r = random.RandomState(5, ziggurat=True)
+        r2 = pickle.loads(pickle.dumps(r))
+        assert_(r2.ziggurat)
+        assert_array_equal(r.standard_normal(10), r2.standard_normal(10))
+        assert_(np.all([s.ziggurat for s in r.spawn(2)]))
+
+
 class TestSetState(TestCase):
     def setUp(self):
         self.seed = 1234567890